@@ -5,55 +5,21 @@ For users: All built-in Aviary functions, code, and objects
 should be imported from this file.
 
 For developers: All Aviary code which is intended to be
-user-facing should be imported to this file.
+user-facing should be registered in this file. Apart from the variable hierarchies,
+enums, and constants, API objects are imported lazily on first access so that importing
+this module does not pull in OpenMDAO, Dymos, and every subsystem; add new objects to
+_lazy_imports rather than importing them directly.
 """
 
+from importlib import import_module
+
 # TODO: don't rename things here, do it in the entire codebase
 # TODO: when documenting methods and classes, make sure to include documentation (printing of docstrings) for everything that's imported in this API
 # TODO: remove overload prototype
 # TODO: import and use the aviary api in all user-facing files rather than individual imports
 
-
-###################
-# General Imports #
-###################
-
 from aviary.variable_info.variables import Aircraft, Mission, Dynamic, Settings
-from aviary.variable_info.options import is_option
-from aviary.utils.develop_metadata import add_meta_data, update_meta_data
-from aviary.variable_info.variable_meta_data import CoreMetaData
-from aviary.variable_info.functions import (
-    add_aviary_input,
-    add_aviary_output,
-    add_aviary_option,
-    get_units,
-)
-from aviary.utils.merge_hierarchies import merge_hierarchies
-from aviary.utils.merge_variable_metadata import merge_meta_data
-from aviary.utils.named_values import NamedValues
-from aviary.utils.aviary_values import AviaryValues
-from aviary.utils.csv_data_file import read_data_file, write_data_file
-from aviary.utils.data_interpolator_builder import build_data_interpolator
 from aviary.variable_info.enums import *
-from aviary.models.missions.two_dof_default import phase_info as default_2DOF_phase_info
-from aviary.models.missions.energy_state_default import (
-    phase_info as default_energy_state_phase_info,
-)
-from aviary.interface.run_aviary import run_aviary
-from aviary.core.aviary_problem import AviaryProblem, reload_aviary_problem
-
-# Converters
-from aviary.utils.engine_deck_conversion import convert_engine_deck
-from aviary.utils.fortran_to_aviary import fortran_to_aviary
-from aviary.utils.aero_table_conversion import convert_aero_table
-
-from aviary.utils.functions import (
-    get_path,
-    set_aviary_initial_values,
-    set_aviary_input_defaults,
-    top_dir,
-)
-from aviary.utils.options import list_options
 from aviary.constants import (
     GRAV_ENGLISH_FLOPS,
     GRAV_ENGLISH_GASP,
@@ -66,147 +32,233 @@ from aviary.constants import (
     RHO_SEA_LEVEL_METRIC,
     TSLS_DEGR,
 )
-from aviary.subsystems.test.subsystem_tester import (
-    TestSubsystemBuilder,
-)
-from aviary.subsystems.propulsion.utils import build_engine_deck
 
-###################
-# Level 3 Imports #
-###################
-# Model Setup
-from aviary.variable_info.functions import (
-    override_aviary_vars,
-    setup_model_options,
-    setup_trajectory_params,
-)
+# Maps each lazily imported API name to the module that defines it. Names that are
+# renamed in the API map to a (module, attribute) tuple instead.
+_lazy_imports = {
+    'is_option': 'aviary.variable_info.options',
+    'add_meta_data': 'aviary.utils.develop_metadata',
+    'update_meta_data': 'aviary.utils.develop_metadata',
+    'CoreMetaData': 'aviary.variable_info.variable_meta_data',
+    'add_aviary_input': 'aviary.variable_info.functions',
+    'add_aviary_output': 'aviary.variable_info.functions',
+    'add_aviary_option': 'aviary.variable_info.functions',
+    'get_units': 'aviary.variable_info.functions',
+    'merge_hierarchies': 'aviary.utils.merge_hierarchies',
+    'merge_meta_data': 'aviary.utils.merge_variable_metadata',
+    'NamedValues': 'aviary.utils.named_values',
+    'AviaryValues': 'aviary.utils.aviary_values',
+    'read_data_file': 'aviary.utils.csv_data_file',
+    'write_data_file': 'aviary.utils.csv_data_file',
+    'build_data_interpolator': 'aviary.utils.data_interpolator_builder',
+    'default_2DOF_phase_info': ('aviary.models.missions.two_dof_default', 'phase_info'),
+    'default_energy_state_phase_info': (
+        'aviary.models.missions.energy_state_default',
+        'phase_info',
+    ),
+    'run_aviary': 'aviary.interface.run_aviary',
+    'AviaryProblem': 'aviary.core.aviary_problem',
+    'reload_aviary_problem': 'aviary.core.aviary_problem',
+    # Converters
+    'convert_engine_deck': 'aviary.utils.engine_deck_conversion',
+    'fortran_to_aviary': 'aviary.utils.fortran_to_aviary',
+    'convert_aero_table': 'aviary.utils.aero_table_conversion',
+    'get_path': 'aviary.utils.functions',
+    'set_aviary_initial_values': 'aviary.utils.functions',
+    'set_aviary_input_defaults': 'aviary.utils.functions',
+    'top_dir': 'aviary.utils.functions',
+    'list_options': 'aviary.utils.options',
+    'TestSubsystemBuilder': 'aviary.subsystems.test.subsystem_tester',
+    'build_engine_deck': 'aviary.subsystems.propulsion.utils',
+    ###################
+    # Level 3 Imports #
+    ###################
+    # Model Setup
+    'override_aviary_vars': 'aviary.variable_info.functions',
+    'setup_model_options': 'aviary.variable_info.functions',
+    'setup_trajectory_params': 'aviary.variable_info.functions',
+    # Miscellaneous
+    'CorePreMission': 'aviary.subsystems.premission',
+    'SubsystemBuilder': 'aviary.subsystems.subsystem_builder',
+    'create_vehicle': 'aviary.utils.process_input_decks',
+    # Preprocessors
+    'preprocess_options': 'aviary.utils.preprocessors',
+    'preprocess_crewpayload': 'aviary.utils.preprocessors',
+    'preprocess_fuel_capacities': 'aviary.utils.preprocessors',
+    'preprocess_propulsion': 'aviary.utils.preprocessors',
+    # ODEs
+    # TODO: check and see if this works with both sides, or just GASP
+    'BaseODE': 'aviary.mission.base_ode',
+    'EnergyStateODE': 'aviary.mission.energy_state.ode.energy_state_ODE',
+    'DetailedLandingODE': ('aviary.mission.energy_state.ode.landing_ode', 'LandingODE'),
+    'DetailedFlareODE': ('aviary.mission.energy_state.ode.landing_ode', 'FlareODE'),
+    'DetailedTakeoffODE': ('aviary.mission.energy_state.ode.takeoff_ode', 'TakeoffODE'),
+    'EnergyStateSimplifiedTakeoff': (
+        'aviary.mission.energy_state.phases.simplified_takeoff',
+        'TakeoffGroup',
+    ),
+    'EnergyStateSimplifiedLanding': (
+        'aviary.mission.energy_state.phases.simplified_landing',
+        'LandingGroup',
+    ),
+    'TwoDOFODE': 'aviary.mission.two_dof.ode.two_dof_ode',
+    'TwoDOFAccelerationODE': ('aviary.mission.two_dof.ode.accel_ode', 'AccelODE'),
+    'BreguetCruiseODE': 'aviary.mission.two_dof.ode.breguet_cruise_ode',
+    'ElectricBreguetCruiseODE': 'aviary.mission.two_dof.ode.breguet_cruise_ode',
+    'TwoDOFFlightODE': ('aviary.mission.two_dof.ode.flight_ode', 'FlightODE'),
+    'TwoDOFTakeOffODE': ('aviary.mission.two_dof.ode.takeoff_ode', 'TakeOffODE'),
+    'TwoDOFSimplifiedLanding': ('aviary.mission.two_dof.ode.landing_ode', 'LandingSegment'),
+    'AnalyticTaxi': ('aviary.mission.two_dof.ode.taxi_ode', 'TaxiSegment'),
+    # Phase builders
+    'PhaseBuilder': 'aviary.mission.phase_builder',
+    # note that this is only for simplified right now
+    'EnergyStatePhaseBuilder': ('aviary.mission.energy_state.phases.energy_phase', 'EnergyPhase'),
+    'EnergyStateLandingPhaseBuilder': (
+        'aviary.mission.energy_state.phases.build_landing',
+        'Landing',
+    ),
+    # note that this is only for simplified right now
+    'EnergyStateTakeoffPhaseBuilder': (
+        'aviary.mission.energy_state.phases.build_takeoff',
+        'Takeoff',
+    ),
+    'DetailedLandingApproachToMicP3PhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingApproachToMicP3',
+    ),
+    'DetailedLandingMicP3ToObstaclePhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingMicP3ToObstacle',
+    ),
+    'DetailedLandingObstacleToFlarePhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingObstacleToFlare',
+    ),
+    'DetailedLandingFlareToTouchdownPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingFlareToTouchdown',
+    ),
+    'DetailedLandingTouchdownToNoseDownPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingTouchdownToNoseDown',
+    ),
+    'DetailedLandingNoseDownToStopPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingNoseDownToStop',
+    ),
+    'DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffBrakeReleaseToDecisionSpeed',
+    ),
+    'DetailedTakeoffDecisionSpeedToRotatePhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffDecisionSpeedToRotate',
+    ),
+    'DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffDecisionSpeedBrakeDelay',
+    ),
+    'DetailedTakeoffRotateToLiftoffPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffRotateToLiftoff',
+    ),
+    'DetailedTakeoffLiftoffToObstaclePhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffLiftoffToObstacle',
+    ),
+    'DetailedTakeoffObstacleToMicP2PhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffObstacleToMicP2',
+    ),
+    'DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffMicP2ToEngineCutback',
+    ),
+    'DetailedTakeoffEngineCutbackPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffEngineCutback',
+    ),
+    'DetailedTakeoffEngineCutbackToMicP1PhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffEngineCutbackToMicP1',
+    ),
+    'DetailedTakeoffMicP1ToClimbPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffMicP1ToClimb',
+    ),
+    'DetailedTakeoffBrakeToAbortPhaseBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffBrakeToAbort',
+    ),
+    # Phase builders
+    'TwoDOFAccelerationPhase': ('aviary.mission.two_dof.phases.accel_phase', 'AccelPhase'),
+    'TwoDOFFlightPhase': ('aviary.mission.two_dof.phases.flight_phase', 'FlightPhase'),
+    'TwoDOFTakeoffPhase': ('aviary.mission.two_dof.phases.takeoff_phase', 'TakeoffPhase'),
+    'BreguetCruisePhase': 'aviary.mission.two_dof.phases.breguet_cruise_phase',
+    'ElectricCruisePhase': 'aviary.mission.two_dof.phases.breguet_cruise_phase',
+    # Trajectory builders
+    'DetailedLandingTrajectoryBuilder': (
+        'aviary.mission.energy_state.phases.detailed_landing_phases',
+        'LandingTrajectory',
+    ),
+    'DetailedTakeoffTrajectoryBuilder': (
+        'aviary.mission.energy_state.phases.detailed_takeoff_phases',
+        'TakeoffTrajectory',
+    ),
+    ##############
+    # Subsystems #
+    ##############
+    # Aerodynamics
+    'AerodynamicsBuilder': 'aviary.subsystems.aerodynamics.aerodynamics_builder',
+    'CoreAerodynamicsBuilder': 'aviary.subsystems.aerodynamics.aerodynamics_builder',
+    'TabularAeroGroup': 'aviary.subsystems.aerodynamics.flops_based.tabular_aero_group',
+    # Atmosphere
+    'Atmosphere': 'aviary.subsystems.atmosphere.atmosphere',
+    # Energy
+    'BatteryBuilder': 'aviary.subsystems.energy.battery_builder',
+    # Geometry
+    'GeometryBuilder': 'aviary.subsystems.geometry.geometry_builder',
+    'CoreGeometryBuilder': 'aviary.subsystems.geometry.geometry_builder',
+    # Mass
+    'MassBuilder': 'aviary.subsystems.mass.mass_builder',
+    'CoreMassBuilder': 'aviary.subsystems.mass.mass_builder',
+    # Performance
+    'PerformanceBuilder': 'aviary.subsystems.performance.performance_builder',
+    'CorePerformanceBuilder': 'aviary.subsystems.performance.performance_builder',
+    # Propulsion
+    'EngineDeck': 'aviary.subsystems.propulsion.engine_deck',
+    'EngineModel': 'aviary.subsystems.propulsion.engine_model',
+    'EngineSurrogate': 'aviary.subsystems.propulsion.engine_surrogate',
+    'MotorBuilder': 'aviary.subsystems.propulsion.motor.motor_builder',
+    'PropulsionBuilder': 'aviary.subsystems.propulsion.propulsion_builder',
+    'CorePropulsionBuilder': 'aviary.subsystems.propulsion.propulsion_builder',
+    'TurbopropModel': 'aviary.subsystems.propulsion.turboprop_model',
+    'GearboxBuilder': 'aviary.subsystems.propulsion.gearbox.gearbox_builder',
+    'PropellerBuilder': 'aviary.subsystems.propulsion.propeller.propeller_builder',
+}
 
-# Miscellaneous
-from aviary.subsystems.premission import CorePreMission
-from aviary.subsystems.subsystem_builder import SubsystemBuilder
-from aviary.utils.process_input_decks import create_vehicle
+# "from aviary.api import *" only sees module attributes, so the lazy names are listed here
+__all__ = [
+    name for name in globals() if not name.startswith('_') and name != 'import_module'
+] + list(_lazy_imports)
 
-# Preprocessors
-from aviary.utils.preprocessors import (
-    preprocess_options,
-    preprocess_crewpayload,
-    preprocess_fuel_capacities,
-    preprocess_propulsion,
-)
 
-# ODEs
-# TODO: check and see if this works with both sides, or just GASP
-from aviary.mission.base_ode import BaseODE
-from aviary.mission.energy_state.ode.energy_state_ODE import EnergyStateODE
-from aviary.mission.energy_state.ode.landing_ode import LandingODE as DetailedLandingODE
-from aviary.mission.energy_state.ode.landing_ode import FlareODE as DetailedFlareODE
-from aviary.mission.energy_state.ode.takeoff_ode import TakeoffODE as DetailedTakeoffODE
-from aviary.mission.energy_state.phases.simplified_takeoff import (
-    TakeoffGroup as EnergyStateSimplifiedTakeoff,
-)
-from aviary.mission.energy_state.phases.simplified_landing import (
-    LandingGroup as EnergyStateSimplifiedLanding,
-)
-from aviary.mission.two_dof.ode.two_dof_ode import TwoDOFODE
-from aviary.mission.two_dof.ode.accel_ode import AccelODE as TwoDOFAccelerationODE
-from aviary.mission.two_dof.ode.breguet_cruise_ode import BreguetCruiseODE, ElectricBreguetCruiseODE
-from aviary.mission.two_dof.ode.flight_ode import FlightODE as TwoDOFFlightODE
-from aviary.mission.two_dof.ode.takeoff_ode import TakeOffODE as TwoDOFTakeOffODE
-from aviary.mission.two_dof.ode.landing_ode import LandingSegment as TwoDOFSimplifiedLanding
-from aviary.mission.two_dof.ode.taxi_ode import TaxiSegment as AnalyticTaxi
+def __getattr__(name):
+    try:
+        entry = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
 
-# Phase builders
-from aviary.mission.phase_builder import PhaseBuilder
+    if isinstance(entry, tuple):
+        module, attr = entry
+    else:
+        module, attr = entry, name
 
-# note that this is only for simplified right now
-from aviary.mission.energy_state.phases.energy_phase import (
-    EnergyPhase as EnergyStatePhaseBuilder,
-)
-from aviary.mission.energy_state.phases.build_landing import (
-    Landing as EnergyStateLandingPhaseBuilder,
-)
+    value = getattr(import_module(module), attr)
+    # cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# note that this is only for simplified right now
-from aviary.mission.energy_state.phases.build_takeoff import (
-    Takeoff as EnergyStateTakeoffPhaseBuilder,
-)
-from aviary.mission.energy_state.phases.detailed_landing_phases import (
-    LandingApproachToMicP3 as DetailedLandingApproachToMicP3PhaseBuilder,
-    LandingMicP3ToObstacle as DetailedLandingMicP3ToObstaclePhaseBuilder,
-    LandingObstacleToFlare as DetailedLandingObstacleToFlarePhaseBuilder,
-    LandingFlareToTouchdown as DetailedLandingFlareToTouchdownPhaseBuilder,
-    LandingTouchdownToNoseDown as DetailedLandingTouchdownToNoseDownPhaseBuilder,
-    LandingNoseDownToStop as DetailedLandingNoseDownToStopPhaseBuilder,
-)
-from aviary.mission.energy_state.phases.detailed_takeoff_phases import (
-    TakeoffBrakeReleaseToDecisionSpeed as DetailedTakeoffBrakeReleaseToDecisionSpeedPhaseBuilder,
-    TakeoffDecisionSpeedToRotate as DetailedTakeoffDecisionSpeedToRotatePhaseBuilder,
-    TakeoffDecisionSpeedBrakeDelay as DetailedTakeoffDecisionSpeedBrakeDelayPhaseBuilder,
-    TakeoffRotateToLiftoff as DetailedTakeoffRotateToLiftoffPhaseBuilder,
-    TakeoffLiftoffToObstacle as DetailedTakeoffLiftoffToObstaclePhaseBuilder,
-    TakeoffObstacleToMicP2 as DetailedTakeoffObstacleToMicP2PhaseBuilder,
-    TakeoffMicP2ToEngineCutback as DetailedTakeoffMicP2ToEngineCutbackPhaseBuilder,
-    TakeoffEngineCutback as DetailedTakeoffEngineCutbackPhaseBuilder,
-    TakeoffEngineCutbackToMicP1 as DetailedTakeoffEngineCutbackToMicP1PhaseBuilder,
-    TakeoffMicP1ToClimb as DetailedTakeoffMicP1ToClimbPhaseBuilder,
-    TakeoffBrakeToAbort as DetailedTakeoffBrakeToAbortPhaseBuilder,
-)
-
-# Phase builders
-from aviary.mission.two_dof.phases.accel_phase import AccelPhase as TwoDOFAccelerationPhase
-from aviary.mission.two_dof.phases.flight_phase import FlightPhase as TwoDOFFlightPhase
-from aviary.mission.two_dof.phases.takeoff_phase import TakeoffPhase as TwoDOFTakeoffPhase
-from aviary.mission.two_dof.phases.breguet_cruise_phase import (
-    BreguetCruisePhase,
-    ElectricCruisePhase,
-)
-
-# Trajectory builders
-from aviary.mission.energy_state.phases.detailed_landing_phases import (
-    LandingTrajectory as DetailedLandingTrajectoryBuilder,
-)
-from aviary.mission.energy_state.phases.detailed_takeoff_phases import (
-    TakeoffTrajectory as DetailedTakeoffTrajectoryBuilder,
-)
-
-##############
-# Subsystems #
-##############
-
-# Aerodynamics
-from aviary.subsystems.aerodynamics.aerodynamics_builder import (
-    AerodynamicsBuilder,
-    CoreAerodynamicsBuilder,
-)
-from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import TabularAeroGroup
-
-# Atmosphere
-from aviary.subsystems.atmosphere.atmosphere import Atmosphere
-
-# Energy
-from aviary.subsystems.energy.battery_builder import BatteryBuilder
-
-# Geometry
-from aviary.subsystems.geometry.geometry_builder import GeometryBuilder, CoreGeometryBuilder
 
-# Mass
-from aviary.subsystems.mass.mass_builder import MassBuilder, CoreMassBuilder
-
-# Performance
-from aviary.subsystems.performance.performance_builder import (
-    PerformanceBuilder,
-    CorePerformanceBuilder,
-)
-
-# Propulsion
-from aviary.subsystems.propulsion.engine_deck import EngineDeck
-from aviary.subsystems.propulsion.engine_model import EngineModel
-from aviary.subsystems.propulsion.motor.motor_builder import MotorBuilder
-from aviary.subsystems.propulsion.propulsion_builder import (
-    PropulsionBuilder,
-    CorePropulsionBuilder,
-)
-from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
-from aviary.subsystems.propulsion.gearbox.gearbox_builder import GearboxBuilder
-from aviary.subsystems.propulsion.motor.motor_builder import MotorBuilder
-from aviary.subsystems.propulsion.propeller.propeller_builder import PropellerBuilder
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
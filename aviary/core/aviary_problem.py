@@ -1,8 +1,10 @@
 import csv
 import json
 import os
+import pickle
 import subprocess
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
@@ -19,7 +21,9 @@ from openmdao.utils.units import convert_units
 from packaging import version
 
 from aviary.core.aviary_group import AviaryGroup
+from aviary.interface.coloring_cache import ColoringCache
 from aviary.interface.utils import set_warning_format
+from aviary.interface.warm_start import WarmStartStore
 from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.csv_data_file import write_data_file
 from aviary.utils.functions import convert_strings_to_data, get_path
@@ -52,6 +56,15 @@ class AviaryProblem(om.Problem):
     meta_data : dict, optional
         Variable metadata used throughout the problem. Defaults to a copy of the Aviary base
         metadata.
+    parallel_missions : bool or None, optional
+        Only used for multi-mission problems. If True, the AviaryGroups of each mission are added
+        to a ParallelGroup, so they can be distributed across MPI processes. If None, missions are
+        run in parallel when the problem's communicator has more than one process.
+    coloring_cache : bool, str, Path, or ColoringCache, optional
+        Directory where derivative colorings are stored, so they are reused by later problems with
+        the same model structure instead of being recomputed. If True, the 'coloring_cache'
+        directory next to the problem's output directory is used. If False, colorings are not
+        stored. Defaults to False.
     **kwargs : dict
         Additional keyword arguments passed to ``om.Problem.__init__``.
 
@@ -67,6 +80,11 @@ class AviaryProblem(om.Problem):
         The loaded aircraft and mission input data.
     aviary_groups_dict : dict
         Dictionary mapping names to AviaryGroup instances, used for multi-mission problems.
+    parallel_missions : bool
+        Flag indicating whether the AviaryGroups of a multi-mission problem are added to a
+        ParallelGroup.
+    coloring_cache : bool, str, Path, or ColoringCache
+        Directory where derivative colorings are stored, or False if colorings are not stored.
     meta_data : dict
         Variable metadata used throughout the problem.
     generate_payload_range : bool
@@ -78,6 +96,8 @@ class AviaryProblem(om.Problem):
         problem_type: ProblemType = None,
         verbosity=None,
         meta_data=CoreMetaData.copy(),
+        parallel_missions=None,
+        coloring_cache=False,
         **kwargs,
     ):
         # Modify OpenMDAO's default_reports for this session.
@@ -89,6 +109,7 @@ class AviaryProblem(om.Problem):
             'sizing_results',
             'input_checks',
             'overridden_variables',
+            'performance',
         ]
         for report in new_reports:
             if report not in _default_reports:
@@ -105,16 +126,33 @@ class AviaryProblem(om.Problem):
         set_warning_format(verbosity)
 
         self.problem_type = problem_type
+        self.parallel_missions = False
         if problem_type == ProblemType.MULTI_MISSION:
             self.model = om.Group()
+
+            if parallel_missions is None:
+                parallel_missions = self.comm.size > 1
+            self.parallel_missions = parallel_missions
+
+            if parallel_missions:
+                # Each mission only depends on the shared design variables, which are promoted to
+                # the top of the model, so the missions can be run concurrently. Promoting
+                # everything keeps the same variable names as a serial multi-mission problem.
+                self._mission_parent = self.model.add_subsystem(
+                    'missions', om.ParallelGroup(), promotes=['*']
+                )
+            else:
+                self._mission_parent = self.model
         else:
-            self.model = AviaryGroup()
+            self.model = self._mission_parent = AviaryGroup()
             # This causes problems where aviary_inputs are stored in different places for
             # multi-mission vs. standard mission
             self.aviary_inputs = None
 
         self.aviary_groups_dict = {}
 
+        self.coloring_cache = coloring_cache
+
         self.meta_data = meta_data
 
         # TODO try and find a better solution than a new custom flag - the issue is multimission
@@ -290,7 +328,7 @@ class AviaryProblem(om.Problem):
                 'add_aviary_group() should only be called when ProblemType is MULTI_MISSION.'
             )
 
-        sub = self.model.add_subsystem(name, AviaryGroup())
+        sub = AviaryGroup()
         sub.meta_data = self.meta_data
         sub.load_inputs(
             aircraft_data=aircraft,
@@ -302,6 +340,12 @@ class AviaryProblem(om.Problem):
 
         sub.check_and_preprocess_inputs()
 
+        # When missions are distributed across MPI processes, processes are allocated in
+        # proportion to the size of each mission
+        self._mission_parent.add_subsystem(
+            name, sub, proc_weight=_count_mission_nodes(sub.mission_info)
+        )
+
         self.aviary_groups_dict[name] = sub
 
         if self.verbosity is None:
@@ -1188,7 +1232,7 @@ class AviaryProblem(om.Problem):
                     # the group name matches the mission name,
                     # group.promotes(var_pairs)
                     # print("var_pairs",var_pairs)
-                    self.model.promotes(mission_name, inputs=var_pairs)
+                    self._mission_parent.promotes(mission_name, inputs=var_pairs)
 
     def setup(self, **kwargs):
         """
@@ -1210,9 +1254,14 @@ class AviaryProblem(om.Problem):
 
         # Use OpenMDAO's model options to pass all options through the system hierarchy.
         if self.problem_type == ProblemType.MULTI_MISSION:
+            if self.parallel_missions:
+                prefix = self._mission_parent.name + '.'
+            else:
+                prefix = ''
+
             for name, group in self.aviary_groups_dict.items():
                 setup_model_options(
-                    self, group.aviary_inputs, group.meta_data, prefix=name, group=group
+                    self, group.aviary_inputs, group.meta_data, prefix=prefix + name, group=group
                 )
                 with warnings.catch_warnings():
                     # group.aviary_inputs is already set
@@ -1267,6 +1316,10 @@ class AviaryProblem(om.Problem):
 
         if self.problem_type == ProblemType.MULTI_MISSION:
             for name, group in self.aviary_groups_dict.items():
+                if not group._is_local:
+                    # this mission is running on other MPI processes
+                    continue
+
                 group.set_initial_guesses(
                     parent_prob=parent_prob,
                     parent_prefix=parent_prefix,
@@ -1289,6 +1342,7 @@ class AviaryProblem(om.Problem):
         make_plots=True,
         verbosity=None,
         real_time_plotting=False,
+        warm_start=None,
     ):
         """
         Run the Aviary problem.
@@ -1315,6 +1369,11 @@ class AviaryProblem(om.Problem):
             verbosity.
         real_time_plotting : bool, optional
             If True, enables real-time plotting of the optimization progress.
+        warm_start : str, Path, or WarmStartStore, optional
+            Directory of previously converged solutions. Unless ``restart_filename`` is given, the
+            problem is seeded with the stored solution that best matches its phases and
+            transcriptions before running, and the solution is added to the directory if the
+            optimization succeeds.
         """
         # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
         # override for just this method
@@ -1324,6 +1383,14 @@ class AviaryProblem(om.Problem):
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
+        if warm_start is not None and not isinstance(warm_start, WarmStartStore):
+            warm_start = WarmStartStore(warm_start)
+
+        if warm_start is not None and restart_filename is None:
+            warm_start_file = warm_start.load(self)
+            if warm_start_file is not None and verbosity >= Verbosity.BRIEF:
+                print(f'Using initial guess from warm start file {warm_start_file}')
+
         if (
             verbosity >= Verbosity.VERBOSE or real_time_plotting
         ):  # If real_time_plotting needs a driver recorder file to run the realtime plot server
@@ -1331,6 +1398,12 @@ class AviaryProblem(om.Problem):
             self.driver.add_recorder(recorder)
             self.final_setup()
 
+        coloring_cache = self._get_coloring_cache()
+        if coloring_cache is not None:
+            num_loaded = coloring_cache.load(self)
+            if num_loaded and verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
+                print(f'Loaded {num_loaded} colorings from {coloring_cache.directory}')
+
         if verbosity >= Verbosity.VERBOSE:  # VERBOSE, DEBUG
             with open(self.get_reports_dir() / 'input_list.txt', 'w') as outfile:
                 self.model.list_inputs(out_stream=outfile)
@@ -1384,10 +1457,16 @@ class AviaryProblem(om.Problem):
                 not self.result.success and verbosity <= Verbosity.BRIEF  # QUIET, BRIEF
             ):
                 warnings.warn('\nAviary run failed. See the dashboard for more details.\n')
+
+            if warm_start is not None and self.result.success:
+                warm_start.save(self)
         else:
             self.run_model()
             self.result = self.driver.result
 
+        if coloring_cache is not None:
+            coloring_cache.save(self)
+
         # update n2 diagram after run.
         outdir = Path(self.get_reports_dir(force=True))
         outfile = os.path.join(outdir, 'n2.html')
@@ -1485,229 +1564,278 @@ class AviaryProblem(om.Problem):
         Returns
         -------
         AviaryProblem
-            The completed off-design AviaryProblem after running.
+            The completed off-design AviaryProblem after running. Its
+            ``rerun_off_design_mission`` method re-solves it with a new gross mass, range, or cargo
+            without repeating setup.
 
         Raises
         ------
         UserWarning
             If ``problem_type`` is ``SIZING``, or if both ``fill_cargo`` and ``fill_fuel`` are True.
         """
-        # For off-design missions, provided verbosity will be used for all L2 method calls
+        return _run_off_design_mission(
+            self._get_off_design_sizing_data(),
+            problem_type=problem_type,
+            phase_info=phase_info,
+            equations_of_motion=equations_of_motion,
+            problem_configurator=problem_configurator,
+            num_first_class=num_first_class,
+            num_business=num_business,
+            num_economy=num_economy,
+            num_pax=num_pax,
+            wing_cargo=wing_cargo,
+            misc_cargo=misc_cargo,
+            cargo_mass=cargo_mass,
+            mission_gross_mass=mission_gross_mass,
+            mission_range=mission_range,
+            optimizer=optimizer,
+            name=name,
+            fill_cargo=fill_cargo,
+            fill_fuel=fill_fuel,
+            verbosity=verbosity,
+        )
+
+    def run_off_design_missions(self, missions, num_procs=None, verbosity=None):
+        """
+        Run a batch of off-design missions using a previously sized aircraft.
+
+        Each mission is run as a separate AviaryProblem in a pool of worker processes. The data
+        needed from the current (sizing) problem is pickled once and sent to each worker when it
+        starts, so missions do not depend on each other or on the current problem.
+
+        Parameters
+        ----------
+        missions : list of dict
+            Keyword arguments of ``run_off_design_mission`` for each off-design mission.
+            ``problem_type`` is required. Missions without a ``name`` are named
+            ``'{original_name}_off_design_batch_{index}'``. All values must be picklable.
+        num_procs : int, optional
+            Maximum number of worker processes. Defaults to the number of CPUs. If 1, the missions
+            are run one after another in the current process.
+        verbosity : Verbosity or int, optional
+            Controls the level of terminal output for missions that do not provide their own
+            verbosity. If None, uses the problem-level verbosity.
+
+        Returns
+        -------
+        NamedValues
+            Results table with one entry per mission, in the order provided: 'Mission Name',
+            'Problem Type', 'Success', 'Payload', 'Fuel', 'Range', and 'Gross Mass'. Missions
+            that raised an error are not successful and have NaN results.
+
+        Notes
+        -----
+        Worker processes are created using the default multiprocessing start method of the
+        platform. If that is 'spawn' (Windows and macOS), scripts calling this method must guard
+        their entry point with ``if __name__ == '__main__':``.
+        """
         if verbosity is not None:
             # compatibility with being passed int for verbosity
             verbosity = Verbosity(verbosity)
         else:
             verbosity = self.verbosity  # defaults to BRIEF
 
-        # accept str for problem type
-        problem_type = ProblemType(problem_type)
-        if problem_type is ProblemType.SIZING:
-            raise UserWarning('Off-design missions cannot be SIZING missions.')
+        missions = [dict(mission) for mission in missions]
+        for idx, mission in enumerate(missions):
+            # accept str for problem type, and catch invalid ones before starting any missions
+            mission['problem_type'] = ProblemType(mission['problem_type'])
+            # name every mission up front, so parallel missions can't pick the same output
+            # directory
+            mission.setdefault('name', f'{self._name}_off_design_batch_{idx}')
+            mission.setdefault('verbosity', verbosity)
 
-        if fill_cargo and fill_fuel:
-            raise UserWarning(
-                'Cannot run an off-design mission with both "fill_cargo" and "fill_fuel" flags '
-                'active.'
-            )
-
-        if name is None:
-            # increment the name if the output directory already exists
-            #    to avoid overwriting previous off-design runs
-            base_name = self._name + '_off_design'
-            for design_number in count(0):
-                name = base_name if design_number == 0 else f'{base_name}_{design_number}'
-                output_path = Path(f'{name}_out')
-                if not output_path.is_dir():
-                    break
-        off_design_prob = AviaryProblem(name=name)
-
-        # Set up problem for mission, such as equations of motion, configurators, etc.
-        inputs = deepcopy(self.aviary_inputs)
-
-        design_gross_mass = self.get_val(Aircraft.Design.GROSS_MASS, units='lbm')[0]
-        inputs.set_val(Aircraft.Design.GROSS_MASS, design_gross_mass, units='lbm')
-
-        if problem_type is not None:
-            inputs.set_val(Settings.PROBLEM_TYPE, problem_type)
-        if equations_of_motion is not None:
-            inputs.set_val(Settings.EQUATIONS_OF_MOTION, equations_of_motion)
-
-        if problem_configurator is not None:
-            off_design_prob.model.configurator = problem_configurator
-
-        if phase_info is None:
-            # model phase_info only contains mission information, recreate the whole thing here
-            phase_info = self.model.mission_info.copy()
-            phase_info['pre_mission'] = self.model.pre_mission_info.copy()
-            phase_info['post_mission'] = self.model.post_mission_info.copy()
+        sizing_data = self._get_off_design_sizing_data()
 
-        # update passenger count and cargo masses
-        mass_method = inputs.get_val(Settings.MASS_METHOD)
+        if num_procs is None:
+            num_procs = os.cpu_count() or 1
+        num_procs = max(1, min(num_procs, len(missions)))
 
-        # Sanity check passenger counts - cover specific edge case that preprocessors won't catch
-        # Since we inherit mission pax count from sizing mission, we need to overwrite it
-        if (
-            mass_method is FLOPS
-            and num_pax is None
-            and not any((num_economy, num_business, num_first_class))
-        ):
-            num_pax = sum(filter(None, [num_economy, num_business, num_first_class]))
-
-        # only FLOPS cares about seat class or specific cargo categories
-        if mass_method == LegacyCode.FLOPS:
-            if num_first_class is not None:
-                inputs.set_val(Aircraft.CrewPayload.NUM_FIRST_CLASS, num_first_class)
-            if num_business is not None:
-                inputs.set_val(Aircraft.CrewPayload.NUM_BUSINESS_CLASS, num_business)
-            if num_economy is not None:
-                inputs.set_val(Aircraft.CrewPayload.NUM_ECONOMY_CLASS, num_economy)
-
-            if wing_cargo is not None:
-                inputs.set_val(Aircraft.CrewPayload.WING_CARGO, wing_cargo, 'lbm')
-            if misc_cargo is not None:
-                inputs.set_val(Aircraft.CrewPayload.MISC_CARGO, misc_cargo, 'lbm')
+        if num_procs == 1:
+            results = [_run_off_design_case(sizing_data, mission) for mission in missions]
         else:
-            warnings.warn(
-                'Off-design functionality is in beta for GASP-mass based aircraft. Please manually '
-                'verify your results.'
-            )
-
-        if num_pax is not None:
-            inputs.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, num_pax)
-        if cargo_mass is not None:
-            inputs.set_val(Aircraft.CrewPayload.CARGO_MASS, cargo_mass, 'lbm')
-
-        # NOTE once load_inputs is run, phase info details are stored in prob.model.configurator,
-        #      meaning any phase_info changes that happen after load inputs is ignored
+            with ProcessPoolExecutor(
+                max_workers=num_procs,
+                initializer=_init_off_design_worker,
+                initargs=(pickle.dumps(sizing_data),),
+            ) as executor:
+                results = list(executor.map(_run_off_design_worker, missions))
+
+        off_design_results = NamedValues()
+        off_design_results.set_val('Mission Name', [mission['name'] for mission in missions])
+        off_design_results.set_val(
+            'Problem Type', [mission['problem_type'].value for mission in missions]
+        )
+        off_design_results.set_val('Success', [result['Success'] for result in results])
+        for column, _, units in _off_design_result_columns:
+            off_design_results.set_val(column, [result[column] for result in results], units)
 
-        if problem_type is ProblemType.OFF_DESIGN_MIN_FUEL:
-            # Set mission range, aviary will calculate required fuel
-            if mission_range is None:
-                if verbosity >= Verbosity.VERBOSE:
+        if verbosity > Verbosity.QUIET:
+            for mission, result in zip(missions, results):
+                if result['Error'] is not None:
                     warnings.warn(
-                        'OFF_DESIGN_MIN_FUEL problem type requested with no specified range. Using design '
-                        'mission range for the off-design mission.'
+                        f'Off-design mission "{mission["name"]}" failed: {result["Error"]}'
                     )
-                mission_range = self.get_val(Mission.RANGE, units='NM')[0]
 
-            phase_info['post_mission']['target_range'] = (
-                mission_range,
-                'nmi',
+        return off_design_results
+
+    def rerun_off_design_mission(
+        self,
+        mission_gross_mass=None,
+        mission_range=None,
+        wing_cargo=None,
+        misc_cargo=None,
+        cargo_mass=None,
+        verbosity=None,
+    ):
+        """
+        Re-solve this off-design problem with new mission inputs.
+
+        The model is not rebuilt or set up again. The total derivative coloring computed by the
+        previous solve is reused, and the previous solution is used as the initial guess. Use this
+        on the problem returned by ``run_off_design_mission`` to fly the same aircraft on a series
+        of missions that only differ in gross mass, range, or cargo.
+
+        Parameters
+        ----------
+        mission_gross_mass : float, optional
+            Gross mass for the mission, in lbm. For OFF_DESIGN_MIN_FUEL missions, this is the
+            initial guess.
+        mission_range : float, optional
+            Fixed range for OFF_DESIGN_MIN_FUEL missions, in nautical miles. Unused for other
+            mission types.
+        wing_cargo : float, optional
+            Mass of wing cargo, in lbm. FLOPS mass method only.
+        misc_cargo : float, optional
+            Mass of miscellaneous cargo, in lbm. FLOPS mass method only.
+        cargo_mass : float, optional
+            Total cargo mass, in lbm. GASP mass method only.
+        verbosity : Verbosity or int, optional
+            Controls the level of terminal output for this method. If None, uses the problem-level
+            verbosity.
+
+        Returns
+        -------
+        AviaryProblem
+            This off-design problem, after running.
+
+        Raises
+        ------
+        UserWarning
+            If this is not an off-design problem, or if cargo is given that is not an input of
+            the mass method being used.
+
+        Notes
+        -----
+        Inputs that change the structure of the model, such as passenger counts or phase info,
+        require a new call to ``run_off_design_mission``. Results of each re-solve overwrite the
+        output files of the previous one.
+        """
+        # `self.verbosity` is "true" verbosity for entire run. `verbosity` is verbosity
+        # override for just this method
+        if verbosity is not None:
+            # compatibility with being passed int for verbosity
+            verbosity = Verbosity(verbosity)
+        else:
+            verbosity = self.verbosity  # defaults to BRIEF
+
+        if self.problem_type not in (
+            ProblemType.OFF_DESIGN_MIN_FUEL,
+            ProblemType.OFF_DESIGN_MAX_RANGE,
+        ):
+            raise UserWarning(
+                f'Cannot rerun a {self.problem_type.value} problem as an off-design mission.'
             )
 
-        # reset the AviaryProblem to run the new mission
-        off_design_prob.load_inputs(inputs, phase_info, verbosity=verbosity)
-
-        # Update inputs that are specific to problem type
-        # Some OFF_DESIGN_MIN_FUEL problem changes had to happen before load_inputs, all OFF_DESIGN_MAX_RANGE problem
-        # changes must come after load_inputs
-        if problem_type is ProblemType.OFF_DESIGN_MIN_FUEL:
-            off_design_prob.aviary_inputs.set_val(Mission.RANGE, mission_range, units='NM')
-            # set initial guess for Mission.GROSS_MASS to help optimizer with new design
-            # variable bounds.
-            if mission_gross_mass is None:
-                mission_gross_mass = off_design_prob.aviary_inputs.get_val(
-                    Aircraft.Design.GROSS_MASS, 'lbm'
+        # FLOPS cargo mass is computed from wing and misc cargo, GASP only uses total cargo mass
+        if self.aviary_inputs.get_val(Settings.MASS_METHOD) is FLOPS:
+            cargo = {
+                Aircraft.CrewPayload.WING_CARGO: wing_cargo,
+                Aircraft.CrewPayload.MISC_CARGO: misc_cargo,
+            }
+            if cargo_mass is not None:
+                raise UserWarning(
+                    'Cannot change "cargo_mass" of an off-design mission using FLOPS mass. Use '
+                    '"wing_cargo" and "misc_cargo" instead.'
+                )
+        else:
+            cargo = {Aircraft.CrewPayload.CARGO_MASS: cargo_mass}
+            if wing_cargo is not None or misc_cargo is not None:
+                raise UserWarning(
+                    'Cannot change "wing_cargo" or "misc_cargo" of an off-design mission using '
+                    'GASP mass. Use "cargo_mass" instead.'
                 )
-            off_design_prob.aviary_inputs.set_val(
-                Mission.GROSS_MASS, mission_gross_mass * 0.9, units='lbm'
-            )
 
-        elif problem_type is ProblemType.OFF_DESIGN_MAX_RANGE:
-            # Set mission fuel and calculate gross weight, aviary will calculate range
-            if mission_gross_mass is None:
-                if verbosity >= Verbosity.VERBOSE:
-                    warnings.warn(
-                        'OFF_DESIGN_MAX_RANGE problem type requested with no specified gross mass. Using design '
-                        'takeoff gross mass for the off-design mission.'
-                    )
-                mission_gross_mass = self.get_val(Aircraft.Design.GROSS_MASS, units='lbm')[0]
+        for var_name, val in cargo.items():
+            if val is not None:
+                self.aviary_inputs.set_val(var_name, val, 'lbm')
+                self.set_val(var_name, val, units='lbm')
 
-            off_design_prob.aviary_inputs.set_val(
-                Mission.GROSS_MASS, mission_gross_mass, units='lbm'
-            )
+        if mission_gross_mass is not None:
+            self.aviary_inputs.set_val(Mission.GROSS_MASS, mission_gross_mass, units='lbm')
+            self.set_val(Mission.GROSS_MASS, mission_gross_mass, units='lbm')
 
-        off_design_prob.check_and_preprocess_inputs(verbosity=verbosity)
-        # off_design_prob.add_pre_mission_systems(verbosity=verbosity)
-        # off_design_prob.add_phases(verbosity=verbosity)
-        # off_design_prob.add_post_mission_systems(verbosity=verbosity)
-        # off_design_prob.link_phases(verbosity=verbosity)
-        off_design_prob.build_model(verbosity=verbosity)
+        if mission_range is not None and self.problem_type is ProblemType.OFF_DESIGN_MIN_FUEL:
+            self.aviary_inputs.set_val(Mission.RANGE, mission_range, units='NM')
+            self.set_val('target_range', mission_range, units='NM')
 
-        if optimizer is None:
-            try:
-                optimizer = self.driver.options['optimizer']
-            except KeyError:
-                optimizer = None
-        try:
-            if optimizer == 'SNOPT':
-                max_iter = self.driver.opt_settings['Major iterations limit']
-            elif optimizer == 'IPOPT':
-                max_iter = self.driver.opt_settings['max_iter']
-            elif optimizer == 'SLSQP':
-                max_iter = self.driver.opt_settings['maxiter']
-            else:
-                max_iter = None
-        except KeyError:
-            max_iter = None
-        off_design_prob.add_driver(optimizer=optimizer, max_iter=max_iter, verbosity=verbosity)
-        off_design_prob.add_design_variables(verbosity=verbosity)
-
-        # Handle edge case for payload-range diagrams
-        # Select which cargo variable makes the most sense to float, and then set a tolerance
-        # based on rough guesses on what is sufficient to get the problem to converge without
-        # setting design variable bounds too large
-        if fill_cargo:
-            # GASP cargo mass is an input, can directly use as control variable
-            if mass_method is GASP:
-                control_var = Aircraft.CrewPayload.CARGO_MASS
-                val = cargo_mass
-                tol = 1.05
-            # FLOPS cargo mass is an output, not valid for control variable. Pick control var.
-            else:
-                # See if misc_cargo is being used, float that as a backup
-                if misc_cargo is None or misc_cargo == 0:
-                    # We aren't using cargo_mass OR misc_mass - try wing cargo as last resort
-                    if wing_cargo is None or wing_cargo == 0:
-                        # We don't know enough about the aircraft to make any informed guesses. Use
-                        # arbitrary values
-                        control_var = Aircraft.CrewPayload.MISC_CARGO
-                        val = self.get_val(Aircraft.Design.GROSS_MASS)
-                        tol = 0.05
-                        inputs.set_val(Aircraft.CrewPayload.CARGO_MASS, 0, 'lbm')
-                    else:
-                        control_var = Aircraft.CrewPayload.WING_CARGO
-                        val = wing_cargo
-                        tol = 1.1
-                else:
-                    control_var = Aircraft.CrewPayload.MISC_CARGO
-                    val = misc_cargo
-                    tol = 1.1
+        # final_setup resets dynamic coloring, so fix the driver to the one computed by the
+        # previous solve
+        coloring = self.driver._coloring_info.coloring
+        if coloring is not None:
+            self.driver.use_fixed_coloring(coloring)
 
-            off_design_prob.model.add_design_var(
-                control_var,
-                lower=0,
-                upper=val * tol,
-                ref=val,
-            )
+        self.run_aviary_problem(verbosity=verbosity)
 
-        if fill_fuel:
-            off_design_prob.model.add_design_var(
-                Mission.GROSS_MASS,
-                lower=0,
-                upper=off_design_prob.aviary_inputs.get_val(
-                    Aircraft.Design.GROSS_MASS, units='lbm'
-                ),
-                ref=off_design_prob.aviary_inputs.get_val(Aircraft.Design.GROSS_MASS, units='lbm'),
-            )
+        return self
+
+    def _get_coloring_cache(self):
+        """
+        Get the store of derivative colorings used by this problem.
 
-        off_design_prob.add_objective(verbosity=verbosity)
-        off_design_prob.setup(verbosity=verbosity)
-        off_design_prob.set_initial_guesses(verbosity=verbosity)
+        Returns
+        -------
+        ColoringCache or None
+            The store of derivative colorings, or None if colorings are not stored.
+        """
+        coloring_cache = self.coloring_cache
+        if coloring_cache is False or coloring_cache is None:
+            return None
 
-        off_design_prob.run_aviary_problem(verbosity=verbosity)
+        if coloring_cache is True:
+            coloring_cache = Path(self.get_outputs_dir()).parent / 'coloring_cache'
 
-        return off_design_prob
+        if not isinstance(coloring_cache, ColoringCache):
+            coloring_cache = ColoringCache(coloring_cache)
+
+        return coloring_cache
+
+    def _get_off_design_sizing_data(self):
+        """
+        Collect the data from the current (sizing) problem needed to run off-design missions.
+
+        Returns
+        -------
+        dict
+            Picklable sizing data used by off-design missions.
+        """
+        try:
+            optimizer = self.driver.options['optimizer']
+        except KeyError:
+            optimizer = None
+
+        return {
+            'name': self._name,
+            'verbosity': self.verbosity,
+            'aviary_inputs': self.aviary_inputs,
+            'mission_info': self.model.mission_info,
+            'pre_mission_info': self.model.pre_mission_info,
+            'post_mission_info': self.model.post_mission_info,
+            'design_gross_mass': self.get_val(Aircraft.Design.GROSS_MASS, units='lbm')[0],
+            'design_range': self.get_val(Mission.RANGE, units='NM')[0],
+            'optimizer': optimizer,
+            'opt_settings': dict(getattr(self.driver, 'opt_settings', {})),
+            'coloring_cache': self.coloring_cache,
+        }
 
     def run_payload_range(self, verbosity=None):
         """
@@ -2038,6 +2166,360 @@ class AviaryProblem(om.Problem):
         )
 
 
+def _count_mission_nodes(mission_info):
+    """
+    Count the nodes in the transcriptions of a mission, used to balance parallel missions.
+
+    Parameters
+    ----------
+    mission_info : dict
+        Phase info for each phase of the mission, without pre-mission and post-mission.
+
+    Returns
+    -------
+    int
+        Approximate number of nodes in the mission. Phases that do not specify a number of
+        segments are counted as a single segment.
+    """
+    num_nodes = 0
+    for phase_info in mission_info.values():
+        user_options = phase_info.get('user_options', {})
+        num_nodes += user_options.get('num_segments', 1) * user_options.get('order', 3)
+
+    return max(num_nodes, 1)
+
+
+def _build_off_design_mission(
+    sizing_data,
+    problem_type: ProblemType,
+    phase_info=None,
+    equations_of_motion: EquationsOfMotion = None,
+    problem_configurator=None,
+    num_first_class=None,
+    num_business=None,
+    num_economy=None,
+    num_pax=None,
+    wing_cargo=None,
+    misc_cargo=None,
+    cargo_mass=None,
+    mission_gross_mass=None,
+    mission_range=None,
+    optimizer=None,
+    name=None,
+    fill_cargo=False,
+    fill_fuel=False,
+    verbosity=None,
+):
+    """
+    Build and set up an off-design mission for a sized aircraft, without running it.
+
+    See ``AviaryProblem.run_off_design_mission`` for a description of the mission arguments.
+
+    Parameters
+    ----------
+    sizing_data : dict
+        Data from the sizing problem, as returned by
+        ``AviaryProblem._get_off_design_sizing_data``.
+
+    Returns
+    -------
+    AviaryProblem
+        The off-design AviaryProblem, set up and ready to run.
+    """
+    # For off-design missions, provided verbosity will be used for all L2 method calls
+    if verbosity is not None:
+        # compatibility with being passed int for verbosity
+        verbosity = Verbosity(verbosity)
+    else:
+        verbosity = sizing_data['verbosity']  # defaults to BRIEF
+
+    # accept str for problem type
+    problem_type = ProblemType(problem_type)
+    if problem_type is ProblemType.SIZING:
+        raise UserWarning('Off-design missions cannot be SIZING missions.')
+
+    if fill_cargo and fill_fuel:
+        raise UserWarning(
+            'Cannot run an off-design mission with both "fill_cargo" and "fill_fuel" flags active.'
+        )
+
+    if name is None:
+        # increment the name if the output directory already exists
+        #    to avoid overwriting previous off-design runs
+        base_name = sizing_data['name'] + '_off_design'
+        for design_number in count(0):
+            name = base_name if design_number == 0 else f'{base_name}_{design_number}'
+            output_path = Path(f'{name}_out')
+            if not output_path.is_dir():
+                break
+    # off-design missions share the coloring cache of the sizing problem, so their phases can
+    # reuse its partial colorings
+    off_design_prob = AviaryProblem(name=name, coloring_cache=sizing_data['coloring_cache'])
+
+    # Set up problem for mission, such as equations of motion, configurators, etc.
+    inputs = deepcopy(sizing_data['aviary_inputs'])
+
+    design_gross_mass = sizing_data['design_gross_mass']
+    inputs.set_val(Aircraft.Design.GROSS_MASS, design_gross_mass, units='lbm')
+
+    if problem_type is not None:
+        inputs.set_val(Settings.PROBLEM_TYPE, problem_type)
+    if equations_of_motion is not None:
+        inputs.set_val(Settings.EQUATIONS_OF_MOTION, equations_of_motion)
+
+    if problem_configurator is not None:
+        off_design_prob.model.configurator = problem_configurator
+
+    if phase_info is None:
+        # model phase_info only contains mission information, recreate the whole thing here
+        phase_info = sizing_data['mission_info'].copy()
+        phase_info['pre_mission'] = sizing_data['pre_mission_info'].copy()
+        phase_info['post_mission'] = sizing_data['post_mission_info'].copy()
+
+    # update passenger count and cargo masses
+    mass_method = inputs.get_val(Settings.MASS_METHOD)
+
+    # Sanity check passenger counts - cover specific edge case that preprocessors won't catch
+    # Since we inherit mission pax count from sizing mission, we need to overwrite it
+    if (
+        mass_method is FLOPS
+        and num_pax is None
+        and not any((num_economy, num_business, num_first_class))
+    ):
+        num_pax = sum(filter(None, [num_economy, num_business, num_first_class]))
+
+    # only FLOPS cares about seat class or specific cargo categories
+    if mass_method == LegacyCode.FLOPS:
+        if num_first_class is not None:
+            inputs.set_val(Aircraft.CrewPayload.NUM_FIRST_CLASS, num_first_class)
+        if num_business is not None:
+            inputs.set_val(Aircraft.CrewPayload.NUM_BUSINESS_CLASS, num_business)
+        if num_economy is not None:
+            inputs.set_val(Aircraft.CrewPayload.NUM_ECONOMY_CLASS, num_economy)
+
+        if wing_cargo is not None:
+            inputs.set_val(Aircraft.CrewPayload.WING_CARGO, wing_cargo, 'lbm')
+        if misc_cargo is not None:
+            inputs.set_val(Aircraft.CrewPayload.MISC_CARGO, misc_cargo, 'lbm')
+    else:
+        warnings.warn(
+            'Off-design functionality is in beta for GASP-mass based aircraft. Please manually '
+            'verify your results.'
+        )
+
+    if num_pax is not None:
+        inputs.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, num_pax)
+    if cargo_mass is not None:
+        inputs.set_val(Aircraft.CrewPayload.CARGO_MASS, cargo_mass, 'lbm')
+
+    # NOTE once load_inputs is run, phase info details are stored in prob.model.configurator,
+    #      meaning any phase_info changes that happen after load inputs is ignored
+
+    if problem_type is ProblemType.OFF_DESIGN_MIN_FUEL:
+        # Set mission range, aviary will calculate required fuel
+        if mission_range is None:
+            if verbosity >= Verbosity.VERBOSE:
+                warnings.warn(
+                    'OFF_DESIGN_MIN_FUEL problem type requested with no specified range. Using design '
+                    'mission range for the off-design mission.'
+                )
+            mission_range = sizing_data['design_range']
+
+        phase_info['post_mission']['target_range'] = (
+            mission_range,
+            'nmi',
+        )
+
+    # reset the AviaryProblem to run the new mission
+    off_design_prob.load_inputs(inputs, phase_info, verbosity=verbosity)
+
+    # Update inputs that are specific to problem type
+    # Some OFF_DESIGN_MIN_FUEL problem changes had to happen before load_inputs, all OFF_DESIGN_MAX_RANGE problem
+    # changes must come after load_inputs
+    if problem_type is ProblemType.OFF_DESIGN_MIN_FUEL:
+        off_design_prob.aviary_inputs.set_val(Mission.RANGE, mission_range, units='NM')
+        # set initial guess for Mission.GROSS_MASS to help optimizer with new design
+        # variable bounds.
+        if mission_gross_mass is None:
+            mission_gross_mass = off_design_prob.aviary_inputs.get_val(
+                Aircraft.Design.GROSS_MASS, 'lbm'
+            )
+        off_design_prob.aviary_inputs.set_val(
+            Mission.GROSS_MASS, mission_gross_mass * 0.9, units='lbm'
+        )
+
+    elif problem_type is ProblemType.OFF_DESIGN_MAX_RANGE:
+        # Set mission fuel and calculate gross weight, aviary will calculate range
+        if mission_gross_mass is None:
+            if verbosity >= Verbosity.VERBOSE:
+                warnings.warn(
+                    'OFF_DESIGN_MAX_RANGE problem type requested with no specified gross mass. Using design '
+                    'takeoff gross mass for the off-design mission.'
+                )
+            mission_gross_mass = design_gross_mass
+
+        off_design_prob.aviary_inputs.set_val(Mission.GROSS_MASS, mission_gross_mass, units='lbm')
+
+    off_design_prob.check_and_preprocess_inputs(verbosity=verbosity)
+    # off_design_prob.add_pre_mission_systems(verbosity=verbosity)
+    # off_design_prob.add_phases(verbosity=verbosity)
+    # off_design_prob.add_post_mission_systems(verbosity=verbosity)
+    # off_design_prob.link_phases(verbosity=verbosity)
+    off_design_prob.build_model(verbosity=verbosity)
+
+    if optimizer is None:
+        optimizer = sizing_data['optimizer']
+    opt_settings = sizing_data['opt_settings']
+    try:
+        if optimizer == 'SNOPT':
+            max_iter = opt_settings['Major iterations limit']
+        elif optimizer == 'IPOPT':
+            max_iter = opt_settings['max_iter']
+        elif optimizer == 'SLSQP':
+            max_iter = opt_settings['maxiter']
+        else:
+            max_iter = None
+    except KeyError:
+        max_iter = None
+    off_design_prob.add_driver(optimizer=optimizer, max_iter=max_iter, verbosity=verbosity)
+    off_design_prob.add_design_variables(verbosity=verbosity)
+
+    # Handle edge case for payload-range diagrams
+    # Select which cargo variable makes the most sense to float, and then set a tolerance
+    # based on rough guesses on what is sufficient to get the problem to converge without
+    # setting design variable bounds too large
+    if fill_cargo:
+        # GASP cargo mass is an input, can directly use as control variable
+        if mass_method is GASP:
+            control_var = Aircraft.CrewPayload.CARGO_MASS
+            val = cargo_mass
+            tol = 1.05
+        # FLOPS cargo mass is an output, not valid for control variable. Pick control var.
+        else:
+            # See if misc_cargo is being used, float that as a backup
+            if misc_cargo is None or misc_cargo == 0:
+                # We aren't using cargo_mass OR misc_mass - try wing cargo as last resort
+                if wing_cargo is None or wing_cargo == 0:
+                    # We don't know enough about the aircraft to make any informed guesses. Use
+                    # arbitrary values
+                    control_var = Aircraft.CrewPayload.MISC_CARGO
+                    val = design_gross_mass
+                    tol = 0.05
+                    inputs.set_val(Aircraft.CrewPayload.CARGO_MASS, 0, 'lbm')
+                else:
+                    control_var = Aircraft.CrewPayload.WING_CARGO
+                    val = wing_cargo
+                    tol = 1.1
+            else:
+                control_var = Aircraft.CrewPayload.MISC_CARGO
+                val = misc_cargo
+                tol = 1.1
+
+        off_design_prob.model.add_design_var(
+            control_var,
+            lower=0,
+            upper=val * tol,
+            ref=val,
+        )
+
+    if fill_fuel:
+        off_design_prob.model.add_design_var(
+            Mission.GROSS_MASS,
+            lower=0,
+            upper=off_design_prob.aviary_inputs.get_val(Aircraft.Design.GROSS_MASS, units='lbm'),
+            ref=off_design_prob.aviary_inputs.get_val(Aircraft.Design.GROSS_MASS, units='lbm'),
+        )
+
+    off_design_prob.add_objective(verbosity=verbosity)
+    off_design_prob.setup(verbosity=verbosity)
+    off_design_prob.set_initial_guesses(verbosity=verbosity)
+
+    return off_design_prob
+
+
+def _run_off_design_mission(sizing_data, **kwargs):
+    """
+    Run an off-design mission for a sized aircraft.
+
+    See ``AviaryProblem.run_off_design_mission`` for a description of the mission arguments.
+
+    Parameters
+    ----------
+    sizing_data : dict
+        Data from the sizing problem, as returned by
+        ``AviaryProblem._get_off_design_sizing_data``.
+    **kwargs : dict
+        Keyword arguments of ``AviaryProblem.run_off_design_mission``.
+
+    Returns
+    -------
+    AviaryProblem
+        The completed off-design AviaryProblem after running.
+    """
+    off_design_prob = _build_off_design_mission(sizing_data, **kwargs)
+    # verbosity of the off-design problem was set by load_inputs
+    off_design_prob.run_aviary_problem()
+
+    return off_design_prob
+
+
+# columns of the table returned by AviaryProblem.run_off_design_missions: (name, variable, units)
+_off_design_result_columns = (
+    ('Payload', Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS, 'lbm'),
+    ('Fuel', Mission.FUEL, 'lbm'),
+    ('Range', Mission.RANGE, 'NM'),
+    ('Gross Mass', Mission.GROSS_MASS, 'lbm'),
+)
+
+# sizing data shared by all missions run in an off-design worker process
+_off_design_worker_data = None
+
+
+def _init_off_design_worker(pickled_sizing_data):
+    """Unpickle the sizing data when an off-design worker process starts."""
+    global _off_design_worker_data
+    _off_design_worker_data = pickle.loads(pickled_sizing_data)
+
+
+def _run_off_design_worker(mission):
+    """Run an off-design mission in a worker process."""
+    return _run_off_design_case(_off_design_worker_data, mission)
+
+
+def _run_off_design_case(sizing_data, mission):
+    """
+    Run an off-design mission and collect its results.
+
+    Parameters
+    ----------
+    sizing_data : dict
+        Data from the sizing problem, as returned by
+        ``AviaryProblem._get_off_design_sizing_data``.
+    mission : dict
+        Keyword arguments of ``_run_off_design_mission``.
+
+    Returns
+    -------
+    dict
+        Mission results keyed by column name of the off-design results table. 'Error' contains
+        the error message if the mission raised an error, otherwise None.
+    """
+    result = {'Success': False, 'Error': None}
+    try:
+        prob = _run_off_design_mission(sizing_data, **mission)
+    except Exception as error:
+        result['Error'] = f'{type(error).__name__}: {error}'
+        for column, _, _ in _off_design_result_columns:
+            result[column] = np.nan
+        return result
+
+    result['Success'] = bool(prob.result.success)
+    for column, var_name, units in _off_design_result_columns:
+        result[column] = float(prob.get_val(var_name, units=units)[0])
+
+    return result
+
+
 def _read_sizing_json(json_filename, meta_data, verbosity=Verbosity.BRIEF):
     """
     Read saved sizing results from a JSON file.
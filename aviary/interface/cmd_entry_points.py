@@ -2,14 +2,24 @@ import argparse
 import os
 import sys
 
-from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight_profile_parser
-from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
+# Only lightweight modules that define the command line options are imported here. Each command
+# imports the modules that do the actual work when it is executed.
+from aviary.interface.graphical_input_cmd import _exec_flight_profile, _setup_flight_profile_parser
+from aviary.interface.plot_drag_polar_cmd import (
+    _exec_plot_drag_polar,
+    _setup_plot_drag_polar_parser,
+)
 from aviary.interface.run_aviary import _exec_run_aviary, _setup_run_aviary_parser
 from aviary.interface.installation_test import _exec_installation_test, _setup_installation_test
 from aviary.utils.aero_table_conversion_cmd import _exec_ATC, _setup_ATC_parser
-from aviary.utils.engine_deck_conversion_cmd import _exec_EDC, _setup_EDC_parser
-from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
-from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
+from aviary.utils.engine_deck_conversion_cmd import (
+    _exec_ECD,
+    _exec_EDC,
+    _setup_ECD_parser,
+    _setup_EDC_parser,
+)
+from aviary.utils.fortran_to_aviary_cmd import _exec_F2A, _setup_F2A_parser
+from aviary.utils.propeller_map_conversion_cmd import _exec_PMC, _setup_PMC_parser
 from aviary.visualization.dashboard_cmd import _dashboard_cmd, _dashboard_setup_parser
 from aviary.visualization.realtime_plot import _rtplot_cmd, _rtplot_setup_parser
 
@@ -49,6 +59,11 @@ _convert_command_map = {
         _exec_ATC,
         'Convert FLOPS- or GASP-formatted aero data files into Aviary csv format.',
     ),
+    'compiled_engine_deck': (
+        _setup_ECD_parser,
+        _exec_ECD,
+        'Compile an Aviary-formatted engine deck into a binary format that loads without processing.',
+    ),
     'engine_deck': (
         _setup_EDC_parser,
         _exec_EDC,
@@ -84,7 +99,8 @@ def _exec_convert(options, user_args):
     if not hasattr(options, 'executor'):
         # No sub-sub-command was specified, show help
         print(
-            'Error: Please specify a conversion type (aero_table, engine_deck, fortran_to_aviary, or propeller_table)'
+            'Error: Please specify a conversion type (aero_table, compiled_engine_deck, engine_deck, '
+            'fortran_to_aviary, or propeller_table)'
         )
         print("Use 'aviary convert -h' for more information.")
         sys.exit(1)
@@ -102,7 +118,7 @@ _command_map = {
     'convert': (
         _setup_convert_parser,
         _exec_convert,
-        'Convert legacy formatted data files (aero_table, engine_deck, fortran_to_aviary, propeller_table) to Aviary format.',
+        'Convert legacy formatted data files (aero_table, engine_deck, fortran_to_aviary, propeller_table) to Aviary format, or compile engine decks (compiled_engine_deck).',
     ),
     'run_mission': (
         _setup_run_aviary_parser,
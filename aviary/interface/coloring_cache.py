@@ -0,0 +1,285 @@
+"""
+Store derivative colorings and reuse them in later problems with the same structure.
+
+Computing the total derivative coloring of a large mission takes tens of seconds and is repeated
+every time the problem is run, even though it only depends on the structure of the model. A
+ColoringCache saves the total coloring of the driver, and the partial colorings of components
+that declare one, to a directory. Each coloring is keyed by a hash of the structure it was
+computed from:
+
+- partial colorings by the class, pathname and options of the component, the sizes of its
+  variables, and the sparsity of its declared partials.
+- the total coloring by the structure of every component in the model, the connections between
+  them, the design variables and responses of the driver, and the derivative mode.
+
+Every key also includes the versions of Aviary, Dymos and OpenMDAO, so colorings are recomputed
+after an upgrade. Colorings are loaded before a problem is run if a matching one is found, and newly
+computed colorings are saved after it is run. Components are matched by pathname, so off-design
+problems built from the same phase info as a sizing problem reuse the partial colorings of their
+phases.
+
+Classes
+-------
+ColoringCache : Directory of derivative colorings keyed by model structure.
+"""
+
+import hashlib
+from pathlib import Path
+
+import dymos
+import numpy as np
+import openmdao
+from openmdao.core.component import Component
+from openmdao.core.constants import _SetupStatus
+from openmdao.utils.coloring import Coloring
+
+import aviary
+
+COLORING_EXTENSION = '.pkl'
+
+
+def _update_hash(sha, *items):
+    """Add items to a hash, using the raw bytes of numpy arrays."""
+    for item in items:
+        if isinstance(item, np.ndarray):
+            sha.update(str((item.dtype, item.shape)).encode())
+            sha.update(np.ascontiguousarray(item).tobytes())
+        else:
+            sha.update(repr(item).encode())
+
+
+def _update_hash_value(sha, value, depth=0):
+    """
+    Add an option value to a hash.
+
+    Containers are hashed item by item, and objects whose repr contains their memory address are
+    hashed by their type and attributes, so equal options give the same hash in every process.
+    """
+    if depth > 4:
+        _update_hash(sha, type(value).__qualname__)
+    elif isinstance(value, (str, bytes, bool, int, float, complex, np.generic, np.ndarray)):
+        _update_hash(sha, value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        _update_hash(sha, type(value).__qualname__, len(items))
+        for item in items:
+            _update_hash_value(sha, item, depth + 1)
+    elif isinstance(value, dict) or (hasattr(value, 'items') and callable(value.items)):
+        _update_hash(sha, type(value).__qualname__)
+        for key, item in sorted(value.items(), key=lambda kv: repr(kv[0])):
+            _update_hash(sha, key)
+            _update_hash_value(sha, item, depth + 1)
+    elif isinstance(value, type) or callable(value) and hasattr(value, '__qualname__'):
+        _update_hash(sha, getattr(value, '__module__', None), value.__qualname__)
+    elif ' at 0x' in repr(value):
+        _update_hash(sha, type(value).__module__, type(value).__qualname__)
+        _update_hash_value(sha, getattr(value, '__dict__', {}), depth + 1)
+    else:
+        _update_hash(sha, value)
+
+
+def _can_use_fixed_coloring(comp):
+    """Return True if a component can use a partial coloring computed by another problem."""
+    # ExecComps that do not declare their partials compute colored partials with their own
+    # complex step, which needs data that is only set up when the component computes its coloring
+    return getattr(comp, '_manual_decl_partials', True)
+
+
+class ColoringCache:
+    """
+    Directory of derivative colorings keyed by model structure.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory containing the colorings. It is created when the first coloring is saved.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory containing the colorings.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    @staticmethod
+    def _component_key(comp):
+        """Return the hash of the variables and declared partials of a component."""
+        sha = hashlib.sha1()
+        _update_hash(
+            sha,
+            aviary.__version__,
+            dymos.__version__,
+            openmdao.__version__,
+            type(comp).__module__,
+            type(comp).__qualname__,
+            comp.pathname,
+        )
+        # the sparsity found by a dynamic coloring can depend on any option of the component
+        for name, meta in sorted(comp.options._dict.items()):
+            _update_hash(sha, name)
+            _update_hash_value(sha, meta['val'])
+        # ExecComp partials depend on their expressions, which are not stored in options
+        _update_hash(sha, getattr(comp, '_exprs', None))
+
+        for io in ('input', 'output'):
+            for name, meta in comp._var_abs2meta[io].items():
+                _update_hash(sha, name, meta['shape'], meta['distributed'])
+
+        for key in sorted(comp._subjacs_info):
+            meta = comp._subjacs_info[key]
+            _update_hash(
+                sha, key, meta.get('shape'), meta.get('diagonal'), meta.get('method'), meta['rows']
+            )
+            _update_hash(sha, meta['cols'])
+
+        info = comp._coloring_info
+        _update_hash(sha, info.wrt_patterns, info.method, info.form, info.per_instance)
+
+        return sha.hexdigest()[:16]
+
+    def signature(self, prob):
+        """
+        Compute the keys of the colorings of a problem that has been set up.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem to compute the keys of.
+
+        Returns
+        -------
+        total_key : str
+            Hash of the structure the total coloring of the driver depends on.
+        partial_keys : dict
+            Hash of the structure of each local component, keyed by pathname.
+        """
+        # Design variables and responses of the driver are set up by final_setup. Calling it
+        # again after a run would discard the dynamic coloring of the driver.
+        if prob._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+            prob.final_setup()
+
+        model = prob.model
+        partial_keys = {
+            comp.pathname: self._component_key(comp)
+            for comp in model.system_iter(recurse=True, typ=Component)
+        }
+
+        sha = hashlib.sha1()
+        _update_hash(
+            sha,
+            aviary.__version__,
+            dymos.__version__,
+            openmdao.__version__,
+            prob._orig_mode,
+            prob._mode,
+        )
+        for path in sorted(partial_keys):
+            _update_hash(sha, path, partial_keys[path])
+
+        _update_hash(sha, sorted(model._conn_global_abs_in2out.items()))
+
+        driver = prob.driver
+        for voi in (driver._designvars, driver._responses):
+            for name, meta in voi.items():
+                indices = meta['indices']
+                _update_hash(sha, name, meta['source'], meta['size'], str(indices))
+
+        return sha.hexdigest()[:16], partial_keys
+
+    def _filename(self, kind, key):
+        return self.directory / f'{kind}_{key}{COLORING_EXTENSION}'
+
+    def load(self, prob):
+        """
+        Use stored colorings in a problem that has been set up.
+
+        The driver uses a stored total coloring if it declares a dynamic coloring, and each
+        component that declares a dynamic partial coloring uses a stored partial coloring.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem to load colorings into.
+
+        Returns
+        -------
+        int
+            Number of colorings loaded.
+        """
+        # the signature only covers local systems, so it may differ between processes
+        if prob.comm.size > 1 or not self.directory.is_dir():
+            return 0
+
+        total_key, partial_keys = self.signature(prob)
+        num_loaded = 0
+
+        driver = prob.driver
+        info = driver._coloring_info
+        if driver.supports['simultaneous_derivatives'] and info.dynamic:
+            filename = self._filename('total', total_key)
+            if filename.is_file():
+                driver.use_fixed_coloring(Coloring.load(filename))
+                num_loaded += 1
+
+        for comp in prob.model.system_iter(recurse=True):
+            info = comp._coloring_info
+            if (
+                comp.pathname not in partial_keys
+                or not info.dynamic
+                or info.coloring is not None
+                or not _can_use_fixed_coloring(comp)
+            ):
+                continue
+
+            filename = self._filename('partial', partial_keys[comp.pathname])
+            if filename.is_file():
+                comp.use_fixed_coloring(Coloring.load(filename), recurse=False)
+                num_loaded += 1
+
+        return num_loaded
+
+    def save(self, prob):
+        """
+        Store the colorings computed by a problem that has been run.
+
+        Colorings that are already stored are not written again.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem to save the colorings of.
+
+        Returns
+        -------
+        int
+            Number of colorings saved.
+        """
+        if prob.comm.size > 1:
+            return 0
+
+        total_key, partial_keys = self.signature(prob)
+        colorings = {}
+
+        coloring = prob.driver._coloring_info.coloring
+        if coloring is not None:
+            colorings[self._filename('total', total_key)] = coloring
+
+        for comp in prob.model.system_iter(recurse=True):
+            coloring = comp._coloring_info.coloring
+            if (
+                coloring is not None
+                and comp.pathname in partial_keys
+                and _can_use_fixed_coloring(comp)
+            ):
+                colorings[self._filename('partial', partial_keys[comp.pathname])] = coloring
+
+        num_saved = 0
+        for filename, coloring in colorings.items():
+            if not filename.is_file():
+                self.directory.mkdir(parents=True, exist_ok=True)
+                coloring.save(filename)
+                num_saved += 1
+
+        return num_saved
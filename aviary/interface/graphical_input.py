@@ -1745,33 +1745,6 @@ def estimate_total_range_trapezoidal(times, mach_numbers, units):
     return round(convert_units(total_range, 'm', range_unit), 2), range_unit
 
 
-def _setup_flight_profile_parser(parser):
-    """
-    Set up the command line options for the Flight Profile plotting tool.
-
-    Parameters
-    ----------
-    parser : argparse.ArgumentParser
-        The parser instance.
-    """
-    pass
-
-
-def _exec_flight_profile(options, user_args):
-    """
-    Run the Flight Profile plotting tool.
-
-    Parameters
-    ----------
-    options : argparse.Namespace
-        Command line options.
-    user_args : list of str
-        Args to be passed to the user script.
-    """
-    app = AviaryMissionEditor()
-    app.mainloop()
-
-
 if __name__ == '__main__':
     app = AviaryMissionEditor()
     app.mainloop()
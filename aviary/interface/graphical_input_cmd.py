@@ -0,0 +1,33 @@
+"""
+Command line api for the mission profile drawing GUI.
+Kept in a separate file so that tkinter and matplotlib are only imported when the GUI is opened.
+"""
+
+
+def _setup_flight_profile_parser(parser):
+    """
+    Set up the command line options for the Flight Profile plotting tool.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser instance.
+    """
+    pass
+
+
+def _exec_flight_profile(options, user_args):
+    """
+    Run the Flight Profile plotting tool.
+
+    Parameters
+    ----------
+    options : argparse.Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    from aviary.interface.graphical_input import AviaryMissionEditor
+
+    app = AviaryMissionEditor()
+    app.mainloop()
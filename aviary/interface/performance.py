@@ -0,0 +1,328 @@
+"""
+Measure where the time of an Aviary run is spent.
+
+A PerformanceMonitor wraps the methods of the components, solvers, and driver of a problem to
+count how many times they are called and how long they take, without the overhead of a
+profiler. It is used by the 'performance' report, which records the driver run of an
+AviaryProblem, but can also be used directly around any part of a run.
+
+Classes
+-------
+PerformanceMonitor : Record call counts and wall times of the systems and solvers of a problem.
+"""
+
+import json
+import sys
+import time
+from collections import defaultdict
+
+import dymos as dm
+from openmdao.core.component import Component
+from openmdao.solvers.linear.linear_runonce import LinearRunOnce
+from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+# component methods that evaluate the component, and the methods that compute its partials
+_COMPUTE_METHODS = ('_solve_nonlinear', '_apply_nonlinear')
+_LINEARIZE_METHODS = ('_linearize',)
+
+
+def get_peak_memory():
+    """
+    Return the peak memory used by this process.
+
+    Returns
+    -------
+    float or None
+        Peak resident set size of this process, in MB, or None if it is not available on this
+        platform.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == 'darwin':
+        return peak / 1024.0**2
+
+    return peak / 1024.0
+
+
+class _CallTimer:
+    """Call count and total wall time of a group of methods."""
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.max_time = 0.0
+
+    def wrap(self, func, callback=None):
+        """Return a wrapper of func that records its calls in this timer."""
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.count += 1
+                self.time += elapsed
+                self.max_time = max(self.max_time, elapsed)
+                if callback is not None:
+                    callback()
+
+        return wrapper
+
+    def to_dict(self):
+        return {'count': self.count, 'time': self.time, 'max_time': self.max_time}
+
+
+class PerformanceMonitor:
+    """
+    Record call counts and wall times of the systems and solvers of a problem.
+
+    Components record how many times they are evaluated (compute, apply_nonlinear and
+    solve_nonlinear) and linearized, and how long that takes. Iterative solvers record how many
+    times they are run and how many iterations they take. The driver records its model and
+    derivative evaluations.
+
+    Parameters
+    ----------
+    prob : om.Problem
+        Problem to monitor. It must have been set up.
+
+    Attributes
+    ----------
+    prob : om.Problem
+        The monitored problem.
+    run_time : float
+        Wall time between starting and stopping the monitor, in seconds.
+    """
+
+    def __init__(self, prob):
+        self.prob = prob
+        self.run_time = 0.0
+
+        self._start_time = None
+        self._wrapped = []
+        self._components = {}
+        self._solvers = {}
+        self._driver = {}
+
+    def _wrap(self, obj, method_name, timer, callback=None):
+        """Replace a method of an object by one that records its calls."""
+        # methods are replaced by instance attributes, keep any that were already there
+        self._wrapped.append((obj, method_name, vars(obj).get(method_name)))
+        setattr(obj, method_name, timer.wrap(getattr(obj, method_name), callback))
+
+    def start(self):
+        """Start recording calls."""
+        if self._start_time is not None:
+            return
+
+        model = self.prob.model
+
+        for comp in model.system_iter(recurse=True, typ=Component):
+            timers = self._components[comp.pathname] = {
+                'compute': _CallTimer(),
+                'linearize': _CallTimer(),
+            }
+            for method_name in _COMPUTE_METHODS:
+                self._wrap(comp, method_name, timers['compute'])
+            for method_name in _LINEARIZE_METHODS:
+                self._wrap(comp, method_name, timers['linearize'])
+
+        for system in model.system_iter(include_self=True, recurse=True):
+            for kind, solver in (
+                ('nonlinear', system._nonlinear_solver),
+                ('linear', system._linear_solver),
+            ):
+                if solver is None or isinstance(solver, (NonlinearRunOnce, LinearRunOnce)):
+                    continue
+
+                record = {
+                    'path': system.pathname,
+                    'solver': type(solver).__name__,
+                    'kind': kind,
+                    'iterations': 0,
+                    'max_iterations': 0,
+                    'timer': _CallTimer(),
+                }
+                self._solvers[system.pathname, kind] = record
+
+                def count_iterations(solver=solver, record=record):
+                    iter_count = solver._iter_count
+                    record['iterations'] += iter_count
+                    record['max_iterations'] = max(record['max_iterations'], iter_count)
+
+                self._wrap(solver, 'solve', record['timer'], count_iterations)
+
+        self._driver = {'model_evals': _CallTimer(), 'deriv_evals': _CallTimer()}
+        self._wrap(model, 'run_solve_nonlinear', self._driver['model_evals'])
+        self._wrap(self.prob.driver, '_compute_totals', self._driver['deriv_evals'])
+
+        self._start_time = time.perf_counter()
+
+    def stop(self):
+        """Stop recording calls, and restore the original methods."""
+        if self._start_time is None:
+            return
+
+        self.run_time += time.perf_counter() - self._start_time
+        self._start_time = None
+
+        for obj, method_name, original in reversed(self._wrapped):
+            if original is None:
+                delattr(obj, method_name)
+            else:
+                setattr(obj, method_name, original)
+        self._wrapped = []
+
+    def _get_group_name(self, path, phase_paths):
+        """Return the phase containing a component, and the subsystem it is reported under."""
+        parent = ''
+        for phase_path in phase_paths:
+            if path.startswith(phase_path + '.'):
+                parent = phase_path
+                break
+
+        # Components are reported under their subsystem two levels below the phase (for example
+        # an ODE and its aerodynamics), or below the model if they are not in a phase. Groups
+        # that converge their subsystems, like the solver group of the energy-state ODE, do not
+        # count as a level, so that the subsystems they contain are reported separately.
+        names = path[len(parent) + 1 if parent else 0 :].split('.')
+        group_path = parent
+        num_levels = 0
+        for idx, name in enumerate(names):
+            group_path = f'{group_path}.{name}' if group_path else name
+            if (group_path, 'nonlinear') not in self._solvers:
+                num_levels += 1
+                if num_levels == 2:
+                    break
+
+        return parent or None, '.'.join(names[: idx + 1])
+
+    def get_results(self):
+        """
+        Return the recorded data.
+
+        Returns
+        -------
+        dict
+            Recorded data, with the keys:
+
+            - 'run_time': wall time recorded by the monitor, in seconds.
+            - 'peak_memory': peak memory of the process, in MB.
+            - 'driver': number and wall time of model and derivative evaluations of the driver.
+            - 'phases': compute and linearize counts and times of each phase, and of the
+              subsystems in each phase.
+            - 'other_systems': compute and linearize counts and times of the subsystems outside
+              of phases.
+            - 'solvers': run counts, iterations, and wall times of iterative solvers.
+            - 'components': compute and linearize counts and times of each component, in order
+              of decreasing total time.
+        """
+        driver = self.prob.driver
+        driver_results = {name: timer.to_dict() for name, timer in self._driver.items()}
+        driver_results['name'] = driver._get_name()
+        driver_results['iterations'] = driver.iter_count
+
+        phase_paths = sorted(
+            (phase.pathname for phase in self.prob.model.system_iter(recurse=True, typ=dm.Phase)),
+            key=len,
+            reverse=True,
+        )
+
+        def new_totals():
+            return {
+                'compute_count': 0,
+                'compute_time': 0.0,
+                'linearize_count': 0,
+                'linearize_time': 0.0,
+            }
+
+        phases = defaultdict(
+            lambda: {'totals': new_totals(), 'subsystems': defaultdict(new_totals)}
+        )
+        other_systems = defaultdict(new_totals)
+
+        components = []
+        for path, timers in self._components.items():
+            compute = timers['compute']
+            linearize = timers['linearize']
+            if compute.count == 0 and linearize.count == 0:
+                continue
+
+            comp_results = {
+                'path': path,
+                'compute_count': compute.count,
+                'compute_time': compute.time,
+                'linearize_count': linearize.count,
+                'linearize_time': linearize.time,
+            }
+            components.append(comp_results)
+
+            phase_path, group_name = self._get_group_name(path, phase_paths)
+            if phase_path is None:
+                group_totals = [other_systems[group_name]]
+            else:
+                phase = phases[phase_path]
+                group_totals = [phase['totals'], phase['subsystems'][group_name]]
+
+            for totals in group_totals:
+                for key in totals:
+                    totals[key] += comp_results[key]
+
+        components.sort(
+            key=lambda data: data['compute_time'] + data['linearize_time'], reverse=True
+        )
+
+        solvers = []
+        for record in self._solvers.values():
+            timer = record['timer']
+            if timer.count == 0:
+                continue
+
+            solvers.append(
+                {
+                    'path': record['path'],
+                    'solver': record['solver'],
+                    'kind': record['kind'],
+                    'solves': timer.count,
+                    'iterations': record['iterations'],
+                    'max_iterations': record['max_iterations'],
+                    'time': timer.time,
+                }
+            )
+        solvers.sort(key=lambda data: data['time'], reverse=True)
+
+        return {
+            'run_time': self.run_time,
+            'peak_memory': get_peak_memory(),
+            'driver': driver_results,
+            'phases': {
+                path: {'totals': data['totals'], 'subsystems': dict(data['subsystems'])}
+                for path, data in phases.items()
+            },
+            'other_systems': dict(other_systems),
+            'solvers': solvers,
+            'components': components,
+        }
+
+    def write_json(self, filename):
+        """
+        Write the recorded data to a JSON file.
+
+        Parameters
+        ----------
+        filename : str or Path
+            Path of the JSON file.
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.get_results(), f, indent=1)
+            print(file=f)  # avoid 'no newline at end of file' message
@@ -189,33 +189,5 @@ def plot_drag_polar(input_file=None):
     window.mainloop()
 
 
-def _setup_plot_drag_polar_parser(parser):
-    """
-    Set up the command line options for the Model Building tool.
-
-    Parameters
-    ----------
-    parser : argparse.ArgumentParser
-        The parser instance.
-    parser : argparse subparser
-        The parser we're adding options to.
-    """
-    pass
-
-
-def _exec_plot_drag_polar(options, user_args):
-    """
-    Run the Model Building tool.
-
-    Parameters
-    ----------
-    options : argparse.Namespace
-        Command line options.
-    user_args : list of str
-        Args to be passed to the user script.
-    """
-    plot_drag_polar()
-
-
 if __name__ == '__main__':
     plot_drag_polar()
@@ -0,0 +1,34 @@
+"""
+Command line api for the drag polar plotting tool.
+Kept in a separate file so that tkinter and matplotlib are only imported when the tool is opened.
+"""
+
+
+def _setup_plot_drag_polar_parser(parser):
+    """
+    Set up the command line options for the Model Building tool.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser instance.
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    pass
+
+
+def _exec_plot_drag_polar(options, user_args):
+    """
+    Run the Model Building tool.
+
+    Parameters
+    ----------
+    options : argparse.Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    from aviary.interface.plot_drag_polar import plot_drag_polar
+
+    plot_drag_polar()
@@ -3,18 +3,28 @@ import json
 import sys
 import time
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
 from openmdao.utils.mpi import MPI
-from openmdao.utils.reports_system import register_report
+from openmdao.utils.reports_system import register_report, register_report_hook
 
 from aviary.core.aviary_problem import AviaryProblem
+from aviary.interface.performance import PerformanceMonitor
 from aviary.interface.utils import write_markdown_variable_table
 from aviary.utils.named_values import NamedValues
-from aviary.utils.utils import wrapped_convert_units
 from aviary.variable_info.enums import ProblemType
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# performance monitors of problems whose driver run is being recorded
+_performance_monitors = WeakKeyDictionary()
+
 
 def register_custom_reports():
     """
@@ -70,6 +80,16 @@ def register_custom_reports():
         pre_or_post='post',
     )
 
+    register_report_hook(
+        'performance',
+        'run_driver',
+        'AviaryProblem',
+        pre=_start_performance_report,
+        post=performance_report,
+        description='Generates a report on the call counts and wall times of subsystems, solvers '
+        'and the driver',
+    )
+
     register_report(
         name='input_checks',
         func=input_check_report,
@@ -130,6 +150,42 @@ def run_status(prob: AviaryProblem):
         print(file=f)  # avoid 'no newline at end of file' message
 
 
+def _start_performance_report(prob: AviaryProblem):
+    """
+    Start recording the performance of the driver run of a problem.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem used to generate this report
+    """
+    monitor = _performance_monitors[prob] = PerformanceMonitor(prob)
+    monitor.start()
+
+
+def performance_report(prob: AviaryProblem):
+    """
+    Creates a JSON file with the call counts and wall times of the subsystems, solvers and
+    driver recorded during the driver run.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem used to generate this report
+    """
+    monitor = _performance_monitors.pop(prob, None)
+    if monitor is None:
+        return
+
+    monitor.stop()
+
+    if MPI and prob.comm.rank != 0:
+        return
+
+    reports_folder = Path(prob.get_reports_dir())
+    monitor.write_json(reports_folder / 'performance.json')
+
+
 def sizing_results(prob: AviaryProblem):
     """
     Creates a JSON file that contains the variable set from a sizing problem. If the ProblemType run
@@ -478,10 +534,10 @@ def timeseries_csv(prob: AviaryProblem, **kwargs):
     """
     Generates a CSV file containing timeseries data for variables from an Aviary mission.
 
-    This function extracts timeseries data from the provided problem object, processes the data
-    to unify units across different phases of the mission, and then outputs the result to a CSV file.
-    The 'time' variable is moved to the beginning of the dataset so it's always the leftmost column.
-    Duplicate consecutive rows are eliminated.
+    The timeseries of each phase are read directly from the problem and streamed to the file one
+    phase at a time. Values of each variable are converted to the units used in the first phase
+    that contains it, and variables missing from a phase are filled with NaN. The 'time' variable
+    is always the leftmost column.
 
     Parameters
     ----------
@@ -491,110 +547,172 @@ def timeseries_csv(prob: AviaryProblem, **kwargs):
         Additional keyword arguments (unused)
 
     The output CSV file is named 'mission_timeseries_data.csv' and is saved in the reports directory.
-    The first row of the CSV file contains headers with variable names and units.
-    Each subsequent row represents the mission outputs at a different time step.
+    For multi-mission problems, one file named 'mission_timeseries_data_<mission name>.csv' is
+    written for each mission. The first row of the CSV file contains headers with variable names
+    and units. Each subsequent row represents the mission outputs at a different time step.
     """
-    multi_mission = prob.problem_type == ProblemType.MULTI_MISSION
-    if multi_mission:
-        for _, model in prob.aviary_groups_dict.items():
-            # TODO: We need to rewrite this report to support multimission
-            # For now, just write the first mission's csv file.
-            break
+    export_timeseries(prob, file_format='csv')
+
+
+def export_timeseries(prob: AviaryProblem, file_format=None, output_dir=None):
+    """
+    Write the trajectory timeseries of every mission in the problem to columnar data files.
+
+    Data is streamed one phase at a time, so the complete set of timeseries outputs is never held
+    in memory at once. Parquet files are written with one row group per phase, and CSV files are
+    appended to one phase at a time.
+
+    Parameters
+    ----------
+    prob : AviaryProblem
+        The AviaryProblem containing the timeseries data.
+    file_format : str or None
+        Either 'csv' or 'parquet'. Writing Parquet files requires pyarrow. If None, Parquet is
+        used when pyarrow is installed and CSV otherwise.
+    output_dir : str, Path, or None
+        Directory the files are written to. Defaults to the problem's reports directory.
+
+    Returns
+    -------
+    list of Path
+        Paths of the files written, one per mission. Empty on all but the root process when
+        running under MPI.
+    """
+    if file_format is None:
+        file_format = 'csv' if pq is None else 'parquet'
+
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f'Unsupported timeseries file format "{file_format}".')
+
+    if file_format == 'parquet' and pq is None:
+        raise ImportError('Writing timeseries data in the parquet format requires pyarrow.')
+
+    if output_dir is None:
+        output_dir = prob.get_reports_dir()
+    output_dir = Path(output_dir)
+
+    if prob.problem_type == ProblemType.MULTI_MISSION:
+        models = {
+            f'mission_timeseries_data_{name}.{file_format}': model
+            for name, model in prob.aviary_groups_dict.items()
+        }
     else:
-        model = prob.model
+        models = {f'mission_timeseries_data.{file_format}': prob.model}
 
-    timeseries_outputs = model.list_outputs(
-        includes='*timeseries*', out_stream=None, return_format='dict', units=True
-    )
-    phase_names = model.traj._phases.keys()
+    root = not MPI or prob.comm.rank == 0
 
-    # There are no more collective calls, so we can exit.
-    if MPI and prob.comm.rank != 0:
-        return
+    filenames = []
+    for filename, model in models.items():
+        filepath = output_dir / filename
+        _write_timeseries(model, filepath if root else None, file_format)
+        if root:
+            filenames.append(filepath)
 
-    timeseries_outputs = {value['prom_name']: value for key, value in timeseries_outputs.items()}
+    return filenames
 
-    timeseries_outputs = {
-        key: value for key, value in timeseries_outputs.items() if not key.endswith('_phase')
-    }
 
-    unique_variable_names = set(
-        [timeseries_output.split('.')[-1] for timeseries_output in timeseries_outputs]
+def _get_timeseries_layout(model):
+    """
+    Collect the phases, variables, and column units of the timeseries in a mission.
+
+    Returns a dict mapping each phase to its number of nodes and the names of its timeseries
+    variables, and a dict mapping each variable to its units and size at a single node.
+    """
+    meta = model.get_io_metadata(
+        iotypes='output',
+        metadata_keys=['units', 'shape'],
+        includes='traj.*.timeseries.*',
+        get_remote=True,
     )
 
-    timeseries_data = {}
-    for variable_name in unique_variable_names:
-        timeseries_data[variable_name] = {}
-        first = True  # flag to check if this is first iteration in for loop
-        units = None
-        for idx_phase, phase_name in enumerate(phase_names):
-            variable_str = f'traj.{phase_name}.timeseries.{variable_name}'
-            time_str = f'traj.{phase_name}.timeseries.time'
-
-            if variable_str not in timeseries_outputs:
-                Warning(
-                    f'Variable {variable_str} not found in timeseries_outputs for phase '
-                    f'{phase_name}.'
-                )
-                val = np.zeros_like(timeseries_outputs[time_str]['val'])
-                val[:] = np.nan
-                if first:
-                    val_full_traj = val
-                    first = False
-                else:
-                    val_full_traj = np.vstack((val_full_traj, val))
+    phases = {phase: {'num_nodes': 0, 'variables': set()} for phase in model.traj._phases}
+    variables = {}
 
-            else:
-                val = timeseries_outputs[variable_str]['val']
-
-                # grab the units from the first phase that uses this variable; use these units for all others
-                if units is None:
-                    units = timeseries_outputs[variable_str]['units']
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
-                else:
-                    original_units = timeseries_outputs[variable_str]['units']
+    for var_meta in meta.values():
+        parts = var_meta['prom_name'].split('.', 3)
+        if len(parts) != 4 or parts[0] != 'traj' or parts[2] != 'timeseries':
+            continue
 
-                    if original_units != units:
-                        val = wrapped_convert_units((val, original_units), units)
+        phase, name = parts[1], parts[3]
+        if name.endswith('_phase') or phase not in phases:
+            continue
 
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
+        shape = var_meta['shape']
+        phases[phase]['num_nodes'] = shape[0]
+        phases[phase]['variables'].add(name)
 
-        timeseries_data[variable_name]['val'] = val_full_traj
-        timeseries_data[variable_name]['units'] = units
-        timeseries_data[variable_name]['shape'] = val_full_traj.shape
+        # the units used in the first phase that contains a variable are used for all phases
+        if name not in variables:
+            variables[name] = {'units': var_meta['units'], 'size': int(np.prod(shape[1:]))}
 
-    # Create a DataFrame from timeseries_data
-    df_data = {
-        variable_name: pd.Series(timeseries_data[variable_name]['val'].flatten())
-        for variable_name in timeseries_data
-    }
-    df = pd.DataFrame(df_data)
+    # 'time' is always the first column, followed by the other variables in alphabetical order
+    names = sorted(variables, key=lambda name: (name != 'time', name))
+    variables = {name: variables[name] for name in names}
 
-    time_column = ['time']  # Isolate the 'time' column
-    # Sort the rest of the columns
-    other_columns = sorted([col for col in df.columns if col != 'time'])
-    columns = time_column + other_columns  # Combine them, keeping 'time' first
-    df = df[columns]
+    return phases, variables
 
-    # Add units to column names
-    df.columns = [f'{col} ({timeseries_data[col]["units"]})' for col in df.columns]
 
-    df.drop_duplicates()
+def _write_timeseries(model, filepath, file_format):
+    """
+    Stream the timeseries of a single mission to a file, one phase at a time.
 
-    # The path where you want to save the CSV file
-    reports_folder = Path(prob.get_reports_dir())
-    report_file = reports_folder / 'mission_timeseries_data.csv'
+    Every process must call this function, because fetching values is a collective operation
+    under MPI. Only the process given a filepath writes data.
+    """
+    phases, variables = _get_timeseries_layout(model)
+
+    columns = []
+    for name, var_meta in variables.items():
+        if var_meta['size'] == 1:
+            columns.append(f'{name} ({var_meta["units"]})')
+        else:
+            columns.extend(f'{name}[{i}] ({var_meta["units"]})' for i in range(var_meta['size']))
 
-    # Write the DataFrame to a CSV file
-    df.to_csv(report_file, index=False)
+    writer = None
+    first = True
+
+    try:
+        for phase, phase_meta in phases.items():
+            num_nodes = phase_meta['num_nodes']
+            if num_nodes == 0:
+                continue
+
+            blocks = []
+            for name, var_meta in variables.items():
+                if name in phase_meta['variables']:
+                    val = model.get_val(
+                        f'traj.{phase}.timeseries.{name}', units=var_meta['units'], get_remote=True
+                    )
+                    blocks.append(np.reshape(val, (num_nodes, -1)))
+                else:
+                    blocks.append(np.full((num_nodes, var_meta['size']), np.nan))
+
+            if filepath is None:
+                continue
+
+            data = np.hstack(blocks) if blocks else np.empty((num_nodes, 0))
+            df = pd.DataFrame(data, columns=columns)
+
+            if file_format == 'parquet':
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filepath, table.schema)
+                writer.write_table(table)
+            else:
+                df.to_csv(filepath, mode='w' if first else 'a', header=first, index=False)
+
+            first = False
+
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if filepath is not None and first:
+        # no phase had any timeseries data; still write the (empty) file
+        if file_format == 'parquet':
+            pd.DataFrame(columns=columns).to_parquet(filepath, index=False)
+        else:
+            pd.DataFrame(columns=columns).to_csv(filepath, index=False)
 
 
 def overridden_variables_report(prob: AviaryProblem, **kwargs):
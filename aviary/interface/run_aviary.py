@@ -7,7 +7,6 @@ import subprocess
 import sys
 from pathlib import Path
 
-from aviary.utils.functions import get_path
 from aviary.variable_info.enums import Verbosity
 
 
@@ -24,6 +23,7 @@ def run_aviary(
     phase_info_modifier=None,
     verbosity=None,
     real_time_plotting=False,
+    warm_start=None,
 ):
     """
     Run the Aviary optimization problem for a specified aircraft configuration and mission.
@@ -60,6 +60,11 @@ def run_aviary(
     verbosity : Verbosity or int, optional
         Sets level of information outputted to the terminal during model execution. If provided,
         overrides verbosity specified in aircraft_data.
+    real_time_plotting : bool, optional
+        If True, enables real-time plotting of the optimization progress.
+    warm_start : str or Path, optional
+        Directory of previously converged solutions used to seed the problem. Converged solutions
+        are added to this directory.
 
     Returns
     -------
@@ -119,6 +124,7 @@ def run_aviary(
         make_plots=make_plots,
         verbosity=verbosity,
         real_time_plotting=real_time_plotting,
+        warm_start=warm_start,
     )
 
     return prob
@@ -131,6 +137,7 @@ def run_aviary_cmd(
     max_iter=50,
     verbosity=Verbosity.BRIEF,
     real_time_plotting=False,
+    warm_start=None,
 ):
     """
     This file enables running aviary from the command line with a user specified input deck.
@@ -141,9 +148,12 @@ def run_aviary_cmd(
         'optimizer': optimizer,
         'verbosity': Verbosity(verbosity),
         'real_time_plotting': real_time_plotting,
+        'warm_start': warm_start,
     }
 
     if isinstance(phase_info, str):
+        from aviary.utils.functions import get_path
+
         phase_info_path = get_path(phase_info)
         spec = spec_from_file_location('phase_info_file', str(phase_info_path))
         phase_info_file = module_from_spec(spec)
@@ -186,6 +196,13 @@ def _setup_run_aviary_parser(parser):
         action='store_true',
         help='Enable realtime plotting option',
     )
+    parser.add_argument(
+        '--warm_start',
+        type=str,
+        default=None,
+        help='Directory of converged solutions used to seed the problem, and to which the '
+        'solution is saved if the optimization succeeds',
+    )
 
 
 def _exec_run_aviary(args, user_args):
@@ -203,4 +220,5 @@ def _exec_run_aviary(args, user_args):
         max_iter=args.max_iter,
         verbosity=args.verbosity,
         real_time_plotting=args.rtplot,
+        warm_start=args.warm_start,
     )
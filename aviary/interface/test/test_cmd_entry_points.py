@@ -93,6 +93,15 @@ class fortran_to_aviaryTestCases(CommandEntryPointsTestCases):
         cmd2 = f'aviary convert fortran_to_aviary {filepath} {outfile} --force -f GASP'
         self.run_and_test_cmd(cmd2)
 
+    def test_batch_conversion(self):
+        filepath = get_aviary_resource_path('validation_cases/validation_data/legacy_files')
+        outdir = Path.cwd() / 'converted'
+        cmd = (
+            f'aviary convert fortran_to_aviary {filepath} {outdir} -f GASP --batch'
+            ' --pattern *_GASP.dat -j 2'
+        )
+        self.run_and_test_cmd(cmd)
+
 
 class convert_engineTestCases(CommandEntryPointsTestCases):
     def test_GASP_conversion(self):
@@ -115,6 +124,12 @@ class convert_engineTestCases(CommandEntryPointsTestCases):
         cmd = f'aviary convert engine_deck {filepath} {outfile} --format GASP_TS'
         self.run_and_test_cmd(cmd)
 
+    def test_compile(self):
+        filepath = self.get_file('models/engines/turbofan_28k.csv')
+        outfile = Path.cwd() / 'turbofan_28k.npz'
+        cmd = f'aviary convert compiled_engine_deck {filepath} {outfile}'
+        self.run_and_test_cmd(cmd)
+
 
 class convert_aero_tableTestCases(CommandEntryPointsTestCases):
     def test_GASP_conversion(self):
@@ -0,0 +1,150 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_totals, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.coloring_cache import ColoringCache
+
+
+class ShiftComp(om.ExplicitComponent):
+    """Component whose sparsity depends on an option but whose variable shapes do not."""
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+        self.options.declare('shift', default=0, types=int)
+
+    def setup(self):
+        num_nodes = self.options['num_nodes']
+        self.add_input('x', np.ones(num_nodes))
+        self.add_output('y', np.ones(num_nodes))
+        self.declare_partials('y', 'x', method='cs')
+        self.declare_coloring(wrt='x', method='cs', show_summary=False)
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        outputs['y'] = x**2 + np.roll(x, self.options['shift'])
+
+
+def build_shift_problem(shift, num_nodes=10):
+    prob = om.Problem(reports=False)
+    model = prob.model
+
+    model.add_subsystem('comp', ShiftComp(num_nodes=num_nodes, shift=shift), promotes=['*'])
+    model.add_subsystem('obj', om.ExecComp('f = sum(y)', y=np.ones(num_nodes)), promotes=['*'])
+    model.add_design_var('x', lower=-10.0, upper=10.0)
+    model.add_objective('f')
+
+    prob.setup(force_alloc_complex=True)
+    prob.set_val('x', np.linspace(1.0, 2.0, num_nodes))
+
+    return prob
+
+
+def build_problem(num_nodes=20, expr='y = x**2 + 3.0*x'):
+    prob = om.Problem(reports=False)
+    model = prob.model
+
+    comp = model.add_subsystem(
+        'comp', om.ExecComp(expr, x=np.ones(num_nodes), y=np.ones(num_nodes)), promotes=['*']
+    )
+    comp.declare_coloring(show_summary=False)
+
+    model.add_subsystem('obj', om.ExecComp('f = sum(y)', y=np.ones(num_nodes)), promotes=['*'])
+    model.add_subsystem(
+        'con',
+        om.ExecComp(
+            'g = y - x',
+            x=np.ones(num_nodes),
+            y=np.ones(num_nodes),
+            g=np.ones(num_nodes),
+            has_diag_partials=True,
+        ),
+        promotes=['*'],
+    )
+
+    model.add_design_var('x', lower=-10.0, upper=10.0)
+    model.add_objective('f')
+    model.add_constraint('g', lower=-0.5)
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+    prob.driver.declare_coloring(show_summary=False)
+
+    prob.setup()
+
+    return prob
+
+
+@use_tempdirs
+class ColoringCacheTest(unittest.TestCase):
+    def test_coloring_cache(self):
+        cache = ColoringCache('coloring_cache')
+
+        prob = build_problem()
+        self.assertEqual(cache.load(prob), 0)
+        prob.run_driver()
+
+        self.assertEqual(cache.save(prob), 2)
+        self.assertEqual(len(list(cache.directory.glob('total_*.pkl'))), 1)
+        self.assertEqual(len(list(cache.directory.glob('partial_*.pkl'))), 1)
+
+        # stored colorings are not written again
+        self.assertEqual(cache.save(prob), 0)
+
+        # a problem with the same structure uses the stored colorings instead of computing them
+        new_prob = build_problem()
+        self.assertEqual(cache.signature(new_prob), cache.signature(prob))
+        self.assertEqual(cache.load(new_prob), 2)
+        self.assertFalse(new_prob.driver._coloring_info.dynamic)
+        self.assertFalse(new_prob.model.comp._coloring_info.dynamic)
+
+        new_prob.run_driver()
+        assert_near_equal(new_prob.get_val('x'), prob.get_val('x'), 1e-12)
+        self.assertEqual(cache.save(new_prob), 0)
+
+    def test_signature(self):
+        cache = ColoringCache('coloring_cache')
+        total_key, partial_keys = cache.signature(build_problem())
+
+        # changing the sizes of variables changes every key
+        other_total_key, other_partial_keys = cache.signature(build_problem(num_nodes=10))
+        self.assertNotEqual(other_total_key, total_key)
+        self.assertNotEqual(other_partial_keys['comp'], partial_keys['comp'])
+
+        # changing an ExecComp expression only changes the keys that depend on that component
+        other_total_key, other_partial_keys = cache.signature(build_problem(expr='y = 2.0*x'))
+        self.assertNotEqual(other_total_key, total_key)
+        self.assertNotEqual(other_partial_keys['comp'], partial_keys['comp'])
+        self.assertEqual(other_partial_keys['obj'], partial_keys['obj'])
+
+    def test_option_change(self):
+        cache = ColoringCache('coloring_cache')
+
+        prob = build_shift_problem(shift=0)
+        prob.run_model()
+        prob.compute_totals()
+        self.assertEqual(cache.save(prob), 1)
+
+        # a component with the same shapes but different options does not reuse the coloring,
+        # which would drop the off-diagonal partials
+        new_prob = build_shift_problem(shift=1)
+        _, partial_keys = cache.signature(prob)
+        _, new_partial_keys = cache.signature(new_prob)
+        self.assertNotEqual(new_partial_keys['comp'], partial_keys['comp'])
+        self.assertEqual(new_partial_keys['obj'], partial_keys['obj'])
+
+        self.assertEqual(cache.load(new_prob), 0)
+        self.assertTrue(new_prob.model.comp._coloring_info.dynamic)
+
+        new_prob.run_model()
+        data = new_prob.check_totals(method='cs', out_stream=None)
+        assert_check_totals(data, atol=1e-10, rtol=1e-10)
+
+        # the recomputed coloring is stored under its own key
+        self.assertEqual(cache.save(new_prob), 1)
+        self.assertEqual(len(list(cache.directory.glob('partial_*.pkl'))), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+
+# modules that take a significant fraction of a second to import and should only be loaded
+# once a command or API object that needs them is actually used
+HEAVY_MODULES = (
+    'dymos',
+    'matplotlib',
+    'openmdao.api',
+    'aviary.core.aviary_problem',
+    'aviary.variable_info.variable_meta_data',
+)
+
+
+def _import_in_subprocess(statement):
+    """Run an import statement in a fresh interpreter and return the set of modules loaded."""
+    code = f'import sys; {statement}; print(",".join(sys.modules))'
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(result.stdout.strip().split(','))
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_cmd_entry_points(self):
+        modules = _import_in_subprocess('import aviary.interface.cmd_entry_points')
+
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules, f'{name} is imported by the aviary command')
+
+    def test_api(self):
+        modules = _import_in_subprocess('import aviary.api as av; av.Aircraft; av.LegacyCode')
+
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules, f'{name} is imported by aviary.api')
+
+        # objects are still available, and are only loaded when they are accessed
+        modules = _import_in_subprocess('import aviary.api as av; av.AviaryProblem')
+        self.assertIn('aviary.core.aviary_problem', modules)
+        self.assertIn('dymos', modules)
+
+        # a star import still exports the lazily imported names
+        modules = _import_in_subprocess('from aviary.api import *; AviaryProblem')
+        self.assertIn('aviary.core.aviary_problem', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from copy import deepcopy
+
+import openmdao.api as om
+from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import set_env_vars, use_tempdirs
+
+from aviary.core.aviary_problem import AviaryProblem
+from aviary.models.missions.energy_state_default import phase_info
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import ProblemType
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+def build_multi_mission(parallel_missions):
+    aviary_inputs_1 = get_flops_inputs('LargeSingleAisle2FLOPS')
+    aviary_inputs_2 = deepcopy(aviary_inputs_1)
+    aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, 1)
+    aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_ECONOMY_CLASS, 1)
+    aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_BUSINESS_CLASS, 0)
+    aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_FIRST_CLASS, 0)
+
+    # the second mission has a coarser cruise
+    phase_info_2 = deepcopy(phase_info)
+    phase_info_2['cruise']['user_options']['num_segments'] = 2
+
+    prob = AviaryProblem(
+        problem_type=ProblemType.MULTI_MISSION, verbosity=0, parallel_missions=parallel_missions
+    )
+    prob.add_aviary_group('mission1', aircraft=aviary_inputs_1, phase_info=deepcopy(phase_info))
+    prob.add_aviary_group('mission2', aircraft=aviary_inputs_2, phase_info=phase_info_2)
+    prob.build_model()
+    prob.promote_inputs(
+        ['mission1', 'mission2'], [(Aircraft.Design.GROSS_MASS, 'Aircraft1:GROSS_MASS')]
+    )
+    prob.add_design_var_default(
+        'Aircraft1:GROSS_MASS', lower=10.0, upper=900e3, units='lbm', default_val=170000.0
+    )
+    prob.add_composite_objective(('mission1', Mission.FUEL, 2), ('mission2', Mission.FUEL, 1))
+    prob.add_driver('SLSQP', max_iter=0)
+    prob.add_design_variables()
+    prob.setup()
+
+    return prob
+
+
+@use_tempdirs
+class ParallelMissionsTest(unittest.TestCase):
+    def setUp(self):
+        om.clear_reports()
+        _clear_problem_names()
+
+    @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='0')
+    def test_parallel_missions(self):
+        serial_prob = build_multi_mission(parallel_missions=None)
+        self.assertFalse(serial_prob.parallel_missions)
+        serial_prob.run_model()
+
+        prob = build_multi_mission(parallel_missions=True)
+        self.assertTrue(prob.parallel_missions)
+
+        missions = prob.model.missions
+        self.assertIsInstance(missions, om.ParallelGroup)
+        self.assertIs(missions.mission1, prob.aviary_groups_dict['mission1'])
+
+        # processes are allocated in proportion to the number of nodes in each mission
+        self.assertEqual(missions._proc_info['mission1'][2], 45)
+        self.assertEqual(missions._proc_info['mission2'][2], 36)
+
+        prob.run_model()
+
+        # variable names, and results, are the same as for missions run in series
+        for name in (
+            'composite_objective',
+            'Aircraft1:GROSS_MASS',
+            'mission1.' + Mission.FUEL,
+            'mission2.' + Mission.FUEL,
+        ):
+            with self.subTest(name=name):
+                assert_near_equal(
+                    prob.get_val(name, units=None), serial_prob.get_val(name, units=None), 1e-10
+                )
+
+        self.assertEqual(
+            prob.model_options['missions.mission1.*'][Aircraft.CrewPayload.NUM_PASSENGERS],
+            serial_prob.model_options['mission1.*'][Aircraft.CrewPayload.NUM_PASSENGERS],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
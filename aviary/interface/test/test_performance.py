@@ -0,0 +1,102 @@
+import json
+import unittest
+
+import dymos as dm
+import openmdao.api as om
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.performance import PerformanceMonitor
+
+
+def build_problem():
+    prob = om.Problem(reports=False)
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', maxiter=5)
+    prob.driver.declare_coloring()
+
+    traj = prob.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase(
+        'phase0',
+        dm.Phase(ode_class=BrachistochroneODE, transcription=dm.Radau(num_segments=5, order=3)),
+    )
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(0.5, 10.0), units='s')
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True, fix_final=False)
+    phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final', scaler=10)
+
+    # a converged group, so there is an iterative solver to record
+    balance = prob.model.add_subsystem('balance', om.Group())
+    balance.add_subsystem('comp', om.ExecComp('r = x**2 - a'), promotes=['*'])
+    balance.add_subsystem(
+        'bal', om.BalanceComp('x', val=1.0, lhs_name='r', rhs_val=0.0), promotes=['*']
+    )
+    balance.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=-1)
+    balance.linear_solver = om.DirectSolver()
+
+    prob.setup()
+
+    phase.set_time_val(initial=0.0, duration=2.0)
+    phase.set_state_val('x', [0.0, 10.0])
+    phase.set_state_val('y', [10.0, 5.0])
+    phase.set_state_val('v', [0.0, 9.9])
+    phase.set_control_val('theta', [5.0, 100.5])
+    prob.set_val('balance.a', 2.0)
+
+    return prob
+
+
+@use_tempdirs
+class PerformanceMonitorTest(unittest.TestCase):
+    def test_performance_monitor(self):
+        prob = build_problem()
+
+        monitor = PerformanceMonitor(prob)
+        monitor.start()
+        prob.run_driver()
+        monitor.stop()
+
+        # original methods are restored
+        self.assertNotIn('_solve_nonlinear', vars(prob.model.traj.phases.phase0.rhs_all))
+        self.assertNotIn('run_solve_nonlinear', vars(prob.model))
+
+        results = monitor.get_results()
+        self.assertGreater(results['run_time'], 0.0)
+
+        driver = results['driver']
+        self.assertEqual(driver['name'], 'ScipyOptimize_SLSQP')
+        self.assertGreaterEqual(driver['model_evals']['count'], driver['iterations'])
+        self.assertGreater(driver['deriv_evals']['count'], 0)
+
+        phase = results['phases']['traj.phases.phase0']
+        self.assertIn('rhs_all', phase['subsystems'])
+        self.assertEqual(
+            phase['totals']['compute_count'],
+            sum(data['compute_count'] for data in phase['subsystems'].values()),
+        )
+
+        ode = phase['subsystems']['rhs_all']
+        self.assertGreater(ode['compute_count'], 0)
+        self.assertGreater(ode['linearize_count'], 0)
+
+        self.assertIn('balance.comp', results['other_systems'])
+
+        solvers = {(data['path'], data['kind']): data for data in results['solvers']}
+        newton = solvers['balance', 'nonlinear']
+        self.assertEqual(newton['solver'], 'NewtonSolver')
+        self.assertGreater(newton['iterations'], 0)
+        self.assertEqual(solvers['balance', 'linear']['solver'], 'DirectSolver')
+
+        times = [data['compute_time'] + data['linearize_time'] for data in results['components']]
+        self.assertEqual(times, sorted(times, reverse=True))
+
+        monitor.write_json('performance.json')
+        with open('performance.json') as f:
+            self.assertEqual(json.load(f)['solvers'], results['solvers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import csv
+import json
 import unittest
 from copy import deepcopy
 from pathlib import Path
@@ -8,11 +9,15 @@ from openmdao.core.problem import _clear_problem_names
 from openmdao.utils.testing_utils import set_env_vars, use_tempdirs
 
 from aviary.models.missions.energy_state_default import phase_info
+from aviary.interface.reports import export_timeseries
 from aviary.interface.run_aviary import run_aviary
 from aviary.core.aviary_problem import AviaryProblem
 from aviary.subsystems.subsystem_builder import SubsystemBuilder
 from aviary.utils.develop_metadata import add_meta_data
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import ProblemType
 from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft, Mission
 import aviary.api as av
 
 
@@ -87,6 +92,51 @@ class TestReports(unittest.TestCase):
                         msg='CSV row value does not match expected value within tolerance',
                     )
 
+    @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='0')
+    def test_multi_mission_timeseries(self):
+        # every mission of a multi-mission problem gets its own timeseries file
+        aviary_inputs_1 = get_flops_inputs('LargeSingleAisle2FLOPS')
+        aviary_inputs_2 = deepcopy(aviary_inputs_1)
+        aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_PASSENGERS, 1)
+        aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_ECONOMY_CLASS, 1)
+        aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_BUSINESS_CLASS, 0)
+        aviary_inputs_2.set_val(Aircraft.CrewPayload.NUM_FIRST_CLASS, 0)
+
+        prob = AviaryProblem(problem_type=ProblemType.MULTI_MISSION, verbosity=0)
+        prob.add_aviary_group('mission1', aircraft=aviary_inputs_1, phase_info=deepcopy(phase_info))
+        prob.add_aviary_group('mission2', aircraft=aviary_inputs_2, phase_info=deepcopy(phase_info))
+        prob.build_model()
+        prob.add_composite_objective(('mission1', Mission.FUEL, 1), ('mission2', Mission.FUEL, 1))
+        prob.add_driver('SLSQP', max_iter=0)
+        prob.add_design_variables()
+        prob.setup()
+        prob.run_model()
+
+        filenames = export_timeseries(prob, file_format='csv', output_dir='.')
+        self.assertEqual(
+            [filename.name for filename in filenames],
+            ['mission_timeseries_data_mission1.csv', 'mission_timeseries_data_mission2.csv'],
+        )
+
+        for filename, mission in zip(filenames, ('mission1', 'mission2')):
+            with open(filename, mode='r') as csvfile:
+                csvreader = csv.reader(csvfile)
+                header = next(csvreader)
+                rows = [[float(val) for val in row] for row in csvreader]
+
+            self.assertEqual(header[0], 'time (s)')
+            self.assertIn('mass (kg)', header)
+
+            # phases are written in order, converted to the units in the header
+            mass = prob.get_val(f'{mission}.traj.climb.timeseries.mass', units='kg')
+            mass_col = header.index('mass (kg)')
+            self.assertEqual(len(rows), 60)
+            for row, expected in zip(rows, mass[:, 0]):
+                self.assertAlmostEqual(row[mass_col], expected, places=7)
+
+        with self.assertRaises(ValueError):
+            export_timeseries(prob, file_format='xlsx', output_dir='.')
+
     @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='check_input_report')
     def test_check_input_report(self):
         # Make sure the input check works with custom metadata.
@@ -136,6 +186,38 @@ class TestReports(unittest.TestCase):
         # no need to run this model, just generate the report.
         prob.final_setup()
 
+    @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='performance')
+    def test_performance_report(self):
+        prob = run_aviary(
+            'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+            deepcopy(phase_info),
+            optimizer='SLSQP',
+            max_iter=0,
+            verbosity=0,
+        )
+
+        with open(Path(prob.get_reports_dir()) / 'performance.json') as f:
+            performance = json.load(f)
+
+        self.assertEqual(
+            set(performance['phases']),
+            {'traj.phases.climb', 'traj.phases.cruise', 'traj.phases.descent'},
+        )
+
+        # subsystems inside the solver group of the ODE are reported separately
+        subsystems = performance['phases']['traj.phases.cruise']['subsystems']
+        for name in ('aerodynamics', 'propulsion'):
+            self.assertGreater(subsystems[f'rhs_all.solver_sub.{name}']['compute_count'], 0)
+        self.assertIn('pre_mission.core_subsystems', performance['other_systems'])
+
+        solvers = {(data['path'], data['kind']): data for data in performance['solvers']}
+        skin_friction = solvers[
+            'traj.phases.cruise.rhs_all.solver_sub.aerodynamics.SkinFrictionCoef', 'nonlinear'
+        ]
+        self.assertGreater(skin_friction['iterations'], 0)
+
+        self.assertGreater(performance['driver']['model_evals']['count'], 0)
+
     @set_env_vars(TESTFLO_RUNNING='0')
     def test_multiple_off_design_report_directories(self):
         prob = av.AviaryProblem(verbosity=0)
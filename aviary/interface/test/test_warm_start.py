@@ -0,0 +1,109 @@
+import unittest
+
+import dymos as dm
+import numpy as np
+import openmdao.api as om
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.warm_start import WarmStartStore
+
+
+def build_brachistochrone(num_segments):
+    prob = om.Problem()
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-8)
+    prob.driver.declare_coloring()
+
+    traj = prob.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase(
+        'phase0',
+        dm.Phase(
+            ode_class=BrachistochroneODE,
+            transcription=dm.Radau(num_segments=num_segments, order=3),
+        ),
+    )
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(0.5, 10.0), units='s')
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True, fix_final=False)
+    phase.add_control('theta', continuity=True, rate_continuity=True, units='deg', lower=0.01)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final', scaler=10)
+
+    prob.setup()
+
+    phase.set_time_val(initial=0.0, duration=2.0)
+    phase.set_state_val('x', [0.0, 10.0])
+    phase.set_state_val('y', [10.0, 5.0])
+    phase.set_state_val('v', [0.0, 9.9])
+    phase.set_control_val('theta', [5.0, 100.5])
+
+    return prob, phase
+
+
+@use_tempdirs
+class WarmStartStoreTest(unittest.TestCase):
+    def test_warm_start(self):
+        store = WarmStartStore('warm_start')
+
+        prob, phase = build_brachistochrone(num_segments=10)
+        self.assertIsNone(store.find(prob))
+        self.assertIsNone(store.load(prob))
+
+        prob.run_driver()
+        filename = store.save(prob)
+        self.assertTrue(filename.is_file())
+
+        solution = {
+            name: prob.get_val(f'traj.phase0.timeseries.{name}')
+            for name in ('time', 'x', 'y', 'v', 'theta')
+        }
+
+        # a problem with the same signature is seeded with the exact solution
+        new_prob, new_phase = build_brachistochrone(num_segments=10)
+        self.assertEqual(store.find(new_prob), filename)
+        self.assertEqual(store.load(new_prob), filename)
+        new_prob.run_model()
+
+        for name, expected in solution.items():
+            assert_near_equal(
+                new_prob.get_val(f'traj.phase0.timeseries.{name}'), expected, tolerance=1e-10
+            )
+
+        # a problem with a different number of nodes is seeded by interpolation
+        coarse_prob, coarse_phase = build_brachistochrone(num_segments=6)
+        self.assertNotEqual(store.signature(coarse_prob), store.signature(prob))
+        self.assertEqual(store.signature(coarse_prob)[0], store.signature(prob)[0])
+        self.assertEqual(store.load(coarse_prob), filename)
+
+        assert_near_equal(coarse_prob.get_val('traj.phase0.t_duration'), solution['time'][-1])
+
+        coarse_prob.run_model()
+        time = coarse_prob.get_val('traj.phase0.timeseries.time')
+        for name in ('x', 'y', 'v'):
+            expected = np.interp(time[:, 0], solution['time'][:, 0], solution[name][:, 0])
+            assert_near_equal(
+                coarse_prob.get_val(f'traj.phase0.timeseries.{name}')[:, 0],
+                expected,
+                tolerance=1e-2,
+            )
+
+        # fixed initial and final values are not changed
+        assert_near_equal(coarse_phase.get_val('states:x')[[0, -1], 0], [0.0, 10.0])
+
+        cold_prob, _ = build_brachistochrone(num_segments=6)
+        cold_prob.run_driver()
+
+        coarse_prob.run_driver()
+        self.assertLess(coarse_prob.driver.iter_count, cold_prob.driver.iter_count)
+        assert_near_equal(
+            coarse_prob.get_val('traj.phase0.t_duration'),
+            cold_prob.get_val('traj.phase0.t_duration'),
+            tolerance=1e-5,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+"""
+Store converged solutions and use them as initial guesses for later, similar problems.
+
+Repeatedly solving the same or a slightly modified problem (for example a nightly sizing run)
+spends most of its optimizer iterations moving from the phase_info initial guesses back to a
+solution that was already found. A WarmStartStore keeps the final design variables, phase times,
+states, and controls of converged runs in a directory of numpy archives. Entries are keyed by a
+hash of the problem structure (the phases, their transcriptions, states, and controls) and the
+number of nodes in each phase. A problem is seeded from an entry with the same structure, using
+the entry with the same number of nodes if there is one. Otherwise phase variables are
+interpolated onto the new grid.
+
+Classes
+-------
+WarmStartStore : Directory of converged solutions keyed by problem signature.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import dymos as dm
+import numpy as np
+
+# format version of stored solutions. Increment the version whenever the contents of stored
+# solutions change so outdated files are ignored
+WARM_START_VERSION = 1
+WARM_START_EXTENSION = '.npz'
+
+
+def _hash(data):
+    """Return a short hash of JSON-compatible data."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class WarmStartStore:
+    """
+    Directory of converged solutions keyed by problem signature.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory containing the stored solutions. It is created when the first solution is saved.
+
+    Attributes
+    ----------
+    directory : Path
+        Directory containing the stored solutions.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    @staticmethod
+    def _get_phases(prob):
+        """Return the Dymos phases of the problem that are local to this process."""
+        return [
+            phase for phase in prob.model.system_iter(recurse=True, typ=dm.Phase) if phase._is_local
+        ]
+
+    def signature(self, prob):
+        """
+        Compute the signature of a problem that has been set up.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem containing Dymos phases.
+
+        Returns
+        -------
+        structure_key : str
+            Hash of the phases of the problem, their transcriptions, states, and controls.
+        nodes_key : str
+            Hash of the number of nodes in each phase.
+        """
+        structure = {'problem_type': str(getattr(prob, 'problem_type', None)), 'phases': []}
+        nodes = {}
+
+        for phase in self._get_phases(prob):
+            transcription = phase.options['transcription']
+            structure['phases'].append(
+                {
+                    'path': phase.pathname,
+                    'transcription': type(transcription).__name__,
+                    'states': sorted(phase.state_options),
+                    'controls': sorted(phase.control_options),
+                }
+            )
+            grid_data = getattr(transcription, 'grid_data', None)
+            nodes[phase.pathname] = None if grid_data is None else int(grid_data.num_nodes)
+
+        return _hash(structure), _hash(nodes)
+
+    def _filename(self, structure_key, nodes_key):
+        return self.directory / f'{structure_key}_{nodes_key}{WARM_START_EXTENSION}'
+
+    def find(self, prob):
+        """
+        Find the stored solution that best matches a problem.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem containing Dymos phases, which has been set up.
+
+        Returns
+        -------
+        Path or None
+            The stored solution with the same signature if there is one, otherwise the most
+            recently saved solution with the same structure. None if there are no solutions with
+            the same structure.
+        """
+        structure_key, nodes_key = self.signature(prob)
+
+        filename = self._filename(structure_key, nodes_key)
+        if filename.is_file():
+            return filename
+
+        if not self.directory.is_dir():
+            return None
+
+        candidates = list(self.directory.glob(f'{structure_key}_*{WARM_START_EXTENSION}'))
+        if not candidates:
+            return None
+
+        return max(candidates, key=lambda path: path.stat().st_mtime_ns)
+
+    def save(self, prob):
+        """
+        Store the current design variables and phase variables of a problem.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem containing Dymos phases, which has been run.
+
+        Returns
+        -------
+        Path
+            Path to the written file.
+        """
+        phases = self._get_phases(prob)
+        phase_paths = tuple(phase.pathname + '.' for phase in phases)
+
+        metadata = {'version': WARM_START_VERSION, 'design_vars': {}, 'phases': {}}
+        arrays = {}
+
+        # Design variables inside of phases are discretized on the phase grid, and are stored
+        # below as time histories instead
+        for name, meta in prob.model.get_design_vars(recurse=True, get_sizes=False).items():
+            if meta['source'].startswith(phase_paths):
+                continue
+
+            units = meta['units']
+            key = f'design_var.{len(metadata["design_vars"])}'
+            metadata['design_vars'][name] = {'key': key, 'units': units}
+            arrays[key] = np.asarray(prob.get_val(name, units=units), dtype=float)
+
+        for idx, phase in enumerate(phases):
+            time_options = phase.time_options
+            time_units = time_options['units']
+            time = phase.get_val(f'timeseries.{time_options["name"]}', units=time_units)
+
+            phase_meta = {
+                'time_key': f'phase.{idx}.time',
+                'time_units': time_units,
+                'states': {},
+                'controls': {},
+            }
+            arrays[phase_meta['time_key']] = time
+
+            for kind, options in (
+                ('states', phase.state_options),
+                ('controls', phase.control_options),
+            ):
+                for name, var_options in options.items():
+                    key = f'phase.{idx}.{kind}.{len(phase_meta[kind])}'
+                    phase_meta[kind][name] = {'key': key, 'units': var_options['units']}
+                    arrays[key] = phase.get_val(f'timeseries.{name}', units=var_options['units'])
+
+            metadata['phases'][phase.pathname] = phase_meta
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        filename = self._filename(*self.signature(prob))
+
+        arrays['metadata'] = np.array(json.dumps(metadata, sort_keys=True))
+        with open(filename, 'wb') as f:
+            np.savez(f, **arrays)
+
+        return filename
+
+    def load(self, prob, filename=None):
+        """
+        Set the initial guess of a problem from a stored solution.
+
+        Design variables outside of phases are set if their shapes match. Phase times are set if
+        they are not fixed or connected, and the time histories of states and optimized controls
+        are interpolated onto the phase grids, keeping fixed initial and final values.
+
+        Parameters
+        ----------
+        prob : om.Problem
+            Problem containing Dymos phases, which has been set up.
+        filename : str or Path or None
+            Stored solution to use. Defaults to the best match found by ``find``.
+
+        Returns
+        -------
+        Path or None
+            The stored solution that was used, or None if no suitable solution was found.
+        """
+        if filename is None:
+            filename = self.find(prob)
+            if filename is None:
+                return None
+
+        with np.load(filename, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+
+        metadata = json.loads(str(arrays.pop('metadata')))
+        if metadata.get('version') != WARM_START_VERSION:
+            return None
+
+        prob.final_setup()
+
+        current_design_vars = prob.model.get_design_vars(recurse=True, get_sizes=False)
+        for name, var_meta in metadata['design_vars'].items():
+            if name not in current_design_vars:
+                continue
+
+            val = arrays[var_meta['key']]
+            if np.shape(prob.get_val(name, units=var_meta['units'])) == val.shape:
+                prob.set_val(name, val, units=var_meta['units'])
+
+        for phase in self._get_phases(prob):
+            phase_meta = metadata['phases'].get(phase.pathname)
+            if phase_meta is not None:
+                self._load_phase(phase, phase_meta, arrays)
+
+        return Path(filename)
+
+    @staticmethod
+    def _load_phase(phase, phase_meta, arrays):
+        """Interpolate a stored phase solution onto the grid of a phase."""
+        time_options = phase.time_options
+        time_units = phase_meta['time_units']
+
+        # segment boundaries appear twice in timeseries outputs
+        prev_time, unique_idxs = np.unique(arrays[phase_meta['time_key']], return_index=True)
+        prev_initial = prev_time[0]
+        prev_duration = prev_time[-1] - prev_time[0]
+
+        if not (time_options['fix_initial'] or time_options['input_initial']):
+            phase.set_time_val(initial=prev_initial, units=time_units)
+        if not (time_options['fix_duration'] or time_options['input_duration']):
+            phase.set_time_val(duration=prev_duration, units=time_units)
+
+        if prev_duration <= 0.0:
+            return
+
+        # Map the stored time history onto the current time span of the phase, so the stored
+        # solution is interpolated at the same relative position in the phase even if the phase
+        # starts at a different time or its duration is fixed.
+        initial = phase.get_val('t_initial', units=time_units)[0]
+        duration = phase.get_val('t_duration', units=time_units)[0]
+        time_vals = initial + (prev_time - prev_initial) * (duration / prev_duration)
+
+        for kind, options in (('states', phase.state_options), ('controls', phase.control_options)):
+            for name, var_meta in phase_meta[kind].items():
+                if name not in options:
+                    continue
+
+                var_options = options[name]
+                if kind == 'controls' and not var_options['opt']:
+                    # controls that are not optimized are defined by the new problem
+                    continue
+
+                units = var_meta['units']
+                vals = arrays[var_meta['key']][unique_idxs]
+
+                if var_options['fix_initial'] or var_options['fix_final']:
+                    try:
+                        current = phase.get_val(f'{kind}:{name}', units=units)
+                    except KeyError:
+                        current = None
+
+                    if current is not None:
+                        vals = vals.copy()
+                        if var_options['fix_initial']:
+                            vals[0] = current[0]
+                        if var_options['fix_final']:
+                            vals[-1] = current[-1]
+
+                if kind == 'states':
+                    phase.set_state_val(name, vals, time_vals=time_vals, units=units)
+                else:
+                    phase.set_control_val(name, vals, time_vals=time_vals, units=units)
@@ -1001,15 +1001,17 @@ class TakeoffLiftoffToObstacle(PhaseBuilder):
         )
 
         altitude_ref, units = user_options['altitude_ref']
+        # the aircraft climbs from the runway, at the airport altitude
+        airport_altitude = aviary_options.get_val(Mission.Takeoff.AIRPORT_ALTITUDE, units)
 
         phase.add_state(
             Dynamic.Mission.ALTITUDE,
             fix_initial=True,
-            lower=0,
+            lower=airport_altitude,
             ref=altitude_ref,
             defect_ref=altitude_ref,
             units=units,
-            upper=altitude_ref,
+            upper=airport_altitude + altitude_ref,
             rate_source=Dynamic.Mission.ALTITUDE_RATE,
         )
 
@@ -0,0 +1,682 @@
+"""
+Define utilities for sweeping detailed takeoff and balanced field length over airport conditions.
+
+Airport performance charts need the balanced field length at hundreds of combinations of airport
+altitude, atmosphere, runway condition, and takeoff weight. Building and setting up the detailed
+takeoff trajectory takes as long as solving it, so a sweep sets up one problem and re-solves it
+for every point that only differs in values that can be set on the problem after setup. Each
+point is warm started from the solution of the nearest point already solved on the same problem,
+and groups of points are solved in parallel on a pool of worker processes.
+
+Conditions are given as Aviary variables. Inputs of the takeoff model (such as
+Mission.Takeoff.LIFT_COEFFICIENT_MAX or Aircraft.Engine.SCALE_FACTOR) are set on the problem
+directly. Mission.GROSS_MASS sets the initial mass of the trajectory. Any other variable (such as
+Mission.Takeoff.AIRPORT_ALTITUDE, the runway friction coefficients, or Settings.ATMOSPHERE_MODEL)
+is read by the phase builders when the trajectory is built, so each different value needs its own
+problem. Each worker process sets up every problem it needs once, and reuses it for all of the
+points it is given that share those values.
+
+Functions
+---------
+build_takeoff_problem : build and set up an optimization problem for a detailed takeoff
+trajectory
+make_takeoff_sweep_points : return every combination of the given takeoff conditions
+run_takeoff_sweep : solve a detailed takeoff trajectory for each of a list of takeoff conditions
+"""
+
+import copy
+import itertools
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import dymos as dm
+import numpy as np
+import openmdao.api as om
+
+from aviary.mission.phase_builder import PhaseBuilder
+from aviary.subsystems.aerodynamics.aerodynamics_builder import CoreAerodynamicsBuilder
+from aviary.subsystems.premission import CorePreMission
+from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import set_aviary_initial_values, set_aviary_input_defaults
+from aviary.utils.named_values import NamedValues
+from aviary.utils.preprocessors import preprocess_options
+from aviary.variable_info.enums import LegacyCode, Verbosity
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+_traj_name = 'traj'
+
+
+def build_takeoff_problem(
+    aviary_inputs: AviaryValues,
+    trajectory_builder,
+    optimizer='SLSQP',
+    opt_settings=None,
+    verbosity=Verbosity.BRIEF,
+):
+    """
+    Build and set up an optimization problem for a detailed takeoff trajectory.
+
+    The objective is to minimize the distance at the end of the liftoff to obstacle phase. If the
+    trajectory includes the aborted takeoff phases, this is the balanced field length.
+
+    The runway is placed at Mission.Takeoff.AIRPORT_ALTITUDE. It sets the ground altitude of the
+    low speed aerodynamics of every phase, the altitude of the phases on the runway, and the
+    initial altitude of the airborne phases.
+
+    Parameters
+    ----------
+    aviary_inputs : AviaryValues
+        Collection of Aircraft/Mission specific options. It is not modified.
+    trajectory_builder : TakeoffTrajectory
+        Builder of the detailed takeoff trajectory, with all phase builders assigned. It is not
+        modified.
+    optimizer : str, optional
+        Name of the optimizer. 'SNOPT' and 'IPOPT' use pyOptSparseDriver, any other optimizer
+        uses ScipyOptimizeDriver.
+    opt_settings : dict, optional
+        Settings passed to the optimizer.
+    verbosity : Verbosity or int, optional
+        Sets level of printouts of the driver.
+
+    Returns
+    -------
+    prob : om.Problem
+        The problem after setup, with the initial guesses of the trajectory applied.
+    trajectory_builder : TakeoffTrajectory
+        Copy of the trajectory builder that was used to build the trajectory of the problem.
+    """
+    verbosity = Verbosity(verbosity)
+
+    aviary_inputs = aviary_inputs.deepcopy()
+    trajectory_builder = copy.deepcopy(trajectory_builder)
+
+    engines = [build_engine_deck(aviary_inputs)]
+    preprocess_options(aviary_inputs, engine_models=engines)
+
+    airport_altitude = _get_airport_altitude(aviary_inputs)
+    _set_ground_altitude(trajectory_builder, airport_altitude)
+
+    prob = om.Problem(reports=False)
+
+    if optimizer in ('SNOPT', 'IPOPT'):
+        driver = prob.driver = om.pyOptSparseDriver(optimizer=optimizer)
+        driver.options['print_results'] = verbosity >= Verbosity.VERBOSE
+    else:
+        driver = prob.driver = om.ScipyOptimizeDriver(optimizer=optimizer)
+        driver.options['disp'] = verbosity >= Verbosity.VERBOSE
+
+    if opt_settings is not None:
+        driver.opt_settings.update(opt_settings)
+
+    driver.declare_coloring(show_summary=verbosity >= Verbosity.VERBOSE)
+
+    prob.model.add_subsystem(
+        'core_subsystems',
+        CorePreMission(
+            aviary_options=aviary_inputs,
+            subsystems=[
+                CoreAerodynamicsBuilder('aerodynamics', CoreMetaData, LegacyCode('FLOPS')),
+                CorePropulsionBuilder('propulsion', CoreMetaData, engine_models=engines),
+            ],
+            subsystem_options={},
+        ),
+        promotes_inputs=['aircraft:*'],
+        promotes_outputs=['aircraft:*'],
+    )
+
+    traj = prob.model.add_subsystem(_traj_name, dm.Trajectory())
+
+    trajectory_builder.build_trajectory(aviary_options=aviary_inputs, model=prob.model, traj=traj)
+
+    liftoff = trajectory_builder._liftoff_to_obstacle
+    distance_max, units = liftoff.user_options['distance_max']
+
+    trajectory_builder.get_phase(liftoff.name).add_objective(
+        Dynamic.Mission.DISTANCE, loc='final', ref=distance_max, units=units
+    )
+
+    varnames = [Aircraft.Wing.ASPECT_RATIO, Aircraft.Engine.SCALE_FACTOR]
+    set_aviary_input_defaults(prob.model, varnames, aviary_inputs)
+
+    setup_model_options(prob, aviary_inputs)
+
+    # suppress warnings:
+    # "input variable '...' promoted using '*' was already promoted using 'aircraft:*'
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', om.PromotionWarning)
+        prob.setup()
+
+    set_aviary_initial_values(prob, aviary_inputs)
+
+    prob.set_solver_print(level=0)
+
+    trajectory_builder.apply_initial_guesses(prob, _traj_name)
+    _set_runway_altitude(prob, trajectory_builder, airport_altitude)
+
+    return prob, trajectory_builder
+
+
+def _get_airport_altitude(aviary_inputs: AviaryValues):
+    """Return the airport altitude in m."""
+    if Mission.Takeoff.AIRPORT_ALTITUDE in aviary_inputs:
+        return aviary_inputs.get_val(Mission.Takeoff.AIRPORT_ALTITUDE, 'm')
+
+    return 0.0
+
+
+def _set_ground_altitude(trajectory_builder, airport_altitude):
+    """Set the ground altitude (m) of the low speed aerodynamics of every phase builder."""
+    for phase_builder in vars(trajectory_builder).values():
+        if isinstance(phase_builder, PhaseBuilder):
+            aero_options = phase_builder.subsystem_options.get('aerodynamics')
+            if aero_options is not None and aero_options.get('method') == 'low_speed':
+                aero_options['ground_altitude'] = airport_altitude
+
+
+def _set_runway_altitude(prob, trajectory_builder, airport_altitude):
+    """
+    Start the trajectory on the runway at the airport altitude (m).
+
+    Phases on the runway have no altitude state, so the altitude input of their ODE is set. The
+    altitude states of the airborne phases are shifted so the first of them starts on the runway.
+    """
+    input_meta = prob.model.get_io_metadata(iotypes='input', metadata_keys=[], get_remote=True)
+
+    delta = None
+    for phase_name in trajectory_builder.get_phase_names():
+        phase = trajectory_builder.get_phase(phase_name)
+
+        if Dynamic.Mission.ALTITUDE in phase.state_options:
+            path = f'{_traj_name}.{phase_name}.states:{Dynamic.Mission.ALTITUDE}'
+            altitude = prob.get_val(path, units='m')
+            if delta is None:
+                delta = airport_altitude - np.ravel(altitude)[0]
+            prob.set_val(path, altitude + delta, units='m')
+            continue
+
+        prom_names = {
+            meta['prom_name']
+            for abs_name, meta in input_meta.items()
+            if abs_name.startswith(phase.pathname + '.')
+            and abs_name.rsplit('.', 1)[-1] == Dynamic.Mission.ALTITUDE
+            and prob.model.get_source(abs_name).startswith('_auto_ivc.')
+        }
+        for prom_name in prom_names:
+            prob.set_val(prom_name, airport_altitude, units='m')
+
+
+def make_takeoff_sweep_points(conditions):
+    """
+    Return every combination of the given takeoff conditions.
+
+    Parameters
+    ----------
+    conditions : dict
+        Maps the name of each condition to a tuple of the list of its values and their units,
+        or to a list of values for conditions without units.
+
+    Returns
+    -------
+    list of dict
+        One point per combination of condition values, in the format expected by
+        ``run_takeoff_sweep``. The last condition varies fastest.
+    """
+    names = []
+    values = []
+    for name, condition in conditions.items():
+        if isinstance(condition, tuple):
+            vals, units = condition
+            vals = [(val, units) for val in vals]
+        else:
+            vals = list(condition)
+
+        names.append(name)
+        values.append(vals)
+
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def run_takeoff_sweep(
+    aviary_inputs: AviaryValues,
+    trajectory_builder,
+    points,
+    outputs=None,
+    optimizer='SLSQP',
+    opt_settings=None,
+    num_procs=None,
+    verbosity=Verbosity.BRIEF,
+):
+    """
+    Solve a detailed takeoff trajectory for each of a list of takeoff conditions.
+
+    Points are grouped by the values of their conditions that are used to build the trajectory,
+    and each group is ordered so that neighboring points are solved one after the other. Groups
+    are split into chunks so there is at least one chunk for every worker process. A worker
+    solves the points of a chunk in order on one problem, starting each point from the solution
+    of the nearest point of the chunk already solved. The first point of each chunk, and any
+    point that fails to converge from a warm start, starts from the initial guesses of the
+    trajectory builder.
+
+    Parameters
+    ----------
+    aviary_inputs : AviaryValues
+        Collection of Aircraft/Mission specific options, which supplies every value not set by
+        the points.
+    trajectory_builder : TakeoffTrajectory
+        Builder of the detailed takeoff trajectory, with all phase builders assigned.
+    points : list of dict
+        Conditions of each point, mapping Aviary variable names to a tuple of value and units,
+        or to a value in the default units of the variable. Mission.GROSS_MASS sets the initial
+        mass of the trajectory.
+    outputs : dict, optional
+        Maps result column names to a tuple of the path of a problem variable and its units. The
+        final value of each variable is reported. Defaults to the field length (the final
+        distance of the liftoff to obstacle phase) in ft and the decision speed (the final
+        velocity of the brake release to decision speed phase) in kn.
+    optimizer : str, optional
+        Name of the optimizer. 'SNOPT' and 'IPOPT' use pyOptSparseDriver, any other optimizer
+        uses ScipyOptimizeDriver.
+    opt_settings : dict, optional
+        Settings passed to the optimizer.
+    num_procs : int, optional
+        Maximum number of worker processes. Defaults to the number of CPUs. If 1, the points are
+        solved one after another in the current process.
+    verbosity : Verbosity or int, optional
+        Sets level of printouts.
+
+    Returns
+    -------
+    NamedValues
+        Results table with one entry per point, in the order provided. There is a column for
+        each condition, 'Success', and each output. Points that raised an error are not
+        successful and have NaN outputs.
+
+    Notes
+    -----
+    All arguments are pickled and sent to each worker process when it starts. Worker processes
+    are created using the default multiprocessing start method of the platform. If that is
+    'spawn' (Windows and macOS), scripts calling this function must guard their entry point with
+    ``if __name__ == '__main__':``.
+    """
+    verbosity = Verbosity(verbosity)
+    points = [dict(point) for point in points]
+
+    if outputs is None:
+        liftoff_name = trajectory_builder._liftoff_to_obstacle.name
+        decision_speed_name = trajectory_builder._brake_release_to_decision_speed.name
+        outputs = {
+            'Field Length': (
+                f'{_traj_name}.{liftoff_name}.timeseries.{Dynamic.Mission.DISTANCE}',
+                'ft',
+            ),
+            'Decision Speed': (
+                f'{_traj_name}.{decision_speed_name}.timeseries.{Dynamic.Mission.VELOCITY}',
+                'kn',
+            ),
+        }
+
+    sweep_data = {
+        'aviary_inputs': aviary_inputs,
+        'trajectory_builder': trajectory_builder,
+        'optimizer': optimizer,
+        'opt_settings': opt_settings,
+        'outputs': outputs,
+        'verbosity': verbosity,
+        'condition_names': _get_condition_names(points),
+    }
+
+    if num_procs is None:
+        num_procs = os.cpu_count() or 1
+    num_procs = max(1, min(num_procs, len(points)))
+
+    # Conditions that are inputs of the takeoff model can be set after setup. Finding them needs
+    # a problem that has been set up, which is reused when points are solved in this process.
+    _sweep_problems.clear()
+    sweep_problem = _get_sweep_problem(sweep_data, ())
+    sweep_data['model_inputs'] = set(sweep_problem['model_inputs'])
+
+    chunks = _get_sweep_chunks(sweep_data, points, num_procs)
+
+    if verbosity >= Verbosity.BRIEF:
+        num_problems = len({build_key for build_key, _ in chunks})
+        print(
+            f'Solving {len(points)} takeoff points on {num_problems} takeoff problems in '
+            f'{len(chunks)} chunks'
+        )
+
+    if num_procs == 1:
+        chunk_results = [_solve_sweep_chunk(sweep_data, *chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=num_procs,
+            initializer=_init_sweep_worker,
+            initargs=(pickle.dumps(sweep_data),),
+        ) as executor:
+            chunk_results = list(executor.map(_run_sweep_worker, chunks))
+
+    _sweep_problems.clear()
+
+    results = {}
+    for chunk_result in chunk_results:
+        results.update(chunk_result)
+    results = [results[idx] for idx in range(len(points))]
+
+    sweep_results = NamedValues()
+    for name in sweep_data['condition_names']:
+        units = CoreMetaData[name]['units'] if name in CoreMetaData else 'unitless'
+        vals = []
+        for point in points:
+            val = point.get(name)
+            if isinstance(val, tuple):
+                val, units = val
+            vals.append(val)
+        sweep_results.set_val(name, vals, units)
+
+    sweep_results.set_val('Success', [result['Success'] for result in results])
+    for column, (_, units) in outputs.items():
+        sweep_results.set_val(column, [result[column] for result in results], units)
+
+    if verbosity > Verbosity.QUIET:
+        for idx, result in enumerate(results):
+            if result['Error'] is not None:
+                warnings.warn(f'Takeoff sweep point {idx} failed: {result["Error"]}')
+
+    return sweep_results
+
+
+def _get_condition_names(points):
+    """Return the names of all conditions set by any point, in the order first used."""
+    return list(dict.fromkeys(name for point in points for name in point))
+
+
+def _get_model_inputs(prob, names):
+    """
+    Return the initial value of each of the named conditions that is an independent input of the
+    takeoff model.
+    """
+    model_inputs = {}
+    for name in names:
+        if name == Mission.GROSS_MASS:
+            continue
+
+        try:
+            source = prob.model.get_source(name)
+        except (KeyError, RuntimeError):
+            # not a variable of the model
+            continue
+
+        if source.startswith('_auto_ivc.'):
+            model_inputs[name] = prob.get_val(name).copy()
+
+    return model_inputs
+
+
+def _split_condition(condition):
+    """Return the value and units of a condition."""
+    if isinstance(condition, tuple):
+        return condition
+
+    return condition, None
+
+
+def _get_build_key(sweep_data, point):
+    """
+    Return the conditions of a point that are used to build the trajectory, as a hashable key.
+
+    Conditions with the same value as the inputs of the sweep are left out, so they share the
+    problem built from those inputs.
+    """
+    aviary_inputs: AviaryValues = sweep_data['aviary_inputs']
+    model_inputs = sweep_data['model_inputs']
+
+    build_key = []
+    for name, condition in sorted(point.items()):
+        if name == Mission.GROSS_MASS or name in model_inputs:
+            continue
+
+        val, units = _split_condition(condition)
+        if name in aviary_inputs:
+            current = aviary_inputs.get_val(name, units) if units else aviary_inputs.get_val(name)
+            if np.array_equal(np.asarray(current, dtype=object), np.asarray(val, dtype=object)):
+                continue
+
+        if isinstance(val, (list, np.ndarray)):
+            val = tuple(np.ravel(val).tolist())
+
+        build_key.append((name, val, units))
+
+    return tuple(build_key)
+
+
+def _get_coordinates(points):
+    """
+    Return the position of each point in the space of its conditions.
+
+    Numerical conditions are scaled by their range over all points. Other conditions add a
+    distance of one between points with different values.
+    """
+    coordinates = np.zeros((len(points), 0))
+
+    for name in _get_condition_names(points):
+        vals = [_split_condition(point.get(name))[0] for point in points]
+
+        try:
+            numbers = np.array([np.ravel(val) for val in vals], dtype=float)
+        except (TypeError, ValueError):
+            # categorical condition
+            labels = {}
+            numbers = np.array([[labels.setdefault(repr(val), len(labels))] for val in vals])
+            numbers = (numbers == np.arange(len(labels))).astype(float)
+        else:
+            span = np.ptp(numbers, axis=0)
+            span[span == 0.0] = 1.0
+            numbers = (numbers - numbers.min(axis=0)) / span
+
+        coordinates = np.hstack([coordinates, numbers])
+
+    return coordinates
+
+
+def _order_by_neighbors(coordinates, indices):
+    """Order points so each point is followed by its nearest point that has not been ordered."""
+    remaining = list(indices)
+    order = [remaining.pop(0)]
+
+    while remaining:
+        distances = np.linalg.norm(coordinates[remaining] - coordinates[order[-1]], axis=1)
+        order.append(remaining.pop(int(np.argmin(distances))))
+
+    return order
+
+
+def _get_sweep_chunks(sweep_data, points, num_procs):
+    """Group points by the problem they are solved on, and split the groups into chunks."""
+    coordinates = _get_coordinates(points)
+
+    groups = {}
+    for idx, point in enumerate(points):
+        groups.setdefault(_get_build_key(sweep_data, point), []).append(idx)
+
+    # every worker gets at least one chunk
+    num_splits = -(-num_procs // len(groups))
+
+    chunks = []
+    for build_key, indices in groups.items():
+        order = _order_by_neighbors(coordinates, indices)
+        for split in np.array_split(order, min(num_splits, len(order))):
+            chunk = [(int(idx), points[idx], coordinates[idx]) for idx in split]
+            chunks.append((build_key, chunk))
+
+    return chunks
+
+
+# problems set up in this process, keyed by the build conditions of their points
+_sweep_problems = {}
+
+# sweep data shared by all chunks solved in a sweep worker process
+_sweep_worker_data = None
+
+
+def _init_sweep_worker(pickled_sweep_data):
+    """Unpickle the sweep data when a sweep worker process starts."""
+    global _sweep_worker_data
+    _sweep_worker_data = pickle.loads(pickled_sweep_data)
+    _sweep_problems.clear()
+
+
+def _run_sweep_worker(chunk):
+    """Solve a chunk of sweep points in a worker process."""
+    return _solve_sweep_chunk(_sweep_worker_data, *chunk)
+
+
+def _get_sweep_problem(sweep_data, build_key):
+    """
+    Return the problem for a build key, setting it up if needed.
+
+    Returns
+    -------
+    dict
+        'prob', the problem after setup; 'trajectory_builder', the trajectory builder used to
+        build it; 'model_inputs', the initial value of each condition that is an input of the
+        problem; and 'airport_altitude' in m.
+    """
+    try:
+        return _sweep_problems[build_key]
+    except KeyError:
+        pass
+
+    aviary_inputs: AviaryValues = sweep_data['aviary_inputs'].deepcopy()
+    for name, val, units in build_key:
+        if units is None:
+            aviary_inputs.set_val(name, val)
+        else:
+            aviary_inputs.set_val(name, val, units)
+
+    prob, trajectory_builder = build_takeoff_problem(
+        aviary_inputs,
+        sweep_data['trajectory_builder'],
+        optimizer=sweep_data['optimizer'],
+        opt_settings=sweep_data['opt_settings'],
+        verbosity=sweep_data['verbosity'],
+    )
+
+    _sweep_problems[build_key] = {
+        'prob': prob,
+        'trajectory_builder': trajectory_builder,
+        'model_inputs': _get_model_inputs(prob, sweep_data['condition_names']),
+        'airport_altitude': _get_airport_altitude(aviary_inputs),
+    }
+
+    return _sweep_problems[build_key]
+
+
+def _solve_sweep_chunk(sweep_data, build_key, chunk):
+    """
+    Solve the points of a chunk in order on one problem.
+
+    Returns
+    -------
+    dict
+        Maps the index of each point to its results: 'Success', each output, and 'Error', which
+        contains the error message if the point raised an error, otherwise None.
+    """
+    outputs = sweep_data['outputs']
+    results = {}
+    solutions = []
+
+    try:
+        sweep_problem = _get_sweep_problem(sweep_data, build_key)
+    except Exception as error:
+        for idx, _, _ in chunk:
+            results[idx] = {'Success': False, 'Error': f'{type(error).__name__}: {error}'}
+            results[idx].update({column: np.nan for column in outputs})
+        return results
+
+    for idx, point, coordinates in chunk:
+        warm_start = None
+        if solutions:
+            distances = [np.linalg.norm(coordinates - position) for position, _ in solutions]
+            warm_start = solutions[int(np.argmin(distances))][1]
+
+        result = _solve_sweep_point(outputs, sweep_problem, point, warm_start)
+        if not result['Success'] and warm_start is not None:
+            result = _solve_sweep_point(outputs, sweep_problem, point, None)
+
+        if result['Success']:
+            solutions.append((coordinates, _get_design_var_values(sweep_problem['prob'])))
+
+        results[idx] = result
+
+    return results
+
+
+def _get_design_var_values(prob):
+    """Return the current value of each design variable, keyed by source."""
+    design_vars = prob.model.get_design_vars(recurse=True, get_sizes=False)
+
+    return {meta['source']: prob.get_val(meta['source']).copy() for meta in design_vars.values()}
+
+
+def _set_initial_mass(prob, trajectory_builder, gross_mass, units):
+    """Shift the mass states of every phase, so the trajectory starts at the gross mass."""
+    phase_names = trajectory_builder.get_phase_names()
+    first_phase = f'{_traj_name}.{phase_names[0]}'
+
+    initial_mass = prob.get_val(f'{first_phase}.states:{Dynamic.Vehicle.MASS}', units=units)[0]
+    delta = gross_mass - initial_mass
+
+    for phase_name in phase_names:
+        path = f'{_traj_name}.{phase_name}.states:{Dynamic.Vehicle.MASS}'
+        prob.set_val(path, prob.get_val(path, units=units) + delta, units=units)
+
+
+def _solve_sweep_point(outputs, sweep_problem, point, warm_start):
+    """Set the conditions of a point on a problem, solve it, and collect its results."""
+    prob = sweep_problem['prob']
+    trajectory_builder = sweep_problem['trajectory_builder']
+
+    result = {'Success': False, 'Error': None}
+
+    try:
+        if warm_start is None:
+            trajectory_builder.apply_initial_guesses(prob, _traj_name)
+            _set_runway_altitude(prob, trajectory_builder, sweep_problem['airport_altitude'])
+        else:
+            for source, val in warm_start.items():
+                prob.set_val(source, val)
+
+        # inputs not set by this point return to their initial values
+        for name, val in sweep_problem['model_inputs'].items():
+            if name in point:
+                val, units = _split_condition(point[name])
+                prob.set_val(name, val, units)
+            else:
+                prob.set_val(name, val)
+
+        if Mission.GROSS_MASS in point:
+            val, units = _split_condition(point[Mission.GROSS_MASS])
+            _set_initial_mass(prob, trajectory_builder, val, units or 'lbm')
+
+        # final_setup resets dynamic coloring, so fix the driver to the one computed by the
+        # first solve of this problem
+        coloring = prob.driver._coloring_info.coloring
+        if coloring is not None:
+            prob.driver.use_fixed_coloring(coloring)
+
+        result['Success'] = prob.run_driver().success
+
+    except Exception as error:
+        result['Error'] = f'{type(error).__name__}: {error}'
+        result.update({column: np.nan for column in outputs})
+        return result
+
+    for column, (path, units) in outputs.items():
+        result[column] = float(np.ravel(prob.get_val(path, units=units))[-1])
+
+    return result
@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.mission.energy_state.phases import takeoff_sweep
+from aviary.mission.energy_state.phases.takeoff_sweep import (
+    make_takeoff_sweep_points,
+    run_takeoff_sweep,
+)
+from aviary.validation_cases.validation_data.test_data.advanced_single_aisle_data import (
+    balanced_trajectory_builder,
+    inputs,
+)
+from aviary.variable_info.enums import Verbosity
+from aviary.variable_info.variables import Mission
+
+
+class TakeoffSweepPointsTest(unittest.TestCase):
+    def test_points(self):
+        points = make_takeoff_sweep_points(
+            {
+                Mission.Takeoff.AIRPORT_ALTITUDE: ([0.0, 1000.0], 'ft'),
+                Mission.Takeoff.ROLLING_FRICTION_COEFFICIENT: [0.0175, 0.025],
+            }
+        )
+
+        self.assertEqual(len(points), 4)
+        self.assertEqual(
+            points[1],
+            {
+                Mission.Takeoff.AIRPORT_ALTITUDE: (0.0, 'ft'),
+                Mission.Takeoff.ROLLING_FRICTION_COEFFICIENT: 0.025,
+            },
+        )
+
+
+@use_tempdirs
+class TakeoffSweepTest(unittest.TestCase):
+    def test_gross_mass(self):
+        gross_mass = [129734.0, 129500.0, 130500.0, 128000.0]
+        points = make_takeoff_sweep_points({Mission.GROSS_MASS: (gross_mass, 'lbm')})
+
+        serial = run_takeoff_sweep(
+            inputs, balanced_trajectory_builder, points, num_procs=1, verbosity=Verbosity.QUIET
+        )
+        parallel = run_takeoff_sweep(
+            inputs, balanced_trajectory_builder, points, num_procs=2, verbosity=Verbosity.QUIET
+        )
+
+        for results in (serial, parallel):
+            self.assertEqual(list(results.get_val('Success')), [True] * 4)
+            assert_near_equal(results.get_val(Mission.GROSS_MASS, 'lbm'), gross_mass)
+
+        field_length = serial.get_val('Field Length', 'ft')
+        assert_near_equal(field_length[0], 7141.7, 1e-3)
+        # a lighter aircraft needs less runway
+        self.assertEqual(sorted(field_length), [field_length[i] for i in (3, 1, 0, 2)])
+
+        assert_near_equal(parallel.get_val('Field Length', 'ft'), field_length, 1e-3)
+        assert_near_equal(
+            parallel.get_val('Decision Speed', 'kn'), serial.get_val('Decision Speed', 'kn'), 1e-3
+        )
+
+    def test_airport_altitude(self):
+        points = make_takeoff_sweep_points(
+            {
+                Mission.Takeoff.AIRPORT_ALTITUDE: ([0.0, 5000.0], 'ft'),
+                Mission.GROSS_MASS: ([129734.0, 128000.0], 'lbm'),
+            }
+        )
+
+        with patch.object(
+            takeoff_sweep, 'build_takeoff_problem', wraps=takeoff_sweep.build_takeoff_problem
+        ) as build:
+            results = run_takeoff_sweep(
+                inputs, balanced_trajectory_builder, points, num_procs=1, verbosity=Verbosity.QUIET
+            )
+
+        # the airport altitude is read when the trajectory is built, so the points at 5000 ft
+        # share a second problem, while the points at sea level use the problem of the inputs
+        self.assertEqual(build.call_count, 2)
+
+        self.assertEqual(list(results.get_val('Success')), [True] * 4)
+        assert_near_equal(
+            results.get_val(Mission.Takeoff.AIRPORT_ALTITUDE, 'ft'), [0.0, 0.0, 5000.0, 5000.0]
+        )
+
+        field_length = results.get_val('Field Length', 'ft')
+        assert_near_equal(field_length[0], 7141.7, 1e-3)
+        # thinner air at altitude needs more runway
+        self.assertGreater(field_length[2], field_length[0])
+        self.assertGreater(field_length[3], field_length[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,34 +1,40 @@
 import numpy as np
 import openmdao.api as om
-from numpy.polynomial import Polynomial
+from scipy.special import comb
 
 
-class PolynomialFit(om.ImplicitComponent):
+class PolynomialFit(om.ExplicitComponent):
     """
     Using location data (control points) to build a polynomial fit function
     and to compute initial gear time and flap time.
 
+    The cubic is fit to the control points in the least-squares sense by solving the normal
+    equations, and the derivatives of the fit are computed in closed form from the same
+    pseudo-inverse.
+
     Methods
     -------
     initialize(self):
         declare number of control point "N_cp"
     setup(self):
-        setup the polynomial fit inputs, outputs, and solver.
-    solve_nonlinear(self, inputs, outputs):
-        Compute the outputs, given the inputs using the numpy fitting function.
-    apply_nonlinear(self, inputs, outputs, residuals):
-        Compute the residuals
+        setup the polynomial fit inputs, outputs, and partials.
+    compute(self, inputs, outputs):
+        Compute the polynomial coefficients and the heights at the gear and flap times.
+    compute_partials(self, inputs, J):
+        Compute the closed-form least-squares derivatives.
     """
 
     def initialize(self):
         self.options.declare('N_cp', types=int, desc='number of control point')
 
     def setup(self):
+        N_cp = self.options['N_cp']
+
         # locations data up want to fit, which can
         # also be thought of as the "control points"
         # of the fit function
-        self.add_input('h_cp', shape=self.options['N_cp'], units='ft')
-        self.add_input('time_cp', shape=self.options['N_cp'], units='s')
+        self.add_input('h_cp', shape=N_cp, units='ft')
+        self.add_input('time_cp', shape=N_cp, units='s')
 
         self.add_input('t_init_gear', 37.3, units='s')
         self.add_output('h_init_gear', shape=1, units='ft')
@@ -37,25 +43,87 @@ class PolynomialFit(om.ImplicitComponent):
         self.add_output('h_init_flaps', shape=1, units='ft')
 
         # these are the coefficients of the polynomial function you are fitting
-        self.add_output('A', np.zeros(4))  # assuming a 5th order polynomial
+        self.add_output('A', np.zeros(4))  # assuming a 3rd order polynomial
 
-        # using CS here will give accurate partials, but will miss the sparsity pattern
-        # issue #497
-        self.declare_partials('*', '*', method='cs')
+        # control point times of the most recent fit, and the factorization computed from them
+        self._cached_time = None
+        self._cached_basis = None
 
-        self.linear_solver = om.DirectSolver()
+        self.declare_partials('A', ['h_cp', 'time_cp'])
+        self.declare_partials('h_init_gear', ['h_cp', 'time_cp', 't_init_gear'])
+        self.declare_partials('h_init_flaps', ['h_cp', 'time_cp', 't_init_flaps'])
 
-    def solve_nonlinear(self, inputs, outputs):
-        """Compute the outputs, given the inputs using the numpy fitting function."""
+    def _fit_basis(self, X_cp):
+        """
+        Build the scaled Vandermonde matrix of the control point times and its pseudo-inverse.
+
+        The result for the most recent control point times is cached, so the factorization is
+        only repeated when the times change.
+
+        Parameters
+        ----------
+        X_cp : ndarray
+            Control point times.
+
+        Returns
+        -------
+        tuple
+            The scaled times, the scale factor, the scaled Vandermonde matrix, the inverse of the
+            normal-equations matrix, the pseudo-inverse of the Vandermonde matrix, and the matrix
+            that converts coefficients of the scaled polynomial to coefficients in time.
+        """
+        cached_time = self._cached_time
+        if (
+            cached_time is not None
+            and X_cp.dtype == cached_time.dtype
+            and np.array_equal(X_cp, cached_time)
+        ):
+            return self._cached_basis
+
+        # Fit in a time scaled to [-1, 1], like numpy's Polynomial.fit, to keep the normal
+        # equations well conditioned. The least-squares cubic does not depend on the choice of
+        # scaling, so the scaling is held fixed when differentiating.
+        t_min = np.min(X_cp.real)
+        t_max = np.max(X_cp.real)
+        center = 0.5 * (t_max + t_min)
+        scale = 0.5 * (t_max - t_min)
+        if scale == 0.0:
+            scale = 1.0
+
+        u = (X_cp - center) / scale
+        vander = np.stack((np.ones_like(u), u, u**2, u**3), axis=1)
+
+        normal = vander.T @ vander
+        if np.iscomplexobj(normal):
+            normal_inv = np.linalg.inv(normal)
+        else:
+            # minimum-norm fit when there are too few distinct control points
+            normal_inv = np.linalg.pinv(normal)
+        pinv = normal_inv @ vander.T
+
+        # a_k * u**k = a_k * ((t - center) / scale)**k, expanded in powers of t
+        powers = np.arange(4)
+        convert = (
+            comb(powers, powers[:, np.newaxis])
+            * (-center) ** np.maximum(powers - powers[:, np.newaxis], 0)
+            / scale**powers
+        )
+
+        self._cached_time = X_cp.copy()
+        self._cached_basis = (u, scale, vander, normal_inv, pinv, convert)
+
+        return self._cached_basis
+
+    def compute(self, inputs, outputs):
+        """Compute the polynomial coefficients and the heights at the gear and flap times."""
         X_cp = inputs['time_cp']
         Y_cp = inputs['h_cp']
 
-        # using the numpy fitting function because its faster and more stable
-        polynomial = Polynomial.fit(X_cp, Y_cp, deg=3)
+        _, _, _, _, pinv, convert = self._fit_basis(X_cp)
 
-        coeffs = polynomial.convert().coef
+        coeffs = convert @ (pinv @ Y_cp)
 
-        outputs['A'][:] = coeffs
+        outputs['A'] = coeffs
 
         (
             a0,
@@ -70,42 +138,41 @@ class PolynomialFit(om.ImplicitComponent):
         x_flaps = inputs['t_init_flaps']
         outputs['h_init_flaps'] = a0 + a1 * x_flaps + a2 * x_flaps**2 + a3 * x_flaps**3
 
-    def apply_nonlinear(self, inputs, outputs, residuals):
-        (
-            a0,
-            a1,
-            a2,
-            a3,
-        ) = outputs['A']
-        """
-        Compute the residuals
-        """
-
+    def compute_partials(self, inputs, J):
+        """Compute the closed-form least-squares derivatives."""
         X_cp = inputs['time_cp']
         Y_cp = inputs['h_cp']
 
-        Y_computed = a0 + a1 * X_cp + a2 * X_cp**2 + a3 * X_cp**3
+        u, scale, vander, normal_inv, pinv, convert = self._fit_basis(X_cp)
 
-        # note that derivatives are showing up in the apply_nonlinear method because
-        # this is the formulation we use to form the residual.
-        # We are minimizing the sum of the square of the error: np.sum((Y_computed-Y_cp)**2) w.r.t A
-        # hence we differentiate the objective w.r.t A and set the resulting system of equations to 0
-        d_error__d_Y_computed = 2 * (Y_computed - Y_cp)
+        scaled_coeffs = pinv @ Y_cp
+        fit_error = Y_cp - vander @ scaled_coeffs
 
-        d_Y_computed__d_a0 = np.ones(self.options['N_cp'])
-        d_Y_computed__d_a1 = X_cp
-        d_Y_computed__d_a2 = X_cp**2
-        d_Y_computed__d_a3 = X_cp**3
+        # Moving control point i only changes row i of the Vandermonde matrix, so
+        # dA/dt_i = (V^T V)^-1 (dv_i * err_i - v_i * (dv_i . A))
+        d_vander = np.stack((np.zeros_like(u), np.ones_like(u), 2.0 * u, 3.0 * u**2), axis=1)
+        d_vander /= scale
+        d_normal_rhs = (
+            d_vander * fit_error[:, np.newaxis] - vander * (d_vander @ scaled_coeffs)[:, np.newaxis]
+        )
 
-        residuals['A'][0] = np.sum(d_error__d_Y_computed * d_Y_computed__d_a0)
-        residuals['A'][1] = np.sum(d_error__d_Y_computed * d_Y_computed__d_a1)
-        residuals['A'][2] = np.sum(d_error__d_Y_computed * d_Y_computed__d_a2)
-        residuals['A'][3] = np.sum(d_error__d_Y_computed * d_Y_computed__d_a3)
+        dA_dh_cp = convert @ pinv
+        dA_dtime_cp = convert @ (normal_inv @ d_normal_rhs.T)
 
-        x_gear = inputs['t_init_gear']
-        h_gear = a0 + a1 * x_gear + a2 * x_gear**2 + a3 * x_gear**3
-        residuals['h_init_gear'] = h_gear - outputs['h_init_gear']
+        J['A', 'h_cp'] = dA_dh_cp
+        J['A', 'time_cp'] = dA_dtime_cp
 
-        x_flaps = inputs['t_init_flaps']
-        h_flaps = a0 + a1 * x_flaps + a2 * x_flaps**2 + a3 * x_flaps**3
-        residuals['h_init_flaps'] = h_flaps - outputs['h_init_flaps']
+        (
+            a0,
+            a1,
+            a2,
+            a3,
+        ) = convert @ scaled_coeffs
+
+        for name, t_name in (('h_init_gear', 't_init_gear'), ('h_init_flaps', 't_init_flaps')):
+            x = inputs[t_name]
+            dh_dA = np.array([np.ones_like(x), x, x**2, x**3]).reshape(4)
+
+            J[name, 'h_cp'] = dh_dA @ dA_dh_cp
+            J[name, 'time_cp'] = dh_dA @ dA_dtime_cp
+            J[name, t_name] = a1 + 2.0 * a2 * x + 3.0 * a3 * x**2
@@ -1,7 +1,9 @@
 import unittest
 
+import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal
+from numpy.polynomial import Polynomial
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
 from aviary.mission.two_dof.polynomial_fit import PolynomialFit
 
@@ -74,15 +76,47 @@ class PolynomialFitTest(unittest.TestCase):
         self.prob.setup(check=False, force_alloc_complex=True)
 
     def test_case1(self):
-        # Checks output values only. It will not check partials
-        # because cs is used to compute partials already.
-
         self.prob.run_model()
 
         tol = 5e-4
         assert_near_equal(self.prob['h_init_gear'], -600, tol)
         assert_near_equal(self.prob['h_init_flaps'], -250, tol)
 
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
+
+    def test_noisy_fit(self):
+        # control points that are not exactly on a cubic, so the fit has a residual error
+        Y_noisy = np.array(Y_cp) + 20.0 * np.sin(np.arange(16))
+        self.prob.set_val('h_cp', Y_noisy, units='ft')
+        self.prob.set_val('t_init_gear', 55.0, units='s')
+        self.prob.set_val('t_init_flaps', 62.0, units='s')
+
+        self.prob.run_model()
+
+        polynomial = Polynomial.fit(X_cp, Y_noisy, deg=3)
+        assert_near_equal(self.prob['A'], polynomial.convert().coef, 1e-10)
+        assert_near_equal(self.prob['h_init_gear'], polynomial(55.0), 1e-10)
+        assert_near_equal(self.prob['h_init_flaps'], polynomial(62.0), 1e-10)
+
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
+
+    def test_cached_basis(self):
+        self.prob.run_model()
+
+        # the factorization is reused while the control point times are unchanged
+        comp = self.prob.model.polyfit
+        basis = comp._cached_basis
+        self.prob.set_val('h_cp', 2.0 * np.array(Y_cp), units='ft')
+        self.prob.run_model()
+        self.assertIs(comp._cached_basis, basis)
+        assert_near_equal(self.prob['h_init_gear'], -1200, 5e-4)
+
+        self.prob.set_val('time_cp', np.array(X_cp) + 1.0, units='s')
+        self.prob.run_model()
+        self.assertIsNot(comp._cached_basis, basis)
+
 
 if __name__ == '__main__':
     unittest.main()
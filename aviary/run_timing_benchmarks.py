@@ -0,0 +1,106 @@
+"""
+Run the timing benchmarks and compare them against a stored baseline.
+
+The timings of each run are appended to a history file. Use ``--update_baseline`` to store the
+timings of a run as the baseline that later runs are compared to. Baselines are specific to the
+machine they were recorded on.
+
+The exit code is 1 if any timing regressed.
+"""
+
+import argparse
+import json
+import sys
+
+from aviary.validation_cases.timing_benchmarks import (
+    TIMING_CASES,
+    TIMING_METRICS,
+    compare_to_baseline,
+    run_timing_benchmarks,
+)
+
+
+def _print_record(record):
+    print(f'{"case":<14}' + ''.join(f'{metric:>16}' for metric in TIMING_METRICS))
+    for name, results in record['cases'].items():
+        values = ''.join(
+            f'{"-":>16}' if results[metric] is None else f'{results[metric]:>16.3f}'
+            for metric in TIMING_METRICS
+        )
+        print(f'{name:<14}' + values)
+    print('(times in s, peak_memory in MB)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'cases',
+        nargs='*',
+        help=f'Cases to run, all by default. Valid cases are: {", ".join(TIMING_CASES)}.',
+    )
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=3,
+        help='Number of timed model and derivative evaluations of each case.',
+    )
+    parser.add_argument(
+        '--history',
+        default='timing_history.json',
+        help='JSON file the timings are appended to.',
+    )
+    parser.add_argument(
+        '--baseline',
+        default='timing_baseline.json',
+        help='JSON file of the baseline timings.',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='Allowed relative increase of each timing from the baseline.',
+    )
+    parser.add_argument(
+        '--update_baseline',
+        action='store_true',
+        help='Store the timings of this run as the new baseline.',
+    )
+    args = parser.parse_args()
+
+    for name in args.cases:
+        if name not in TIMING_CASES:
+            parser.error(f'unknown case "{name}"')
+
+    record = run_timing_benchmarks(
+        cases=args.cases or None, num_repeats=args.repeats, history_file=args.history
+    )
+    _print_record(record)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(record, f, indent=1)
+            print(file=f)  # avoid 'no newline at end of file' message
+        print(f'Baseline timings written to {args.baseline}')
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f'No baseline timings found at {args.baseline}, run with --update_baseline first.')
+        return 0
+
+    regressions = compare_to_baseline(record, baseline, tolerance=args.tolerance)
+    if not regressions:
+        print(f'No regressions from the baseline of {baseline["timestamp"]}.')
+        return 0
+
+    print(f'Regressions from the baseline of {baseline["timestamp"]}:')
+    for name, metric, baseline_value, value in regressions:
+        print(f'  {name} {metric}: {baseline_value:.3f} -> {value:.3f}')
+
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
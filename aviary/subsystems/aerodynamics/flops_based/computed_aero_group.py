@@ -11,7 +11,10 @@ from aviary.subsystems.aerodynamics.flops_based.induced_drag import InducedDrag
 from aviary.subsystems.aerodynamics.flops_based.lift import LiftEqualsWeight
 from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import LiftDependentDrag
 from aviary.subsystems.aerodynamics.flops_based.mux_component import MuxComponent
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import (
+    ExplicitSkinFriction,
+    SkinFriction,
+)
 from aviary.subsystems.aerodynamics.flops_based.skin_friction_drag import SkinFrictionDrag
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 
@@ -24,6 +27,14 @@ class ComputedAeroGroup(om.Group):
             'num_nodes', default=1, types=int, desc='Number of nodes along mission segment'
         )
         self.options.declare('gamma', default=1.4, desc='Ratio of specific heats for air.')
+        self.options.declare(
+            'explicit_skin_friction',
+            default=False,
+            types=bool,
+            desc='If True, compute the skin friction coefficient with ExplicitSkinFriction, '
+            'which converges every node with a vectorized Newton iteration instead of a '
+            'Newton solver and dense DirectSolver.',
+        )
 
     def setup(self):
         num_nodes = self.options['num_nodes']
@@ -119,7 +130,10 @@ class ComputedAeroGroup(om.Group):
             ],
         )
 
-        comp = SkinFriction(num_nodes=num_nodes)
+        if self.options['explicit_skin_friction']:
+            comp = ExplicitSkinFriction(num_nodes=num_nodes)
+        else:
+            comp = SkinFriction(num_nodes=num_nodes)
         self.add_subsystem(
             'SkinFrictionCoef',
             comp,
@@ -309,3 +309,321 @@ class SkinFriction(om.ImplicitComponent):
             'ij,i->ij', dskf_dwtr, dwtr_dwt
         ).ravel()
         partials['skin_friction_coeff', 'cf_iter'] = (-1.0 / wall_temp_ratio).ravel()
+
+
+class ExplicitSkinFriction(om.ExplicitComponent):
+    """
+    Computes skin friction coefficient using the Sommer and Short T Prime method as used
+    in FLOPS AERSCL.
+
+    This is an explicit alternative to SkinFriction. Every node and component pair is an
+    independent system of two equations in the skin friction coefficient and the wall
+    temperature, so all pairs are converged at once with a vectorized Newton's method, and the
+    partials are computed with the implicit function theorem. This avoids factorizing a matrix
+    that grows with the number of nodes.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.CONLOG = 2.302585
+        self.sea_level_pressure = 14.6959 * 144  # psi -> psf
+
+    def initialize(self):
+        """Declare options."""
+        self.options.declare(
+            'num_nodes',
+            types=int,
+            default=1,
+            desc='The number of points at which the cross product is computed.',
+        )
+        self.options.declare(
+            'tolerance',
+            types=float,
+            default=1e-14,
+            desc='Relative tolerance on the Newton step used to converge the skin friction '
+            'coefficient and wall temperature.',
+        )
+        self.options.declare(
+            'max_iter',
+            types=int,
+            default=20,
+            desc='Maximum number of Newton iterations.',
+        )
+
+        add_aviary_option(self, Aircraft.Design.TYPE)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Fuselage.NUM_FUSELAGES)
+        add_aviary_option(self, Aircraft.HorizontalTail.NUM_TAILS)
+        add_aviary_option(self, Aircraft.VerticalTail.NUM_TAILS)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+        num_fuselages = self.options[Aircraft.Fuselage.NUM_FUSELAGES]
+        num_h_tails = self.options[Aircraft.HorizontalTail.NUM_TAILS]
+        num_v_tails = self.options[Aircraft.VerticalTail.NUM_TAILS]
+
+        self.nc = nc = 1 + num_h_tails + num_v_tails + num_fuselages + int(sum(num_engines))
+
+        # Simulation inputs
+        add_aviary_input(self, Dynamic.Atmosphere.TEMPERATURE, shape=nn, units='degR')
+        add_aviary_input(self, Dynamic.Atmosphere.STATIC_PRESSURE, shape=nn, units='lbf/ft**2')
+        add_aviary_input(self, Dynamic.Atmosphere.MACH, shape=nn, units='unitless')
+
+        # Aero subsystem inputs
+        self.add_input('characteristic_lengths', np.ones(nc), units='ft')
+
+        self.add_output('cf_iter', np.ones((nn, nc)), units='unitless')
+        self.add_output('skin_friction_coeff', np.ones((nn, nc)), units='unitless')
+        self.add_output('Re', np.ones((nn, nc)), units='unitless')
+        self.add_output('wall_temp', np.ones((nn, nc)), units='degR')
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        nc = self.nc
+        n = nn * nc
+
+        # every output only depends on the inputs at its own node and component
+        row_col = np.arange(n)
+        node_cols = np.repeat(np.arange(nn), nc)
+        length_cols = np.tile(np.arange(nc), nn)
+
+        outputs = ['Re', 'cf_iter', 'wall_temp', 'skin_friction_coeff']
+        self.declare_partials(
+            outputs,
+            [
+                Dynamic.Atmosphere.TEMPERATURE,
+                Dynamic.Atmosphere.STATIC_PRESSURE,
+                Dynamic.Atmosphere.MACH,
+            ],
+            rows=row_col,
+            cols=node_cols,
+        )
+        self.declare_partials(outputs, 'characteristic_lengths', rows=row_col, cols=length_cols)
+
+    def compute(self, inputs, outputs):
+        T, pressure, mach, length = self._reshape_inputs(inputs)
+
+        cf, wall_temp = self._solve(T, pressure, mach, length)
+        terms = self._terms(T, pressure, mach, length, cf, wall_temp)
+
+        outputs['Re'] = terms['reynolds_num']
+        outputs['cf_iter'] = cf
+        outputs['wall_temp'] = wall_temp
+        outputs['skin_friction_coeff'] = cf / terms['wall_temp_ratio']
+
+    def compute_partials(self, inputs, partials):
+        T, pressure, mach, length = self._reshape_inputs(inputs)
+
+        cf, wall_temp = self._solve(T, pressure, mach, length)
+        terms = self._terms(T, pressure, mach, length, cf, wall_temp, derivs=True)
+
+        # The outputs y = (cf, wall_temp) satisfy R(x, y) = 0, so dy/dx = -inv(dR/dy) dR/dx.
+        # dR/dy is a 2x2 matrix for each node and component pair, and is inverted directly.
+        dRc_dcf = terms['dRc_dcf']
+        dRc_dwt = terms['dRc_dwt']
+        dRw_dcf = terms['dRw_dcf']
+        dRw_dwt = terms['dRw_dwt']
+        det = dRc_dcf * dRw_dwt - dRc_dwt * dRw_dcf
+
+        wall_temp_ratio = terms['wall_temp_ratio']
+        dwtr_dwt = terms['dwtr_dwt']
+
+        wrt_names = {
+            'T': Dynamic.Atmosphere.TEMPERATURE,
+            'p': Dynamic.Atmosphere.STATIC_PRESSURE,
+            'mach': Dynamic.Atmosphere.MACH,
+            'len': 'characteristic_lengths',
+        }
+        for key, wrt in wrt_names.items():
+            dRc_dx = terms['dRc_d' + key]
+            dRw_dx = terms['dRw_d' + key]
+
+            dcf_dx = (dRc_dwt * dRw_dx - dRw_dwt * dRc_dx) / det
+            dwt_dx = (dRw_dcf * dRc_dx - dRc_dcf * dRw_dx) / det
+            dwtr_dx = terms['dwtr_d' + key] + dwtr_dwt * dwt_dx
+
+            partials['Re', wrt] = terms['dreyn_d' + key].ravel()
+            partials['cf_iter', wrt] = dcf_dx.ravel()
+            partials['wall_temp', wrt] = dwt_dx.ravel()
+            partials['skin_friction_coeff', wrt] = (
+                dcf_dx / wall_temp_ratio - cf * dwtr_dx / wall_temp_ratio**2
+            ).ravel()
+
+    def _reshape_inputs(self, inputs):
+        """Return the inputs shaped to broadcast to (num_nodes, num_components)."""
+        T = inputs[Dynamic.Atmosphere.TEMPERATURE][:, np.newaxis]
+        pressure = inputs[Dynamic.Atmosphere.STATIC_PRESSURE][:, np.newaxis]
+        mach = inputs[Dynamic.Atmosphere.MACH][:, np.newaxis]
+        length = inputs['characteristic_lengths'][np.newaxis, :]
+
+        return T, pressure, mach, length
+
+    def _solve(self, T, pressure, mach, length):
+        """Converge the skin friction coefficient and wall temperature at every pair at once."""
+        tolerance = self.options['tolerance']
+        max_iter = self.options['max_iter']
+
+        reynolds_num = self._terms(T, pressure, mach, length)['reynolds_num']
+
+        # same initial guesses as SkinFriction
+        wall_temp = (1.0 + 0.176 * mach * mach) * T * np.ones_like(reynolds_num)
+        cf = (0.242 / (np.log(reynolds_num * 0.0015) / self.CONLOG)) ** 2
+
+        for _ in range(max_iter):
+            terms = self._terms(T, pressure, mach, length, cf, wall_temp, derivs=True)
+
+            Rc = terms['Rc']
+            Rw = terms['Rw']
+            dRc_dcf = terms['dRc_dcf']
+            dRc_dwt = terms['dRc_dwt']
+            dRw_dcf = terms['dRw_dcf']
+            dRw_dwt = terms['dRw_dwt']
+            det = dRc_dcf * dRw_dwt - dRc_dwt * dRw_dcf
+
+            delta_cf = (dRc_dwt * Rw - dRw_dwt * Rc) / det
+            delta_wt = (dRw_dcf * Rc - dRc_dcf * Rw) / det
+
+            cf = cf + delta_cf
+            wall_temp = wall_temp + delta_wt
+
+            # only the real part is checked, so complex step converges the same way
+            error = max(
+                np.max(np.abs(delta_cf.real / cf.real)),
+                np.max(np.abs(delta_wt.real / wall_temp.real)),
+            )
+            if error <= tolerance:
+                break
+        else:
+            raise om.AnalysisError(
+                f'{self.msginfo}: skin friction did not converge in {max_iter} iterations.'
+            )
+
+        return cf, wall_temp
+
+    def _terms(self, T, pressure, mach, length, cf=None, wall_temp=None, derivs=False):
+        """
+        Compute the Reynolds number and, when cf and wall_temp are given, the residuals of the
+        skin friction and wall temperature equations.
+
+        When derivs is True, the partials of the Reynolds number and residuals with respect to
+        the inputs and to cf and wall_temp are also returned.
+        """
+        terms = {}
+
+        Pratio = pressure / self.sea_level_pressure
+        kelvin = T / 1.8
+        RE = 1.479301e9 * Pratio * (kelvin + 110.4) / kelvin**2
+
+        # REYNOLDS NUMBER
+        reynolds_num = RE * mach * length
+        terms['reynolds_num'] = reynolds_num
+
+        if derivs:
+            dRE_dp = 1.479301e9 * (kelvin + 110.4) / (self.sea_level_pressure * kelvin**2)
+            dRE_dT = -1.479301e9 / 1.8 * (Pratio * (1.0 / kelvin**2 + 2.0 * 110.4 / kelvin**3))
+
+            dreyn_dT = dRE_dT * mach * length
+            dreyn_dp = dRE_dp * mach * length
+            dreyn_dmach = RE * length * np.ones_like(mach)
+            dreyn_dlen = RE * mach * np.ones_like(length)
+
+            terms['dreyn_dT'] = dreyn_dT
+            terms['dreyn_dp'] = dreyn_dp
+            terms['dreyn_dmach'] = dreyn_dmach
+            terms['dreyn_dlen'] = dreyn_dlen
+
+        if cf is None:
+            return terms
+
+        # SUTHERLAND'S CONSTANT IS 198.72 DEG R FROM 1962 ON
+        suth_const = T + 198.72
+        E = 0.80
+
+        # COMBINED CONSTANT INCLUDING 1/RHO
+        combined_const = 4.593153e-6 * E * suth_const / (RE * mach * T**1.5)
+
+        # ADIABATIC WALL TEMPERATURE
+        TAW = (1.0 + 0.176 * mach * mach) * T
+
+        # WALL TEMPERATURE RATIO
+        wall_temp_ratio = 1.0 + 0.45 * (wall_temp / T - 1.0) + 0.035 * mach * mach
+        terms['wall_temp_ratio'] = wall_temp_ratio
+
+        sqrt_cf = np.sqrt(cf)
+        den = 1.0 + 3.59 * sqrt_cf * wall_temp_ratio
+        CFL = cf / den
+
+        q = combined_const * wall_temp**3 / CFL
+        terms['Rw'] = 0.5 * TAW / (1.0 + q) - 0.5 * wall_temp
+
+        num = wall_temp_ratio * T + 198.72
+        RP = reynolds_num * num / (suth_const * wall_temp_ratio**2.5)
+
+        log_RP_cf = np.log(RP * cf)
+        fact = (0.242 * self.CONLOG) ** 2
+        terms['Rc'] = fact / log_RP_cf**2 - cf
+
+        if not derivs:
+            return terms
+
+        dcomb_dRE = -combined_const / RE
+        dcomb_dmach = -combined_const / mach
+        dcomb_dT = (
+            4.593153e-6 * E * (1.0 / T**1.5 - 1.5 * suth_const / T**2.5) / (RE * mach)
+            + dcomb_dRE * dRE_dT
+        )
+        dcomb_dp = dcomb_dRE * dRE_dp
+
+        dTAW_dT = 1.0 + 0.176 * mach * mach
+        dTAW_dmach = 0.352 * mach * T
+
+        dwtr_dT = -0.45 * wall_temp / T**2
+        dwtr_dmach = 0.07 * mach * np.ones_like(wall_temp)
+        dwtr_dwt = 0.45 / T * np.ones_like(wall_temp)
+        terms['dwtr_dT'] = dwtr_dT
+        terms['dwtr_dp'] = np.zeros_like(wall_temp)
+        terms['dwtr_dmach'] = dwtr_dmach
+        terms['dwtr_dlen'] = np.zeros_like(wall_temp)
+        terms['dwtr_dwt'] = dwtr_dwt
+
+        dCFL_dcf = 1.0 / den - cf * 3.59 * wall_temp_ratio * 0.5 / (sqrt_cf * den**2)
+        dCFL_dwtr = -cf * 3.59 * sqrt_cf / den**2
+
+        # wall temperature residual
+        dRw_dTAW = 0.5 / (1.0 + q)
+        dRw_dq = -0.5 * TAW / (1.0 + q) ** 2
+        dq_dcomb = wall_temp**3 / CFL
+        dq_dCFL = -q / CFL
+
+        terms['dRw_dcf'] = dRw_dq * dq_dCFL * dCFL_dcf
+        terms['dRw_dwt'] = (
+            dRw_dq * (3.0 * combined_const * wall_temp**2 / CFL + dq_dCFL * dCFL_dwtr * dwtr_dwt)
+            - 0.5
+        )
+        terms['dRw_dT'] = dRw_dTAW * dTAW_dT + dRw_dq * (
+            dq_dcomb * dcomb_dT + dq_dCFL * dCFL_dwtr * dwtr_dT
+        )
+        terms['dRw_dp'] = dRw_dq * dq_dcomb * dcomb_dp
+        terms['dRw_dmach'] = dRw_dTAW * dTAW_dmach + dRw_dq * (
+            dq_dcomb * dcomb_dmach + dq_dCFL * dCFL_dwtr * dwtr_dmach
+        )
+        terms['dRw_dlen'] = np.zeros_like(wall_temp)
+
+        # skin friction residual
+        den = suth_const * wall_temp_ratio**2.5
+        dRP_dreyn = num / den
+        dRP_dwtr = reynolds_num * (T / den - 2.5 * num / (den * wall_temp_ratio))
+        dRP_dT = reynolds_num * (wall_temp_ratio / den - num / (den * suth_const))
+
+        dRc_dRP = -2.0 * fact / (RP * log_RP_cf**3)
+
+        terms['dRc_dcf'] = -2.0 * fact / (cf * log_RP_cf**3) - 1.0
+        terms['dRc_dwt'] = dRc_dRP * dRP_dwtr * dwtr_dwt
+        terms['dRc_dT'] = dRc_dRP * (dRP_dreyn * dreyn_dT + dRP_dwtr * dwtr_dT + dRP_dT)
+        terms['dRc_dp'] = dRc_dRP * dRP_dreyn * dreyn_dp
+        terms['dRc_dmach'] = dRc_dRP * (dRP_dreyn * dreyn_dmach + dRP_dwtr * dwtr_dmach)
+        terms['dRc_dlen'] = dRc_dRP * dRP_dreyn * dreyn_dlen
+
+        return terms
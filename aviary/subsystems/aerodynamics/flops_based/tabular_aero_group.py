@@ -5,6 +5,11 @@ import openmdao.api as om
 
 from aviary.subsystems.aerodynamics.flops_based.drag import TotalDrag as Drag
 from aviary.subsystems.aerodynamics.flops_based.lift import LiftEqualsWeight as CL
+from aviary.subsystems.aerodynamics.flops_based.tabular_polar import (
+    INTERPOLATION_METHODS,
+    TabularPolarInterp,
+    get_gridded_polar,
+)
 from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.data_interpolator_builder import build_data_interpolator
 from aviary.utils.functions import get_path
@@ -40,9 +45,11 @@ class TabularAeroGroup(om.Group):
     drag (CDI_data) and zero-lift drag (CD0_data) are required, and can be provided
     either in a .csv data table or an NamedValues object.
 
-    Data is checked for its structure, and attempts to use a structured grid metamodel
-    component where possible. The "structured" flag forces the use of the structured
-    metamodel components (for both tables).
+    Data is checked for its structure. Tables on a structured grid, or that can be sorted
+    onto one, are read once per process and interpolated with precomputed coefficients
+    (see TabularPolarInterp), using the method set by "interpolation_method". Other tables
+    use a semistructured metamodel component. Setting the "structured" flag to False forces
+    the use of the semistructured metamodel components (for both tables).
 
     The "connect_training_data" flag instructs the metamodel components to look for the
     drag data tables to be connected through OpenMDAO as inputs to this system, for cases
@@ -85,6 +92,14 @@ class TabularAeroGroup(om.Group):
             'for drag coefficients in data will be ignored.',
         )
 
+        options.declare(
+            'interpolation_method',
+            default='lagrange3',
+            values=tuple(INTERPOLATION_METHODS),
+            desc='Interpolation method for drag data on a structured grid. "cubic" is a natural '
+            'cubic spline.',
+        )
+
     def setup(self):
         options = self.options
         nn = options['num_nodes']
@@ -93,37 +108,25 @@ class TabularAeroGroup(om.Group):
         structured = options['structured']
         connect_training_data = options['connect_training_data']
 
-        # if data is from file, read data using alias dict
-        if isinstance(CDI_table, str):
-            CDI_table = get_path(CDI_table)
-        if isinstance(CDI_table, Path):
-            CDI_table, _, _ = read_data_file(CDI_table, aliases=aliases)
-        if isinstance(CD0_table, str):
-            CD0_table = get_path(CD0_table)
-        if isinstance(CD0_table, Path):
-            CD0_table, _, _ = read_data_file(CD0_table, aliases=aliases)
-
-        if connect_training_data or not structured:
-            method = 'lagrange3'
+        if structured:
+            CD0_polar = get_gridded_polar(
+                CD0_table,
+                'zero_lift_drag_coefficient',
+                aliases=aliases,
+                connect_training_data=connect_training_data,
+            )
+            CDI_polar = get_gridded_polar(
+                CDI_table,
+                'lift_dependent_drag_coefficient',
+                aliases=aliases,
+                connect_training_data=connect_training_data,
+            )
         else:
-            method = '2D-lagrange3'
+            CD0_polar = CDI_polar = None
 
-        CD0_interp = build_data_interpolator(
-            num_nodes=nn,
-            interpolator_data=CD0_table,
-            interpolator_outputs={'zero_lift_drag_coefficient': 'unitless'},
-            method=method,
-            structured=structured,
-            connect_training_data=connect_training_data,
-        )
-
-        CDI_interp = build_data_interpolator(
-            num_nodes=nn,
-            interpolator_data=CDI_table,
-            interpolator_outputs={'lift_dependent_drag_coefficient': 'unitless'},
-            method=method,
-            structured=structured,
-            connect_training_data=connect_training_data,
+        CD0_interp = self._build_interpolator(CD0_table, CD0_polar, 'zero_lift_drag_coefficient')
+        CDI_interp = self._build_interpolator(
+            CDI_table, CDI_polar, 'lift_dependent_drag_coefficient'
         )
 
         # add subsystems
@@ -190,6 +193,42 @@ class TabularAeroGroup(om.Group):
             promotes_outputs=['CD', Dynamic.Vehicle.DRAG],
         )
 
+    def _build_interpolator(self, table, polar, output):
+        """Build the interpolation component of one of the drag tables."""
+        options = self.options
+        nn = options['num_nodes']
+        method = options['interpolation_method']
+        connect_training_data = options['connect_training_data']
+
+        if polar is not None:
+            return TabularPolarInterp(
+                num_nodes=nn,
+                polar=polar,
+                method=method,
+                connect_training_data=connect_training_data,
+            )
+
+        if method == 'cubic':
+            raise ValueError(
+                f'Data for {output} is not on a structured grid, which is required for cubic '
+                'interpolation.'
+            )
+
+        # if data is from file, read data using alias dict
+        if isinstance(table, str):
+            table = get_path(table)
+        if isinstance(table, Path):
+            table, _, _ = read_data_file(table, aliases=aliases)
+
+        return build_data_interpolator(
+            num_nodes=nn,
+            interpolator_data=table,
+            interpolator_outputs={output: 'unitless'},
+            method=method,
+            structured=False,
+            connect_training_data=connect_training_data,
+        )
+
 
 class _DynamicPressure(om.ExplicitComponent):
     """Calculate dynamic pressure as a function of velocity and density."""
@@ -0,0 +1,360 @@
+"""
+Drag polars on structured grids, with precomputed interpolation coefficients.
+
+Tabular aerodynamics reads the same drag polars in every phase of a mission. Polars are read and
+sorted onto a structured grid once per process, keyed by a hash of their content, and shared by
+every TabularAeroGroup that uses them.
+
+The interpolation methods supported here are all linear in the tabulated values. For each axis of
+a grid, the coefficients of the polynomial on every grid interval are precomputed as a matrix that
+maps the tabulated values to polynomial coefficients. The matrices only depend on the grid, so
+they are also cached, and do not need to be recomputed when the tabulated values are connected as
+training data that change during a run.
+
+Classes
+-------
+GriddedPolar : Drag polar on a structured grid.
+TabularPolarInterp : Interpolate a drag polar on a structured grid.
+
+Functions
+---------
+get_gridded_polar : Return a drag polar on a structured grid, reusing a cached polar if possible.
+clear_polar_cache : Remove all cached polars and interpolation coefficients.
+"""
+
+import copy
+import hashlib
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from scipy.interpolate import CubicSpline
+
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.functions import get_path
+from aviary.utils.interpolant_cache import hash_training_data
+
+GriddedPolar = namedtuple('GriddedPolar', ['inputs', 'grid', 'output', 'values'])
+GriddedPolar.__doc__ = """
+Drag polar on a structured grid.
+
+Attributes
+----------
+inputs : tuple of (str, str)
+    Name and units of each independent variable, in the order of the grid axes.
+grid : tuple of numpy.ndarray
+    Sorted, unique values of each independent variable.
+output : tuple of (str, str)
+    Name and units of the tabulated variable.
+values : numpy.ndarray or None
+    Tabulated values with shape (len(axis) for axis in grid), or None if the values are
+    connected as training data.
+"""
+
+# number of polynomial coefficients on each grid interval, and minimum number of grid points
+INTERPOLATION_METHODS = {'slinear': 2, 'lagrange3': 4, 'cubic': 4}
+
+# parsed polar tables and gridded polars, keyed by content hash
+_table_cache = {}
+_polar_cache = {}
+# interval coefficient matrices, keyed by (grid hash, method)
+_coefficient_cache = {}
+
+
+def _load_table(data, aliases):
+    """
+    Read a polar table from file once per file content and aliases, and return it with its hash.
+    """
+    if isinstance(data, str):
+        data = get_path(data)
+
+    if isinstance(data, Path):
+        sha = hashlib.sha1(data.read_bytes())
+        # the column names of the parsed table depend on the aliases
+        sha.update(repr(sorted((aliases or {}).items())).encode())
+        key = sha.hexdigest()
+        try:
+            return _table_cache[key], key
+        except KeyError:
+            # read_data_file normalizes the aliases in place, which would change the key
+            table, _, _ = read_data_file(data, aliases=copy.deepcopy(aliases))
+            _table_cache[key] = table
+            return table, key
+
+    sha = hashlib.sha1()
+    for name, (val, units) in data.items():
+        sha.update(f'{name}:{units}:'.encode())
+        sha.update(hash_training_data(val).encode())
+    return data, sha.hexdigest()
+
+
+def _grid_table(table, output, output_units, connect_training_data):
+    """Sort a polar table onto a structured grid. Return None if it is not a full grid."""
+    inputs = []
+    columns = []
+    for name, (val, units) in table.items():
+        if name != output:
+            inputs.append((name, units))
+            columns.append(np.asarray(val, dtype=float))
+
+    if any(column.ndim != 1 for column in columns):
+        return None
+
+    if connect_training_data:
+        # tabulated values are connected in the gridded order, only the axes are needed
+        grid = tuple(np.unique(column) for column in columns)
+        return GriddedPolar(tuple(inputs), grid, (output, output_units), None)
+
+    values = np.asarray(table.get_val(output, output_units), dtype=float)
+    shape = tuple(len(column) for column in columns)
+
+    if values.shape == shape and all(
+        np.array_equal(np.unique(column), column) for column in columns
+    ):
+        # already on a structured grid
+        grid = tuple(columns)
+
+    elif values.ndim == 1 and all(len(column) == len(values) for column in columns):
+        # one row per point: sort the points and check that they fill the whole grid
+        grid = tuple(np.unique(column) for column in columns)
+        shape = tuple(len(axis) for axis in grid)
+        if np.prod(shape) != len(values):
+            return None
+
+        order = np.lexsort(columns[::-1])
+        points = np.stack([column[order] for column in columns])
+        full_grid = np.stack([axis.ravel() for axis in np.meshgrid(*grid, indexing='ij')])
+        if not np.array_equal(points, full_grid):
+            return None
+
+        values = values[order].reshape(shape)
+
+    else:
+        return None
+
+    values = values.copy()
+    values.setflags(write=False)
+    for axis in grid:
+        axis.setflags(write=False)
+
+    return GriddedPolar(tuple(inputs), grid, (output, output_units), values)
+
+
+def get_gridded_polar(
+    data, output, output_units='unitless', aliases=None, connect_training_data=False
+):
+    """
+    Return a drag polar on a structured grid, reusing a cached polar if possible.
+
+    Polars read from a file are only parsed the first time a file with that content is used.
+    Data with one row per point is sorted onto a structured grid.
+
+    Parameters
+    ----------
+    data : str, Path, or NamedValues
+        Data file, or NamedValues object, containing the polar.
+    output : str
+        Name of the tabulated variable. Every other variable in data is an independent variable.
+    output_units : str, optional
+        Units of the tabulated variable.
+    aliases : dict, optional
+        Allowed headers of each variable, used when reading data files.
+    connect_training_data : bool, optional
+        If True, the tabulated values are connected during the run, so only the grid is needed
+        from data.
+
+    Returns
+    -------
+    GriddedPolar or None
+        Polar on a structured grid, or None if the data does not fill a structured grid.
+    """
+    table, table_key = _load_table(data, aliases)
+    key = (table_key, output, output_units, connect_training_data)
+
+    try:
+        return _polar_cache[key]
+    except KeyError:
+        polar = _polar_cache[key] = _grid_table(table, output, output_units, connect_training_data)
+        return polar
+
+
+def _get_coefficients(grid, method):
+    """
+    Return the interval coefficient matrices of a grid axis.
+
+    The result has shape (number of intervals, number of coefficients, number of points). On
+    interval i, the interpolant is sum(c[k] * (x - grid[i])**k) with c = result[i] @ values.
+    """
+    key = (hash_training_data(grid), method)
+    try:
+        return _coefficient_cache[key]
+    except KeyError:
+        pass
+
+    num_points = len(grid)
+    num_coeffs = INTERPOLATION_METHODS[method]
+    if num_points < num_coeffs:
+        raise ValueError(
+            f'{method} interpolation requires at least {num_coeffs} points in each dimension, '
+            f'but a grid with {num_points} points was provided.'
+        )
+
+    coefficients = np.zeros((num_points - 1, num_coeffs, num_points))
+
+    if method == 'slinear':
+        intervals = np.arange(num_points - 1)
+        inv_width = 1.0 / np.diff(grid)
+        coefficients[intervals, 0, intervals] = 1.0
+        coefficients[intervals, 1, intervals] = -inv_width
+        coefficients[intervals, 1, intervals + 1] = inv_width
+
+    elif method == 'lagrange3':
+        # cubic through two points on each side of the interval, shifted inward at the ends
+        for i in range(num_points - 1):
+            start = min(max(i - 1, 0), num_points - 4)
+            points = grid[start : start + 4] - grid[i]
+            coefficients[i, :, start : start + 4] = np.linalg.inv(
+                np.vander(points, 4, increasing=True)
+            )
+
+    else:
+        # natural cubic spline, the polynomial coefficients are linear in the values
+        spline = CubicSpline(grid, np.eye(num_points), bc_type='natural')
+        coefficients[...] = spline.c[::-1].transpose(1, 0, 2)
+
+    coefficients.setflags(write=False)
+    _coefficient_cache[key] = coefficients
+
+    return coefficients
+
+
+def clear_polar_cache():
+    """Remove all cached polars and interpolation coefficients."""
+    _table_cache.clear()
+    _polar_cache.clear()
+    _coefficient_cache.clear()
+
+
+def _contract(values, weights):
+    """Contract each axis of values with the weights of every point along that axis."""
+    result = np.einsum('ip,p...->i...', weights[0], values)
+    for weight in weights[1:]:
+        result = np.einsum('ip,ip...->i...', weight, result)
+
+    return result
+
+
+class TabularPolarInterp(om.ExplicitComponent):
+    """
+    Interpolate a drag polar on a structured grid.
+
+    Values outside of the grid are extrapolated with the polynomial of the nearest interval. If
+    'connect_training_data' is True, the tabulated values are an input named '<output>_train',
+    with the shape of the grid.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare('polar', types=GriddedPolar, desc='Drag polar to interpolate.')
+
+        self.options.declare(
+            'method',
+            default='lagrange3',
+            values=tuple(INTERPOLATION_METHODS),
+            desc='Interpolation method. "cubic" is a natural cubic spline.',
+        )
+
+        self.options.declare(
+            'connect_training_data',
+            types=bool,
+            default=False,
+            desc='Flag that sets if the tabulated values are passed via openMDAO connections.',
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        polar = self.options['polar']
+        output, output_units = polar.output
+
+        for name, units in polar.inputs:
+            self.add_input(name, val=1.0, shape=nn, units=units)
+
+        self.add_output(output, shape=nn, units=output_units)
+
+        if self.options['connect_training_data']:
+            self.add_input(
+                f'{output}_train',
+                val=np.zeros([len(axis) for axis in polar.grid]),
+                units=output_units,
+            )
+
+        method = self.options['method']
+        self._coefficients = [_get_coefficients(axis, method) for axis in polar.grid]
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        polar = self.options['polar']
+        output = polar.output[0]
+
+        ar = np.arange(nn)
+        for name, _ in polar.inputs:
+            self.declare_partials(output, name, rows=ar, cols=ar)
+
+        if self.options['connect_training_data']:
+            self.declare_partials(output, f'{output}_train')
+
+    def _weights(self, inputs):
+        """Return the weight of each grid value, and its derivative, along each axis."""
+        polar = self.options['polar']
+
+        weights = []
+        derivs = []
+        for (name, _), axis, coefficients in zip(polar.inputs, polar.grid, self._coefficients):
+            x = inputs[name]
+            interval = np.searchsorted(axis, x.real, side='right') - 1
+            interval = np.clip(interval, 0, len(axis) - 2)
+
+            num_coeffs = coefficients.shape[1]
+            dx = x - axis[interval]
+            powers = dx[:, np.newaxis] ** np.arange(num_coeffs)
+            dpowers = np.zeros_like(powers)
+            dpowers[:, 1:] = np.arange(1, num_coeffs) * powers[:, :-1]
+
+            interval_coefficients = coefficients[interval]
+            weights.append(np.einsum('ik,ikp->ip', powers, interval_coefficients))
+            derivs.append(np.einsum('ik,ikp->ip', dpowers, interval_coefficients))
+
+        return weights, derivs
+
+    def _values(self, inputs):
+        polar = self.options['polar']
+
+        if self.options['connect_training_data']:
+            return inputs[f'{polar.output[0]}_train']
+
+        return polar.values
+
+    def compute(self, inputs, outputs):
+        weights, _ = self._weights(inputs)
+
+        outputs[self.options['polar'].output[0]] = _contract(self._values(inputs), weights)
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+        polar = self.options['polar']
+        output = polar.output[0]
+
+        weights, derivs = self._weights(inputs)
+        values = self._values(inputs)
+
+        for i, (name, _) in enumerate(polar.inputs):
+            J[output, name] = _contract(values, weights[:i] + [derivs[i]] + weights[i + 1 :])
+
+        if self.options['connect_training_data']:
+            outer = weights[0]
+            for weight in weights[1:]:
+                outer = np.einsum('ip,iq->ipq', outer, weight).reshape(nn, -1)
+
+            J[output, f'{output}_train'] = outer
@@ -5,7 +5,10 @@ import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import (
+    ExplicitSkinFriction,
+    SkinFriction,
+)
 from aviary.variable_info.variables import Aircraft
 
 
@@ -441,6 +444,45 @@ class SkinFrictionCoeffTest(unittest.TestCase):
         assert_near_equal(np.max(cf_diff), 0.0, 1e-4)
         assert_near_equal(np.max(Re_diff), 0.0, 1e-4)
 
+    def test_explicit(self):
+        n = 12
+        nc = 9
+
+        machs = np.array([0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.775, 0.8, 0.825, 0.85, 0.875])
+        lens = np.linspace(1, 120, nc)
+        temp = np.linspace(389.97, 518.67, n)
+        pres = np.linspace(374.74437747, 2116.22, n)
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = 0
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = 1
+        options[Aircraft.Engine.NUM_ENGINES] = [2, 4]
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('implicit', SkinFriction(num_nodes=n, **options), promotes=['*'])
+        model.add_subsystem(
+            'explicit', ExplicitSkinFriction(num_nodes=n, **options), promotes_inputs=['*']
+        )
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val('temperature', temp)
+        prob.set_val('static_pressure', pres)
+        prob.set_val('mach', machs)
+        prob.set_val('characteristic_lengths', lens)
+
+        prob.run_model()
+
+        for name in ('cf_iter', 'skin_friction_coeff', 'Re', 'wall_temp'):
+            assert_near_equal(
+                prob.get_val(f'explicit.{name}'), prob.get_val(f'implicit.{name}'), 1e-10
+            )
+
+        derivs = prob.check_partials(method='cs', out_stream=None, includes=['explicit'])
+        assert_check_partials(derivs, atol=1e-08, rtol=1e-10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from parameterized import parameterized
+
+from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import aliases
+from aviary.subsystems.aerodynamics.flops_based.tabular_polar import (
+    TabularPolarInterp,
+    clear_polar_cache,
+    get_gridded_polar,
+)
+from aviary.utils.named_values import NamedValues
+
+CDI_table = 'validation_cases/validation_data/test_data/large_single_aisle_1_CDI_polar.csv'
+
+
+class GriddedPolarTest(unittest.TestCase):
+    def setUp(self):
+        clear_polar_cache()
+
+    def test_file(self):
+        polar = get_gridded_polar(CDI_table, 'lift_dependent_drag_coefficient', aliases=aliases)
+
+        self.assertEqual(polar.inputs, (('mach', 'unitless'), ('lift_coefficient', 'unitless')))
+        self.assertEqual(polar.values.shape, (12, 15))
+        assert_near_equal(polar.grid[1][:3], [0.15, 0.2, 0.25])
+        assert_near_equal(polar.values[0, :3], [0.00114, 0.00138, 0.0019])
+
+        # the same file is only read and gridded once
+        self.assertIs(
+            get_gridded_polar(CDI_table, 'lift_dependent_drag_coefficient', aliases=aliases),
+            polar,
+        )
+
+        # the same file read with other aliases has other column names
+        other_aliases = {
+            'M': 'mach',
+            'CL': 'lift_coefficient',
+            'CDI': 'lift-dependent_drag_coefficient',
+        }
+        other_polar = get_gridded_polar(CDI_table, 'CDI', aliases=other_aliases)
+        self.assertEqual(other_polar.inputs, (('M', 'unitless'), ('CL', 'unitless')))
+        assert_near_equal(other_polar.values, polar.values)
+
+    def test_named_values(self):
+        mach, cl = np.meshgrid([0.2, 0.4, 0.6], [0.1, 0.2, 0.3, 0.4], indexing='ij')
+        cd = 0.01 + mach * cl**2
+
+        # points in any order are sorted onto the grid
+        order = np.random.default_rng(0).permutation(mach.size)
+        data = NamedValues()
+        data.set_val('mach', mach.ravel()[order])
+        data.set_val('lift_coefficient', cl.ravel()[order])
+        data.set_val('lift_dependent_drag_coefficient', cd.ravel()[order])
+
+        polar = get_gridded_polar(data, 'lift_dependent_drag_coefficient')
+        assert_near_equal(polar.grid[0], [0.2, 0.4, 0.6])
+        assert_near_equal(polar.values, cd)
+
+        # points missing from the grid
+        data.set_val('mach', mach.ravel()[order][:-1])
+        data.set_val('lift_coefficient', cl.ravel()[order][:-1])
+        data.set_val('lift_dependent_drag_coefficient', cd.ravel()[order][:-1])
+        self.assertIsNone(get_gridded_polar(data, 'lift_dependent_drag_coefficient'))
+
+
+class TabularPolarInterpTest(unittest.TestCase):
+    @parameterized.expand(['slinear', 'lagrange3', 'cubic'])
+    def test_method(self, method):
+        nn = 20
+        polar = get_gridded_polar(CDI_table, 'lift_dependent_drag_coefficient', aliases=aliases)
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'polar', TabularPolarInterp(num_nodes=nn, polar=polar, method=method)
+        )
+        prob.model.add_subsystem(
+            'train',
+            TabularPolarInterp(
+                num_nodes=nn, polar=polar, method=method, connect_training_data=True
+            ),
+        )
+
+        # equivalent structured metamodel
+        comp = om.MetaModelStructuredComp(method=method, extrapolate=True, vec_size=nn)
+        comp.add_input('mach', training_data=polar.grid[0])
+        comp.add_input('lift_coefficient', training_data=polar.grid[1])
+        comp.add_output('lift_dependent_drag_coefficient', training_data=polar.values)
+        prob.model.add_subsystem('meta_model', comp)
+
+        prob.setup(force_alloc_complex=True)
+
+        # includes points outside of the grid
+        rng = np.random.default_rng(1)
+        mach = rng.uniform(0.1, 0.95, nn)
+        cl = rng.uniform(0.05, 0.95, nn)
+        for name in ('polar', 'train', 'meta_model'):
+            prob.set_val(f'{name}.mach', mach)
+            prob.set_val(f'{name}.lift_coefficient', cl)
+        prob.set_val('train.lift_dependent_drag_coefficient_train', polar.values)
+
+        prob.run_model()
+
+        expected = prob.get_val('meta_model.lift_dependent_drag_coefficient')
+        for name in ('polar', 'train'):
+            assert_near_equal(
+                prob.get_val(f'{name}.lift_dependent_drag_coefficient'), expected, 1e-12
+            )
+
+        partial_data = prob.check_partials(
+            out_stream=None, method='cs', includes=['polar', 'train']
+        )
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
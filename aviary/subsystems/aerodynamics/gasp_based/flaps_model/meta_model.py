@@ -2,838 +2,388 @@ import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.enums import FlapType
-from aviary.variable_info.functions import add_aviary_option
+from aviary.variable_info.functions import add_aviary_input, add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic
 
-
-class MetaModelGroup(om.Group):
-    """
-    Group of metamodel components to interpolate intermediate calculation values for flaps model in GASP-based
-    aerodynamics.
-    """
-
-    def initialize(self):
-        add_aviary_option(self, Aircraft.Wing.FLAP_TYPE)
-
-    def setup(self):
-        flap_type = self.options[Aircraft.Wing.FLAP_TYPE]
-
-        # VDEL1
-        VDEL1_interp = self.add_subsystem(
-            'VDEL1_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'aircraft:*',
-            ],
-            promotes_outputs=[
-                'VDEL1',
-            ],
-        )
-
-        VDEL1_interp.add_input(
-            Aircraft.Wing.FLAP_CHORD_RATIO,
-            0.0,
-            training_data=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5],
-            units='unitless',
-            desc='ratio of flap chord to wing chord',
-        )
-
-        if flap_type is FlapType.PLAIN or flap_type is FlapType.SPLIT:
-            VDEL1_interp.add_output(
-                'VDEL1',
-                1.0,
-                training_data=[0.0, 0.32, 0.66, 1.0, 1.32, 1.70],
-                units='unitless',
-                desc='sensitivity of flap minimum drag coefficient to flap chord ratio',
-            )
-
-        else:
-            VDEL1_interp.add_output(
-                'VDEL1',
+_PLAIN_OR_SPLIT = (FlapType.PLAIN, FlapType.SPLIT)
+_SLOTTED = (FlapType.SINGLE_SLOTTED, FlapType.DOUBLE_SLOTTED, FlapType.TRIPLE_SLOTTED)
+_FOWLER = (FlapType.FOWLER, FlapType.DOUBLE_SLOTTED_FOWLER)
+
+# Inputs of the lookup tables that are not aircraft variables: (default value, units, desc)
+_TABLE_INPUTS = {
+    'flap_defl_ratio': (
+        0.727273,
+        'unitless',
+        'ratio of flap deflection to optimum flap deflection angle',
+    ),
+    'flap_defl': (10.0, 'deg', 'flap deflection'),
+    'slat_defl_ratio': (
+        0.5,
+        'unitless',
+        'Ratio of leading edge slat deflection to optimum deflection angle',
+    ),
+    'reynolds': (157.1111, 'unitless', 'reynolds number'),
+    Dynamic.Atmosphere.MACH: (0.17522, 'unitless', 'Mach number'),
+    'body_to_span_ratio': (
+        0.09240447,
+        'unitless',
+        'trailing edge flap span divided by wing span',
+    ),
+    'chord_to_body_ratio': (0.12679, 'unitless', 'taper ratio of wing'),
+}
+
+# fmt: off
+_FLAP_CHORD_RATIO_GRID = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
+_ASPECT_RATIO_GRID = [
+    0.0, 0.2, 0.6, 1.0, 1.4, 2.0, 2.5, 3.0, 3.5, 4.0, 4.3, 5.0, 7.0, 9.0, 10.0, 11.2, 12.0, 20.0
+]
+_THICKNESS_TO_CHORD_GRID = [
+    0.0, 0.04, 0.06, 0.07, 0.08, 0.10, 0.11, 0.12, 0.14, 0.15, 0.16, 0.18, 0.20, 0.22, 0.24, 0.28
+]
+
+# One-dimensional sensitivity curves from GASP, linearly interpolated and extrapolated:
+# output -> (input, grid, values, default value, desc). Curves that depend on the flap type
+# give their values as a dict keyed by the flap types they apply to, where None applies to all
+# other flap types.
+_CURVES = {
+    'VDEL1': (
+        Aircraft.Wing.FLAP_CHORD_RATIO,
+        _FLAP_CHORD_RATIO_GRID,
+        {
+            _PLAIN_OR_SPLIT: [0.0, 0.32, 0.66, 1.0, 1.32, 1.70],
+            None: [0.0, 0.24, 0.55, 1.00, 1.60, 2.20],
+        },
+        1.0,
+        'sensitivity of flap minimum drag coefficient to flap chord ratio',
+    ),
+    'VDEL2': (
+        'flap_defl_ratio',
+        [0.0, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 2.25, 2.5, 2.75, 3.0],
+        [0.0, 0.18, 0.37, 0.65, 1.00, 1.97, 3.44, 4.15, 4.55, 4.82, 5.00],
+        0.62455,
+        'sensitivity of flap minimum drag coefficient to flap angle',
+    ),
+    'VLAM1': (
+        Aircraft.Wing.ASPECT_RATIO,
+        _ASPECT_RATIO_GRID,
+        [
+            0.0, 1.36, 1.47, 1.49, 1.47, 1.24, 0.97, 0.91, 0.88, 0.87, 0.86, 0.87, 0.92, 0.96, 0.97,
+            0.99, 1.0, 1.0,
+        ],
+        0.97217,
+        'sensitivity of clean wing maximum lift coefficient to wing aspect ratio',
+    ),
+    'VLAM2': (
+        Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
+        _THICKNESS_TO_CHORD_GRID,
+        [
+            0.8, 0.82, 0.84, 0.85, 0.88, 1.00, 1.05, 1.07, 1.10, 1.11, 1.11, 1.10, 1.07, 1.02, 0.96,
+            0.80,
+        ],
+        1.09948,
+        'sensitivity of clean wing maximum lift coefficient to wing thickness to chord ratio',
+    ),
+    'VLAM3': (
+        Aircraft.Wing.ASPECT_RATIO,
+        _ASPECT_RATIO_GRID,
+        [
+            0.0, 0.1, 0.24, 0.33, 0.41, 0.50, 0.56, 0.61, 0.66, 0.70, 0.72, 0.77, 0.88, 0.95, 0.97,
+            0.99, 1.0, 1.0,
+        ],
+        0.97217,
+        'sensitivity of flap clean wing maximum lift coefficient to wing aspect ratio',
+    ),
+    'VLAM4': (
+        Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
+        _THICKNESS_TO_CHORD_GRID,
+        {
+            _PLAIN_OR_SPLIT: [
+                1.25, 1.17, 1.08, 1.05, 1.02, 1.00, 1.02, 1.05, 1.20, 1.36, 1.60, 1.87, 2.02, 2.12,
+                2.18, 2.20,
+            ],
+            None: [
+                0.84, 0.86, 0.89, 0.91, 0.94, 1.00, 1.04, 1.10, 1.26, 1.33, 1.39, 1.49, 1.55, 1.58,
+                1.59, 1.60,
+            ],
+        },
+        1.25725,
+        'sensitivity of flap clean wing maximum lift coefficient slope to wing thickness',
+    ),
+    'VLAM5': (
+        Aircraft.Wing.FLAP_CHORD_RATIO,
+        _FLAP_CHORD_RATIO_GRID,
+        {
+            _PLAIN_OR_SPLIT: [0.0, 0.72, 0.94, 1.00, 0.95, 0.73],
+            _SLOTTED: [0.0, 0.575, 0.83, 1.00, 1.065, 1.09],
+            None: [0.0, 0.41, 0.73, 1.00, 1.22, 1.40],
+        },
+        1.0,
+        'sensitivity of flap clean wing maximum lift coefficient to wing flap to chord ratio',
+    ),
+    'VLAM6': (
+        'flap_defl',
+        [0.0, 5.0, 10.0, 15.0, 20.0, 25.0, 30.0, 35.0, 38.0, 40.0, 42.0, 44.0, 50.0, 55.0, 60.0],
+        {
+            _PLAIN_OR_SPLIT: [
+                0.0, 0.12, 0.23, 0.34, 0.43, 0.53, 0.62, 0.71, 0.76, 0.80, 0.82, 0.86, 0.94, 0.98,
                 1.0,
-                training_data=[0.0, 0.24, 0.55, 1.00, 1.60, 2.20],
-                units='unitless',
-                desc='sensitivity of flap minimum drag coefficient to flap chord ratio',
-            )
-
-        # VDEL2
-        VDEL2_interp = self.add_subsystem(
-            'VDEL2_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'flap_defl_ratio',
-            ],
-            promotes_outputs=[
-                'VDEL2',
             ],
-        )
-
-        VDEL2_interp.add_input(
-            'flap_defl_ratio',
-            0.727273,
-            training_data=[0.0, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 2.25, 2.5, 2.75, 3.0],
-            units='unitless',
-            desc='ratio of flap deflection to optimum flap deflection angle',
-        )
-
-        VDEL2_interp.add_output(
-            'VDEL2',
-            0.62455,
-            training_data=[
-                0.0,
-                0.18,
-                0.37,
-                0.65,
-                1.00,
-                1.97,
-                3.44,
-                4.15,
-                4.55,
-                4.82,
-                5.00,
-            ],
-            units='unitless',
-            desc='sensitivity of flap minimum drag coefficient to flap angle',
-        )
-
-        # VDEL3
-
-        VDEL3_interp = self.add_subsystem(
-            'VDEL3_interp',
-            om.MetaModelStructuredComp(method='scipy_slinear', extrapolate=True),
-            promotes_inputs=['aircraft:*'],
-            promotes_outputs=[
-                'VDEL3',
-            ],
-        )
-
-        VDEL3_interp.add_input(
-            Aircraft.Wing.FLAP_SPAN_RATIO,
-            0.65,
-            training_data=[0.0, 0.2, 0.4, 0.6, 0.7, 0.8, 0.9, 1.0],
-            units='unitless',
-            desc='BTEOB: trailing edge flap span divided by wing span',
-        )
-
-        VDEL3_interp.add_input(
-            Aircraft.Wing.TAPER_RATIO,
-            0.0,
-            training_data=[0.0, 0.33, 1.0],
-            units='unitless',
-            desc='taper ratio of wing',
-        )
-
-        VDEL3_interp.add_output(
-            'VDEL3',
-            0.765,
-            units='unitless',
-            desc='sensitivity of flap minimum drag coefficient to partial flap span',
-            training_data=np.array(
-                [
-                    [0.0, 0.0, 0.0],
-                    [0.4, 0.28, 0.2],
-                    [0.67, 0.52, 0.4],
-                    [0.86, 0.72, 0.6],
-                    [0.92, 0.81, 0.7],
-                    [0.96, 0.88, 0.8],
-                    [0.99, 0.95, 0.9],
-                    [1.0, 1.0, 1.0],
-                ]
-            ),
-        )
-
-        # [0.,.4,.67,.86,.92,.96,.99,1.0,0.,.28,.52,.72,.81,.88,.95,1.0,0.,.2,.4,.6,.7,.8,.9,1.0]
-
-        # VLAM1
-        VLAM1_interp = self.add_subsystem(
-            'VLAM1_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'aircraft:*',
+            _SLOTTED: [
+                0.0, 0.22, 0.41, 0.57, 0.71, 0.83, 0.91, 0.975, 0.995, 1.0, 0.997, 0.992, 0.945,
+                0.85, 0.75,
             ],
-            promotes_outputs=[
-                'VLAM1',
-            ],
-        )
-
-        VLAM1_interp.add_input(
-            Aircraft.Wing.ASPECT_RATIO,
-            0.0,
-            training_data=[
-                0.0,
-                0.2,
-                0.6,
-                1.0,
-                1.4,
-                2.0,
-                2.5,
-                3.0,
-                3.5,
-                4.0,
-                4.3,
-                5.0,
-                7.0,
-                9.0,
-                10.0,
-                11.2,
-                12.0,
-                20.0,
-            ],
-            units='unitless',
-            desc='aspect ratio',
-        )
-
-        VLAM1_interp.add_output(
-            'VLAM1',
-            0.97217,
-            training_data=[
-                0.0,
-                1.36,
-                1.47,
-                1.49,
-                1.47,
-                1.24,
-                0.97,
-                0.91,
-                0.88,
-                0.87,
-                0.86,
-                0.87,
-                0.92,
-                0.96,
-                0.97,
-                0.99,
-                1.0,
-                1.0,
-            ],
-            units='unitless',
-            desc='sensitivity of clean wing maximum lift coefficient to wing aspect ratio',
-        )
-
-        # VLAM2
-        VLAM2_interp = self.add_subsystem(
-            'VLAM2_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            ],
-            promotes_outputs=['VLAM2'],
-        )
-
-        VLAM2_interp.add_input(
-            Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            0.0,
-            training_data=[
-                0.0,
-                0.04,
-                0.06,
-                0.07,
-                0.08,
-                0.10,
-                0.11,
-                0.12,
-                0.14,
-                0.15,
-                0.16,
-                0.18,
+            _FOWLER: [
+                0.0, 0.25, 0.46, 0.65, 0.80, 0.92, 1.00, 1.07, 1.10, 1.11, 1.10, 1.07, 0.85, 0.56,
                 0.20,
-                0.22,
-                0.24,
-                0.28,
-            ],
-            units='unitless',
-            desc='average wing thickness to chord ratio',
-        )
-
-        VLAM2_interp.add_output(
-            'VLAM2',
-            1.09948,
-            training_data=[
-                0.8,
-                0.82,
-                0.84,
-                0.85,
-                0.88,
-                1.00,
-                1.05,
-                1.07,
-                1.10,
-                1.11,
-                1.11,
-                1.10,
-                1.07,
-                1.02,
-                0.96,
-                0.80,
-            ],
-            units='unitless',
-            desc='sensitivity of clean wing maximum lift coefficient to wing thickness to chord ratio',
-        )
-
-        # VLAM3
-        VLAM3_interp = self.add_subsystem(
-            'VLAM3_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'aircraft:*',
-            ],
-            promotes_outputs=['VLAM3'],
-        )
-
-        VLAM3_interp.add_input(
-            Aircraft.Wing.ASPECT_RATIO,
-            0.0,
-            training_data=[
-                0.0,
-                0.2,
-                0.6,
-                1.0,
-                1.4,
-                2.0,
-                2.5,
-                3.0,
-                3.5,
-                4.0,
-                4.3,
-                5.0,
-                7.0,
-                9.0,
-                10.0,
-                11.2,
-                12.0,
-                20.0,
-            ],
-            units='unitless',
-            desc='aspect ratio',
-        )
-
-        VLAM3_interp.add_output(
-            'VLAM3',
-            0.97217,
-            training_data=[
-                0.0,
-                0.1,
-                0.24,
-                0.33,
-                0.41,
-                0.50,
-                0.56,
-                0.61,
-                0.66,
-                0.70,
-                0.72,
-                0.77,
-                0.88,
-                0.95,
-                0.97,
-                0.99,
-                1.0,
-                1.0,
-            ],
-            units='unitless',
-            desc='sensitivity of flap clean wing maximum lift coefficient to wing aspect ratio',
-        )
-
-        # VLAM4
-        VLAM4_interp = self.add_subsystem(
-            'VLAM4_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            ],
-            promotes_outputs=[
-                'VLAM4',
-            ],
-        )
-
-        VLAM4_interp.add_input(
-            Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            0.0,
-            training_data=[
-                0.0,
-                0.04,
-                0.06,
-                0.07,
-                0.08,
-                0.10,
-                0.11,
-                0.12,
-                0.14,
-                0.15,
-                0.16,
-                0.18,
-                0.20,
-                0.22,
-                0.24,
-                0.28,
-            ],
-            units='unitless',
-            desc='average wing thickness to chord ratio',
-        )
-
-        if flap_type is FlapType.PLAIN or flap_type is FlapType.SPLIT:
-            VLAM4_interp.add_output(
-                'VLAM4',
-                1.19742,
-                training_data=[
-                    1.25,
-                    1.17,
-                    1.08,
-                    1.05,
-                    1.02,
-                    1.00,
-                    1.02,
-                    1.05,
-                    1.20,
-                    1.36,
-                    1.60,
-                    1.87,
-                    2.02,
-                    2.12,
-                    2.18,
-                    2.20,
-                ],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient slope to wing thickness',
-            )
-
-        else:
-            VLAM4_interp.add_output(
-                'VLAM4',
-                1.25725,
-                training_data=[
-                    0.84,
-                    0.86,
-                    0.89,
-                    0.91,
-                    0.94,
-                    1.00,
-                    1.04,
-                    1.10,
-                    1.26,
-                    1.33,
-                    1.39,
-                    1.49,
-                    1.55,
-                    1.58,
-                    1.59,
-                    1.60,
-                ],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient slope to wing thickness',
-            )
-
-        # VLAM5
-        VLAM5_interp = self.add_subsystem(
-            'VLAM5_intep',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'aircraft:*',
             ],
-            promotes_outputs=['VLAM5'],
-        )
-
-        VLAM5_interp.add_input(
-            Aircraft.Wing.FLAP_CHORD_RATIO,
-            0.0,
-            training_data=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5],
-            units='unitless',
-            desc='ratio of flap chord to wing chord',
-        )
-
-        if flap_type is FlapType.PLAIN or flap_type is FlapType.SPLIT:
-            VLAM5_interp.add_output(
-                'VLAM5',
-                1.0,
-                training_data=[0.0, 0.72, 0.94, 1.00, 0.95, 0.73],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap to chord ratio',
-            )
-
-        elif (
-            flap_type is FlapType.SINGLE_SLOTTED
-            or flap_type is FlapType.DOUBLE_SLOTTED
-            or flap_type is FlapType.TRIPLE_SLOTTED
-        ):
-            VLAM5_interp.add_output(
-                'VLAM5',
-                1.0,
-                training_data=[0.0, 0.575, 0.83, 1.00, 1.065, 1.09],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap to chord ratio',
-            )
+        },
+        1.0,
+        'sensitivity of flap clean wing maximum lift coefficient to wing flap deflection',
+    ),
+    'VLAM7': (
+        Aircraft.Wing.FLAP_SPAN_RATIO,
+        [0.0, 0.2, 0.4, 0.6, 0.8, 0.9, 1.0],
+        [0.0, 0.25, 0.47, 0.69, 0.87, 0.94, 1.00],
+        0.735,
+        'sensitivity of flap clean wing maximum lift coefficient to wing flap span',
+    ),
+    'VLAM10': (
+        'slat_defl_ratio',
+        [0.0, 0.2, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.4, 1.6, 1.7],
+        [0.0, 0.34, 0.62, 0.74, 0.83, 0.90, 0.96, 0.99, 1.00, 0.99, 0.96, 0.81, 0.49, 0.22],
+        0.74,
+        'sensitivity of clean wing maximum lift coefficient to slat deflection angle',
+    ),
+    'VLAM11': (
+        Aircraft.Wing.SLAT_SPAN_RATIO,
+        [0.0, 0.2, 0.3, 0.4, 0.47, 0.5, 1.0],
+        [0.0, 0.05, 0.09, 0.15, 0.20, 0.23, 1.00],
+        0.84232,
+        'sensitivity of slat clean wing maximum lift coefficient to slat span',
+    ),
+    'VLAM13': (
+        'reynolds',
+        [1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 90.0, 120.0, 170.0, 250.0, 300.0, 500.0, 1000.0, 10000.0],
+        [0.70, 0.70, 0.75, 0.81, 0.925, 1.0, 1.04, 1.05, 1.03, 1.00, 0.98, 0.93, 0.90, 0.90],
+        1.03512,
+        'reynolds number correction factor',
+    ),
+    'VLAM14': (
+        Dynamic.Atmosphere.MACH,
+        [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        [1.0, 0.99, 0.94, 0.87, 0.78, 0.66],
+        0.99124,
+        'Mach number correction factor',
+    ),
+}
+# fmt: on
+
+# Two-dimensional tables from GASP, bilinearly interpolated and extrapolated:
+# output -> (inputs, grids, values, default value, desc)
+_TABLES = {
+    'VDEL3': (
+        (Aircraft.Wing.FLAP_SPAN_RATIO, Aircraft.Wing.TAPER_RATIO),
+        ([0.0, 0.2, 0.4, 0.6, 0.7, 0.8, 0.9, 1.0], [0.0, 0.33, 1.0]),
+        [
+            [0.0, 0.0, 0.0],
+            [0.4, 0.28, 0.2],
+            [0.67, 0.52, 0.4],
+            [0.86, 0.72, 0.6],
+            [0.92, 0.81, 0.7],
+            [0.96, 0.88, 0.8],
+            [0.99, 0.95, 0.9],
+            [1.0, 1.0, 1.0],
+        ],
+        0.765,
+        'sensitivity of flap minimum drag coefficient to partial flap span',
+    ),
+    'fus_lift': (
+        ('body_to_span_ratio', 'chord_to_body_ratio'),
+        (
+            [0.0, 0.05, 0.10, 0.12, 0.15, 0.20, 0.25, 0.30, 0.40, 0.50],
+            [0.1, 0.2, 0.3, 0.4, 0.5],
+        ),
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.046, 0.018, -0.002, -0.009, -0.025],
+            [0.070, 0.025, -0.007, -0.030, -0.048],
+            [0.076, 0.026, -0.010, -0.038, -0.057],
+            [0.080, 0.023, -0.018, -0.051, -0.070],
+            [0.073, 0.004, -0.035, -0.073, -0.090],
+            [0.053, -0.022, -0.060, -0.094, -0.109],
+            [0.030, -0.047, -0.084, -0.112, -0.126],
+            [-0.018, -0.094, -0.126, -0.145, -0.155],
+            [-0.068, -0.130, -0.160, -0.172, -0.180],
+        ],
+        0.05498,
+        'sensitivity of flap minimum drag coefficient to partial flap span',
+    ),
+}
+
+
+def _curve_values(values, flap_type):
+    """Return the values of a curve for the given flap type."""
+    if not isinstance(values, dict):
+        return values
+
+    for flap_types, curve in values.items():
+        if flap_types is not None and flap_type in flap_types:
+            return curve
+
+    if None not in values:
+        raise ValueError(f'{flap_type} is not a valid flap type')
+
+    return values[None]
+
+
+def _segment(grid, x):
+    """Index of the grid interval used to interpolate or extrapolate to x."""
+    return np.clip(np.searchsorted(grid, x.real, side='right') - 1, 0, len(grid) - 2)
+
+
+class FlapsLookupTables(om.ExplicitComponent):
+    """
+    Lookup tables of the sensitivities used by the flaps model in GASP-based aerodynamics.
 
-        else:
-            VLAM5_interp.add_output(
-                'VLAM5',
-                1.0,
-                training_data=[0.0, 0.41, 0.73, 1.00, 1.22, 1.40],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap to chord ratio',
-            )
+    All one-dimensional curves are packed into a single table and evaluated together, with
+    analytic derivatives.
+    """
 
-        # VLAM6
-        VLAM6_interp = self.add_subsystem(
-            'VLAM6_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'flap_defl',
-            ],
-            promotes_outputs=[
-                'VLAM6',
-            ],
-        )
+    def initialize(self):
+        add_aviary_option(self, Aircraft.Wing.FLAP_TYPE)
 
-        VLAM6_interp.add_input(
-            'flap_defl',
-            10.0,
-            training_data=[
-                0.0,
-                5.0,
-                10.0,
-                15.0,
-                20.0,
-                25.0,
-                30.0,
-                35.0,
-                38.0,
-                40.0,
-                42.0,
-                44.0,
-                50.0,
-                55.0,
-                60.0,
-            ],
-            units='deg',
-            desc='flap deflection',
-        )
+    def setup(self):
+        flap_type = self.options[Aircraft.Wing.FLAP_TYPE]
 
-        if flap_type is FlapType.PLAIN or flap_type is FlapType.SPLIT:
-            VLAM6_interp.add_output(
-                'VLAM6',
-                0.8,
-                training_data=[
-                    0.0,
-                    0.12,
-                    0.23,
-                    0.34,
-                    0.43,
-                    0.53,
-                    0.62,
-                    0.71,
-                    0.76,
-                    0.80,
-                    0.82,
-                    0.86,
-                    0.94,
-                    0.98,
-                    1.0,
-                ],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap deflection',
+        curves = {
+            name: (input_name, grid, _curve_values(values, flap_type))
+            for name, (input_name, grid, values, *_) in _CURVES.items()
+        }
+
+        input_names = []
+        for input_name, *_ in curves.values():
+            if input_name not in input_names:
+                input_names.append(input_name)
+        for table_inputs, *_ in _TABLES.values():
+            input_names.extend(name for name in table_inputs if name not in input_names)
+        self._input_names = input_names
+
+        for name in input_names:
+            if name in _TABLE_INPUTS:
+                val, units, desc = _TABLE_INPUTS[name]
+                self.add_input(name, val, units=units, desc=desc)
+            else:
+                add_aviary_input(self, name, units='unitless')
+
+        for name, (_, _, _, val, desc) in _CURVES.items():
+            # original tables scaled VLAM14
+            ref = 100 if name == 'VLAM14' else 1.0
+            self.add_output(name, val, units='unitless', desc=desc, ref=ref)
+
+        for name, (_, _, _, val, desc) in _TABLES.items():
+            self.add_output(name, val, units='unitless', desc=desc)
+
+        # pack the curves into one table, padding the grids of the shorter curves with inf so
+        # that the padding is never bracketed
+        num_points = np.array([len(grid) for _, grid, _ in curves.values()])
+        self._curve_names = list(curves)
+        self._curve_inputs = np.array(
+            [input_names.index(input_name) for input_name, *_ in curves.values()]
+        )
+        self._num_points = num_points
+        self._grid = np.full((len(curves), num_points.max()), np.inf)
+        self._values = np.zeros((len(curves), num_points.max()))
+        for i, (_, grid, values) in enumerate(curves.values()):
+            self._grid[i, : num_points[i]] = grid
+            self._values[i, : num_points[i]] = values
+
+        self._tables = {
+            name: (
+                [input_names.index(input_name) for input_name in table_inputs],
+                [np.array(grid) for grid in grids],
+                np.array(values),
             )
-
-        elif (
-            flap_type is FlapType.SINGLE_SLOTTED
-            or flap_type is FlapType.DOUBLE_SLOTTED
-            or flap_type is FlapType.TRIPLE_SLOTTED
-        ):
-            VLAM6_interp.add_output(
-                'VLAM6',
-                1.0,
-                training_data=[
-                    0.0,
-                    0.22,
-                    0.41,
-                    0.57,
-                    0.71,
-                    0.83,
-                    0.91,
-                    0.975,
-                    0.995,
-                    1.0,
-                    0.997,
-                    0.992,
-                    0.945,
-                    0.85,
-                    0.75,
-                ],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap deflection',
+            for name, (table_inputs, grids, values, *_) in _TABLES.items()
+        }
+
+    def setup_partials(self):
+        for name, (input_name, *_) in _CURVES.items():
+            self.declare_partials(name, input_name)
+
+        for name, (table_inputs, *_) in _TABLES.items():
+            self.declare_partials(name, table_inputs)
+
+    def _evaluate(self, inputs):
+        """Return the value of each output and its derivatives with respect to its inputs."""
+        x_in = np.array([inputs[name][0] for name in self._input_names])
+        x = x_in[self._curve_inputs]
+
+        # index of the interval of each curve, from the number of grid points below x
+        rows = np.arange(len(x))
+        idx = np.sum(self._grid <= x.real[:, np.newaxis], axis=1) - 1
+        idx = np.clip(idx, 0, self._num_points - 2)
+
+        x0 = self._grid[rows, idx]
+        y0 = self._values[rows, idx]
+        slope = (self._values[rows, idx + 1] - y0) / (self._grid[rows, idx + 1] - x0)
+
+        values = dict(zip(self._curve_names, y0 + slope * (x - x0)))
+        derivs = {name: [d] for name, d in zip(self._curve_names, slope)}
+
+        for name, (table_inputs, (grid0, grid1), table) in self._tables.items():
+            x0, x1 = x_in[table_inputs]
+            i = _segment(grid0, x0)
+            j = _segment(grid1, x1)
+            dx0 = grid0[i + 1] - grid0[i]
+            dx1 = grid1[j + 1] - grid1[j]
+            t = (x0 - grid0[i]) / dx0
+            u = (x1 - grid1[j]) / dx1
+
+            v00, v01 = table[i, j], table[i, j + 1]
+            v10, v11 = table[i + 1, j], table[i + 1, j + 1]
+
+            values[name] = (
+                (1.0 - t) * (1.0 - u) * v00
+                + t * (1.0 - u) * v10
+                + (1.0 - t) * u * v01
+                + t * u * v11
             )
+            derivs[name] = [
+                ((1.0 - u) * (v10 - v00) + u * (v11 - v01)) / dx0,
+                ((1.0 - t) * (v01 - v00) + t * (v11 - v10)) / dx1,
+            ]
 
-        elif flap_type is FlapType.FOWLER or flap_type is FlapType.DOUBLE_SLOTTED_FOWLER:
-            VLAM6_interp.add_output(
-                'VLAM6',
-                1.11,
-                training_data=[
-                    0.0,
-                    0.25,
-                    0.46,
-                    0.65,
-                    0.80,
-                    0.92,
-                    1.00,
-                    1.07,
-                    1.10,
-                    1.11,
-                    1.10,
-                    1.07,
-                    0.85,
-                    0.56,
-                    0.20,
-                ],
-                units='unitless',
-                desc='sensitivity of flap clean wing maximum lift coefficient to wing flap deflection',
-            )
+        return values, derivs
 
-        else:
-            raise ValueError(flap_type + ' is not a valid flap type')
+    def compute(self, inputs, outputs):
+        values, _ = self._evaluate(inputs)
 
-        # VLAM7
-        VLAM7_interp = self.add_subsystem(
-            'VLAM7_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                Aircraft.Wing.FLAP_SPAN_RATIO,
-            ],
-            promotes_outputs=[
-                'VLAM7',
-            ],
-        )
+        for name, value in values.items():
+            outputs[name] = value
 
-        VLAM7_interp.add_input(
-            Aircraft.Wing.FLAP_SPAN_RATIO,
-            0.65,
-            training_data=[0.0, 0.2, 0.4, 0.6, 0.8, 0.9, 1.0],
-            units='unitless',
-            desc='BTEOB: trailing edge flap span divided by wing span',
-        )
+    def compute_partials(self, inputs, J):
+        _, derivs = self._evaluate(inputs)
 
-        VLAM7_interp.add_output(
-            'VLAM7',
-            0.735,
-            training_data=[0.0, 0.25, 0.47, 0.69, 0.87, 0.94, 1.00],
-            units='unitless',
-            desc='sensitivity of flap clean wing maximum lift coefficient to wing flap span',
-        )
+        for name, (input_name, *_) in _CURVES.items():
+            J[name, input_name] = derivs[name][0]
 
-        # VLAM10
-        VLAM10_interp = self.add_subsystem(
-            'VLAM10_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'slat_defl_ratio',
-            ],
-            promotes_outputs=[
-                'VLAM10',
-            ],
-        )
+        for name, (table_inputs, *_) in _TABLES.items():
+            for input_name, deriv in zip(table_inputs, derivs[name]):
+                J[name, input_name] = deriv
 
-        VLAM10_interp.add_input(
-            'slat_defl_ratio',
-            0.5,
-            training_data=[
-                0.0,
-                0.2,
-                0.4,
-                0.5,
-                0.6,
-                0.7,
-                0.8,
-                0.9,
-                1.0,
-                1.1,
-                1.2,
-                1.4,
-                1.6,
-                1.7,
-            ],
-            units='unitless',
-            desc='Ratio of leading edge slat deflection to optimum deflection angle',
-        )
 
-        VLAM10_interp.add_output(
-            'VLAM10',
-            0.74,
-            training_data=[
-                0.0,
-                0.34,
-                0.62,
-                0.74,
-                0.83,
-                0.90,
-                0.96,
-                0.99,
-                1.00,
-                0.99,
-                0.96,
-                0.81,
-                0.49,
-                0.22,
-            ],
-            units='unitless',
-            desc='sensitivity of clean wing maximum lift coefficient to slat deflection angle',
-        )
-
-        # VLAM11
-        VLAM11_interp = self.add_subsystem(
-            'VLAM11_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                Aircraft.Wing.SLAT_SPAN_RATIO,
-            ],
-            promotes_outputs=[
-                'VLAM11',
-            ],
-        )
-
-        VLAM11_interp.add_input(
-            Aircraft.Wing.SLAT_SPAN_RATIO,
-            0.89759553,
-            training_data=[0.0, 0.2, 0.3, 0.4, 0.47, 0.5, 1.0],
-            units='unitless',
-            desc='ratio of leading edge slat span to wing span',
-        )
-
-        VLAM11_interp.add_output(
-            'VLAM11',
-            0.84232,
-            training_data=[0.0, 0.05, 0.09, 0.15, 0.20, 0.23, 1.00],
-            units='unitless',
-            desc='sensitivity of slat clean wing maximum lift coefficient to slat span',
-        )
-
-        # VLAM13
-        VLAM13_interp = self.add_subsystem(
-            'VLAM13_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                'reynolds',
-            ],
-            promotes_outputs=[
-                'VLAM13',
-            ],
-        )
-
-        VLAM13_interp.add_input(
-            'reynolds',
-            val=157.1111,
-            training_data=[
-                1.0,
-                2.0,
-                5.0,
-                10.0,
-                30.0,
-                60.0,
-                90.0,
-                120.0,
-                170.0,
-                250.0,
-                300.0,
-                500.0,
-                1000.0,
-                10000.0,
-            ],
-            units='unitless',
-            desc='reynolds number',
-        )
-
-        VLAM13_interp.add_output(
-            'VLAM13',
-            1.03512,
-            training_data=[
-                0.70,
-                0.70,
-                0.75,
-                0.81,
-                0.925,
-                1.0,
-                1.04,
-                1.05,
-                1.03,
-                1.00,
-                0.98,
-                0.93,
-                0.90,
-                0.90,
-            ],
-            units='unitless',
-            desc='reynolds number correction factor',
-        )
-
-        # VLAM14
-        VLAM14_interp = self.add_subsystem(
-            'VLAM14_interp',
-            om.MetaModelStructuredComp(method='1D-slinear', extrapolate=True),
-            promotes_inputs=[
-                Dynamic.Atmosphere.MACH,
-            ],
-            promotes_outputs=[
-                'VLAM14',
-            ],
-        )
-
-        VLAM14_interp.add_input(
-            Dynamic.Atmosphere.MACH,
-            0.17522,
-            training_data=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
-            units='unitless',
-            desc='Mach number',
-        )
-
-        VLAM14_interp.add_output(
-            'VLAM14',
-            0.99124,
-            training_data=[1.0, 0.99, 0.94, 0.87, 0.78, 0.66],
-            units='unitless',
-            desc='Mach number correction factor',
-            ref=100,
-        )
-
-        # fus_lift
-        fus_lift_interp = self.add_subsystem(
-            'fus_lift_interp',
-            om.MetaModelStructuredComp(method='scipy_slinear', extrapolate=True),
-            promotes_inputs=['body_to_span_ratio', 'chord_to_body_ratio'],
-            promotes_outputs=[
-                'fus_lift',
-            ],
-        )
-
-        fus_lift_interp.add_input(
-            'body_to_span_ratio',
-            0.09240447,
-            training_data=[0.0, 0.05, 0.10, 0.12, 0.15, 0.20, 0.25, 0.30, 0.40, 0.50],
-            units='unitless',
-            desc='trailing edge flap span divided by wing span',
-        )
+class MetaModelGroup(om.Group):
+    """
+    Group of the lookup tables of intermediate calculation values for flaps model in GASP-based
+    aerodynamics.
+    """
 
-        fus_lift_interp.add_input(
-            'chord_to_body_ratio',
-            0.12679,
-            training_data=[0.1, 0.2, 0.3, 0.4, 0.5],
-            units='unitless',
-            desc='taper ratio of wing',
-        )
+    def initialize(self):
+        add_aviary_option(self, Aircraft.Wing.FLAP_TYPE)
 
-        fus_lift_interp.add_output(
-            'fus_lift',
-            0.05498,
-            units='unitless',
-            desc='sensitivity of flap minimum drag coefficient to partial flap span',
-            training_data=np.array(
-                [
-                    [0.0, 0.0, 0.0, 0.0, 0.0],
-                    [0.046, 0.018, -0.002, -0.009, -0.025],
-                    [0.070, 0.025, -0.007, -0.030, -0.048],
-                    [0.076, 0.026, -0.010, -0.038, -0.057],
-                    [0.080, 0.023, -0.018, -0.051, -0.070],
-                    [0.073, 0.004, -0.035, -0.073, -0.090],
-                    [0.053, -0.022, -0.060, -0.094, -0.109],
-                    [0.030, -0.047, -0.084, -0.112, -0.126],
-                    [-0.018, -0.094, -0.126, -0.145, -0.155],
-                    [-0.068, -0.130, -0.160, -0.172, -0.180],
-                ]
-            ),
+    def setup(self):
+        self.add_subsystem(
+            'tables',
+            FlapsLookupTables(**{Aircraft.Wing.FLAP_TYPE: self.options[Aircraft.Wing.FLAP_TYPE]}),
+            promotes=['*'],
         )
@@ -3,7 +3,10 @@ import unittest
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
-from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import MetaModelGroup
+from aviary.subsystems.aerodynamics.gasp_based.flaps_model.meta_model import (
+    FlapsLookupTables,
+    MetaModelGroup,
+)
 from aviary.variable_info.enums import FlapType
 from aviary.variable_info.variables import Aircraft, Dynamic
 
@@ -130,5 +133,42 @@ class MetaModelTestCaseFowler(unittest.TestCase):
         assert_check_partials(data, atol=1e-4, rtol=1e-4)
 
 
+class FlapsLookupTablesTestCase(unittest.TestCase):
+    def test_extrapolation(self):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'tables',
+            FlapsLookupTables(**{Aircraft.Wing.FLAP_TYPE: FlapType.DOUBLE_SLOTTED}),
+            promotes=['*'],
+        )
+        prob.setup(force_alloc_complex=True)
+
+        # values between grid points, and beyond the ends of the grids
+        prob.set_val(Aircraft.Wing.FLAP_CHORD_RATIO, 0.55)
+        prob.set_val('flap_defl', 36.0, units='deg')
+        prob.set_val(Dynamic.Atmosphere.MACH, -0.1)
+        prob.set_val(Aircraft.Wing.FLAP_SPAN_RATIO, 0.75)
+        prob.set_val(Aircraft.Wing.TAPER_RATIO, 1.2)
+        prob.set_val('body_to_span_ratio', 0.11)
+        prob.set_val('chord_to_body_ratio', 0.05)
+        prob.run_model()
+
+        expected_values = {
+            'VDEL1': 2.5,
+            'VLAM5': 1.1025,
+            'VLAM6': 0.98166667,
+            'VLAM14': 1.005,
+            'VDEL3': 0.72164179,
+            'fus_lift': 0.09675,
+        }
+
+        for var_name, reg_data in expected_values.items():
+            with self.subTest(var=var_name):
+                assert_near_equal(prob[var_name], reg_data, 1e-8)
+
+        data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(data, atol=1e-10, rtol=1e-10)
+
+
 if __name__ == '__main__':
     unittest.main()
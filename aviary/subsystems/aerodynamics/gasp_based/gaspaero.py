@@ -5,7 +5,7 @@ from openmdao.utils import cs_safe as cs
 
 from aviary.constants import GRAV_ENGLISH_LBM
 from aviary.subsystems.aerodynamics.gasp_based.common import AeroForces, CLFromLift, TanhRampComp
-from aviary.utils.math import sigmoidX, smooth_min, d_smooth_min
+from aviary.utils.math import dSigmoidXdx, sigmoidX, smooth_min, d_smooth_min
 from aviary.variable_info.enums import AircraftTypes, Verbosity
 from aviary.variable_info.functions import add_aviary_input, add_aviary_option, add_aviary_output
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
@@ -95,6 +95,42 @@ def cla(ar, sweep, mach):
     )
 
 
+def d_cla(ar, sweep, mach):
+    """Partial derivatives of cla with respect to ar, sweep, and mach.
+
+    Parameters
+    ----------
+    ar : float
+        Aspect ratio
+    sweep : float
+        Quarter-chord sweep angle, in radians
+    mach : float
+        Mach number.
+
+    Returns
+    -------
+    tuple
+        Derivatives of cla with respect to ar, sweep (per radian), and mach.
+    """
+    cos_sweep = np.cos(sweep)
+    a = ar / (2 * cos_sweep)
+    b = 1 - (mach * cos_sweep) ** 2
+    root = np.sqrt(1 + a**2 * b)
+
+    # derivatives of the term under the square root
+    dterm_dar = a * b / cos_sweep
+    dterm_dsweep = 2 * a**2 * b * np.tan(sweep) + a**2 * mach**2 * np.sin(2 * sweep)
+    dterm_dmach = -2 * a**2 * mach * cos_sweep**2
+
+    dcla_droot = -np.pi * ar / (1 + root) ** 2 / (2 * root)
+
+    dcla_dar = np.pi / (1 + root) + dcla_droot * dterm_dar
+    dcla_dsweep = dcla_droot * dterm_dsweep
+    dcla_dmach = dcla_droot * dterm_dmach
+
+    return dcla_dar, dcla_dsweep, dcla_dmach
+
+
 class WingTailRatios(om.ExplicitComponent):
     # NOTE this is actually getting added in mission, not pre-mission. Which place is
     # intended for this component??
@@ -318,27 +354,24 @@ class Xlifts(om.ExplicitComponent):
     def setup_partials(self):
         ar = np.arange(self.options['num_nodes'])
 
-        self.declare_partials('lift_ratio', '*', method='cs')
-        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs')
-        self.declare_partials('lift_curve_slope', '*', method='cs')
-        self.declare_partials(
-            'lift_curve_slope',
-            [
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.HorizontalTail.VERTICAL_TAIL_MOUNT_LOCATION,
-                Aircraft.HorizontalTail.SWEEP,
-                Aircraft.HorizontalTail.MOMENT_RATIO,
-                'sbar',
-                'cbar',
-                'hbar',
-                'bbar',
-            ],
-            method='cs',
-        )
+        geom_params = [
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.SWEEP,
+            Aircraft.HorizontalTail.VERTICAL_TAIL_MOUNT_LOCATION,
+            Aircraft.HorizontalTail.SWEEP,
+            Aircraft.HorizontalTail.MOMENT_RATIO,
+            'sbar',
+            'cbar',
+            'hbar',
+            'bbar',
+        ]
+
         self.declare_partials(
-            'lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar, method='cs'
+            'lift_ratio', geom_params + [Aircraft.Design.STATIC_MARGIN, Aircraft.Design.CG_DELTA]
         )
+        self.declare_partials('lift_ratio', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
+        self.declare_partials('lift_curve_slope', geom_params)
+        self.declare_partials('lift_curve_slope', Dynamic.Atmosphere.MACH, rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -411,6 +444,124 @@ class Xlifts(om.ExplicitComponent):
         outputs['lift_curve_slope'] = claw
         outputs['lift_ratio'] = lift_ratio
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            static_margin,
+            delta_cg,
+            AR,
+            sweep_c4,
+            htail_loc,
+            htail_sweep,
+            h_tail_moment,
+            sbar,
+            cbar,
+            hbar,
+            bbar,
+        ) = inputs.values()
+
+        delta = (static_margin + delta_cg) * h_tail_moment
+        xt = 1 / h_tail_moment
+
+        art = AR * bbar**2 / sbar
+        h = hbar * AR
+
+        claw0 = cla(AR, deg2rad(sweep_c4), mach)
+        dclaw0_dAR, dclaw0_dsweep, dclaw0_dmach = d_cla(AR, deg2rad(sweep_c4), mach)
+
+        htail_fact = 0.9 + 0.1 * htail_loc
+        clat_base = cla(art, deg2rad(htail_sweep), mach)
+        dclat_dart, dclat_dsweep, dclat_dmach = d_cla(art, deg2rad(htail_sweep), mach)
+        clat0 = clat_base * htail_fact
+
+        r1 = np.sqrt(xt**2 + h**2)
+        r3 = np.sqrt(xt**2 + h**2 + AR**2 / 4)
+        r5 = np.sqrt(xt**2 + h**2 + art**2 * cbar**2 / 4)
+        sign_xt = np.sign(xt)
+
+        eps1 = 1 / (4 * np.pi * r1)
+        eps2 = 1 / np.pi / AR
+        eps3 = np.abs(xt) / (np.pi * AR * r3)
+        eps4 = 1 / np.pi / art
+        eps5 = np.abs(xt) / (np.pi * art * r5)
+
+        deps1_dxt = -eps1 * xt / r1**2
+        deps1_dh = -eps1 * h / r1**2
+        deps2_dAR = -eps2 / AR
+        deps3_dxt = sign_xt / (np.pi * AR * r3) - eps3 * xt / r3**2
+        deps3_dh = -eps3 * h / r3**2
+        deps3_dAR = -eps3 / AR - eps3 * AR / (4 * r3**2)
+        deps4_dart = -eps4 / art
+        deps5_dxt = sign_xt / (np.pi * art * r5) - eps5 * xt / r5**2
+        deps5_dh = -eps5 * h / r5**2
+        deps5_dart = -eps5 / art - eps5 * art * cbar**2 / (4 * r5**2)
+        deps5_dcbar = -eps5 * art**2 * cbar / (4 * r5**2)
+
+        # claw = claw0 * (1 - clat0 * F) / (1 - clat0 * claw0 * E * F)
+        E = eps1 + eps2 + eps3
+        F = eps4 - eps5 - cbar * eps1
+        num = 1 - clat0 * F
+        denom = 1 - clat0 * claw0 * E * F
+        claw = claw0 * num / denom
+
+        dclaw_dclaw0 = num / denom**2
+        dclaw_dclat0 = -claw0 * F / denom + claw * claw0 * E * F / denom
+        dclaw_dE = claw * clat0 * claw0 * F / denom
+        dclaw_dF = -claw0 * clat0 / denom + claw * clat0 * claw0 * E / denom
+
+        # lift_ratio = (c - delta) / (1 + delta - c), with c = abar * sbar / (abar * sbar + 1)
+        abar = clat0 * (1 / claw - E)
+        c = abar * sbar / (abar * sbar + 1)
+        dc_dabar = sbar / (abar * sbar + 1) ** 2
+        dlr_dc = 1 / (1 + delta - c) ** 2
+
+        dlr_dabar = dlr_dc * dc_dabar
+        dlr_dclaw = -dlr_dabar * clat0 / claw**2
+        dlr_dclaw0 = dlr_dclaw * dclaw_dclaw0
+        dlr_dclat0 = dlr_dabar * (1 / claw - E) + dlr_dclaw * dclaw_dclat0
+        dlr_dE = -dlr_dabar * clat0 + dlr_dclaw * dclaw_dE
+        dlr_dF = dlr_dclaw * dclaw_dF
+
+        # lift_ratio also depends on h_tail_moment through delta, and directly on sbar
+        dlr_ddelta = -dlr_dc
+        dlr_dhtm = dlr_ddelta * (static_margin + delta_cg)
+        dlr_dsbar = dlr_dc * abar / (abar * sbar + 1) ** 2
+
+        for of, dclaw0, dclat0, dE, dF, dhtm, dsbar in (
+            ('lift_curve_slope', dclaw_dclaw0, dclaw_dclat0, dclaw_dE, dclaw_dF, 0.0, 0.0),
+            ('lift_ratio', dlr_dclaw0, dlr_dclat0, dlr_dE, dlr_dF, dlr_dhtm, dlr_dsbar),
+        ):
+            deps1 = dE - cbar * dF
+            dxt = deps1 * deps1_dxt + dE * deps3_dxt - dF * deps5_dxt
+            dh = deps1 * deps1_dh + dE * deps3_dh - dF * deps5_dh
+            dart = dclat0 * dclat_dart * htail_fact + dF * deps4_dart - dF * deps5_dart
+
+            J[of, Dynamic.Atmosphere.MACH] = (
+                dclaw0 * dclaw0_dmach + dclat0 * dclat_dmach * htail_fact
+            )
+            J[of, Aircraft.Wing.ASPECT_RATIO] = (
+                dclaw0 * dclaw0_dAR
+                + dE * deps2_dAR
+                + dE * deps3_dAR
+                + dart * art / AR
+                + dh * hbar
+            )
+            J[of, Aircraft.Wing.SWEEP] = dclaw0 * dclaw0_dsweep * np.pi / 180.0
+            J[of, Aircraft.HorizontalTail.VERTICAL_TAIL_MOUNT_LOCATION] = (
+                dclat0 * clat_base * 0.1
+            )
+            J[of, Aircraft.HorizontalTail.SWEEP] = (
+                dclat0 * dclat_dsweep * htail_fact * np.pi / 180.0
+            )
+            J[of, Aircraft.HorizontalTail.MOMENT_RATIO] = -dxt * xt**2 + dhtm
+            J[of, 'sbar'] = -dart * art / sbar + dsbar
+            J[of, 'cbar'] = -dF * eps1 - dF * deps5_dcbar
+            J[of, 'hbar'] = dh * AR
+            J[of, 'bbar'] = 2 * dart * art / bbar
+
+        J['lift_ratio', Aircraft.Design.STATIC_MARGIN] = dlr_ddelta * h_tail_moment
+        J['lift_ratio', Aircraft.Design.CG_DELTA] = dlr_ddelta * h_tail_moment
+
 
 class SIWB(om.ExplicitComponent):
     """
@@ -797,8 +948,6 @@ class AeroGeom(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials('*', '*', dependent=False)
         ar = np.arange(self.options['num_nodes'])
 
         self.declare_partials(
@@ -811,7 +960,6 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
                 Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
             ],
-            method='cs',
         )
         self.declare_partials(
             'SA2',
@@ -822,7 +970,6 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.SWEEP,
                 Aircraft.Wing.TAPER_RATIO,
             ],
-            method='cs',
         )
         self.declare_partials(
             'SA3',
@@ -832,10 +979,11 @@ class AeroGeom(om.ExplicitComponent):
                 Aircraft.Wing.TAPER_RATIO,
                 Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
             ],
-            method='cs',
         )
-        self.declare_partials('SA4', [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], method='cs')
-        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar, method='cs')
+        self.declare_partials(
+            'SA4', [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], val=0.75
+        )
+        self.declare_partials('cf', [Dynamic.Atmosphere.MACH], rows=ar, cols=ar)
 
         # diag partials for SA5-SA7
         self.declare_partials(
@@ -847,7 +995,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         self.declare_partials(
             'SA6',
@@ -858,7 +1005,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         self.declare_partials(
             'SA7',
@@ -870,7 +1016,6 @@ class AeroGeom(om.ExplicitComponent):
             ],
             rows=ar,
             cols=ar,
-            method='cs',
         )
 
         # dense partials for SA5-SA7
@@ -884,7 +1029,6 @@ class AeroGeom(om.ExplicitComponent):
             Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR,
             Aircraft.Design.DRAG_COEFFICIENT_INCREMENT,
             Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT,
-            Aircraft.Wing.TAPER_RATIO,
             Aircraft.Strut.AREA_RATIO,
             Aircraft.Wing.AVERAGE_CHORD,
             Aircraft.HorizontalTail.AVERAGE_CHORD,
@@ -899,7 +1043,9 @@ class AeroGeom(om.ExplicitComponent):
             'interference_independent_of_shielded_area',
             'drag_loss_due_to_shielded_wing_area',
         ]
-        self.declare_partials('SA5', most_params, method='cs')
+        if self.options[Aircraft.Wing.HAS_STRUT]:
+            most_params.append(Aircraft.Strut.CHORD)
+
         drag_factors = [
             Aircraft.Fuselage.DRAG_FACTOR,
             Aircraft.HorizontalTail.DRAG_FACTOR,
@@ -912,14 +1058,15 @@ class AeroGeom(om.ExplicitComponent):
             Aircraft.Design.EXCRESCENCE_DRAG_FACTOR,
             Aircraft.Design.PERCENT_EXCRESCENCE_DRAG,
         ]
-        self.declare_partials('SA5', drag_factors, method='cs')
+        self.declare_partials('SA5', most_params + drag_factors)
         self.declare_partials(
-            'SA6', [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD], method='cs'
+            'SA6', [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD]
         )
         self.declare_partials(
             'SA7',
-            most_params + [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP] + ['siwb'],
-            method='cs',
+            most_params
+            + drag_factors
+            + [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP, 'siwb'],
         )
 
     def compute(self, inputs, outputs):
@@ -1022,7 +1169,7 @@ class AeroGeom(om.ExplicitComponent):
         fhtre[good_mask] = (np.log10(reli[good_mask] * htail_chord) / 7) ** -2.6
         include_strut = self.options[Aircraft.Wing.HAS_STRUT]
         if include_strut:
-            fstrtre = (np.log10(reli[good_mask] * strut_chord) / 7) ** -2.6
+            fstrtre[good_mask] = (np.log10(reli[good_mask] * strut_chord) / 7) ** -2.6
 
         # fuselage form drag factor
         # fffus = 1 + 1.5 * (cabin_width / fus_len) ** 1.5 + 7 * (cabin_width / fus_len) ** 3
@@ -1089,6 +1236,337 @@ class AeroGeom(om.ExplicitComponent):
         outputs['SA7'] = sa7
         outputs['cf'] = cf
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            sos,
+            nu,
+            ufac,
+            ff_wing,
+            ff_fus,
+            ff_nac,
+            ff_vtail,
+            ff_htail,
+            wing_fus_intf,
+            strut_fus_intf,
+            cd0_inc,
+            fe_fus_inc,
+            wing_min_pressure_loc,
+            wing_max_thickness_loc,
+            AR,
+            sweep_c4,
+            taper_ratio,
+            strut_wing_area_ratio,
+            avg_chord,
+            htail_chord,
+            vtail_chord,
+            fus_len,
+            nac_len,
+            htail_area,
+            fus_SA,
+            nacelle_area,
+            wing_area,
+            vtail_area,
+            tc_ratio,
+            strut_chord,
+            feintwf,
+            areashieldwf,
+            siwb,
+            fcffc,
+            fcfhtc,
+            fckic,
+            fcfnc,
+            fpylnd,
+            fcfstrc,
+            fcfvtc,
+            fcfwc,
+            fexcrt,
+            pct_excr,
+        ) = inputs.values()
+        nn = self.options['num_nodes']
+        num_engines = self.options[Aircraft.Engine.NUM_ENGINES]
+        include_strut = self.options[Aircraft.Wing.HAS_STRUT]
+        ones = np.ones(nn)
+
+        # skin friction coeff at Re = 10**7
+        cf = 0.455 / 7**2.58 / (1 + 0.144 * mach**2) ** 0.65
+        dcf_dmach = -0.65 * cf * 0.288 * mach / (1 + 0.144 * mach**2)
+        J['cf', Dynamic.Atmosphere.MACH] = dcf_dmach
+
+        # compressibility drag parameters, which only depend on geometry
+        tan_sweep = np.tan(deg2rad(sweep_c4))
+        t = np.abs(tan_sweep)
+        dt_dsweep = np.sign(tan_sweep) / np.cos(deg2rad(sweep_c4)) ** 2 * np.pi / 180.0
+        yale05 = (1 - taper_ratio) / (1 + taper_ratio)
+        dyale05_dtaper = -2 / (1 + taper_ratio) ** 2
+
+        def datan2(offset, doffset_dloc, doffset_dyale):
+            # partials of arctan2(AR * t + offset, AR), where offset depends on a location
+            # and on yale05
+            y = AR * t + offset
+            denom = AR**2 + y**2
+            dAR = (AR * t - y) / denom
+            dy = AR / denom
+            return dAR, dy * AR * dt_dsweep, dy * doffset_dloc, dy * doffset_dyale
+
+        # sweep angles to min pressure point and max thickness point, in degrees
+        ddlmps_dAR, ddlmps_dsweep, ddlmps_dloc, ddlmps_dyale = (
+            rad2deg(d)
+            for d in datan2(
+                -4 * (wing_min_pressure_loc - 0.25) * yale05,
+                -4 * yale05,
+                -4 * (wing_min_pressure_loc - 0.25),
+            )
+        )
+        ddlmtcx_dAR, ddlmtcx_dsweep, ddlmtcx_dloc, ddlmtcx_dyale = (
+            rad2deg(d)
+            for d in datan2(
+                -4 * (wing_max_thickness_loc - 0.25) * yale05,
+                -4 * yale05,
+                -4 * (wing_max_thickness_loc - 0.25),
+            )
+        )
+        # sweep angle of the leading edge
+        rlmle = cs.arctan2(AR * t + yale05, AR)
+        drlmle_dAR, drlmle_dsweep, _, drlmle_dyale = datan2(yale05, 0.0, 1.0)
+
+        fk_denom = 1 + yale05 / AR * 4 * taper_ratio**2
+        fk = 1 / fk_denom
+        dfk_dAR = fk**2 * yale05 * 4 * taper_ratio**2 / AR**2
+        dfk_dtaper = -(fk**2) * (
+            dyale05_dtaper * 4 * taper_ratio**2 / AR + yale05 * 8 * taper_ratio / AR
+        )
+
+        # sa1 = sa_k * sa_l - 0.0368, sa2 = -0.33 * (0.65 - min_pressure_loc) * sa_k
+        dlmps = rad2deg(
+            cs.arctan2(AR * t - 4 * (wing_min_pressure_loc - 0.25) * yale05, AR)
+        )
+        dlmtcx = rad2deg(
+            cs.arctan2(AR * t - 4 * (wing_max_thickness_loc - 0.25) * yale05, AR)
+        )
+        sa_k = 1 + 0.0033 * (4 * dlmps - 3 * dlmtcx)
+        sa_l = 1 - 1.4 * tc_ratio - 0.06 * (1 - wing_min_pressure_loc)
+
+        dk_dAR = 0.0033 * (4 * ddlmps_dAR - 3 * ddlmtcx_dAR)
+        dk_dsweep = 0.0033 * (4 * ddlmps_dsweep - 3 * ddlmtcx_dsweep)
+        dk_dtaper = 0.0033 * (4 * ddlmps_dyale - 3 * ddlmtcx_dyale) * dyale05_dtaper
+        dk_dmin_pressure_loc = 0.0033 * 4 * ddlmps_dloc
+        dk_dmax_thickness_loc = -0.0033 * 3 * ddlmtcx_dloc
+
+        J['SA1', Aircraft.Wing.MIN_PRESSURE_LOCATION] = (
+            dk_dmin_pressure_loc * sa_l + sa_k * 0.06
+        ) * ones
+        J['SA1', Aircraft.Wing.MAX_THICKNESS_LOCATION] = dk_dmax_thickness_loc * sa_l * ones
+        J['SA1', Aircraft.Wing.ASPECT_RATIO] = dk_dAR * sa_l * ones
+        J['SA1', Aircraft.Wing.SWEEP] = dk_dsweep * sa_l * ones
+        J['SA1', Aircraft.Wing.TAPER_RATIO] = dk_dtaper * sa_l * ones
+        J['SA1', Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED] = -1.4 * sa_k * ones
+
+        sa2_fact = -0.33 * (0.65 - wing_min_pressure_loc)
+        J['SA2', Aircraft.Wing.MIN_PRESSURE_LOCATION] = (
+            sa2_fact * dk_dmin_pressure_loc + 0.33 * sa_k
+        ) * ones
+        J['SA2', Aircraft.Wing.MAX_THICKNESS_LOCATION] = sa2_fact * dk_dmax_thickness_loc * ones
+        J['SA2', Aircraft.Wing.ASPECT_RATIO] = sa2_fact * dk_dAR * ones
+        J['SA2', Aircraft.Wing.SWEEP] = sa2_fact * dk_dsweep * ones
+        J['SA2', Aircraft.Wing.TAPER_RATIO] = sa2_fact * dk_dtaper * ones
+
+        # sa3 = (1.5 - 2 * fk**2 * sin(rlmle)**2) * tc_ratio ** (5 / 3)
+        sin_rlmle = np.sin(rlmle)
+        tc_fact = tc_ratio ** (5 / 3.0)
+        dsa3_dfk = -4 * fk * sin_rlmle**2 * tc_fact
+        dsa3_drlmle = -4 * fk**2 * sin_rlmle * np.cos(rlmle) * tc_fact
+
+        J['SA3', Aircraft.Wing.ASPECT_RATIO] = (dsa3_dfk * dfk_dAR + dsa3_drlmle * drlmle_dAR) * ones
+        J['SA3', Aircraft.Wing.SWEEP] = dsa3_drlmle * drlmle_dsweep * ones
+        J['SA3', Aircraft.Wing.TAPER_RATIO] = (
+            dsa3_dfk * dfk_dtaper + dsa3_drlmle * drlmle_dyale * dyale05_dtaper
+        ) * ones
+        J['SA3', Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED] = (
+            (1.5 - 2 * fk**2 * sin_rlmle**2) * (5 / 3.0) * tc_ratio ** (2 / 3.0) * ones
+        )
+
+        # Reynolds number per foot
+        reli_y2 = sos * mach / nu
+        sig = sigmoidX(mach, 0.1, mu=0.005)
+        dsig_dmach = dSigmoidXdx(mach, 0.1, mu=0.005)
+        reli = (1 - sig) * 700000 + sig * reli_y2
+        dreli_dmach = dsig_dmach * (reli_y2 - 700000) + sig * sos / nu
+        dreli_dsos = sig * mach / nu
+        dreli_dnu = -sig * reli_y2 / nu
+
+        good_mask = reli > 1
+
+        def re_correction(length):
+            # Reynolds number correction factor for the given length, and its partials with
+            # respect to reli and length
+            length = np.atleast_1d(length)[:, np.newaxis]
+            fre = np.ones((length.shape[0], nn))
+            dfre_dreli = np.zeros((length.shape[0], nn))
+            dfre_dlen = np.zeros((length.shape[0], nn))
+
+            g = np.log10(reli[good_mask] * length) / 7
+            fre[:, good_mask] = g**-2.6
+            dfre_dlog = -2.6 * g**-3.6 / (7 * np.log(10))
+            dfre_dreli[:, good_mask] = dfre_dlog / reli[good_mask]
+            dfre_dlen[:, good_mask] = dfre_dlog / length
+
+            return fre, dfre_dreli, dfre_dlen
+
+        ffre, dffre_dreli, dffre_dlen = (v[0] for v in re_correction(fus_len))
+        fwre, dfwre_dreli, dfwre_dlen = (v[0] for v in re_correction(avg_chord))
+        fvtre, dfvtre_dreli, dfvtre_dlen = (v[0] for v in re_correction(vtail_chord))
+        fhtre, dfhtre_dreli, dfhtre_dlen = (v[0] for v in re_correction(htail_chord))
+        fnre, dfnre_dreli, dfnre_dlen = re_correction(nac_len)
+        if include_strut:
+            fstrtre, dfstrtre_dreli, dfstrtre_dlen = (v[0] for v in re_correction(strut_chord))
+        else:
+            fstrtre = ones
+            dfstrtre_dreli = dfstrtre_dlen = np.zeros(nn)
+
+        # flat plate equivalent areas, per unit skin friction coefficient
+        fef_cf = fus_SA * fcffc * ffre * ff_fus
+        few_cf = ff_wing * wing_area * fcfwc * fwre
+        per_engine_nac = np.atleast_2d(num_engines * ff_nac * nacelle_area).T
+        nac_sum = np.sum(per_engine_nac * fnre, axis=0)
+        fen_cf = fpylnd * fcfnc * nac_sum
+        fevt_cf = ff_vtail * vtail_area * fcfvtc * fvtre
+        feht_cf = ff_htail * htail_area * fcfhtc * fhtre
+        festrt_cf = strut_fus_intf * strut_wing_area_ratio * wing_area * fcfstrc * fstrtre
+
+        # total of the areas that excrescence drag is applied to
+        fe_sum = (fef_cf + few_cf + fen_cf + fevt_cf + feht_cf + festrt_cf) * cf + fe_fus_inc
+        cdw0 = few_cf * cf / wing_area
+        feshieldwf = cdw0 * areashieldwf
+        feiwf = fckic * (wing_fus_intf * (feintwf - feshieldwf))
+
+        # fe = excr_fact * fe_sum + feiwf + cd0_inc * wing_area
+        excr_fact = 1 + fexcrt * pct_excr
+        dfe_dcdw0 = -fckic * wing_fus_intf * areashieldwf
+
+        # Partials of fe_sum, cdw0, and the remaining terms of fe with respect to each input
+        # that they depend on. cdpo = (fe - few) / wing_area, and few = cdw0 * wing_area.
+        dfe_sum = {}
+        dcdw0 = {}
+        dfe_other = {}
+
+        dfe_sum_dreli = cf * (
+            fus_SA * fcffc * ff_fus * dffre_dreli
+            + ff_wing * wing_area * fcfwc * dfwre_dreli
+            + fpylnd * fcfnc * np.sum(per_engine_nac * dfnre_dreli, axis=0)
+            + ff_vtail * vtail_area * fcfvtc * dfvtre_dreli
+            + ff_htail * htail_area * fcfhtc * dfhtre_dreli
+            + strut_fus_intf * strut_wing_area_ratio * wing_area * fcfstrc * dfstrtre_dreli
+        )
+        dcdw0_dreli = ff_wing * fcfwc * cf * dfwre_dreli
+        dfe_sum_dcf = fef_cf + few_cf + fen_cf + fevt_cf + feht_cf + festrt_cf
+        dcdw0_dcf = few_cf / wing_area
+
+        dfe_sum[Dynamic.Atmosphere.MACH] = dfe_sum_dreli * dreli_dmach + dfe_sum_dcf * dcf_dmach
+        dcdw0[Dynamic.Atmosphere.MACH] = dcdw0_dreli * dreli_dmach + dcdw0_dcf * dcf_dmach
+        dfe_sum[Dynamic.Atmosphere.SPEED_OF_SOUND] = dfe_sum_dreli * dreli_dsos
+        dcdw0[Dynamic.Atmosphere.SPEED_OF_SOUND] = dcdw0_dreli * dreli_dsos
+        dfe_sum[Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = dfe_sum_dreli * dreli_dnu
+        dcdw0[Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = dcdw0_dreli * dreli_dnu
+
+        # form factors
+        dfe_sum[Aircraft.Wing.FORM_FACTOR] = wing_area * fcfwc * fwre * cf
+        dcdw0[Aircraft.Wing.FORM_FACTOR] = fcfwc * fwre * cf
+        dfe_sum[Aircraft.Fuselage.FORM_FACTOR] = fus_SA * fcffc * ffre * cf
+        dfe_sum[Aircraft.Nacelle.FORM_FACTOR] = (
+            fpylnd * fcfnc * cf * (np.atleast_2d(num_engines * nacelle_area).T * fnre)
+        ).T
+        dfe_sum[Aircraft.VerticalTail.FORM_FACTOR] = vtail_area * fcfvtc * fvtre * cf
+        dfe_sum[Aircraft.HorizontalTail.FORM_FACTOR] = htail_area * fcfhtc * fhtre * cf
+
+        # interference
+        dfe_other[Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR] = fckic * (feintwf - feshieldwf)
+        dfe_sum[Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR] = (
+            strut_wing_area_ratio * wing_area * fcfstrc * fstrtre * cf
+        )
+        dfe_other['interference_independent_of_shielded_area'] = fckic * wing_fus_intf * ones
+        dfe_other['drag_loss_due_to_shielded_wing_area'] = -fckic * wing_fus_intf * cdw0
+
+        # increments
+        dfe_other[Aircraft.Design.DRAG_COEFFICIENT_INCREMENT] = wing_area * ones
+        dfe_sum[Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT] = ones
+
+        # geometry
+        dfe_sum[Aircraft.Strut.AREA_RATIO] = strut_fus_intf * wing_area * fcfstrc * fstrtre * cf
+        dfe_sum[Aircraft.Wing.AVERAGE_CHORD] = ff_wing * wing_area * fcfwc * dfwre_dlen * cf
+        dcdw0[Aircraft.Wing.AVERAGE_CHORD] = ff_wing * fcfwc * dfwre_dlen * cf
+        dfe_sum[Aircraft.HorizontalTail.AVERAGE_CHORD] = (
+            ff_htail * htail_area * fcfhtc * dfhtre_dlen * cf
+        )
+        dfe_sum[Aircraft.VerticalTail.AVERAGE_CHORD] = (
+            ff_vtail * vtail_area * fcfvtc * dfvtre_dlen * cf
+        )
+        dfe_sum[Aircraft.Fuselage.LENGTH] = fus_SA * fcffc * ff_fus * dffre_dlen * cf
+        dfe_sum[Aircraft.Nacelle.AVG_LENGTH] = (fpylnd * fcfnc * cf * per_engine_nac * dfnre_dlen).T
+        dfe_sum[Aircraft.HorizontalTail.AREA] = ff_htail * fcfhtc * fhtre * cf
+        dfe_sum[Aircraft.Fuselage.WETTED_AREA] = fcffc * ffre * ff_fus * cf
+        dfe_sum[Aircraft.Nacelle.SURFACE_AREA] = (
+            fpylnd * fcfnc * cf * (np.atleast_2d(num_engines * ff_nac).T * fnre)
+        ).T
+        dfe_sum[Aircraft.VerticalTail.AREA] = ff_vtail * fcfvtc * fvtre * cf
+        dfe_sum[Aircraft.Wing.AREA] = (few_cf + festrt_cf) * cf / wing_area
+        dfe_other[Aircraft.Wing.AREA] = cd0_inc * ones
+        if include_strut:
+            dfe_sum[Aircraft.Strut.CHORD] = (
+                strut_fus_intf * strut_wing_area_ratio * wing_area * fcfstrc * dfstrtre_dlen * cf
+            )
+
+        # drag factors
+        dfe_sum[Aircraft.Fuselage.DRAG_FACTOR] = fus_SA * ffre * ff_fus * cf
+        dfe_sum[Aircraft.HorizontalTail.DRAG_FACTOR] = ff_htail * htail_area * fhtre * cf
+        dfe_other[Aircraft.Design.INTERFERENCE_DRAG_FACTOR] = wing_fus_intf * (
+            feintwf - feshieldwf
+        )
+        dfe_sum[Aircraft.Nacelle.DRAG_FACTOR] = fpylnd * nac_sum * cf
+        dfe_sum[Aircraft.Nacelle.PYLON_DRAG_FACTOR] = fcfnc * nac_sum * cf
+        dfe_sum[Aircraft.Strut.DRAG_FACTOR] = (
+            strut_fus_intf * strut_wing_area_ratio * wing_area * fstrtre * cf
+        )
+        dfe_sum[Aircraft.VerticalTail.DRAG_FACTOR] = ff_vtail * vtail_area * fvtre * cf
+        dfe_sum[Aircraft.Wing.DRAG_FACTOR] = ff_wing * wing_area * fwre * cf
+        dcdw0[Aircraft.Wing.DRAG_FACTOR] = ff_wing * fwre * cf
+        dfe_other[Aircraft.Design.EXCRESCENCE_DRAG_FACTOR] = pct_excr * fe_sum
+        dfe_other[Aircraft.Design.PERCENT_EXCRESCENCE_DRAG] = fexcrt * fe_sum
+
+        # sa5 = cdpo
+        # sa7 = 1 / (pi * AR * ufac * siwb) + 1.1938 / pi * (cdw0 / cos(sweep)**2 + cdpo)
+        cos_sweep = np.cos(deg2rad(sweep_c4))
+        sa7_fact = 1.1938 / np.pi
+        fe = excr_fact * fe_sum + feiwf + cd0_inc * wing_area
+        cdpo = (fe - cdw0 * wing_area) / wing_area
+
+        for name in dfe_sum.keys() | dcdw0.keys() | dfe_other.keys():
+            dfe_sum_dx = dfe_sum.get(name, 0.0)
+            dcdw0_dx = dcdw0.get(name, 0.0)
+
+            dfe_dx = excr_fact * dfe_sum_dx + dfe_dcdw0 * dcdw0_dx + dfe_other.get(name, 0.0)
+            dcdpo_dx = dfe_dx / wing_area - dcdw0_dx
+            if name == Aircraft.Wing.AREA:
+                # few = cdw0 * wing_area also depends on wing area directly
+                dcdpo_dx = dcdpo_dx - (cdw0 + cdpo) / wing_area
+
+            J['SA5', name] = dcdpo_dx
+            J['SA7', name] = sa7_fact * (dcdw0_dx / cos_sweep**2 + dcdpo_dx)
+
+        J['SA6', Dynamic.Atmosphere.MACH] = ff_wing * dfwre_dreli * dreli_dmach
+        J['SA6', Dynamic.Atmosphere.SPEED_OF_SOUND] = ff_wing * dfwre_dreli * dreli_dsos
+        J['SA6', Dynamic.Atmosphere.KINEMATIC_VISCOSITY] = ff_wing * dfwre_dreli * dreli_dnu
+        J['SA6', Aircraft.Wing.FORM_FACTOR] = fwre
+        J['SA6', Aircraft.Wing.AVERAGE_CHORD] = ff_wing * dfwre_dlen
+
+        oswald_fact = 1 / (np.pi * AR * ufac * siwb)
+        J['SA7', 'ufac'] = -oswald_fact / ufac
+        J['SA7', 'siwb'] = -oswald_fact / siwb
+        J['SA7', Aircraft.Wing.ASPECT_RATIO] = -oswald_fact / AR
+        J['SA7', Aircraft.Wing.SWEEP] = (
+            sa7_fact * cdw0 * 2 * np.tan(deg2rad(sweep_c4)) / cos_sweep**2 * np.pi / 180.0
+        )
+
 
 class AeroSetup(om.Group):
     """Calculations for setting up aero."""
@@ -1308,24 +1786,32 @@ class DragCoef(om.ExplicitComponent):
         self.declare_partials('*', '*', dependent=False)
         ar = np.arange(self.options['num_nodes'])
 
-        self.declare_partials('CD_base', ['*'], method='cs')
+        self.declare_partials(
+            'CD_base',
+            [
+                'flap_defl',
+                Aircraft.Wing.HEIGHT,
+                'airport_alt',
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                'dCL_flaps_model',
+                'dCL_flaps_coef',
+                'CDI_factor',
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+        )
         self.declare_partials(
             'CD_base',
             [Dynamic.Mission.ALTITUDE, 'CL', 'cf', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
-        # self.declare_partials(
-        #     "CD_base", [Aircraft.Design.GROSS_MASS, "dCD_flaps_model", "wing_area"], val=0
-        # )
 
         self.declare_partials('dCD_flaps_full', ['dCD_flaps_model'], val=1)
 
         self.declare_partials(
             'dCD_gear_full',
             [Aircraft.Design.GROSS_MASS, Aircraft.Wing.AREA, 'flap_defl'],
-            method='cs',
         )
 
     def compute(self, inputs, outputs):
@@ -1375,6 +1861,86 @@ class DragCoef(om.ExplicitComponent):
         outputs['dCD_flaps_full'] = dCD_flaps_model  # same as inputs['dCD_flaps_model']
         outputs['dCD_gear_full'] = dcd_gear
 
+    def compute_partials(self, inputs, J):
+        (
+            alt,
+            CL,
+            gross_mass_initial,
+            flap_defl,
+            wing_height,
+            airport_alt,
+            flap_chord_ratio,
+            dCL_flaps_model,
+            dCD_flaps_model,
+            dCL_flaps_coef,
+            CDI_factor,
+            avg_chord,
+            wingspan,
+            wing_area,
+            cf,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+        nn = self.options['num_nodes']
+        gross_wt_initial = gross_mass_initial * GRAV_ENGLISH_LBM
+
+        # induced drag
+        cl_clean = CL - dCL_flaps_coef * dCL_flaps_model
+        cdi = SA7 * cl_clean**2 / CDI_factor
+        dcdi_dcl_clean = 2 * SA7 * cl_clean / CDI_factor
+
+        # ground effects
+        hac = wing_height + alt - airport_alt
+        sin_flap = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - sin_flap * flap_chord_ratio * avg_chord
+        hob = heff / wingspan
+        sig = np.exp(-2.48 * hob**0.768)
+        betag = np.sqrt(1 + hob**2) - hob
+        c1 = betag * CL / (12.5664 * hac)
+
+        dsig_dhob = -2.48 * 0.768 * hob**-0.232 * sig
+        dbetag_dhob = hob / np.sqrt(1 + hob**2) - 1
+
+        # dcd_ground = -(sig - c1) * cdi / (1.0 - c1) - c1 * SA6 * cf
+        ddcd_dsig = -cdi / (1.0 - c1)
+        ddcd_dc1 = cdi * (1.0 - sig) / (1.0 - c1) ** 2 - SA6 * cf
+        dCD_dcdi = 1.0 - (sig - c1) / (1.0 - c1)
+
+        dCD_dhob = ddcd_dsig * dsig_dhob + ddcd_dc1 * CL / (12.5664 * hac) * dbetag_dhob
+        dCD_dheff = dCD_dhob / wingspan
+        dCD_dhac = 2 * dCD_dheff - ddcd_dc1 * c1 / hac
+
+        J['CD_base', Dynamic.Mission.ALTITUDE] = dCD_dhac
+        J['CD_base', 'CL'] = dCD_dcdi * dcdi_dcl_clean + ddcd_dc1 * betag / (12.5664 * hac)
+        J['CD_base', 'cf'] = SA6 * (1.0 - c1)
+        J['CD_base', 'SA5'] = np.ones(nn)
+        J['CD_base', 'SA6'] = cf * (1.0 - c1)
+        J['CD_base', 'SA7'] = dCD_dcdi * cl_clean**2 / CDI_factor
+
+        J['CD_base', 'flap_defl'] = (
+            -dCD_dheff * np.cos(deg2rad(flap_defl)) * np.pi / 180.0 * flap_chord_ratio * avg_chord
+        )
+        J['CD_base', Aircraft.Wing.HEIGHT] = dCD_dhac
+        J['CD_base', 'airport_alt'] = -dCD_dhac
+        J['CD_base', Aircraft.Wing.FLAP_CHORD_RATIO] = -dCD_dheff * sin_flap * avg_chord
+        J['CD_base', 'dCL_flaps_model'] = -dCD_dcdi * dcdi_dcl_clean * dCL_flaps_coef
+        J['CD_base', 'dCL_flaps_coef'] = -dCD_dcdi * dcdi_dcl_clean * dCL_flaps_model
+        J['CD_base', 'CDI_factor'] = -dCD_dcdi * cdi / CDI_factor
+        J['CD_base', Aircraft.Wing.AVERAGE_CHORD] = -dCD_dheff * sin_flap * flap_chord_ratio
+        J['CD_base', Aircraft.Wing.SPAN] = -dCD_dhob * hob / wingspan
+
+        # landing gear
+        grfe = 0.0033 * gross_wt_initial**0.785
+        flap_fact = 1 - 0.454545 * flap_defl / 50
+        dcd_gear = (grfe / wing_area) * flap_fact
+
+        J['dCD_gear_full', Aircraft.Design.GROSS_MASS] = (
+            0.785 * dcd_gear / gross_mass_initial * np.ones(nn)
+        )
+        J['dCD_gear_full', Aircraft.Wing.AREA] = -dcd_gear / wing_area * np.ones(nn)
+        J['dCD_gear_full', 'flap_defl'] = -grfe / wing_area * 0.454545 / 50 * np.ones(nn)
+
 
 class DragCoefClean(om.ExplicitComponent):
     """Clean drag coefficient for high-speed flight."""
@@ -1420,15 +1986,17 @@ class DragCoefClean(om.ExplicitComponent):
             [Dynamic.Atmosphere.MACH, 'CL', 'cf', 'SA1', 'SA2', 'SA5', 'SA6', 'SA7'],
             rows=ar,
             cols=ar,
-            method='cs',
         )
         self.declare_partials(
             'CD',
             [
                 Aircraft.Design.DRAG_DIVERGENCE_SHIFT,
+                Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+                Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
                 Aircraft.Design.COMPRESSIBILITY_DRAG_FACTOR,
             ],
-            method='cs',
         )
 
     def compute(self, inputs, outputs):
@@ -1472,6 +2040,57 @@ class DragCoefClean(om.ExplicitComponent):
 
         outputs['CD'] = CD_scaled
 
+    def compute_partials(self, inputs, J):
+        (
+            mach,
+            CL,
+            div_drag_supercrit,
+            subsonic_factor,
+            supersonic_factor,
+            lift_factor,
+            zero_lift_factor,
+            fcmpc,
+            cf,
+            SA1,
+            SA2,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+
+        mach_div = SA1 + SA2 * CL + div_drag_supercrit
+
+        sig = sigmoidX(mach - mach_div, 0.0, mu=0.005)
+        dsig = dSigmoidXdx(mach - mach_div, 0.0, mu=0.005)
+        delcdm = sig * (10 * (mach - mach_div) ** 3)
+        ddelcdm_dmach = dsig * 10 * (mach - mach_div) ** 3 + sig * 30 * (mach - mach_div) ** 2
+
+        cd0 = SA5 + SA6 * cf
+        cdi = SA7 * CL**2
+        CD = cd0 * zero_lift_factor + cdi * lift_factor + fcmpc * delcdm
+
+        supersonic = mach >= 1.0
+        scale = np.where(supersonic, supersonic_factor, subsonic_factor)
+
+        # mach_div only appears as (mach - mach_div)
+        dCD_dmach_div = -scale * fcmpc * ddelcdm_dmach
+
+        J['CD', Dynamic.Atmosphere.MACH] = scale * fcmpc * ddelcdm_dmach
+        J['CD', 'CL'] = scale * 2 * SA7 * CL * lift_factor + dCD_dmach_div * SA2
+        J['CD', 'cf'] = scale * SA6 * zero_lift_factor
+        J['CD', 'SA1'] = dCD_dmach_div
+        J['CD', 'SA2'] = dCD_dmach_div * CL
+        J['CD', 'SA5'] = scale * zero_lift_factor
+        J['CD', 'SA6'] = scale * cf * zero_lift_factor
+        J['CD', 'SA7'] = scale * CL**2 * lift_factor
+
+        J['CD', Aircraft.Design.DRAG_DIVERGENCE_SHIFT] = dCD_dmach_div
+        J['CD', Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, 0.0, CD)
+        J['CD', Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR] = np.where(supersonic, CD, 0.0)
+        J['CD', Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR] = scale * cdi
+        J['CD', Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR] = scale * cd0
+        J['CD', Aircraft.Design.COMPRESSIBILITY_DRAG_FACTOR] = scale * delcdm
+
 
 class GroundEffect(om.ExplicitComponent):
     """Factor of CL due to ground effect."""
@@ -1526,8 +2145,23 @@ class GroundEffect(om.ExplicitComponent):
             'lift_curve_slope',
         ]
 
-        self.declare_partials('kclge', ['*'], method='cs')
-        self.declare_partials('kclge', dynvars, rows=ar, cols=ar, method='cs')
+        self.declare_partials(
+            'kclge',
+            [
+                Aircraft.Wing.ZERO_LIFT_ANGLE,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.HEIGHT,
+                'airport_alt',
+                'flap_defl',
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                Aircraft.Wing.TAPER_RATIO,
+                'dCL_flaps_model',
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+        )
+        self.declare_partials('kclge', dynvars, rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -1574,6 +2208,110 @@ class GroundEffect(om.ExplicitComponent):
 
         outputs['kclge'] = kclge
 
+    def compute_partials(self, inputs, J):
+        (
+            alpha,
+            alt,
+            lift_curve_slope,
+            alpha0,
+            sweep_c4,
+            AR,
+            wing_height,
+            airport_alt,
+            flap_defl,
+            flap_chord_ratio,
+            taper_ratio,
+            dCL_flaps_model,
+            avg_chord,
+            wingspan,
+        ) = inputs.values()
+
+        hac = wing_height + alt - airport_alt
+        sin_flap = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - sin_flap * flap_chord_ratio * avg_chord
+        r = heff / wingspan
+        sig = np.exp(-2.48 * r**0.768)
+        betag = (1 + r**2) ** 0.5 - r
+
+        dsig_dr = -2.48 * 0.768 * r**-0.232 * sig
+        dbetag_dr = r / np.sqrt(1 + r**2) - 1
+
+        # half chord sweep
+        tan_sweep = np.tan(deg2rad(sweep_c4))
+        yale = (1 - taper_ratio) / (1 + taper_ratio)
+        y = AR * tan_sweep - yale
+        rlmc2 = np.arctan2(y, AR)
+        drlmc2_dAR = (AR * tan_sweep - y) / (AR**2 + y**2)
+        drlmc2_dy = AR / (AR**2 + y**2)
+
+        cos_rlmc2 = np.cos(rlmc2)
+        root = np.sqrt(AR**2 + (2 * cos_rlmc2) ** 2)
+        c3 = 2 * cos_rlmc2 + root
+        dc3_dcos = 2 + 4 * cos_rlmc2 / root
+        dc3_dAR = AR / root
+
+        c4 = betag / (12.5664 * hac / avg_chord)
+        cloge = lift_curve_slope * deg2rad(alpha - alpha0) + dCL_flaps_model
+        q = cloge - lift_curve_slope / (16 * hac / avg_chord)
+
+        kclge = 1 + sig - sig * AR * cos_rlmc2 / c3 - c4 * q
+
+        dk_dsig = 1 - AR * cos_rlmc2 / c3
+        dk_dcos = -sig * AR * (1 / c3 - cos_rlmc2 * dc3_dcos / c3**2)
+        dk_dAR = -sig * cos_rlmc2 / c3 + sig * AR * cos_rlmc2 * dc3_dAR / c3**2
+        dk_dq = -c4
+        dk_dc4 = -q
+
+        dk_drlmc2 = -dk_dcos * np.sin(rlmc2)
+        dk_dr = dk_dsig * dsig_dr + dk_dc4 * c4 / betag * dbetag_dr
+        dk_dheff = dk_dr / wingspan
+        dk_dhac = (
+            2 * dk_dheff
+            - dk_dc4 * c4 / hac
+            + dk_dq * lift_curve_slope * avg_chord / (16 * hac**2)
+        )
+
+        # clipped nodes, and nodes far from the ground, have no ground effect
+        active = ((kclge > 1.0) & (hac / wingspan < 10.0)).astype(float)
+
+        J['kclge', Dynamic.Vehicle.ANGLE_OF_ATTACK] = (
+            active * dk_dq * lift_curve_slope * np.pi / 180.0
+        )
+        J['kclge', Dynamic.Mission.ALTITUDE] = active * dk_dhac
+        J['kclge', 'lift_curve_slope'] = active * dk_dq * (
+            deg2rad(alpha - alpha0) - avg_chord / (16 * hac)
+        )
+
+        J['kclge', Aircraft.Wing.ZERO_LIFT_ANGLE] = (
+            -active * dk_dq * lift_curve_slope * np.pi / 180.0
+        )
+        J['kclge', Aircraft.Wing.SWEEP] = (
+            active * dk_drlmc2 * drlmc2_dy * AR * np.pi / 180.0 / np.cos(deg2rad(sweep_c4)) ** 2
+        )
+        J['kclge', Aircraft.Wing.ASPECT_RATIO] = active * (dk_dAR + dk_drlmc2 * drlmc2_dAR)
+        J['kclge', Aircraft.Wing.HEIGHT] = active * dk_dhac
+        J['kclge', 'airport_alt'] = -active * dk_dhac
+        J['kclge', 'flap_defl'] = (
+            -active
+            * dk_dheff
+            * np.cos(deg2rad(flap_defl))
+            * np.pi
+            / 180.0
+            * flap_chord_ratio
+            * avg_chord
+        )
+        J['kclge', Aircraft.Wing.FLAP_CHORD_RATIO] = -active * dk_dheff * sin_flap * avg_chord
+        J['kclge', Aircraft.Wing.TAPER_RATIO] = (
+            active * dk_drlmc2 * drlmc2_dy * 2 / (1 + taper_ratio) ** 2
+        )
+        J['kclge', 'dCL_flaps_model'] = active * dk_dq
+        J['kclge', Aircraft.Wing.AVERAGE_CHORD] = active * (
+            -dk_dheff * sin_flap * flap_chord_ratio
+            + dk_dc4 * c4 / avg_chord
+            - dk_dq * lift_curve_slope / (16 * hac)
+        )
+        J['kclge', Aircraft.Wing.SPAN] = -active * dk_dr * r / wingspan
+
 
 class LiftCoeff(om.ExplicitComponent):
     """GASP lift coefficient calculation for low-speed near-ground flight."""
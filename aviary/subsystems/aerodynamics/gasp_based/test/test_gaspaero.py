@@ -1,6 +1,8 @@
 import json
 import os
+import time
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 import openmdao.api as om
@@ -8,6 +10,7 @@ import pandas as pd
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
+from aviary.subsystems.aerodynamics.gasp_based import gaspaero
 from aviary.subsystems.aerodynamics.gasp_based.gaspaero import (
     AeroGeom,
     CruiseAero,
@@ -318,8 +321,8 @@ class XLiftsTest(unittest.TestCase):
         assert_near_equal(prob['lift_curve_slope'], [5.94800206, 5.94800206], tol)
         assert_near_equal(prob['lift_ratio'], [-0.140812203, -0.140812203], tol)
 
-        partial_data = prob.check_partials(method='fd', out_stream=None)
-        assert_check_partials(partial_data, atol=1e-4, rtol=1e-3)
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
     def test_case2(self):
         options = get_option_defaults()
@@ -358,8 +361,8 @@ class XLiftsTest(unittest.TestCase):
         assert_near_equal(prob['lift_curve_slope'], [4.638043756, 4.63804375], tol)
         assert_near_equal(prob['lift_ratio'], [-0.140812203, -0.140812203], tol)
 
-        partial_data = prob.check_partials(method='fd', out_stream=None)
-        assert_check_partials(partial_data, atol=1e-4, rtol=1e-3)
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
 
 class LiftCoeffTest(unittest.TestCase):
@@ -711,6 +714,9 @@ class AeroGeomTest(unittest.TestCase):
         assert_near_equal(prob['SA6'], [2.09276756, 2.09276756], tol)
         assert_near_equal(prob['SA7'], [0.03978045, 0.03978045], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case_multiengine(self):
         # 3-engine test case. 2nd and 3rd engine's properties are arbitrary
         options = get_option_defaults()
@@ -791,6 +797,9 @@ class AeroGeomTest(unittest.TestCase):
         assert_near_equal(prob['SA6'], [2.09276756, 2.09276756], tol)
         assert_near_equal(prob['SA7'], [0.04041756, 0.04041756], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 @use_tempdirs
 class BWBAeroSetupTest(unittest.TestCase):
@@ -948,6 +957,9 @@ class GroundEffectTest(unittest.TestCase):
         tol = 1e-7
         assert_near_equal(prob['kclge'], [1.15064679, 1.15064679], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 class BWBBodyLiftCurveSlopeTest(unittest.TestCase):
     """Body lift curve slope test for BWB"""
@@ -1162,6 +1174,9 @@ class DragCoefTest(unittest.TestCase):
         assert_near_equal(prob['dCD_flaps_full'], [0.0, 0.0], tol)
         assert_near_equal(prob['dCD_gear_full'], [0.01619421, 0.01619421], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case2(self):
         """BWB data"""
         prob = om.Problem()
@@ -1203,6 +1218,9 @@ class DragCoefTest(unittest.TestCase):
         assert_near_equal(prob['dCD_flaps_full'], [0.0, 0.0], tol)
         assert_near_equal(prob['dCD_gear_full'], [0.01781363, 0.01781363], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 class DragCoefCleanTest(unittest.TestCase):
     def test_case1(self):
@@ -1248,6 +1266,9 @@ class DragCoefCleanTest(unittest.TestCase):
         tol = 1e-4
         assert_near_equal(prob['CD'], [0.02251097, 0.02251097], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case2(self):
         """BWB data"""
         prob = om.Problem()
@@ -1291,6 +1312,9 @@ class DragCoefCleanTest(unittest.TestCase):
         tol = 1e-4
         assert_near_equal(prob['CD'], [0.01465816, 0.0156808], tol)
 
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 @use_tempdirs
 class BWBCruiseAeroTest(unittest.TestCase):
@@ -1930,6 +1954,167 @@ class BWBLowSpeedAeroTest3(unittest.TestCase):
             assert_near_equal(CL_over_CD, [CL_Over_CDs[i], CL_Over_CDs[i]], tol)
 
 
+def _build_aero_problem(aero, approx=False):
+    """Set up a problem containing a mission aero group at the cruise or takeoff condition."""
+    prob = om.Problem()
+    prob.model.add_subsystem('aero', aero, promotes=['*'])
+
+    if approx:
+        aero.approx_totals(method='cs')
+
+    setup_model_options(prob, AviaryValues({Aircraft.Engine.NUM_ENGINES: ([2], 'unitless')}))
+
+    prob.setup(check=False, force_alloc_complex=True)
+
+    _init_geom(prob)
+    prob.set_val(Aircraft.Fuselage.FORM_FACTOR, 1.05557953)
+
+    nn = aero.options['num_nodes']
+    prob.set_val(Dynamic.Atmosphere.MACH, np.linspace(0.2, 0.8, nn))
+    prob.set_val(Dynamic.Vehicle.ANGLE_OF_ATTACK, np.linspace(-2.0, 8.0, nn), units='deg')
+    prob.set_val(Dynamic.Atmosphere.SPEED_OF_SOUND, np.linspace(1116.4, 968.1, nn))
+    prob.set_val(Dynamic.Atmosphere.KINEMATIC_VISCOSITY, np.linspace(1.57e-4, 4.1e-4, nn))
+    prob.set_val(Dynamic.Atmosphere.DYNAMIC_PRESSURE, np.linspace(60.0, 250.0, nn))
+
+    if isinstance(aero, LowSpeedAero):
+        # takeoff flaps config
+        prob.set_val(Dynamic.Atmosphere.MACH, np.linspace(0.1, 0.3, nn))
+        prob.set_val(Dynamic.Mission.ALTITUDE, np.linspace(0.0, 100.0, nn))
+        prob.set_val(Aircraft.Wing.HEIGHT, 8.0)
+        prob.set_val('airport_alt', 0.0)
+        prob.set_val(Aircraft.Wing.FLAP_CHORD_RATIO, setup_data['cfoc'])
+        prob.set_val(Aircraft.Design.GROSS_MASS, setup_data['wgto'])
+        prob.set_val('flap_defl', setup_data['delfto'])
+        prob.set_val('CL_max_flaps', setup_data['clmwto'])
+        prob.set_val('dCL_flaps_model', setup_data['dclto'])
+        prob.set_val('dCD_flaps_model', setup_data['dcdto'])
+    else:
+        prob.set_val(Aircraft.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP, setup_data['clmwfu'])
+        prob.set_val(Aircraft.Design.DRAG_DIVERGENCE_SHIFT, setup_data['scfac'])
+
+    return prob
+
+
+def _cs_partials(cls):
+    """
+    Return a subclass of an aero component that computes all of its partials with complex step,
+    as the component did before it had analytic partials.
+    """
+
+    class CSPartials(cls):
+        def setup_partials(self):
+            self.declare_partials('*', '*', method='cs')
+
+        def compute_partials(self, inputs, J):
+            pass
+
+    CSPartials.__name__ = cls.__name__
+    return CSPartials
+
+
+# components of the mission aero groups that have analytic partials
+_analytic_components = ('Xlifts', 'AeroGeom', 'DragCoef', 'DragCoefClean', 'GroundEffect')
+
+_dynamic_wrt = [
+    Dynamic.Atmosphere.MACH,
+    Dynamic.Vehicle.ANGLE_OF_ATTACK,
+    Dynamic.Atmosphere.SPEED_OF_SOUND,
+    Dynamic.Atmosphere.KINEMATIC_VISCOSITY,
+    Dynamic.Atmosphere.DYNAMIC_PRESSURE,
+    Aircraft.Fuselage.FORM_FACTOR,
+]
+
+
+@use_tempdirs
+class GASPAeroJacobianTest(unittest.TestCase):
+    """
+    Compare the total Jacobian of the mission aero groups using analytic partials against a
+    complex-step approximation of the same Jacobian.
+    """
+
+    num_nodes = 60
+
+    def _compare(self, make_aero, wrt):
+        analytic = _build_aero_problem(make_aero(), approx=False)
+        approx = _build_aero_problem(make_aero(), approx=True)
+
+        analytic.run_model()
+        approx.run_model()
+
+        of = ['CL', 'CD']
+        analytic_totals = analytic.compute_totals(of=of, wrt=wrt)
+        approx_totals = approx.compute_totals(of=of, wrt=wrt)
+
+        for key, approx_jac in approx_totals.items():
+            assert_near_equal(analytic_totals[key], approx_jac, 1e-9)
+
+        # WingTailRatios only has scalar inputs and keeps its complex-step partials
+        partial_data = analytic.check_partials(out_stream=None, method='cs', excludes=['*ratios'])
+        assert_check_partials(partial_data, atol=1e-9, rtol=1e-9)
+
+    def test_cruise(self):
+        self._compare(lambda: CruiseAero(num_nodes=self.num_nodes, input_atmos=True), _dynamic_wrt)
+
+    def test_low_speed(self):
+        self._compare(
+            lambda: LowSpeedAero(num_nodes=self.num_nodes, input_atmos=True),
+            _dynamic_wrt + [Dynamic.Mission.ALTITUDE, 'flap_defl'],
+        )
+
+
+@use_tempdirs
+class GASPAeroLinearizeBenchmark(unittest.TestCase):
+    """
+    Time the linearization of the mission aero groups using analytic partials against the same
+    groups with the complex-step partial declarations the components used before, at a typical
+    number of mission nodes.
+    """
+
+    num_nodes = 60
+    num_repeats = 5
+
+    def _time_linearize(self, prob):
+        prob.run_model()
+
+        times = []
+        for _ in range(self.num_repeats):
+            start = time.perf_counter()
+            prob.model.run_linearize()
+            times.append(time.perf_counter() - start)
+
+        return min(times)
+
+    def _compare(self, make_aero):
+        analytic = _build_aero_problem(make_aero())
+
+        patches = [
+            patch.object(gaspaero, name, _cs_partials(getattr(gaspaero, name)))
+            for name in _analytic_components
+        ]
+        for cs_patch in patches:
+            cs_patch.start()
+        try:
+            cs = _build_aero_problem(make_aero())
+        finally:
+            for cs_patch in patches:
+                cs_patch.stop()
+
+        analytic_time = self._time_linearize(analytic)
+        cs_time = self._time_linearize(cs)
+
+        print(
+            f'{type(analytic.model.aero).__name__}, {self.num_nodes} nodes: analytic partials '
+            f'{analytic_time:.4f} s, complex-step partials {cs_time:.4f} s, speedup '
+            f'{cs_time / analytic_time:.1f}x'
+        )
+
+    def bench_test_cruise_linearize(self):
+        self._compare(lambda: CruiseAero(num_nodes=self.num_nodes, input_atmos=True))
+
+    def bench_test_low_speed_linearize(self):
+        self._compare(lambda: LowSpeedAero(num_nodes=self.num_nodes, input_atmos=True))
+
+
 if __name__ == '__main__':
     unittest.main()
     test = AeroGeomTest()
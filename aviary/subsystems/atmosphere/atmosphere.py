@@ -1,16 +1,90 @@
+from importlib import import_module
+
 import numpy as np
 import openmdao.api as om
 
-from aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Cold import atm_data as cold_210A
-from aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Hot import atm_data as hot_210A
-from aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Polar import atm_data as polar_210A
-from aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Tropical import atm_data as tropical_210A
-from aviary.subsystems.atmosphere.data.StandardAtm1976 import atm_data as USatm1976
 from aviary.subsystems.atmosphere.flight_conditions import FlightConditions
 from aviary.variable_info.enums import AtmosphereModel, SpeedType
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Dynamic, Settings
 
+# Modules containing the tabulated data and akima coefficients of each atmosphere model. They are
+# large, so they are only imported when a model that uses them is set up.
+_atmosphere_data_modules = {
+    AtmosphereModel.STANDARD: 'aviary.subsystems.atmosphere.data.StandardAtm1976',
+    AtmosphereModel.TROPICAL: 'aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Tropical',
+    AtmosphereModel.POLAR: 'aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Polar',
+    AtmosphereModel.HOT: 'aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Hot',
+    AtmosphereModel.COLD: 'aviary.subsystems.atmosphere.data.MIL_SPEC_210A_Cold',
+}
+
+# Layers of the U.S. Standard Atmosphere 1976 from Table 4 of the original standard: base
+# geopotential altitude (m) and temperature lapse rate (K/m). The first layer is extended below sea
+# level and the last layer above its top to cover the same altitudes as the tabulated data.
+_layer_base_alt = np.array([0.0, 11_000.0, 20_000.0, 32_000.0, 47_000.0, 51_000.0, 71_000.0])
+_layer_lapse_rate = np.array([-6.5e-3, 0.0, 1.0e-3, 2.8e-3, 0.0, -2.8e-3, -2.0e-3])
+
+_T0 = 288.15  # (K) sea level temperature
+_P0 = 101_325.0  # (Pa) sea level pressure
+_R_M0 = 8314.32 / 28.9644  # (J/(kg*K)) gas constant divided by sea level molar mass of air
+_g0_M0_R = 9.80665 / _R_M0  # (K/m) hydrostatic constant, g0 * M0 / R
+
+
+def _build_layer_bases():
+    """Return temperature (K) and pressure (Pa) at the base of each 1976 atmosphere layer."""
+    temps = [_T0]
+    pressures = [_P0]
+    for L, dh in zip(_layer_lapse_rate[:-1], np.diff(_layer_base_alt)):
+        Tb = temps[-1]
+        temps.append(Tb + L * dh)
+        if L == 0.0:
+            pressures.append(pressures[-1] * np.exp(-_g0_M0_R * dh / Tb))
+        else:
+            pressures.append(pressures[-1] * (Tb / temps[-1]) ** (_g0_M0_R / L))
+
+    return np.array(temps), np.array(pressures)
+
+
+_layer_base_temp, _layer_base_pres = _build_layer_bases()
+
+
+def _standard_atmosphere_1976(h):
+    """
+    Evaluate the U.S. Standard Atmosphere 1976 equations and their derivatives.
+
+    Parameters
+    ----------
+    h : ndarray
+        Geopotential altitude in meters.
+
+    Returns
+    -------
+    tuple of ndarray
+        Temperature (K), pressure (Pa) and density (kg/m**3), followed by their derivatives with
+        respect to geopotential altitude.
+    """
+    layer = np.maximum(np.searchsorted(_layer_base_alt, h.real, side='right') - 1, 0)
+    dh = h - _layer_base_alt[layer]
+    Tb = _layer_base_temp[layer]
+    Pb = _layer_base_pres[layer]
+    dT_dh = _layer_lapse_rate[layer]
+    isothermal = dT_dh == 0.0
+
+    # Equation 23
+    T = Tb + dT_dh * dh
+
+    # Equation 33a for layers with a temperature gradient, and 33b for isothermal layers
+    # (T / Tb is 1 in isothermal layers, so only the divisor of the exponent needs to be guarded)
+    exponent = -_g0_M0_R / np.where(isothermal, 1.0, dT_dh)
+    pressure = np.where(isothermal, Pb * np.exp(-_g0_M0_R * dh / Tb), Pb * (T / Tb) ** exponent)
+    dP_dh = -_g0_M0_R * pressure / T
+
+    # Equation 42
+    density = pressure / (_R_M0 * T)
+    drho_dh = (dP_dh * T - pressure * dT_dh) / (_R_M0 * T**2)
+
+    return T, pressure, density, dT_dh, dP_dh, drho_dh
+
 
 class Atmosphere(om.Group):
     """
@@ -116,16 +190,15 @@ class AtmosphereComp(om.ExplicitComponent):
         self._S = 110.4  # (K) southerlands constant
         self._beta = 1.458e-6  # (s*m*K**(1/2))
 
-        if self.options[Settings.ATMOSPHERE_MODEL] is AtmosphereModel.STANDARD:
-            self.source_data = USatm1976
-        elif self.options[Settings.ATMOSPHERE_MODEL] is AtmosphereModel.TROPICAL:
-            self.source_data = tropical_210A
-        elif self.options[Settings.ATMOSPHERE_MODEL] is AtmosphereModel.POLAR:
-            self.source_data = polar_210A
-        elif self.options[Settings.ATMOSPHERE_MODEL] is AtmosphereModel.HOT:
-            self.source_data = hot_210A
-        elif self.options[Settings.ATMOSPHERE_MODEL] is AtmosphereModel.COLD:
-            self.source_data = cold_210A
+        atmosphere_model = self.options[Settings.ATMOSPHERE_MODEL]
+        if atmosphere_model is AtmosphereModel.STANDARD_ANALYTIC:
+            self.source_data = None
+        else:
+            self.source_data = import_module(_atmosphere_data_modules[atmosphere_model]).atm_data
+
+        # altitudes of the most recent evaluation, and the atmospheric properties found there
+        self._cached_alt = None
+        self._cached_properties = None
 
         self.add_input(Dynamic.Mission.ALTITUDE, val=np.ones(nn), units='m')
 
@@ -169,6 +242,66 @@ class AtmosphereComp(om.ExplicitComponent):
             cols=arange,
         )
 
+    def _evaluate(self, h):
+        """
+        Evaluate atmospheric properties and their derivatives at the given altitudes.
+
+        The result of the most recent evaluation is cached, so that compute_partials can reuse the
+        table lookup done by compute at the same altitudes.
+
+        Parameters
+        ----------
+        h : ndarray
+            Geopotential altitude in meters.
+
+        Returns
+        -------
+        tuple of ndarray
+            Temperature (without delta_T_Celcius), pressure, and density, their derivatives with
+            respect to altitude, and the tabulated temperature derivative along with its own
+            derivative with respect to altitude.
+        """
+        cached_alt = self._cached_alt
+        if cached_alt is not None and h.dtype == cached_alt.dtype and np.array_equal(h, cached_alt):
+            return self._cached_properties
+
+        if self.source_data is None:
+            T, pressure, density, dT_dh, dP_dh, drho_dh = _standard_atmosphere_1976(h)
+            # temperature is piecewise linear, so dT_dh needs no table of its own
+            dT_dh_table = dT_dh
+            d2T_dh2 = np.zeros_like(dT_dh)
+
+        else:
+            table_points = self.source_data.alt
+            idx = np.searchsorted(table_points, h, side='left')
+            h_bin_left = np.hstack((table_points[0], table_points))
+            dx = h - h_bin_left[idx]
+
+            def akima(coeffs):
+                coeffs = coeffs[idx]
+                value = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+                deriv = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
+                return value, deriv
+
+            T, dT_dh = akima(self.source_data.akima_T)
+            pressure, dP_dh = akima(self.source_data.akima_P)
+            density, drho_dh = akima(self.source_data.akima_rho)
+            dT_dh_table, d2T_dh2 = akima(self.source_data.akima_dT)
+
+        self._cached_alt = h.copy()
+        self._cached_properties = (
+            T,
+            pressure,
+            density,
+            dT_dh,
+            dP_dh,
+            drho_dh,
+            dT_dh_table,
+            d2T_dh2,
+        )
+
+        return self._cached_properties
+
     def compute(self, inputs, outputs):
         """
         Interpolate atmospheric properties for a given altitude.
@@ -180,7 +313,6 @@ class AtmosphereComp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        table_points = self.source_data.alt
         h = inputs[Dynamic.Mission.ALTITUDE]
 
         if self._geometric:
@@ -190,22 +322,10 @@ class AtmosphereComp(om.ExplicitComponent):
 
         # From this point forward, h is geopotential altitude (z in the original reference).
 
-        idx = np.searchsorted(table_points, h, side='left')
-        h_bin_left = np.hstack((table_points[0], table_points))
-        dx = h - h_bin_left[idx]
+        T, pressure, raw_density, _, _, _, dT_dh, _ = self._evaluate(h)
 
-        coeffs = self.source_data.akima_T[idx]
-        outputs[Dynamic.Atmosphere.TEMPERATURE] = T = (
-            coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3])) + self._dt
-        )
-
-        coeffs = self.source_data.akima_P[idx]
-        outputs[Dynamic.Atmosphere.STATIC_PRESSURE] = pressure = coeffs[:, 0] + dx * (
-            coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3])
-        )
-
-        coeffs = self.source_data.akima_rho[idx]
-        raw_density = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+        outputs[Dynamic.Atmosphere.TEMPERATURE] = T = T + self._dt
+        outputs[Dynamic.Atmosphere.STATIC_PRESSURE] = pressure
 
         # Equation 42, rho = (P * M)/(R * (T + dT))
         # Assumes pressure does not change (which is a simplification)
@@ -220,8 +340,6 @@ class AtmosphereComp(om.ExplicitComponent):
         outputs[Dynamic.Atmosphere.SPEED_OF_SOUND] = (self._K * T) ** (0.5)
 
         # dsos_dh is only used for unsteady_solved_flight_conditions
-        coeffs = self.source_data.akima_dT[idx]
-        dT_dh = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
         outputs['dsos_dh'] = 0.5 * (self._K * T) ** (-0.5) * dT_dh * self._K
 
         # Equation 51
@@ -240,7 +358,6 @@ class AtmosphereComp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        table_points = self.source_data.alt
         h = inputs[Dynamic.Mission.ALTITUDE]
         dz_dh = 1.0
 
@@ -250,23 +367,18 @@ class AtmosphereComp(om.ExplicitComponent):
 
         # From this point forward, h is geopotential altitude (z in the original reference).
 
-        idx = np.searchsorted(table_points, h, side='left')
-        h_index = np.hstack((table_points[0], table_points))
-        dx = h - h_index[idx]
-
-        coeffs = self.source_data.akima_T[idx]
-        dT_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-        T = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3])) + self._dt
-
-        coeffs = self.source_data.akima_P[idx]
-        pressure = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-        dP_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
+        (
+            T,
+            pressure,
+            raw_density,
+            dT_dh,
+            dP_dh,
+            raw_drho_dh,  # needs correction
+            _,
+            d2T_dh2,
+        ) = self._evaluate(h)
+        T = T + self._dt
 
-        coeffs = self.source_data.akima_rho[idx]
-        raw_density = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-        raw_drho_dh = coeffs[:, 1] + dx * (
-            2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx
-        )  # needs correction
         # corrected_density = (raw_density**(-1) + self._R_air*self._dt * pressure**(-1) )**(-1) # This gets complex because pressure changes as a function of h!
         corrected_drho_dh = (
             -1
@@ -289,8 +401,6 @@ class AtmosphereComp(om.ExplicitComponent):
         dsos_dh = 0.5 * (self._K * T) ** (-0.5) * self._K * dT_dh
 
         # similar to method in dymos
-        coeffs = self.source_data.akima_dT[idx]
-        d2T_dh2 = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
         # dsos_dh = 0.5 * (self._K * T)**(-0.5) * dT_dh * self._K
         # product rule & chain rule
         partials['dsos_dh', Dynamic.Mission.ALTITUDE] = (
@@ -250,6 +250,75 @@ class USatm1976TestCase1(unittest.TestCase):
         assert_check_partials(partial_data)
 
 
+class USatm1976AnalyticTestCase1(unittest.TestCase):
+    def build_problem(self, atmosphere_model, altitudes, **kwargs):
+        prob = om.Problem()
+
+        prob.model.add_subsystem(
+            'atmo',
+            AtmosphereComp(num_nodes=len(altitudes), **kwargs),
+            promotes=['*'],
+        )
+
+        options = AviaryValues()
+        options.set_val(Settings.ATMOSPHERE_MODEL, val=atmosphere_model)
+        setup_model_options(prob, options)
+
+        prob.set_solver_print(level=0)
+        prob.setup(force_alloc_complex=True, check=False)
+        prob.set_val(Dynamic.Mission.ALTITUDE, altitudes, units='m')
+        prob.run_model()
+
+        return prob
+
+    def test_geopotential(self):
+        prob = self.build_problem(
+            AtmosphereModel.STANDARD_ANALYTIC, [-1000, 0, 10950, 11000, 11100, 20000, 32000]
+        )
+
+        tol = 1e-4
+        expected_values = {
+            (Dynamic.Atmosphere.TEMPERATURE, 'K'): expected_temp,
+            (Dynamic.Atmosphere.STATIC_PRESSURE, 'Pa'): expected_pressure,
+            (Dynamic.Atmosphere.DENSITY, 'kg/m**3'): expected_density,
+            (Dynamic.Atmosphere.SPEED_OF_SOUND, 'm/s'): expected_sos,
+            (Dynamic.Atmosphere.DYNAMIC_VISCOSITY, 'Pa*s'): expected_viscosity,
+        }
+
+        for (var_name, units), expected in expected_values.items():
+            with self.subTest(var=var_name):
+                assert_near_equal(prob.get_val(var_name, units=units), expected, tol)
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+
+        assert_check_partials(partial_data)
+
+    def test_match_tables(self):
+        # every layer of the standard, away from the layer boundaries where the akima splines of
+        # the tabulated data round off corners
+        altitudes = [-4000, 5000, 15500, 26000, 40000, 49000, 61000, 78000]
+        options = {'delta_T_Celcius': 15, 'h_def': 'geometric'}
+
+        analytic_prob = self.build_problem(AtmosphereModel.STANDARD_ANALYTIC, altitudes, **options)
+        table_prob = self.build_problem(AtmosphereModel.STANDARD, altitudes, **options)
+
+        for var_name in (
+            Dynamic.Atmosphere.TEMPERATURE,
+            Dynamic.Atmosphere.STATIC_PRESSURE,
+            Dynamic.Atmosphere.DENSITY,
+            Dynamic.Atmosphere.SPEED_OF_SOUND,
+            Dynamic.Atmosphere.DYNAMIC_VISCOSITY,
+        ):
+            with self.subTest(var=var_name):
+                assert_near_equal(
+                    analytic_prob.get_val(var_name), table_prob.get_val(var_name), 1e-6
+                )
+
+        partial_data = analytic_prob.check_partials(out_stream=None, method='cs')
+
+        assert_check_partials(partial_data)
+
+
 class MILSPEC210AColdTestCase1(unittest.TestCase):
     def setUp(self):
         self.prob = om.Problem()
@@ -20,14 +20,20 @@ required_options : tuple
 
 dependent_options : dict
     Options that may or may not be required based on the presence or value of other provided options.
+
+compiled_options : tuple
+    Options that change how engine data is processed. A compiled engine deck stores the values used
+    when it was created, which must match the options of any EngineDeck that loads it.
 """
 
+import hashlib
+import json
 import math
 import warnings
+from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.units import convert_units
 
 from aviary.interface.utils import round_it
 from aviary.subsystems.propulsion.engine_model import EngineModel
@@ -42,6 +48,9 @@ from aviary.subsystems.propulsion.utils import (
 )
 from aviary.utils.aviary_values import AviaryValues, NamedValues
 from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.functions import get_path
+from aviary.utils.interpolant_cache import CachedMetaModelSemiStructuredComp, get_cached_interpolant
+from aviary.utils.utils import convert_units
 from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.variable_meta_data import CoreMetaData
 from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
@@ -111,6 +120,24 @@ dependent_options = {
     )
 }
 
+# options that affect the processed data stored in compiled engine decks
+compiled_options = (
+    Aircraft.Engine.GEOPOTENTIAL_ALT,
+    Aircraft.Engine.IGNORE_NEGATIVE_THRUST,
+    Aircraft.Engine.GENERATE_FLIGHT_IDLE,
+    Aircraft.Engine.FLIGHT_IDLE_THRUST_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_MIN_FRACTION,
+    Aircraft.Engine.FLIGHT_IDLE_MAX_FRACTION,
+    Aircraft.Engine.INTERPOLATION_SORT,
+    Aircraft.Engine.GLOBAL_THROTTLE,
+    Aircraft.Engine.GLOBAL_HYBRID_THROTTLE,
+)
+
+# file extension and format version of compiled engine decks. Increment the version whenever the
+# contents of compiled decks change so outdated files are rejected
+COMPILED_DECK_EXTENSION = '.npz'
+COMPILED_DECK_VERSION = 1
+
 
 class EngineDeck(EngineModel):
     """
@@ -135,6 +162,7 @@ class EngineDeck(EngineModel):
     get_val
     set_val
     update
+    save_compiled_data
     """
 
     # EngineDecks using GLOBAL_THROTTLE = False will have unique maximum throttle levels per flight
@@ -170,6 +198,8 @@ class EngineDeck(EngineModel):
         self._original_data = {key: np.array([]) for key in EngineModelVariables}
         # working copy of engine performance data, is modified during data pre-processing
         self.data = {key: np.array([]) for key in EngineModelVariables}
+        # engine data at maximum throttle and hybrid throttle for each unique flight condition
+        self.max_data = {}
 
         # number of data points in engine data
         self.model_length = 0
@@ -301,8 +331,22 @@ class EngineDeck(EngineModel):
         - Sort and pack data
         - Determine reference thrust (optional)
         - Normalize throttles & hybrid throttles
-        - Fill flight idle points (optional).
+        - Fill flight idle points (optional)
+        - Pre-solve maximum thrust/shaft power at each flight condition.
+
+        If DATA_FILE is a compiled engine deck, the already processed data is loaded directly and
+        only the reference thrust and maximum values are determined.
         """
+        if self.read_from_file and is_compiled_deck(self.get_val(Aircraft.Engine.DATA_FILE)):
+            self._load_compiled_data()
+
+            if self.use_thrust:
+                self._set_reference_thrust()
+
+            self._compute_max_data()
+
+            return
+
         self._read_data(data)
 
         # perform consistency checks on data
@@ -326,6 +370,9 @@ class EngineDeck(EngineModel):
         if self.get_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE):
             self._generate_flight_idle()
 
+        # tabulate maximum thrust/shaft power as a function of flight condition only
+        self._compute_max_data()
+
     def _read_data(self, raw_data: NamedValues):
         """
         Import tabular engine data; either from memory or from a data file.
@@ -376,7 +423,7 @@ class EngineDeck(EngineModel):
                 # Convert data to expected units. Required so settings like tolerances that assume
                 # units work as expected
                 try:
-                    val = np.array([convert_units(i, units, default_units[key]) for i in val])
+                    val = convert_units(np.array(val), units, default_units[key])
                 except TypeError:
                     raise TypeError(
                         f"{self.error_message}: units of '{units}' provided for "
@@ -405,6 +452,165 @@ class EngineDeck(EngineModel):
         for key in self.data:
             self.data[key] = self._original_data[key]
 
+    def _get_compiled_options(self):
+        """
+        Return the values of options that affect data processing, in a JSON-compatible format.
+        Options that are not set or not used are stored as None.
+        """
+        generate_idle = self.get_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE)
+
+        options = {}
+        for key in compiled_options:
+            if key in dependent_options[Aircraft.Engine.GENERATE_FLIGHT_IDLE] and not generate_idle:
+                options[key] = None
+            elif key in self.options:
+                val = self.get_val(key)
+                if isinstance(val, (bool, np.bool_)):
+                    val = bool(val)
+                elif isinstance(val, (int, float, np.number)):
+                    val = float(val)
+                options[key] = val
+            else:
+                options[key] = None
+
+        return options
+
+    def save_compiled_data(self, filename):
+        """
+        Write the processed (sorted, packed, and normalized) engine data to a compiled engine deck.
+
+        Compiled engine decks are uncompressed numpy archives that can be used as the DATA_FILE of
+        another EngineDeck, skipping all data reading and processing. A hash of the contents is
+        stored in the file to detect corrupted or modified data.
+
+        Parameters
+        ----------
+        filename : (str, Path)
+            Path to the compiled engine deck that will be written. The ".npz" extension is added
+            if not present.
+
+        Returns
+        -------
+        Path
+            Path to the written file.
+        """
+        filename = Path(filename)
+        if filename.suffix != COMPILED_DECK_EXTENSION:
+            filename = filename.with_name(filename.name + COMPILED_DECK_EXTENSION)
+
+        if self.read_from_file:
+            source = str(self.get_val(Aircraft.Engine.DATA_FILE))
+        else:
+            source = self.name
+
+        inputs = getattr(self, 'inputs', [])
+        outputs = getattr(self, 'outputs', [])
+
+        metadata = {
+            'version': COMPILED_DECK_VERSION,
+            'source': source,
+            'options': self._get_compiled_options(),
+            'engine_variables': {key.name: units for key, units in self.engine_variables.items()},
+            'inputs': [var.name for var in inputs if isinstance(var, EngineModelVariables)],
+            'outputs': [var.name for var in outputs if isinstance(var, EngineModelVariables)],
+            'data': [key.name for key in self.data],
+            'model_length': int(self.model_length),
+            'mach_max_count': int(self.mach_max_count),
+            'alt_max_count': int(self.alt_max_count),
+            'data_max_count': int(self.data_max_count),
+        }
+
+        arrays = {
+            'throttle_min': np.asarray(self.throttle_min, dtype=float),
+            'throttle_max': np.asarray(self.throttle_max, dtype=float),
+            'hybrid_throttle_min': np.asarray(self.hybrid_throttle_min, dtype=float),
+            'hybrid_throttle_max': np.asarray(self.hybrid_throttle_max, dtype=float),
+            'data_indices': np.asarray(self.data_indices, dtype=int),
+        }
+        for key in self.data:
+            arrays['data.' + key.name] = np.asarray(self.data[key], dtype=float)
+            arrays['packed.' + key.name] = np.asarray(self.packed_data[key], dtype=float)
+
+        metadata = json.dumps(metadata, sort_keys=True)
+        arrays['metadata'] = np.array(metadata)
+        arrays['hash'] = np.array(_compiled_deck_hash(metadata, arrays))
+
+        # uncompressed, so arrays can be read directly from the file without decompression
+        np.savez(filename, **arrays)
+
+        return filename
+
+    def _load_compiled_data(self):
+        """
+        Load already processed engine data from a compiled engine deck.
+
+        Raises
+        ------
+        UserWarning
+            If the compiled deck was written by an incompatible version of Aviary, its contents do
+            not match the stored hash, or it was processed using options that differ from the
+            options of this EngineDeck.
+        """
+        data_file = get_path(self.get_val(Aircraft.Engine.DATA_FILE))
+
+        with np.load(data_file, allow_pickle=False) as deck:
+            arrays = {key: deck[key] for key in deck.files}
+
+        metadata_str = str(arrays.pop('metadata'))
+        stored_hash = str(arrays.pop('hash'))
+        metadata = json.loads(metadata_str)
+
+        if metadata.get('version') != COMPILED_DECK_VERSION:
+            raise UserWarning(
+                f'{self.error_message}: compiled engine deck format version '
+                f'{metadata.get("version")} is not supported (expected version '
+                f'{COMPILED_DECK_VERSION}). Please re-compile the engine deck.'
+            )
+
+        if stored_hash != _compiled_deck_hash(metadata_str, arrays):
+            raise UserWarning(
+                f'{self.error_message}: contents of compiled engine deck do not match its stored '
+                'hash. The file may be corrupted, please re-compile the engine deck.'
+            )
+
+        options = self._get_compiled_options()
+        mismatched = [key for key in compiled_options if options[key] != metadata['options'][key]]
+        if mismatched:
+            raise UserWarning(
+                f'{self.error_message}: compiled engine deck was created using different values '
+                f'for the following options: {mismatched}. Please re-compile the engine deck with '
+                'the current options.'
+            )
+
+        self.engine_variables = {
+            EngineModelVariables[name]: units
+            for name, units in metadata['engine_variables'].items()
+        }
+        self.inputs = [EngineModelVariables[name] for name in metadata['inputs']]
+        self.outputs = [EngineModelVariables[name] for name in metadata['outputs']]
+
+        self.data = {}
+        self.packed_data = {}
+        for name in metadata['data']:
+            key = EngineModelVariables[name]
+            self.data[key] = arrays['data.' + name]
+            self.packed_data[key] = arrays['packed.' + name]
+
+        self.model_length = metadata['model_length']
+        self.mach_max_count = metadata['mach_max_count']
+        self.alt_max_count = metadata['alt_max_count']
+        self.data_max_count = metadata['data_max_count']
+        self.data_indices = arrays['data_indices']
+
+        # throttle limits are scalars when using global throttles
+        for name in ('throttle_min', 'throttle_max', 'hybrid_throttle_min', 'hybrid_throttle_max'):
+            val = arrays[name]
+            if val.ndim == 0:
+                val = val.item()
+            setattr(self, name, val)
+
+        self._set_variable_flags()
+
     def _check_data(self):
         """
         Checks for consistency of provided thrust and drag data, ensures no required variables are
@@ -767,12 +973,14 @@ class EngineDeck(EngineModel):
     def _build_engine_interpolator(self, num_nodes, aviary_inputs):
         """
         Builds the OpenMDAO metamodel component for the engine deck.
-        Currently only the semistructured model is supported.
+        Currently only the semistructured model is supported. Interpolation tables are shared
+        through a process-wide cache, so every phase using this deck reuses the same precomputed
+        grid and coefficients regardless of num_nodes.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
         interp_sort = self.get_val(Aircraft.Engine.INTERPOLATION_SORT)
         # interpolator object for engine data
-        engine = om.MetaModelSemiStructuredComp(
+        engine = CachedMetaModelSemiStructuredComp(
             method=interp_method, extrapolate=True, vec_size=num_nodes
         )
 
@@ -839,8 +1047,9 @@ class EngineDeck(EngineModel):
     def build_mission(self, num_nodes, aviary_inputs, user_options, subsystem_options) -> om.Group:
         """
         Creates interpolator objects to be added to mission-level propulsion subsystem.
-        Interpolators must be re-generated for each ODE due to potentially different num_nodes in
-        each mission segment.
+        Interpolator components must be re-generated for each ODE due to potentially different
+        num_nodes in each mission segment, but the underlying interpolation tables are cached and
+        shared between them.
 
         Parameters
         ----------
@@ -856,8 +1065,8 @@ class EngineDeck(EngineModel):
         Returns
         -------
         engine_group : openmdao.core.Group
-            An OpenMDAO group containing engine data interpolators, an EngineScaling component, and
-            max throttle/max hybrid_throttle generating components as needed for this EngineDeck.
+            An OpenMDAO group containing engine data interpolators, an interpolator for maximum
+            thrust/shaft power as a function of flight condition, and an EngineScaling component.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
         interp_sort = self.get_val(Aircraft.Engine.INTERPOLATION_SORT)
@@ -867,143 +1076,45 @@ class EngineDeck(EngineModel):
         engine = self._build_engine_interpolator(num_nodes, aviary_inputs)
         units = self.engine_variable_units
 
-        # Create copy of interpolation component that computes max thrust/shp for current flight
-        # condition
+        # Interpolate max thrust/shp for current flight condition from the reduced data set
+        # pre-solved at maximum throttle and hybrid throttle for each flight condition
         # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
         #      for each flight condition
-        # TODO Use solver to find throttle/hybrid throttle for maximum thrust at given flight condition?
-        #      Pre-solve max throttle/hybrid throttle for each flight condition, interpolate on
-        #      reduced data set?
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle):
-                # create IndepVarComp to pass maximum throttle to max thrust interpolator
-                fixed_throttles = om.IndepVarComp()
-                if self.global_throttle:
-                    fixed_throttles.add_output(
-                        'throttle_max',
-                        val=np.ones(num_nodes) * self.throttle_max,
-                        units='unitless',
-                        desc='Engine maximum throttle',
-                    )
-                if self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    fixed_throttles.add_output(
-                        'hybrid_throttle_max',
-                        val=np.ones(num_nodes) * self.hybrid_throttle_max,
-                        units='unitless',
-                        desc='Engine maximum hybrid throttle',
-                    )
-            if not (
-                self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle)
-            ):
-                interp_throttles = om.MetaModelSemiStructuredComp(
-                    method=interp_method, extrapolate=False, vec_size=num_nodes
-                )
-
-                packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(alt_table, packed_data[ALTITUDE][M, A, 0])
-
-                # add inputs and outputs to interpolator
-                if interp_sort == 'altitude':
-                    interp_throttles.add_input(
-                        Dynamic.Mission.ALTITUDE,
-                        alt_table,
-                        units=units[ALTITUDE],
-                        desc='Current flight altitude',
-                    )
-                    interp_throttles.add_input(
-                        Dynamic.Atmosphere.MACH,
-                        mach_table,
-                        units='unitless',
-                        desc='Current flight Mach number',
-                    )
-                else:
-                    interp_throttles.add_input(
-                        Dynamic.Atmosphere.MACH,
-                        mach_table,
-                        units='unitless',
-                        desc='Current flight Mach number',
-                    )
-                    interp_throttles.add_input(
-                        Dynamic.Mission.ALTITUDE,
-                        alt_table,
-                        units=units[ALTITUDE],
-                        desc='Current flight altitude',
-                    )
-
-                if not self.global_throttle:
-                    interp_throttles.add_output(
-                        'throttle_max',
-                        self.throttle_max,
-                        units='unitless',
-                        desc='max throttle available at current flight condition',
-                    )
-                if not self.global_hybrid_throttle and self.use_hybrid_throttle:
-                    interp_throttles.add_output(
-                        'hybrid_throttle_max',
-                        self.hybrid_throttle_max,
-                        units='unitless',
-                        desc='max hybrid throttle available at current flight condition',
-                    )
-
-            # Calculation of max thrust currently done with a duplicate of the engine
-            # model and scaling components
-            max_thrust_engine = om.MetaModelSemiStructuredComp(
+            max_data = self.max_data
+            max_thrust_engine = CachedMetaModelSemiStructuredComp(
                 method=interp_method, extrapolate=False, vec_size=num_nodes
             )
-            # TODO engine could have other inputs!! Don't hardcode these
             if interp_sort == 'altitude':
                 max_thrust_engine.add_input(
                     Dynamic.Mission.ALTITUDE,
-                    self.data[ALTITUDE],
+                    max_data[ALTITUDE],
                     units=units[ALTITUDE],
                     desc='Current flight altitude',
                 )
                 max_thrust_engine.add_input(
                     Dynamic.Atmosphere.MACH,
-                    self.data[MACH],
+                    max_data[MACH],
                     units='unitless',
                     desc='Current flight Mach number',
                 )
             else:
                 max_thrust_engine.add_input(
                     Dynamic.Atmosphere.MACH,
-                    self.data[MACH],
+                    max_data[MACH],
                     units='unitless',
                     desc='Current flight Mach number',
                 )
                 max_thrust_engine.add_input(
                     Dynamic.Mission.ALTITUDE,
-                    self.data[ALTITUDE],
+                    max_data[ALTITUDE],
                     units=units[ALTITUDE],
                     desc='Current flight altitude',
                 )
 
-            # replace throttle coming from mission with max value based on flight condition
-            max_thrust_engine.add_input(
-                'throttle_max',
-                self.data[THROTTLE],
-                units='unitless',
-                desc='Current engine throttle',
-            )
-            if self.use_hybrid_throttle:
-                # replace hybrid throttle coming from mission with max value based on
-                # flight condition
-                max_thrust_engine.add_input(
-                    'hybrid_throttle_max',
-                    self.data[HYBRID_THROTTLE],
-                    units='unitless',
-                    desc='Current engine hybrid throttle',
-                )
             max_thrust_engine.add_output(
                 'thrust_net_max_unscaled',
-                self.data[THRUST],
+                max_data[THRUST],
                 units=units[THRUST],
                 desc='maximum thrust that can currently be produced',
             )
@@ -1011,14 +1122,14 @@ class EngineDeck(EngineModel):
             if SHAFT_POWER in self.engine_variables:
                 max_thrust_engine.add_output(
                     'shaft_power_max_unscaled',
-                    self.data[SHAFT_POWER],
+                    max_data[SHAFT_POWER],
                     units=units[SHAFT_POWER],
                     desc='maximum shaft power that can currently be produced',
                 )
             else:
                 max_thrust_engine.add_output(
                     'shaft_power_corrected_max_unscaled',
-                    self.data[SHAFT_POWER_CORRECTED],
+                    max_data[SHAFT_POWER_CORRECTED],
                     units=units[SHAFT_POWER_CORRECTED],
                     desc='maximum corrected shaft power that can currently be produced',
                 )
@@ -1055,18 +1166,6 @@ class EngineDeck(EngineModel):
             )
 
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle):
-                engine_group.add_subsystem(
-                    'fixed_max_throttles',
-                    fixed_throttles,
-                )
-            else:
-                engine_group.add_subsystem(
-                    'interp_max_throttles',
-                    interp_throttles,
-                    promotes_inputs=['*'],
-                )
-
             engine_group.add_subsystem(
                 'max_interpolation',
                 max_thrust_engine,
@@ -1076,18 +1175,6 @@ class EngineDeck(EngineModel):
                 ],
             )
 
-            # manually connect max throttles - do not promote them out of group
-            if self.global_throttle or (self.global_hybrid_throttle and self.use_hybrid_throttle):
-                engine_group.connect(
-                    'fixed_max_throttles.throttle_max',
-                    'max_interpolation.throttle_max',
-                )
-            else:
-                engine_group.connect(
-                    'interp_max_throttles.throttle_max',
-                    'max_interpolation.throttle_max',
-                )
-
             if uncorrect_shp:
                 engine_group.add_subsystem(
                     'uncorrect_max_shaft_power',
@@ -1505,6 +1592,66 @@ class EngineDeck(EngineModel):
         # repack data to keep it up to date
         self._pack_data()
 
+    def _compute_max_data(self):
+        """
+        Pre-solve the maximum thrust and shaft power available at each unique flight condition.
+
+        Maximum values are assumed to occur at maximum throttle and hybrid throttle, which can vary
+        between flight conditions when throttles are not normalized globally. The full engine data
+        is interpolated once at the maximum throttle settings of every Mach, altitude combination in
+        the data, producing a reduced data set that only depends on Mach number and altitude. The
+        mission then evaluates this reduced data set instead of interpolating on throttle (and
+        hybrid throttle) at every node. Requires packed and normalized data.
+        """
+        self.max_data = {}
+
+        if not (self.use_thrust or self.use_shaft_power):
+            return
+
+        interp_sort = self.get_val(Aircraft.Engine.INTERPOLATION_SORT)
+        if interp_sort == 'altitude':
+            independent_variables = [ALTITUDE, MACH, THROTTLE]
+        else:
+            independent_variables = [MACH, ALTITUDE, THROTTLE]
+        if self.use_hybrid_throttle:
+            independent_variables.append(HYBRID_THROTTLE)
+
+        max_outputs = [THRUST]
+        if self.use_shaft_power:
+            if SHAFT_POWER in self.engine_variables:
+                max_outputs.append(SHAFT_POWER)
+            else:
+                max_outputs.append(SHAFT_POWER_CORRECTED)
+
+        # Mach number and altitude of each unique flight condition, in the same order as the
+        # per-condition throttle limits
+        has_data = self.data_indices != 0
+        machs = self.packed_data[MACH][..., 0][has_data]
+        alts = self.packed_data[ALTITUDE][..., 0][has_data]
+        num_conditions = machs.size
+
+        points = {
+            MACH: machs,
+            ALTITUDE: alts,
+            THROTTLE: np.broadcast_to(self.throttle_max, num_conditions),
+            HYBRID_THROTTLE: np.broadcast_to(self.hybrid_throttle_max, num_conditions),
+        }
+        points = np.stack([points[var] for var in independent_variables], axis=-1)
+
+        # interpolated data is sorted the same way as the full data set
+        sort_order = np.lexsort((points[:, 1], points[:, 0]))
+        points = points[sort_order]
+
+        grid = np.stack([self.data[var] for var in independent_variables], axis=-1)
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+
+        self.max_data[independent_variables[0]] = points[:, 0]
+        self.max_data[independent_variables[1]] = points[:, 1]
+
+        for var in max_outputs:
+            interp = get_cached_interpolant(grid, self.data[var], method=interp_method)
+            self.max_data[var] = interp.interpolate(points)
+
     def _sort_data(self):
         """
         Sort unpacked engine data in order based on Aircraft.Engine.INTERPOLATION_SORT. When this
@@ -1695,6 +1842,50 @@ them to propulsion utils.
 """
 
 
+def is_compiled_deck(data_file):
+    """
+    Check if the provided engine data file is a compiled engine deck, based on file extension.
+
+    Parameters
+    ----------
+    data_file : (str, Path)
+        Path to engine data file.
+
+    Returns
+    -------
+    bool
+        True if data_file is a compiled engine deck.
+    """
+    return Path(data_file).suffix == COMPILED_DECK_EXTENSION
+
+
+def _compiled_deck_hash(metadata, arrays):
+    """
+    Compute the validation hash of a compiled engine deck.
+
+    Parameters
+    ----------
+    metadata : str
+        JSON string containing compiled deck metadata.
+    arrays : dict
+        Arrays stored in the compiled deck (excluding metadata and hash).
+
+    Returns
+    -------
+    str
+        Hex digest of the compiled deck contents.
+    """
+    sha = hashlib.sha256(metadata.encode())
+    for key in sorted(arrays):
+        if key in ('metadata', 'hash'):
+            continue
+        array = np.ascontiguousarray(arrays[key])
+        sha.update(key.encode())
+        sha.update(str(array.shape).encode())
+        sha.update(array.tobytes())
+    return sha.hexdigest()
+
+
 def normalize(base_list, maximum=None, minimum=None):
     """
     Normalize the given list from 0 to 1.
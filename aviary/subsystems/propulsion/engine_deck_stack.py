@@ -0,0 +1,487 @@
+"""
+Evaluate the mission performance of several EngineDecks as a single stack.
+
+When an aircraft has several engine types that all use EngineDecks of identical structure (the
+same variables, units, and interpolation settings), their mission performance can be computed by
+one set of components whose outputs are stacked along an engine axis, instead of one group per
+engine type whose outputs are then muxed together. Each deck still uses its own interpolation
+tables, shared through the interpolant cache with any other component using the same data.
+
+Classes
+-------
+EngineDeckStack : Group computing the performance of a stack of EngineDecks.
+EngineDeckStackInterpolation : Interpolate the unscaled performance of a stack of EngineDecks.
+EngineDeckStackScaling : Scale the performance of a stack of EngineDecks.
+
+Functions
+---------
+can_stack_engine_decks : Check if a list of engine models can be evaluated as a stack.
+"""
+
+import inspect
+
+import numpy as np
+import openmdao.api as om
+from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+from openmdao.core.analysis_error import AnalysisError
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from aviary.subsystems.propulsion.utils import EngineModelVariables, max_variables
+from aviary.utils.interpolant_cache import get_cached_interpolant, hash_training_data
+from aviary.variable_info.functions import add_aviary_input, add_aviary_option
+from aviary.variable_info.variables import Aircraft, Dynamic
+
+MACH = EngineModelVariables.MACH
+ALTITUDE = EngineModelVariables.ALTITUDE
+THROTTLE = EngineModelVariables.THROTTLE
+HYBRID_THROTTLE = EngineModelVariables.HYBRID_THROTTLE
+THRUST = EngineModelVariables.THRUST
+SHAFT_POWER = EngineModelVariables.SHAFT_POWER
+SHAFT_POWER_CORRECTED = EngineModelVariables.SHAFT_POWER_CORRECTED
+FUEL_FLOW = EngineModelVariables.FUEL_FLOW
+ELECTRIC_POWER_IN = EngineModelVariables.ELECTRIC_POWER_IN
+NOX_RATE = EngineModelVariables.NOX_RATE
+TEMPERATURE = EngineModelVariables.TEMPERATURE_T4
+
+# Performance of each engine type provided to the rest of the propulsion group, with units. These
+# match the outputs muxed together by PropulsionMission for unstacked engines.
+stack_outputs = {
+    Dynamic.Vehicle.Propulsion.THRUST: 'lbf',
+    Dynamic.Vehicle.Propulsion.THRUST_MAX: 'lbf',
+    Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE: 'lbm/h',
+    Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN: 'kW',
+    Dynamic.Vehicle.Propulsion.NOX_RATE: 'lb/h',
+    Dynamic.Vehicle.Propulsion.TEMPERATURE_T4: 'degR',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER: 'hp',
+    Dynamic.Vehicle.Propulsion.SHAFT_POWER_MAX: 'hp',
+    Dynamic.Vehicle.Propulsion.RPM: 'rpm',
+    Dynamic.Vehicle.Propulsion.PROPELLER_TIP_SPEED: 'ft/s',
+}
+
+# engine deck variables that are scaled and provided by the stack
+scaled_variables = (THRUST, SHAFT_POWER, FUEL_FLOW, ELECTRIC_POWER_IN, NOX_RATE)
+
+
+def _get_table_inputs(engine):
+    """Return the independent variables of the performance table of an EngineDeck, in order."""
+    if engine.get_val(Aircraft.Engine.INTERPOLATION_SORT) == 'altitude':
+        independent_variables = [ALTITUDE, MACH, THROTTLE, HYBRID_THROTTLE]
+    else:
+        independent_variables = [MACH, ALTITUDE, THROTTLE, HYBRID_THROTTLE]
+
+    return [var for var in independent_variables if var in engine.engine_variables]
+
+
+def _get_table_outputs(engine):
+    """
+    Return the outputs interpolated from the tables of an EngineDeck.
+
+    Each output is described by its name, the engine variable it interpolates, and a flag that
+    is True if it is interpolated from the data pre-solved at maximum throttle.
+    """
+    table_outputs = []
+    for variable in engine.engine_variables:
+        if variable in scaled_variables:
+            table_outputs.append((variable.value + '_unscaled', variable, False))
+        elif variable is TEMPERATURE:
+            table_outputs.append((variable.value, variable, False))
+
+        if variable in max_variables:
+            table_outputs.append((max_variables[variable] + '_unscaled', variable, True))
+
+    return table_outputs
+
+
+def can_stack_engine_decks(engine_models):
+    """
+    Check if a list of engine models can be evaluated as a stack.
+
+    Engine models can be stacked if there is more than one, and they are all EngineDecks with the
+    same variables, units, and interpolation settings. Decks that provide corrected shaft power,
+    or that use custom table inputs, are not supported.
+
+    Parameters
+    ----------
+    engine_models : list of EngineModel
+        Engine models of the aircraft.
+
+    Returns
+    -------
+    bool
+        True if the engine models can be evaluated by an EngineDeckStack.
+    """
+    if len(engine_models) < 2:
+        return False
+
+    reference = engine_models[0]
+    for engine in engine_models:
+        # subclasses that build their own mission systems cannot be stacked
+        if not isinstance(engine, EngineDeck) or (
+            type(engine).build_mission is not EngineDeck.build_mission
+        ):
+            return False
+
+        if SHAFT_POWER_CORRECTED in engine.engine_variables:
+            return False
+
+        if engine.inputs and set(engine.inputs) != set(_get_table_inputs(engine)):
+            return False
+
+        if engine.engine_variables != reference.engine_variables:
+            return False
+
+        for option in (Aircraft.Engine.INTERPOLATION_METHOD, Aircraft.Engine.INTERPOLATION_SORT):
+            if engine.get_val(option) != reference.get_val(option):
+                return False
+
+    return True
+
+
+class EngineDeckStackInterpolation(om.ExplicitComponent):
+    """
+    Interpolate the unscaled performance of a stack of EngineDecks.
+
+    Each output has shape (num_nodes, number of engine types). Maximum thrust and shaft power are
+    interpolated from the data of each deck pre-solved at maximum throttle, which only depends on
+    Mach number and altitude.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'engine_models', types=list, desc='list of EngineDecks of identical structure'
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        engine_models = self.options['engine_models']
+        num_engine_type = len(engine_models)
+
+        reference = engine_models[0]
+        engine_variables = reference.engine_variables
+        interp_method = reference.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+
+        self._table_inputs = table_inputs = _get_table_inputs(reference)
+        # the pre-solved maximum data only depends on the flight condition
+        self._max_table_inputs = max_table_inputs = table_inputs[:2]
+
+        for variable in table_inputs:
+            if variable in (MACH, ALTITUDE):
+                shape = nn
+            else:
+                shape = (nn, num_engine_type)
+
+            self.add_input(variable.value, val=np.zeros(shape), units=engine_variables[variable])
+
+        self._table_outputs = _get_table_outputs(reference)
+
+        # interpolants of each output for each engine type
+        self._interps = {}
+        for name, variable, max_value in self._table_outputs:
+            self.add_output(
+                name,
+                val=np.zeros((nn, num_engine_type)),
+                units=engine_variables[variable],
+            )
+
+            interps = self._interps[name] = []
+            for engine in engine_models:
+                if max_value:
+                    data = engine.max_data
+                    inputs = max_table_inputs
+                    # out of range flight conditions are not allowed for maximum values
+                    extrapolate = False
+                else:
+                    data = engine.data
+                    inputs = table_inputs
+                    extrapolate = True
+
+                # same tables, and cache keys, as the interpolation components of the deck
+                grid = np.array([data[var] for var in inputs]).T
+                key = f'{hash_training_data(grid)}-{hash_training_data(data[variable])}'
+                interps.append(
+                    get_cached_interpolant(
+                        grid, data[variable], method=interp_method, extrapolate=extrapolate, key=key
+                    )
+                )
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+
+        size = nn * num_engine_type
+        rows = np.arange(size)
+        node_cols = np.repeat(np.arange(nn), num_engine_type)
+
+        for name, variable, max_value in self._table_outputs:
+            inputs = self._max_table_inputs if max_value else self._table_inputs
+            for input_variable in inputs:
+                if input_variable in (MACH, ALTITUDE):
+                    cols = node_cols
+                else:
+                    cols = rows
+
+                self.declare_partials(name, input_variable.value, rows=rows, cols=cols)
+
+    def _get_points(self, inputs, engine_idx, max_value):
+        """Return the points each table of an engine is evaluated at."""
+        table_inputs = self._max_table_inputs if max_value else self._table_inputs
+
+        points = []
+        for variable in table_inputs:
+            val = inputs[variable.value]
+            if val.ndim > 1:
+                val = val[:, engine_idx]
+            points.append(val)
+
+        return np.array(points).T
+
+    def compute(self, inputs, outputs):
+        for name, variable, max_value in self._table_outputs:
+            for engine_idx, interp in enumerate(self._interps[name]):
+                points = self._get_points(inputs, engine_idx, max_value)
+
+                try:
+                    outputs[name][:, engine_idx] = interp.interpolate(points)
+
+                except OutOfBoundsError as err:
+                    input_name = self._max_table_inputs[err.idx].value
+                    engine = self.options['engine_models'][engine_idx]
+                    raise AnalysisError(
+                        f"{self.msginfo}: Error interpolating output '{name}' of engine "
+                        f"'{engine.name}' because input '{input_name}' required extrapolation, "
+                        f"where its value '{err.value}' exceeded the range ('{err.lower}', "
+                        f"'{err.upper}')",
+                        inspect.currentframe(),
+                        self.msginfo,
+                    )
+
+    def compute_partials(self, inputs, J):
+        for name, variable, max_value in self._table_outputs:
+            inputs_list = self._max_table_inputs if max_value else self._table_inputs
+            derivs = [[] for _ in inputs_list]
+
+            for engine_idx, interp in enumerate(self._interps[name]):
+                points = self._get_points(inputs, engine_idx, max_value)
+                d_dx = interp.gradient(points)
+                for idx in range(len(inputs_list)):
+                    derivs[idx].append(d_dx[:, idx])
+
+            # stack derivatives in (node, engine) order
+            for idx, input_variable in enumerate(inputs_list):
+                J[name, input_variable.value] = np.stack(derivs[idx], axis=-1).ravel()
+
+
+class EngineDeckStackScaling(om.ExplicitComponent):
+    """
+    Scale the performance of a stack of EngineDecks.
+
+    Applies the same scaling as EngineScaling to each engine type, using the scale factor and
+    fuel flow options of that engine type. Variables of stack_outputs that the decks do not
+    provide are output as zeros.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'engine_variables',
+            types=dict,
+            desc='dict of variables provided by every engine deck of the stack, with units',
+        )
+
+        add_aviary_option(self, Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION, units='lbm/h')
+        add_aviary_option(self, Aircraft.Engine.FUEL_FLOW_SCALER_CONSTANT_TERM)
+        add_aviary_option(self, Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM)
+        add_aviary_option(self, Aircraft.Engine.NUM_ENGINES)
+        add_aviary_option(self, Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER)
+        add_aviary_option(self, Aircraft.Engine.SUPERSONIC_FUEL_FLOW_SCALER)
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        engine_variables = self.options['engine_variables']
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+        shape = (nn, num_engine_type)
+
+        add_aviary_input(self, Aircraft.Engine.SCALE_FACTOR, shape=num_engine_type)
+
+        self.add_input(
+            Dynamic.Atmosphere.MACH,
+            val=np.zeros(nn),
+            desc='current Mach number',
+            units='unitless',
+        )
+
+        # (output name, unscaled input name) of each scaled variable
+        self._scaled = []
+        for variable in scaled_variables:
+            if variable not in engine_variables:
+                continue
+
+            if variable is FUEL_FLOW:
+                name = Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE
+            else:
+                name = variable.value
+            self._scaled.append((name, variable.value + '_unscaled'))
+
+            if variable in max_variables:
+                self._scaled.append(
+                    (max_variables[variable], max_variables[variable] + '_unscaled')
+                )
+
+        for name, unscaled_name in self._scaled:
+            units = stack_outputs[name]
+            self.add_input(unscaled_name, val=np.zeros(shape), units=units)
+            self.add_output(name, val=np.zeros(shape), units=units)
+
+        # temperature is not scaled, it comes directly from the interpolation
+        provided_outputs = [name for name, _ in self._scaled]
+        if TEMPERATURE in engine_variables:
+            provided_outputs.append(TEMPERATURE.value)
+
+        for name, units in stack_outputs.items():
+            if name not in provided_outputs:
+                self.add_output(name, val=np.zeros(shape), units=units)
+
+    def _get_engine_options(self):
+        """Return the fuel flow options of each engine type as arrays."""
+        options = self.options
+        num_engine_type = len(options[Aircraft.Engine.NUM_ENGINES])
+
+        def as_array(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), num_engine_type)
+
+        subsonic_fuel_factor = as_array(options[Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER])
+        supersonic_fuel_factor = as_array(options[Aircraft.Engine.SUPERSONIC_FUEL_FLOW_SCALER])
+        constant_fuel_term = as_array(options[Aircraft.Engine.FUEL_FLOW_SCALER_CONSTANT_TERM])
+        linear_fuel_term = as_array(options[Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM])
+        constant_fuel_flow = as_array(options[Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION][0])
+
+        return (
+            subsonic_fuel_factor,
+            supersonic_fuel_factor,
+            constant_fuel_term,
+            linear_fuel_term,
+            constant_fuel_flow,
+        )
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options[Aircraft.Engine.NUM_ENGINES])
+
+        size = nn * num_engine_type
+        rows = np.arange(size)
+        engine_cols = np.tile(np.arange(num_engine_type), nn)
+
+        for name, unscaled_name in self._scaled:
+            self.declare_partials(name, unscaled_name, rows=rows, cols=rows)
+            self.declare_partials(name, Aircraft.Engine.SCALE_FACTOR, rows=rows, cols=engine_cols)
+
+    def compute(self, inputs, outputs):
+        subsonic, supersonic, constant_term, linear_term, constant_fuel_flow = (
+            self._get_engine_options()
+        )
+
+        engine_scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+        mach_number = inputs[Dynamic.Atmosphere.MACH]
+
+        for name, unscaled_name in self._scaled:
+            if name == Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE:
+                # Calculate fuel flow rate scaling factor using FLOPS-derived equation
+                fuel_flow_equation_scaling = (
+                    1 + constant_term + linear_term * (1 - engine_scale_factor)
+                )
+                fuel_flow_mach_scaling = np.where(
+                    mach_number[:, np.newaxis] >= 1.0, supersonic, subsonic
+                )
+                fuel_flow_scale_factor = (
+                    engine_scale_factor * fuel_flow_mach_scaling * fuel_flow_equation_scaling
+                )
+
+                outputs[name] = -(
+                    inputs[unscaled_name] * fuel_flow_scale_factor + constant_fuel_flow
+                )
+            else:
+                outputs[name] = inputs[unscaled_name] * engine_scale_factor
+
+    def compute_partials(self, inputs, J):
+        nn = self.options['num_nodes']
+        subsonic, supersonic, constant_term, linear_term, _ = self._get_engine_options()
+
+        engine_scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+        mach_number = inputs[Dynamic.Atmosphere.MACH]
+
+        for name, unscaled_name in self._scaled:
+            unscaled = inputs[unscaled_name]
+
+            if name == Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE:
+                fuel_flow_equation_scaling = (
+                    1 + constant_term + linear_term * (1 - engine_scale_factor)
+                )
+                fuel_flow_mach_scaling = np.where(
+                    mach_number[:, np.newaxis] >= 1.0, supersonic, subsonic
+                )
+
+                J[name, unscaled_name] = -(
+                    engine_scale_factor * fuel_flow_mach_scaling * fuel_flow_equation_scaling
+                ).ravel()
+                J[name, Aircraft.Engine.SCALE_FACTOR] = -(
+                    fuel_flow_mach_scaling
+                    * unscaled
+                    * (1 + linear_term + constant_term - 2 * linear_term * engine_scale_factor)
+                ).ravel()
+            else:
+                J[name, unscaled_name] = np.tile(engine_scale_factor, nn)
+                J[name, Aircraft.Engine.SCALE_FACTOR] = unscaled.ravel()
+
+
+class EngineDeckStack(om.Group):
+    """
+    Group computing the mission performance of a stack of EngineDecks of identical structure.
+
+    Outputs every variable of stack_outputs with shape (num_nodes, number of engine types), in
+    the order of engine_models.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int)
+
+        self.options.declare(
+            'engine_models', types=list, desc='list of EngineDecks of identical structure'
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        engine_models = self.options['engine_models']
+
+        if not can_stack_engine_decks(engine_models):
+            raise UserWarning(
+                'EngineDeckStack requires two or more EngineDecks with the same variables, units, '
+                'and interpolation settings.'
+            )
+
+        engine_variables = engine_models[0].engine_variables
+
+        promoted_outputs = []
+        if TEMPERATURE in engine_variables:
+            promoted_outputs.append(TEMPERATURE.value)
+
+        self.add_subsystem(
+            'interpolation',
+            EngineDeckStackInterpolation(num_nodes=nn, engine_models=engine_models),
+            promotes_inputs=['*'],
+            promotes_outputs=promoted_outputs,
+        )
+
+        self.add_subsystem(
+            'engine_scaling',
+            EngineDeckStackScaling(num_nodes=nn, engine_variables=engine_variables),
+            promotes_inputs=[Aircraft.Engine.SCALE_FACTOR, Dynamic.Atmosphere.MACH],
+            promotes_outputs=['*'],
+        )
+
+        # connect unscaled variables, since we do not want them promoted
+        for name, variable, max_value in _get_table_outputs(engine_models[0]):
+            if variable is not TEMPERATURE:
+                self.connect(f'interpolation.{name}', f'engine_scaling.{name}')
@@ -0,0 +1,599 @@
+"""
+Define utilities for building smooth surrogates of engine decks.
+
+An EngineDeck is interpolated on its raw, semi-structured data points, typically with 'slinear'
+interpolation that has discontinuous derivatives at every data point. For conceptual trade studies
+a compact, smooth surrogate is often preferable. EngineSurrogate resamples an EngineDeck once onto
+a structured grid of Mach number, altitude, and throttle, and evaluates that grid during the
+mission with a tensor-product spline that has continuous analytic derivatives.
+
+Classes
+-------
+EngineSurrogate : EngineModel that evaluates a tensor-product spline fit of an EngineDeck.
+
+Functions
+---------
+build_turboprop_surrogate : Return a copy of a TurbopropModel that uses a surrogate of its engine
+deck.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+from openmdao.components.interp_util.interp import InterpND
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck, _compiled_deck_hash
+from aviary.subsystems.propulsion.engine_model import EngineModel
+from aviary.subsystems.propulsion.engine_scaling import EngineScaling
+from aviary.subsystems.propulsion.engine_sizing import SizeEngine
+from aviary.subsystems.propulsion.utils import EngineModelVariables, UncorrectData, max_variables
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.functions import get_path
+from aviary.utils.interpolant_cache import get_cached_interpolant
+from aviary.variable_info.variable_meta_data import CoreMetaData
+from aviary.variable_info.variables import Aircraft, Dynamic
+
+MACH = EngineModelVariables.MACH
+ALTITUDE = EngineModelVariables.ALTITUDE
+THROTTLE = EngineModelVariables.THROTTLE
+THRUST = EngineModelVariables.THRUST
+SHAFT_POWER = EngineModelVariables.SHAFT_POWER
+SHAFT_POWER_CORRECTED = EngineModelVariables.SHAFT_POWER_CORRECTED
+TEMPERATURE = EngineModelVariables.TEMPERATURE_T4
+RPM = EngineModelVariables.RPM
+
+# independent variables of the surrogate, in the order of the table axes
+surrogate_inputs = (MACH, ALTITUDE, THROTTLE)
+
+# number of evenly spaced throttle settings used when the engine deck has no common set of
+# throttle breakpoints
+DEFAULT_NUM_THROTTLES = 11
+
+SURROGATE_EXTENSION = '.npz'
+SURROGATE_VERSION = 1
+
+
+class EngineSurrogate(EngineModel):
+    """
+    EngineModel that evaluates a tensor-product spline fit of an EngineDeck.
+
+    The surrogate is fit once, by evaluating the interpolant of the source EngineDeck on a
+    structured grid of Mach number, altitude, and throttle. During the mission it is evaluated
+    with a MetaModelStructuredComp, followed by the same engine scaling as the source deck. A
+    fitted surrogate can be saved to a file and loaded later without the source deck.
+
+    Attributes
+    ----------
+    name : str ('engine_surrogate')
+        Object label.
+    options : AviaryValues (<empty>)
+        Inputs and options related to engine model. Defaults to the options of the source deck.
+    method : str ('akima')
+        Structured interpolation method used to evaluate the surrogate.
+    grid : dict
+        Breakpoints of the surrogate tables for Mach number, altitude, and throttle.
+    tables : dict
+        Fitted engine outputs, with one axis for each of Mach number, altitude, and throttle.
+    max_tables : dict
+        Fitted maximum engine outputs, found at maximum throttle, with one axis for each of Mach
+        number and altitude.
+    accuracy : dict
+        Maximum absolute, root-mean-square, and maximum relative error of each fitted output at
+        the data points of the source deck.
+
+    Methods
+    -------
+    build_pre_mission
+    build_mission
+    save
+    accuracy_report
+    get_val
+    set_val
+    update
+    """
+
+    _default_name = 'engine_surrogate'
+
+    # maximum values are fit directly, so no duplicate engine is needed to compute them
+    compute_max_values = True
+
+    def __init__(
+        self,
+        name: str = None,
+        options: AviaryValues = None,
+        source: EngineDeck = None,
+        data_file=None,
+        grid: dict = None,
+        method: str = 'akima',
+        meta_data: dict = CoreMetaData,
+    ):
+        if (source is None) == (data_file is None):
+            raise UserWarning('EngineSurrogate requires exactly one of "source" or "data_file".')
+
+        if source is not None:
+            if name is None:
+                name = source.name
+            if options is None:
+                options = source.options
+
+        # also calls _preprocess_inputs() as part of EngineModel __init__
+        super().__init__(name, options, meta_data=meta_data)
+
+        self.method = method
+
+        # surrogates do not support hybrid throttle
+        self.use_hybrid_throttle = False
+
+        if source is not None:
+            self._fit(source, grid)
+        else:
+            self._load(data_file)
+
+        self._set_variable_flags()
+
+    def _set_variable_flags(self):
+        """
+        Sets flags that communicate which variables are available to the greater propulsion
+        module, matching the flags of EngineDeck.
+        """
+        self.use_thrust = THRUST in self.tables
+        self.use_shaft_power = SHAFT_POWER in self.tables or SHAFT_POWER_CORRECTED in self.tables
+        self.use_t4 = TEMPERATURE in self.tables
+
+        self.engine_variables = {var: self.units[var] for var in surrogate_inputs}
+        self.engine_variables.update({var: self.units[var] for var in self.tables})
+        self.inputs = list(surrogate_inputs)
+
+    def _fit(self, source, grid):
+        """
+        Fit the surrogate to an EngineDeck.
+
+        Parameters
+        ----------
+        source : EngineDeck
+            Engine deck the surrogate is fit to.
+        grid : dict or None
+            Breakpoints to use for any of Mach number, altitude, and throttle, keyed by
+            EngineModelVariables. Defaults to the unique Mach numbers and altitudes in the source
+            deck, and its throttle settings if they are shared by every flight condition.
+        """
+        if not isinstance(source, EngineDeck):
+            raise TypeError(
+                f'EngineSurrogate <{self.name}> can only be fit to an EngineDeck, but a '
+                f'{type(source).__name__} was provided.'
+            )
+
+        if source.use_hybrid_throttle:
+            raise UserWarning(
+                f'EngineSurrogate <{self.name}> does not support engine decks with hybrid throttle.'
+            )
+
+        extra_inputs = [var.value for var in source.inputs if var not in surrogate_inputs]
+        if extra_inputs:
+            raise UserWarning(
+                f'EngineSurrogate <{self.name}> only supports Mach number, altitude, and throttle '
+                f'as engine inputs, but {source.error_message} also has {extra_inputs}.'
+            )
+
+        data = source.data
+
+        self.units = {var: source.engine_variables[var] for var in source.engine_variables}
+        self.outputs = list(source.outputs)
+        self.source = source.error_message
+
+        self.grid = {}
+        for var in surrogate_inputs:
+            if grid is not None and var in grid:
+                self.grid[var] = np.unique(np.asarray(grid[var], dtype=float))
+            else:
+                self.grid[var] = np.unique(data[var])
+
+        if (grid is None or THROTTLE not in grid) and not source.global_throttle:
+            # locally normalized throttles are different at every flight condition
+            self.grid[THROTTLE] = np.linspace(0.0, 1.0, DEFAULT_NUM_THROTTLES)
+
+        for var, points in self.grid.items():
+            if len(points) < 2:
+                raise UserWarning(
+                    f'EngineSurrogate <{self.name}> needs at least two breakpoints for '
+                    f'{var.value}, but {len(points)} were provided.'
+                )
+
+        # the source deck interpolant expects its inputs in its own sort order
+        if source.get_val(Aircraft.Engine.INTERPOLATION_SORT) == 'altitude':
+            source_order = [ALTITUDE, MACH, THROTTLE]
+        else:
+            source_order = [MACH, ALTITUDE, THROTTLE]
+        source_method = source.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        training_points = np.stack([data[var] for var in source_order], axis=1)
+
+        def source_values(var, points):
+            interp = get_cached_interpolant(
+                training_points, data[var], method=source_method, extrapolate=True
+            )
+            columns = [surrogate_inputs.index(key) for key in source_order]
+            return interp.interpolate(points[:, columns])
+
+        shape = tuple(len(self.grid[var]) for var in surrogate_inputs)
+        mesh = np.meshgrid(*[self.grid[var] for var in surrogate_inputs], indexing='ij')
+        points = np.stack(mesh, axis=-1).reshape(-1, 3)
+
+        # throttle is normalized, so maximum values are found at a throttle of one
+        max_shape = shape[:2]
+        max_points = points.reshape(shape + (3,))[:, :, 0].reshape(-1, 3).copy()
+        max_points[:, 2] = 1.0
+
+        self.tables = {}
+        self.max_tables = {}
+        for var in source.engine_variables:
+            if var in surrogate_inputs:
+                continue
+
+            self.tables[var] = source_values(var, points).reshape(shape)
+
+            if var in max_variables or var is SHAFT_POWER_CORRECTED:
+                self.max_tables[var] = source_values(var, max_points).reshape(max_shape)
+
+        # compare the surrogate against the source data inside the fitted grid
+        data_points = np.stack([data[var] for var in surrogate_inputs], axis=1)
+        in_grid = np.all(
+            [
+                (data_points[:, i] >= self.grid[var][0]) & (data_points[:, i] <= self.grid[var][-1])
+                for i, var in enumerate(surrogate_inputs)
+            ],
+            axis=0,
+        )
+
+        self.accuracy = {}
+        for var in self.tables:
+            expected = data[var][in_grid]
+            error = self._evaluate(var, data_points[in_grid]) - expected
+            data_range = np.ptp(expected) if expected.size else 0.0
+            max_error = float(np.max(np.abs(error))) if error.size else 0.0
+
+            self.accuracy[var] = {
+                'max_abs_error': max_error,
+                'rms_error': float(np.sqrt(np.mean(error**2))) if error.size else 0.0,
+                'max_rel_error': max_error / data_range if data_range > 0.0 else 0.0,
+            }
+
+    def _evaluate(self, var, points):
+        """Evaluate the surrogate of a single engine output at an array of points."""
+        interp = InterpND(
+            method=self.method,
+            points=tuple(self.grid[key] for key in surrogate_inputs),
+            values=self.tables[var],
+            extrapolate=True,
+        )
+        return interp.interpolate(points)
+
+    def accuracy_report(self, out_stream=sys.stdout):
+        """
+        Write a table of the error of each fitted output against the source deck data.
+
+        Parameters
+        ----------
+        out_stream : file-like or None
+            Stream the table is written to. Nothing is written if None.
+
+        Returns
+        -------
+        dict
+            Maximum absolute, root-mean-square, and maximum relative error of each output, keyed
+            by variable name.
+        """
+        report = {var.value: errors for var, errors in self.accuracy.items()}
+
+        if out_stream is not None:
+            width = max([len(name) for name in report] + [8])
+            out_stream.write(f'Surrogate accuracy for EngineSurrogate <{self.name}>\n')
+            out_stream.write(
+                f'{"Variable":<{width}}  {"Units":<8}  {"Max Error":>12}  {"RMS Error":>12}  '
+                f'{"Max Rel Error":>13}\n'
+            )
+            for var, errors in self.accuracy.items():
+                out_stream.write(
+                    f'{var.value:<{width}}  {self.units[var]:<8}  '
+                    f'{errors["max_abs_error"]:>12.4g}  {errors["rms_error"]:>12.4g}  '
+                    f'{errors["max_rel_error"]:>13.3%}\n'
+                )
+
+        return report
+
+    def save(self, filename):
+        """
+        Write the fitted surrogate to a file.
+
+        Surrogate files are uncompressed numpy archives, which can be loaded by an EngineSurrogate
+        using its "data_file" argument. A hash of the contents is stored in the file to detect
+        corrupted or modified data.
+
+        Parameters
+        ----------
+        filename : (str, Path)
+            Path to the surrogate file that will be written. The ".npz" extension is added if not
+            present.
+
+        Returns
+        -------
+        Path
+            Path to the written file.
+        """
+        filename = Path(filename)
+        if filename.suffix != SURROGATE_EXTENSION:
+            filename = filename.with_name(filename.name + SURROGATE_EXTENSION)
+
+        metadata = {
+            'version': SURROGATE_VERSION,
+            'source': self.source,
+            'method': self.method,
+            'units': {var.name: units for var, units in self.units.items()},
+            'outputs': [var.name for var in self.outputs],
+            'tables': [var.name for var in self.tables],
+            'max_tables': [var.name for var in self.max_tables],
+            'accuracy': {var.name: errors for var, errors in self.accuracy.items()},
+        }
+
+        if Aircraft.Engine.REFERENCE_SLS_THRUST in self.options:
+            metadata['reference_sls_thrust'] = float(
+                self.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf')
+            )
+
+        arrays = {}
+        for var in surrogate_inputs:
+            arrays['grid.' + var.name] = self.grid[var]
+        for var, table in self.tables.items():
+            arrays['table.' + var.name] = table
+        for var, table in self.max_tables.items():
+            arrays['max_table.' + var.name] = table
+
+        metadata = json.dumps(metadata, sort_keys=True)
+        arrays['metadata'] = np.array(metadata)
+        arrays['hash'] = np.array(_compiled_deck_hash(metadata, arrays))
+
+        np.savez(filename, **arrays)
+
+        return filename
+
+    def _load(self, data_file):
+        """
+        Load a surrogate written by EngineSurrogate.save().
+
+        Raises
+        ------
+        UserWarning
+            If the file was written by an incompatible version of Aviary, or its contents do not
+            match the stored hash.
+        """
+        data_file = get_path(data_file)
+
+        with np.load(data_file, allow_pickle=False) as surrogate:
+            arrays = {key: surrogate[key] for key in surrogate.files}
+
+        metadata_str = str(arrays.pop('metadata'))
+        stored_hash = str(arrays.pop('hash'))
+        metadata = json.loads(metadata_str)
+
+        if metadata.get('version') != SURROGATE_VERSION:
+            raise UserWarning(
+                f'<{data_file}>: engine surrogate format version {metadata.get("version")} is not '
+                f'supported (expected version {SURROGATE_VERSION}). Please re-fit the surrogate.'
+            )
+
+        if stored_hash != _compiled_deck_hash(metadata_str, arrays):
+            raise UserWarning(
+                f'<{data_file}>: contents of engine surrogate do not match its stored hash. The '
+                'file may be corrupted, please re-fit the surrogate.'
+            )
+
+        self.source = metadata['source']
+        self.method = metadata['method']
+        self.units = {
+            EngineModelVariables[name]: units for name, units in metadata['units'].items()
+        }
+        self.outputs = [EngineModelVariables[name] for name in metadata['outputs']]
+
+        self.grid = {var: arrays['grid.' + var.name] for var in surrogate_inputs}
+        self.tables = {
+            EngineModelVariables[name]: arrays['table.' + name] for name in metadata['tables']
+        }
+        self.max_tables = {
+            EngineModelVariables[name]: arrays['max_table.' + name]
+            for name in metadata['max_tables']
+        }
+        self.accuracy = {
+            EngineModelVariables[name]: errors for name, errors in metadata['accuracy'].items()
+        }
+
+        if (
+            'reference_sls_thrust' in metadata
+            and Aircraft.Engine.REFERENCE_SLS_THRUST not in self.options
+        ):
+            self.set_val(
+                Aircraft.Engine.REFERENCE_SLS_THRUST, metadata['reference_sls_thrust'], 'lbf'
+            )
+
+    def build_pre_mission(self, aviary_inputs, subsystem_options=None) -> om.ExplicitComponent:
+        """
+        Build components to be added to pre-mission propulsion subsystem.
+
+        Returns
+        -------
+            SizeEngine component, used for calculating engine scaling factors.
+        """
+        return SizeEngine()
+
+    def build_mission(self, num_nodes, aviary_inputs, user_options, subsystem_options) -> om.Group:
+        """
+        Creates the surrogate interpolators and scaling to be added to mission-level propulsion
+        subsystem.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes present in the current Dymos phase of mission analysis.
+        aviary_inputs : dict
+            Dictionary containing the aircraft definition.
+        user_options : dict
+            Dictionary of user options for this phase.
+        subsystem_options : dict
+            Dictionary of optional arguments for this subsystem in this phase.
+
+        Returns
+        -------
+        engine_group : openmdao.core.Group
+            An OpenMDAO group containing the surrogate interpolators and an EngineScaling
+            component.
+        """
+        units = self.units
+        engine_group = om.Group()
+
+        engine = om.MetaModelStructuredComp(
+            method=self.method, extrapolate=True, vec_size=num_nodes
+        )
+        for var in surrogate_inputs:
+            engine.add_input(var.value, training_data=self.grid[var], units=units[var])
+
+        # variables that are not passed to scaling keep their names
+        no_scale_variables = [TEMPERATURE, RPM]
+        for var, table in self.tables.items():
+            if var in no_scale_variables:
+                var_name = var.value
+            else:
+                var_name = var.value + '_unscaled'
+            engine.add_output(var_name, training_data=table, units=units[var])
+
+        engine_group.add_subsystem(
+            'interpolation',
+            engine,
+            promotes_inputs=['*'],
+            promotes_outputs=[var.value for var in no_scale_variables if var in self.tables],
+        )
+
+        if self.max_tables:
+            max_engine = om.MetaModelStructuredComp(
+                method=self.method, extrapolate=True, vec_size=num_nodes
+            )
+            for var in (MACH, ALTITUDE):
+                max_engine.add_input(var.value, training_data=self.grid[var], units=units[var])
+            for var, table in self.max_tables.items():
+                max_engine.add_output(
+                    var.value + '_max_unscaled', training_data=table, units=units[var]
+                )
+
+            engine_group.add_subsystem(
+                'max_interpolation',
+                max_engine,
+                promotes_inputs=[Dynamic.Atmosphere.MACH, Dynamic.Mission.ALTITUDE],
+            )
+
+        # shaft power is uncorrected using the current flight condition
+        uncorrect_shp = SHAFT_POWER_CORRECTED in self.tables and SHAFT_POWER not in self.tables
+        if uncorrect_shp:
+            for prefix in ('', 'max_'):
+                engine_group.add_subsystem(
+                    f'uncorrect_{prefix}shaft_power',
+                    subsys=UncorrectData(num_nodes=num_nodes),
+                    promotes_inputs=[
+                        Dynamic.Atmosphere.TEMPERATURE,
+                        Dynamic.Atmosphere.STATIC_PRESSURE,
+                        Dynamic.Atmosphere.MACH,
+                    ],
+                )
+
+            engine_group.connect(
+                'interpolation.shaft_power_corrected_unscaled',
+                'uncorrect_shaft_power.corrected_data',
+            )
+            engine_group.connect(
+                'max_interpolation.shaft_power_corrected_max_unscaled',
+                'uncorrect_max_shaft_power.corrected_data',
+            )
+
+        engine_outputs = self.engine_variables.copy()
+        if SHAFT_POWER_CORRECTED in engine_outputs:
+            engine_outputs[SHAFT_POWER] = engine_outputs.pop(SHAFT_POWER_CORRECTED)
+
+        engine_group.add_subsystem(
+            'engine_scaling',
+            subsys=EngineScaling(num_nodes=num_nodes, engine_variables=engine_outputs),
+            promotes_inputs=[Aircraft.Engine.SCALE_FACTOR, Dynamic.Atmosphere.MACH],
+            promotes_outputs=['*'],
+        )
+
+        # Manually connect unscaled variables, since we do not want them promoted
+        for var in self.tables:
+            if var in no_scale_variables or var is SHAFT_POWER_CORRECTED:
+                continue
+            engine_group.connect(
+                'interpolation.' + var.value + '_unscaled',
+                'engine_scaling.' + var.value + '_unscaled',
+            )
+            if var in max_variables:
+                engine_group.connect(
+                    'max_interpolation.' + var.value + '_max_unscaled',
+                    'engine_scaling.' + var.value + '_max_unscaled',
+                )
+
+        if uncorrect_shp:
+            engine_group.connect(
+                'uncorrect_shaft_power.uncorrected_data',
+                'engine_scaling.shaft_power_unscaled',
+            )
+            engine_group.connect(
+                'uncorrect_max_shaft_power.uncorrected_data',
+                'engine_scaling.shaft_power_max_unscaled',
+            )
+
+        return engine_group
+
+    def get_parameters(self, aviary_inputs=None, user_options=None, subsystem_options=None):
+        params = {
+            Aircraft.Engine.SCALE_FACTOR: {
+                'val': 1.0,
+                'units': 'unitless',
+                'static_target': True,
+            }
+        }
+        return params
+
+    def mission_inputs(self, aviary_inputs=None, user_options=None, subsystem_options=None):
+        return [var.value for var in self.inputs]
+
+    def mission_outputs(self, aviary_inputs=None, user_options=None, subsystem_options=None):
+        return [var.value for var in self.outputs]
+
+
+def build_turboprop_surrogate(turboprop, **kwargs):
+    """
+    Return a copy of a TurbopropModel whose engine deck is replaced by an EngineSurrogate.
+
+    The gearbox and propeller models of the turboprop are reused as they are.
+
+    Parameters
+    ----------
+    turboprop : TurbopropModel
+        Turboprop whose shaft power model is an EngineDeck.
+    **kwargs
+        Additional arguments passed to EngineSurrogate, such as "grid" and "method".
+
+    Returns
+    -------
+    TurbopropModel
+        Turboprop using a surrogate of the original engine deck.
+    """
+    # imported here, since the turboprop model itself needs to know about surrogates
+    from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+
+    surrogate = EngineSurrogate(source=turboprop.shaft_power_model, **kwargs)
+
+    return TurbopropModel(
+        name=turboprop.name,
+        options=turboprop.options,
+        shaft_power_model=surrogate,
+        propeller_model=turboprop.propeller_model,
+        gearbox_model=turboprop.gearbox_model,
+    )
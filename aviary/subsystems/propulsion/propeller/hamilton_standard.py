@@ -10,235 +10,111 @@ from aviary.variable_info.functions import add_aviary_input, add_aviary_option,
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
 
+def _blend_coefficients(xa, x):
+    """
+    Search table xa and get the coefficients of a 4 point interpolation at each point in x.
+
+    The interpolation blends between the 2nd degree curves through the first three (curve A) and
+    last three (curve B) of the four points around each interval to produce a continuity of slope
+    between adjacent intervals. Points off either end of the table are clamped to that end.
+
+    Parameters
+    ----------
+    xa : ndarray
+        Table values in ascending order.
+    x : ndarray
+        Points to interpolate at. May be complex.
+
+    Returns
+    -------
+    jx1 : ndarray
+        Index of the first of the four table points used by each point in x.
+    coeffs : ndarray
+        Coefficients of the four table points used by each point in x.
+    extrap_flag : ndarray
+        0 inside the table, 1 off the low end, and 2 off the high end.
+    """
+    xa = np.asarray(xa)
+    n = len(xa)
+    extrap_flag = np.zeros(x.shape, dtype=int)
+    extrap_flag[x.real < xa[0]] = 1
+    extrap_flag[x.real > xa[-1]] = 2
+    x = np.where(extrap_flag == 1, xa[0], np.where(extrap_flag == 2, xa[-1], x))
+
+    # idx: upper end of interval (xa[idx-1], xa[idx]) containing x
+    idx = np.clip(np.searchsorted(xa, x.real, side='right'), 1, n - 1)
+    # jx1: the first point of four points
+    jx1 = np.clip(idx - 2, 0, n - 4)
+    # first interval uses curve A, last interval uses curve B
+    ra = np.where(
+        idx == 1,
+        1.0,
+        np.where(idx == n - 1, 0.0, (xa[idx] - x) / (xa[idx] - xa[idx - 1])),
+    )
+    rb = 1.0 - ra
+
+    xc = xa[jx1[:, np.newaxis] + np.arange(4)]
+    p1 = xc[:, 1] - xc[:, 0]
+    p2 = xc[:, 2] - xc[:, 1]
+    p3 = xc[:, 3] - xc[:, 2]
+    p4 = p1 + p2
+    p5 = p2 + p3
+
+    d1 = x - xc[:, 0]
+    d2 = x - xc[:, 1]
+    d3 = x - xc[:, 2]
+    d4 = x - xc[:, 3]
+    c1 = (ra * d2 * d3) / (p1 * p4)
+    c2 = -(ra * d1 * d3) / (p1 * p2) + (rb * d3 * d4) / (p2 * p5)
+    c3 = (ra * d1 * d2) / (p2 * p4) - (rb * d2 * d4) / (p2 * p3)
+    c4 = (rb * d2 * d3) / (p5 * p3)
+
+    return jx1, np.stack((c1, c2, c3, c4), axis=-1), extrap_flag
+
+
 def _unint(xa, ya, x):
     """
     Univariate table routine with separate arrays for x and y
     This routine interpolates over a 4 point interval using a
     variation of 3nd degree interpolation to produce a continuity
     of slope between adjacent intervals.
+
+    All points in x are interpolated at once. ya is either shared by all points, or
+    contains a separate row of table values for each point.
     """
-    extrap_flag = 0
-    n = len(xa)
-    # test for off low end
-    if xa[0] > x:
-        extrap_flag = 1  # off low end
-        y = ya[0]
-    elif xa[0] == x:
-        y = ya[0]  # at low end
+    jx1, coeffs, extrap_flag = _blend_coefficients(xa, x)
+    cols = jx1[:, np.newaxis] + np.arange(4)
+    ya = np.asarray(ya)
+    if ya.ndim == 1:
+        yc = ya[cols]
     else:
-        ifnd = 0
-        idx = 0
-        for i in range(1, n):
-            if xa[i] == x:
-                ifnd = 1  # at a node
-                idx = i
-                break
-            elif xa[i] > x:
-                ifnd = 2  # between (xa[i-1],xa[i])
-                idx = i
-                break
-        if ifnd == 0:
-            idx = n
-            extrap_flag = 2  # off high end
-            y = ya[n - 1]
-        elif ifnd == 1:
-            y = ya[idx]
-        elif ifnd == 2:
-            # jx1: the first point of four points
-            if idx == 1:
-                # first interval
-                jx1 = 0
-                ra = 1.0
-            elif idx == n - 1:
-                # last interval
-                jx1 = n - 4
-                ra = 0.0
-            else:
-                jx1 = idx - 2
-                ra = (xa[idx] - x) / (xa[idx] - xa[idx - 1])
-            rb = 1.0 - ra
-
-            # get coefficients and results
-            p1 = xa[jx1 + 1] - xa[jx1]
-            p2 = xa[jx1 + 2] - xa[jx1 + 1]
-            p3 = xa[jx1 + 3] - xa[jx1 + 2]
-            p4 = p1 + p2
-            p5 = p2 + p3
-
-            d1 = x - xa[jx1]
-            d2 = x - xa[jx1 + 1]
-            d3 = x - xa[jx1 + 2]
-            d4 = x - xa[jx1 + 3]
-            c1 = (ra * d2 * d3) / (p1 * p4)
-            c2 = -(ra * d1 * d3) / (p1 * p2) + (rb * d3 * d4) / (p2 * p5)
-            c3 = (ra * d1 * d2) / (p2 * p4) - (rb * d2 * d4) / (p2 * p3)
-            c4 = (rb * d2 * d3) / (p5 * p3)
-            y = ya[jx1] * c1 + ya[jx1 + 1] * c2 + ya[jx1 + 2] * c3 + ya[jx1 + 3] * c4
-
-    return y, extrap_flag
-
-
-def _biquad(T, i, xi, yi):
+        yc = np.take_along_axis(ya, cols, axis=1)
+
+    return np.sum(yc * coeffs, axis=1), extrap_flag
+
+
+def _biquad(xa, ya, za, x, y):
     """
     This routine interpolates over a 4 point interval using a
     variation of 2nd degree interpolation to produce a continuity
     of slope between adjacent intervals.
 
     Table set up:
-    T(i)   = table number
-    T(i+1) = number of x values in xi array
-    T(i+2) = number of y values in yi array
-    T(i+3) = values of x in ascending order
+    xa = values of x in ascending order
+    ya = values of y in ascending order
+    za = table values, with shape (len(xa), len(ya))
+
+    All points (x, y) are interpolated at once. Returns the interpolated values and
+    extrapolation flags (kx + 3 * ky, where kx and ky are 1 off the low end and 2 off
+    the high end of the respective table).
     """
-    lmt = 0
-    nx = int(T[i])
-    ny = int(T[i + 1])
-    j1 = int(i + 2)
-    j2 = j1 + nx - 1
-    # search in x sense
-    # jx1 = subscript of 1st x
-    # search routine - input j1, j2, xi
-    #                - output ra_x, rb_x, kx, jx1
-    z = 0.0
-    x = xi
-    kx = 0
-    ifnd_x = 0
-    jn = 0
-    xc = [0, 0, 0, 0]
-    for j in range(j1, j2 + 1):
-        if T[j] >= x:
-            ifnd_x = 1
-            jn = j
-            break
-    if ifnd_x == 0:
-        # off high end
-        x = T[j2]
-        kx = 2
-        # the last 4 points and curve B
-        jx1 = j2 - 3
-        ra_x = 0.0
-    else:
-        # test for -- off low end, first interval, other
-        if jn < j1 + 1:
-            if T[jn] != x:
-                kx = 1
-                x = T[j1]
-        if jn <= j1 + 1:
-            jx1 = j1
-            ra_x = 1.0
-        else:
-            # test for last interval
-            if j == j2:
-                jx1 = j2 - 3
-                ra_x = 0.0
-            else:
-                jx1 = jn - 2
-                ra_x = (T[jn] - x) / (T[jn] - T[jn - 1])
-
-    rb_x = 1.0 - ra_x
-
-    # return here from search of x
-    lmt = kx
-    jx = jx1
-    # The following code puts x values in xc blocks
-    for j in range(4):
-        xc[j] = T[jx1 + j]
-    # get coeff. in x sense
-    # coefficient routine - input x,x1,x2,x3,x4,ra_x,rb_x
-    p1 = xc[1] - xc[0]
-    p2 = xc[2] - xc[1]
-    p3 = xc[3] - xc[2]
-    p4 = p1 + p2
-    p5 = p2 + p3
-    d1 = x - xc[0]
-    d2 = x - xc[1]
-    d3 = x - xc[2]
-    d4 = x - xc[3]
-    cx1 = ra_x / p1 * d2 / p4 * d3
-    cx2 = -ra_x / p1 * d1 / p2 * d3 + rb_x / p2 * d3 / p5 * d4
-    cx3 = ra_x / p2 * d1 / p4 * d2 - rb_x / p2 * d2 / p3 * d4
-    cx4 = rb_x / p5 * d2 / p3 * d3
-    # return to main body
-
-    # return here with coeff. test for univariate or bivariate
-    if ny == 0:
-        z = 0.0
-        jy = jx + nx
-        z = cx1 * T[jy] + cx2 * T[jy + 1] + cx3 * T[jy + 2] + cx4 * T[jy + 3]
-    else:
-        # bivariate table
-        y = yi
-        j3 = j2 + 1
-        j4 = j3 + ny - 1
-        # search in y sense
-        # jy1 = subscript of 1st y
-        # search routine - input j3,j4,y
-        #                - output ra_y,rb_y,ky,,jy1
-        ky = 0
-        ifnd_y = 0
-        for j in range(j3, j4 + 1):
-            if T[j] >= y:
-                ifnd_y = 1
-                break
-        if ifnd_y == 0:
-            # off high end
-            y = T[j4]
-            ky = 2
-            # use last 4 points and curve B
-            jy1 = j4 - 3
-            ra_y = 0.0
-        else:
-            # test for off low end, first interval
-            if j < j3 + 1:
-                if T[j] != y:
-                    ky = 1
-                    y = T[j3]
-            if j <= j3 + 1:
-                jy1 = j3
-                ra_y = 1.0
-            else:
-                # test for last interval
-                if j == j4:
-                    jy1 = j4 - 3
-                    ra_y = 0.0
-                else:
-                    jy1 = j - 2
-                    ra_y = (T[j] - y) / (T[j] - T[j - 1])
-        rb_y = 1.0 - ra_y
-
-        lmt = lmt + 3 * ky
-        # interpolate in y sense
-        # subscript - base, num. of col., num. of y's
-        jy = (j4 + 1) + (jx - i - 2) * ny + (jy1 - j3)
-        yt = [0, 0, 0, 0]
-        for m in range(4):
-            jx = jy
-            yt[m] = cx1 * T[jx] + cx2 * T[jx + ny] + cx3 * T[jx + 2 * ny] + cx4 * T[jx + 3 * ny]
-            jy = jy + 1
-
-        # the following code puts y values in yc block
-        yc = [0, 0, 0, 0]
-        for j in range(4):
-            yc[j] = T[jy1]
-            jy1 = jy1 + 1
-        # get coeff. in y sense
-        # coefficient routine - input y, y1, y2, y3, y4, ra_y, rb_y
-        p1 = yc[1] - yc[0]
-        p2 = yc[2] - yc[1]
-        p3 = yc[3] - yc[2]
-        p4 = p1 + p2
-        p5 = p2 + p3
-        d1 = y - yc[0]
-        d2 = y - yc[1]
-        d3 = y - yc[2]
-        d4 = y - yc[3]
-        cy1 = ra_y / p1 * d2 / p4 * d3
-        cy2 = -ra_y / p1 * d1 / p2 * d3 + rb_y / p2 * d3 / p5 * d4
-        cy3 = ra_y / p2 * d1 / p4 * d2 - rb_y / p2 * d2 / p3 * d4
-        cy4 = rb_y / p5 * d2 / p3 * d3
-        z = cy1 * yt[0] + cy2 * yt[1] + cy3 * yt[2] + cy4 * yt[3]
-
-    return z, lmt
+    jx1, cx, kx = _blend_coefficients(xa, x)
+    jy1, cy, ky = _blend_coefficients(ya, y)
+    rows = jx1[:, np.newaxis, np.newaxis] + np.arange(4)[:, np.newaxis]
+    cols = jy1[:, np.newaxis, np.newaxis] + np.arange(4)
+    z = np.einsum('ij,ijk,ik->i', cx, za[rows, cols], cy)
+
+    return z, kx + 3 * ky
 
 
 # block auto-formatting of tables
@@ -456,6 +332,13 @@ comp_mach_CT_arr = np.array([
 ])
 # fmt: on
 
+# unpack comp_mach_CT_arr for _biquad
+_nx = int(comp_mach_CT_arr[1])
+_ny = int(comp_mach_CT_arr[2])
+comp_mach_arr = comp_mach_CT_arr[3 : 3 + _nx]
+comp_CTE_arr = comp_mach_CT_arr[3 + _nx : 3 + _nx + _ny]
+comp_mach_CT_table = comp_mach_CT_arr[3 + _nx + _ny :].reshape(_nx, _ny)
+
 
 class PreHamiltonStandard(om.ExplicitComponent):
     """Pre-process parameters needed by HamiltonStandard component."""
@@ -604,6 +487,16 @@ class HamiltonStandard(om.ExplicitComponent):
     It computes the thrust coefficient of a propeller blade.
     """
 
+    # inputs in the order of the arguments of _compute_thrust_coefficient
+    _input_names = (
+        'power_coefficient',
+        'advance_ratio',
+        Dynamic.Atmosphere.MACH,
+        'tip_mach',
+        Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+        Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+    )
+
     def initialize(self):
         self.options.declare('num_nodes', default=1, types=int)
 
@@ -632,19 +525,58 @@ class HamiltonStandard(om.ExplicitComponent):
         self.add_output('comp_tip_loss_factor', val=np.zeros(nn), units='unitless')
 
     def setup_partials(self):
-        # self.declare_partials('*', '*', method='cs')
-        # This should pick up 3 because the vectorized inputs have digaonal jacs.
-        self.declare_coloring(
-            '*', method='cs', num_full_jacs=1, show_summary=False, show_sparsity=False
+        nn = self.options['num_nodes']
+        arange = np.arange(nn)
+
+        # nodes are independent, so partials of vectorized inputs are diagonal
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            ['power_coefficient', 'advance_ratio', Dynamic.Atmosphere.MACH, 'tip_mach'],
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            [
+                Aircraft.Engine.Propeller.ACTIVITY_FACTOR,
+                Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT,
+            ],
         )
 
     def compute(self, inputs, outputs):
+        ct, xft = self._compute_thrust_coefficient(*[inputs[name] for name in self._input_names])
+
+        outputs['thrust_coefficient'] = ct
+        outputs['comp_tip_loss_factor'] = xft
+
+    def compute_partials(self, inputs, partials):
+        # The table look-ups and the iteration on thrust coefficient are complex-safe, so
+        # each column of the jacobian is found by complex stepping all nodes at once. Since
+        # nodes are independent, this takes one evaluation per input regardless of num_nodes.
+        step = 1.0e-40
+        args = [inputs[name] for name in self._input_names]
+
+        for i, name in enumerate(self._input_names):
+            cs_args = list(args)
+            cs_args[i] = args[i] + step * 1j
+            ct, xft = self._compute_thrust_coefficient(*cs_args, report=False)
+
+            partials['thrust_coefficient', name] = ct.imag / step
+            partials['comp_tip_loss_factor', name] = xft.imag / step
+
+    def _compute_thrust_coefficient(
+        self, power_coefficient, adv_ratio, mach, tip_mach, act_factor, cli, report=True
+    ):
+        """
+        Compute thrust coefficient and tip compressibility loss factor at all nodes.
+
+        Nodes are evaluated together, with the table look-ups for each advance ratio bracket and
+        the iteration on thrust coefficient vectorized across the nodes they apply to. Inputs may
+        be complex. Extrapolation warnings and messages are only reported if report is True.
+        """
         verbosity = self.options[Settings.VERBOSITY]
         num_blades = self.options[Aircraft.Engine.Propeller.NUM_BLADES]
-
-        act_factor = inputs[Aircraft.Engine.Propeller.ACTIVITY_FACTOR][0]
-        cli = inputs[Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT][0]
-        adv_ratio = inputs['advance_ratio']
+        nn = self.options['num_nodes']
 
         # TODO verify this works with multiple engine models (i.e. prop mission is
         #      properly slicing these inputs)
@@ -656,296 +588,252 @@ class HamiltonStandard(om.ExplicitComponent):
         else:
             num_blades = int(num_blades[0])
 
-        AF_adj_CP = np.zeros(7, dtype=cli.dtype)  # AFCP: an AF adjustment of CP to be assigned
-        AF_adj_CT = np.zeros(7, dtype=cli.dtype)  # AFCT: an AF adjustment of CT to be assigned
-
-        CTT = np.zeros(7, dtype=cli.dtype)
-        BLL = np.zeros(7, dtype=cli.dtype)
-        PXCLI = np.zeros(7, dtype=cli.dtype)
-        XFFT = np.zeros(6, dtype=cli.dtype)
-        CTG = np.zeros(11, dtype=cli.dtype)
-        CTG1 = np.zeros(11, dtype=cli.dtype)
-        TXCLI = np.zeros(6, dtype=cli.dtype)
-        CTTT = np.zeros(4, dtype=cli.dtype)
-        XXXFT = np.zeros(4, dtype=cli.dtype)
-
-        # TODO: We don't output this.
-        # BLLL = np.zeros(7, dtype=cli.dtype)
-
-        for i_node in range(self.options['num_nodes']):
-            ichck = 0
-            extrap_flag = 0
-            xft = 1.0
-
-            CTT[:] = 0.0
-            BLL[:] = 0.0
-            PXCLI[:] = 0.0
-            XFFT[:] = 0.0
-            CTG[:] = 0.0
-            CTG1[:] = 0.0
-            TXCLI[:] = 0.0
-            CTTT[:] = 0.0
-            XXXFT[:] = 0.0
-
-            # TODO: We don't output this.
-            # BLLL[:] = 0.0
-
-            for k in range(2):
-                AF_adj_CP[k], _ = _unint(Act_Factor_arr, AFCPC[k], act_factor)
-                AF_adj_CT[k], extrap_flag = _unint(Act_Factor_arr, AFCTC[k], act_factor)
-            AF_adj_CP[2:] = AF_adj_CP[1]
-            AF_adj_CT[2:] = AF_adj_CT[1]
-
-            if adv_ratio[i_node].real <= 0.5:
-                AFCTE = 2.0 * adv_ratio[i_node] * (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0]
-            else:
-                AFCTE = AF_adj_CT[1]
-
-            # bounding J (advance ratio) for setting up interpolation
-            if adv_ratio[i_node].real <= 1.0:
-                J_begin = 0
-                J_end = 3
-            elif adv_ratio[i_node].real <= 1.5:
-                J_begin = 1
-                J_end = 4
-            elif adv_ratio[i_node].real <= 2.0:
-                J_begin = 2
-                J_end = 5
-            else:
-                J_begin = 3
-                J_end = 6
-
-            CL_tab_idx_begin = 0  # NCLT
-            CL_tab_idx_end = 0  # NCLTT
-            # flag that given lift coeff (cli) does not fall on a node point of CL_arr
-            CL_tab_idx_flg = 0  # NCL_flg
-            ifnd = 0
-
-            power_coefficient = inputs['power_coefficient'][i_node]
-            for ii in range(6):
-                cl_idx = ii
-                if abs(cli - CL_arr[ii]) <= 0.0009:
-                    ifnd = 1
-                    break
-            if ifnd == 0:
-                if cli <= 0.6:
-                    CL_tab_idx_begin = 0
-                    CL_tab_idx_end = 3
-                elif cli <= 0.7:
-                    CL_tab_idx_begin = 1
-                    CL_tab_idx_end = 4
-                else:
-                    CL_tab_idx_begin = 2
-                    CL_tab_idx_end = 5
-            else:
-                CL_tab_idx_begin = cl_idx
-                CL_tab_idx_end = cl_idx
-                # flag that given lift coeff (cli) falls on a node point of CL_arr
-                CL_tab_idx_flg = 1
-
-            lmod = (num_blades % 2) + 1
-            if lmod == 1:
-                nbb = 1
-                idx_blade = int(num_blades / 2)
-                # even number of blades idx_blade = 1 if 2 blades;
-                #                       idx_blade = 2 if 4 blades;
-                #                       idx_blade = 3 if 6 blades;
-                #                       idx_blade = 4 if 8 blades.
-                idx_blade -= 1
+        dtype = np.result_type(power_coefficient, adv_ratio, mach, tip_mach, act_factor, cli)
+
+        AF_adj_CP = np.zeros(7, dtype=dtype)  # AFCP: an AF adjustment of CP to be assigned
+        AF_adj_CT = np.zeros(7, dtype=dtype)  # AFCT: an AF adjustment of CT to be assigned
+
+        CTT = np.zeros((nn, 7), dtype=dtype)
+        PXCLI = np.zeros((nn, 7), dtype=dtype)
+        CTTT = np.zeros((nn, 4), dtype=dtype)
+        XXXFT = np.zeros((nn, 4), dtype=dtype)
+        ichck = np.zeros(nn, dtype=int)
+
+        for k in range(2):
+            AF_adj_CP[k] = _unint(Act_Factor_arr, AFCPC[k], act_factor)[0][0]
+            AF_adj_CT[k] = _unint(Act_Factor_arr, AFCTC[k], act_factor)[0][0]
+        AF_adj_CP[2:] = AF_adj_CP[1]
+        AF_adj_CT[2:] = AF_adj_CT[1]
+
+        AFCTE = np.where(
+            adv_ratio.real <= 0.5,
+            2.0 * adv_ratio * (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0],
+            AF_adj_CT[1],
+        )
+
+        # bounding J (advance ratio) for setting up interpolation: each node uses
+        # advance_ratio_array[J_begin : J_begin + 4]
+        J_begin = np.searchsorted([1.0, 1.5, 2.0], adv_ratio.real, side='left')
+
+        CL_tab_idx_begin = 0  # NCLT
+        CL_tab_idx_end = 0  # NCLTT
+        # flag that given lift coeff (cli) does not fall on a node point of CL_arr
+        CL_tab_idx_flg = 0  # NCL_flg
+        ifnd = 0
+
+        for ii in range(6):
+            cl_idx = ii
+            if abs(cli[0] - CL_arr[ii]) <= 0.0009:
+                ifnd = 1
+                break
+        if ifnd == 0:
+            if cli[0].real <= 0.6:
+                CL_tab_idx_begin = 0
+                CL_tab_idx_end = 3
+            elif cli[0].real <= 0.7:
+                CL_tab_idx_begin = 1
+                CL_tab_idx_end = 4
             else:
-                nbb = 4
-                # odd number of blades
-                idx_blade = 0  # start from first blade
-
-            for ibb in range(nbb):
-                # nbb = 1 even number of blades. No interpolation needed
-                # nbb = 4 odd number of blades. So, interpolation done
-                #       using 4 sets of even J (advance ratio) interpolation
-                for kdx in range(J_begin, J_end + 1):
-                    CP_Eff = power_coefficient * AF_adj_CP[kdx]
-                    PBL, _ = _unint(CPEC, BL_P_corr_table[idx_blade], CP_Eff)
-                    # PBL = number of blades correction for power_coefficient
-                    CPE1 = CP_Eff * PBL * PF_CLI_arr[kdx]
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end + 1):
-                        CPE1X = CPE1
-                        if CPE1 < CP_CLi_table[CL_tab_idx][0]:
-                            CPE1X = CP_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        PXCLI[kl], extrap_flag = _unint(
-                            CP_CLi_table[CL_tab_idx][:cli_len], XPCLI[CL_tab_idx], CPE1X
-                        )
-                        if extrap_flag == 1:
-                            ichck = ichck + 1
-                        if verbosity == Verbosity.DEBUG or ichck <= Verbosity.BRIEF:
-                            if extrap_flag == 1:
-                                warnings.warn(
-                                    f'Mach = {inputs[Dynamic.Atmosphere.MACH][i_node]}\n'
-                                    f'VTMACH = {inputs["tip_mach"][i_node]}\n'
-                                    f'J = {inputs["advance_ratio"][i_node]}\n'
-                                    f'power_coefficient = {power_coefficient}\n'
-                                    f'CP_Eff = {CP_Eff}'
-                                )
-                            if kl == 4 and CPE1 < 0.010:
-                                print(
-                                    f'Extrapolated data is being used for CLI=.6--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
-                                )
-                            if kl == 5 and CPE1 < 0.010:
-                                print(
-                                    f'Extrapolated data is being used for CLI=.7--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
-                                )
-                            if kl == 6 and CPE1 < 0.010:
-                                print(
-                                    f'Extrapolated data is being used for CLI=.8--CPE1,PXCLI,L= , {CPE1},{PXCLI[kl]},{idx_blade}   Suggest inputting CLI=.5'
-                                )
-                        NERPT = 1
-                        CL_tab_idx += 1
-
-                    if CL_tab_idx_flg != 1:
-                        PCLI, extrap_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            PXCLI[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            cli,
-                        )
-                    else:
-                        PCLI = PXCLI[CL_tab_idx_begin]
-                        # PCLI = CLI adjustment to power_coefficient
-                    CP_Eff = CP_Eff * PCLI  # the effective CP at baseline point for kdx
-                    ang_len = ang_arr_len[kdx]
-                    BLL[kdx], extrap_flag = _unint(
-                        # blade angle at baseline point for kdx
-                        CP_Angle_table[idx_blade][kdx][:ang_len],
-                        Blade_angle_table[kdx],
-                        CP_Eff,
+                CL_tab_idx_begin = 2
+                CL_tab_idx_end = 5
+        else:
+            CL_tab_idx_begin = cl_idx
+            CL_tab_idx_end = cl_idx
+            # flag that given lift coeff (cli) falls on a node point of CL_arr
+            CL_tab_idx_flg = 1
+
+        CL_tab_range = range(CL_tab_idx_begin, CL_tab_idx_end + 1)
+        CL_slice = slice(CL_tab_idx_begin, CL_tab_idx_begin + 4)
+        cli = np.full(nn, cli[0], dtype=dtype)
+
+        # Mach number margins over critical Mach number, which do not depend on ct
+        DMN = np.zeros((nn, 6), dtype=dtype)
+        for kl in CL_tab_range:
+            ZMCRT, _ = _unint(advance_ratio_array2, mach_corr_table[kl], adv_ratio)
+            DMN[:, kl] = np.where(
+                adv_ratio.real != 0.0, mach - ZMCRT, tip_mach - mach_tip_corr_arr[kl]
+            )
+
+        TFCLII, _ = _unint(advance_ratio_array, TF_CLI_arr, adv_ratio)
+
+        lmod = (num_blades % 2) + 1
+        if lmod == 1:
+            nbb = 1
+            idx_blade = int(num_blades / 2)
+            # even number of blades idx_blade = 1 if 2 blades;
+            #                       idx_blade = 2 if 4 blades;
+            #                       idx_blade = 3 if 6 blades;
+            #                       idx_blade = 4 if 8 blades.
+            idx_blade -= 1
+        else:
+            nbb = 4
+            # odd number of blades
+            idx_blade = 0  # start from first blade
+
+        for ibb in range(nbb):
+            # nbb = 1 even number of blades. No interpolation needed
+            # nbb = 4 odd number of blades. So, interpolation done
+            #       using 4 sets of even J (advance ratio) interpolation
+            for kdx in range(7):
+                nodes = np.nonzero((J_begin <= kdx) & (kdx <= J_begin + 3))[0]
+                if nodes.size == 0:
+                    continue
+
+                CP_Eff = power_coefficient[nodes] * AF_adj_CP[kdx]
+                PBL, _ = _unint(CPEC, BL_P_corr_table[idx_blade], CP_Eff)
+                # PBL = number of blades correction for power_coefficient
+                CPE1 = CP_Eff * PBL * PF_CLI_arr[kdx]
+                for kl in CL_tab_range:
+                    CPE1X = np.where(CPE1.real < CP_CLi_table[kl][0], CP_CLi_table[kl][0], CPE1)
+                    cli_len = cli_arr_len[kl]
+                    PXCLI[nodes, kl], extrap_flag = _unint(
+                        CP_CLi_table[kl][:cli_len], XPCLI[kl], CPE1X
                     )
-                    try:
-                        CTT[kdx], extrap_flag = _unint(
-                            # thrust coeff at baseline point for kdx
-                            Blade_angle_table[kdx][:ang_len],
-                            CT_Angle_table[idx_blade][kdx][:ang_len],
-                            BLL[kdx],
-                        )
-                    except IndexError:
-                        raise om.AnalysisError(
-                            'interp failed for CTT (thrust coefficient) in hamilton_standard.py'
+                    if not report:
+                        continue
+
+                    ichck[nodes] += extrap_flag == 1
+                    verbose = (verbosity == Verbosity.DEBUG) | (ichck[nodes] <= Verbosity.BRIEF)
+                    for i in np.nonzero(verbose & (extrap_flag == 1))[0]:
+                        node = nodes[i]
+                        warnings.warn(
+                            f'Mach = {mach[node]}\n'
+                            f'VTMACH = {tip_mach[node]}\n'
+                            f'J = {adv_ratio[node]}\n'
+                            f'power_coefficient = {power_coefficient[node]}\n'
+                            f'CP_Eff = {CP_Eff[i]}'
                         )
-                    if extrap_flag > 1:
-                        NERPT = 2
-                        print(f'ERROR IN PROP. PERF.-- NERPT={NERPT}, extrap_flag={extrap_flag}')
-
-                # TODO: We don't output this.
-                # BLLL[ibb], extrap_flag = _unint(
-                #    advance_ratio_array[J_begin : J_begin + 4],
-                #    BLL[J_begin : J_begin + 4],
-                #    adv_ratio[i_node],
-                # )
-                # ang_blade = BLLL[ibb]
-
-                CTTT[ibb], extrap_flag = _unint(
-                    advance_ratio_array[J_begin : J_begin + 4],
-                    CTT[J_begin : J_begin + 4],
-                    adv_ratio[i_node],
+                    if kl in (4, 5):
+                        for i in np.nonzero(verbose & (CPE1.real < 0.010))[0]:
+                            print(
+                                f'Extrapolated data is being used for CLI={(".6", ".7")[kl - 4]}'
+                                f'--CPE1,PXCLI,L= , {CPE1[i]},{PXCLI[nodes[i], kl]},{idx_blade}'
+                                '   Suggest inputting CLI=.5'
+                            )
+
+                if CL_tab_idx_flg != 1:
+                    PCLI, _ = _unint(CL_arr[CL_slice], PXCLI[nodes, CL_slice], cli[nodes])
+                else:
+                    PCLI = PXCLI[nodes, CL_tab_idx_begin]
+                    # PCLI = CLI adjustment to power_coefficient
+                CP_Eff = CP_Eff * PCLI  # the effective CP at baseline point for kdx
+                ang_len = ang_arr_len[kdx]
+                # blade angle at baseline point for kdx
+                BLL, _ = _unint(
+                    CP_Angle_table[idx_blade][kdx][:ang_len], Blade_angle_table[kdx], CP_Eff
+                )
+                # thrust coeff at baseline point for kdx
+                CTT[nodes, kdx], extrap_flag = _unint(
+                    Blade_angle_table[kdx][:ang_len],
+                    CT_Angle_table[idx_blade][kdx][:ang_len],
+                    BLL,
+                )
+                if report:
+                    NERPT = 2
+                    for flag in extrap_flag[extrap_flag > 1]:
+                        print(f'ERROR IN PROP. PERF.-- NERPT={NERPT}, extrap_flag={flag}')
+
+            for J_idx in np.unique(J_begin):
+                nodes = np.nonzero(J_begin == J_idx)[0]
+                CTTT[nodes, ibb], _ = _unint(
+                    advance_ratio_array[J_idx : J_idx + 4],
+                    CTT[nodes, J_idx : J_idx + 4],
+                    adv_ratio[nodes],
                 )
 
-                # make extra correction. CTG is an "error" function, and the iteration (loop counter = "IL") tries to drive CTG/CT to 0
-                # ERR_CT = CTG1[il]/CTTT[ibb], where CTG1 =CT_Eff - CTTT(IBB).
-                CTG[0] = 0.100
-                CTG[1] = 0.200
-                TFCLII, extrap_flag = _unint(advance_ratio_array, TF_CLI_arr, adv_ratio[i_node])
-                NCTG = 10
-                ifnd1 = 0
-                ifnd2 = 0
-                for il in range(NCTG):
-                    ct = CTG[il]
-                    CT_Eff = CTG[il] * AFCTE
-                    TBL, extrap_flag = _unint(CTEC, BL_T_corr_table[idx_blade], CT_Eff)
-                    # TBL = number of blades correction for thrust_coefficient
-                    CTE1 = CT_Eff * TBL * TFCLII
-                    CL_tab_idx = CL_tab_idx_begin
-                    for kl in range(CL_tab_idx_begin, CL_tab_idx_end + 1):
-                        CTE1X = CTE1
-                        if CTE1 < CT_CLi_table[CL_tab_idx][0]:
-                            CTE1X = CT_CLi_table[CL_tab_idx][0]
-                        cli_len = cli_arr_len[CL_tab_idx]
-                        TXCLI[kl], extrap_flag = _unint(
-                            CT_CLi_table[CL_tab_idx][:cli_len], XTCLI[CL_tab_idx][:cli_len], CTE1X
-                        )
-                        NERPT = 5
-                        if extrap_flag == 1:
+            # make extra correction. CTG is an "error" function, and the iteration (loop counter = "IL") tries to drive CTG/CT to 0
+            # ERR_CT = CTG1[il]/CTTT[ibb], where CTG1 =CT_Eff - CTTT(IBB).
+            NCTG = 10
+            CTG = np.zeros((nn, NCTG + 1), dtype=dtype)
+            CTG1 = np.zeros((nn, NCTG + 1), dtype=dtype)
+            CTG[:, 0] = 0.100
+            CTG[:, 1] = 0.200
+            ct = np.zeros(nn, dtype=dtype)
+            xft = np.ones(nn, dtype=dtype)
+            ifnd1 = np.zeros(nn, dtype=bool)
+            ifnd2 = np.zeros(nn, dtype=bool)
+            for il in range(NCTG):
+                # only iterate on nodes that have not finished
+                nodes = np.nonzero(~(ifnd1 | ifnd2))[0]
+                if nodes.size == 0:
+                    break
+
+                TXCLI = np.zeros((nodes.size, 6), dtype=dtype)
+                XFFT = np.ones((nodes.size, 6), dtype=dtype)  # compressibility tip loss factor
+
+                ct[nodes] = CTG[nodes, il]
+                CT_Eff = CTG[nodes, il] * AFCTE[nodes]
+                TBL, _ = _unint(CTEC, BL_T_corr_table[idx_blade], CT_Eff)
+                # TBL = number of blades correction for thrust_coefficient
+                CTE1 = CT_Eff * TBL * TFCLII[nodes]
+                for kl in CL_tab_range:
+                    CTE1X = np.where(CTE1.real < CT_CLi_table[kl][0], CT_CLi_table[kl][0], CTE1)
+                    cli_len = cli_arr_len[kl]
+                    TXCLI[:, kl], extrap_flag = _unint(
+                        CT_CLi_table[kl][:cli_len], XTCLI[kl][:cli_len], CTE1X
+                    )
+                    NERPT = 5
+                    if report:
+                        for flag in extrap_flag[extrap_flag == 1]:
                             # off lower bound only.
                             print(
                                 f'ERROR IN PROP. PERF.-- NERPT={NERPT}, '
-                                f'extrap_flag={extrap_flag}, il={il}, kl = {kl}'
-                            )
-                        if adv_ratio[i_node].real != 0.0:
-                            ZMCRT, extrap_flag = _unint(
-                                advance_ratio_array2,
-                                mach_corr_table[CL_tab_idx],
-                                adv_ratio[i_node],
+                                f'extrap_flag={flag}, il={il}, kl = {kl}'
                             )
-                            DMN = inputs[Dynamic.Atmosphere.MACH][i_node] - ZMCRT
-                        else:
-                            ZMCRT = mach_tip_corr_arr[CL_tab_idx]
-                            DMN = inputs['tip_mach'][i_node] - ZMCRT
-                        XFFT[kl] = 1.0  # compressibility tip loss factor
-                        if DMN > 0.0:
-                            CTE2 = CT_Eff * TXCLI[kl] * TBL
-                            XFFT[kl], extrap_flag = _biquad(comp_mach_CT_arr, 1, DMN, CTE2)
-                        CL_tab_idx = CL_tab_idx + 1
-                    if CL_tab_idx_flg != 1:
-                        TCLII, extrap_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            TXCLI[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            cli,
+                    comp = DMN[nodes, kl].real > 0.0
+                    if np.any(comp):
+                        CTE2 = CT_Eff[comp] * TXCLI[comp, kl] * TBL[comp]
+                        XFFT[comp, kl], _ = _biquad(
+                            comp_mach_arr,
+                            comp_CTE_arr,
+                            comp_mach_CT_table,
+                            DMN[nodes[comp], kl],
+                            CTE2,
                         )
-                        xft, extrap_flag = _unint(
-                            CL_arr[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            XFFT[CL_tab_idx_begin : CL_tab_idx_begin + 4],
-                            cli,
-                        )
-                    else:
-                        TCLII = TXCLI[CL_tab_idx_begin]
-                        xft = XFFT[CL_tab_idx_begin]
-                    ct = CTG[il]
-                    CT_Eff = CTG[il] * AFCTE * TCLII
-                    CTG1[il] = CT_Eff - CTTT[ibb]
-                    if abs(CTG1[il] / CTTT[ibb]) < 0.001:
-                        ifnd1 = 1
-                        break
-                    if il > 0:
-                        CTG[il + 1] = (
-                            -CTG1[il - 1] * (CTG[il] - CTG[il - 1]) / (CTG1[il] - CTG1[il - 1])
-                            + CTG[il - 1]
-                        )
-                        if CTG[il + 1] <= 0:
-                            ifnd2 = 1
-                            break
-
-                if ifnd1 == 0 and ifnd2 == 0:
-                    raise ValueError(
-                        'Integrated design cl adjustment not working properly for ct '
-                        f'definition (ibb={ibb})'
+                if CL_tab_idx_flg != 1:
+                    TCLII, _ = _unint(CL_arr[CL_slice], TXCLI[:, CL_slice], cli[nodes])
+                    xft[nodes], _ = _unint(CL_arr[CL_slice], XFFT[:, CL_slice], cli[nodes])
+                else:
+                    TCLII = TXCLI[:, CL_tab_idx_begin]
+                    xft[nodes] = XFFT[:, CL_tab_idx_begin]
+                CT_Eff = CTG[nodes, il] * AFCTE[nodes] * TCLII
+                CTG1[nodes, il] = CT_Eff - CTTT[nodes, ibb]
+                ifnd1[nodes] = abs(CTG1[nodes, il] / CTTT[nodes, ibb]) < 0.001
+                if il > 0:
+                    nodes = nodes[~ifnd1[nodes]]
+                    CTG[nodes, il + 1] = (
+                        -CTG1[nodes, il - 1]
+                        * (CTG[nodes, il] - CTG[nodes, il - 1])
+                        / (CTG1[nodes, il] - CTG1[nodes, il - 1])
+                        + CTG[nodes, il - 1]
                     )
-                if ifnd1 == 0 and ifnd2 == 1:
-                    ct = 0.0
-                CTTT[ibb] = ct
-                XXXFT[ibb] = xft
-                idx_blade += 1
-
-            if nbb != 1:
-                # interpolation by the number of blades if odd number
-                ct, _ = _unint(num_blades_arr, CTTT, num_blades)
-                xft, _ = _unint(num_blades_arr, XXXFT, num_blades)
-
-                # TODO: We don't output this.
-                # ang_blade, _ = _unint(num_blades_arr, BLLL[:4], num_blades)
-
-            # NOTE this could be handled via the metamodel comps (extrapolate flag)
-            if ichck > 0:
-                print(f'  table look-up error = {ichck} (if you go outside the tables.)')
-
-            outputs['thrust_coefficient'][i_node] = ct
-            outputs['comp_tip_loss_factor'][i_node] = xft
+                    ifnd2[nodes] = CTG[nodes, il + 1].real <= 0
+
+            if not np.all(ifnd1 | ifnd2):
+                raise ValueError(
+                    'Integrated design cl adjustment not working properly for ct '
+                    f'definition (ibb={ibb})'
+                )
+            ct[~ifnd1 & ifnd2] = 0.0
+            CTTT[:, ibb] = ct
+            XXXFT[:, ibb] = xft
+            idx_blade += 1
+
+        if nbb != 1:
+            # interpolation by the number of blades if odd number
+            num_blades = np.full(nn, num_blades, dtype=float)
+            ct, _ = _unint(num_blades_arr, CTTT, num_blades)
+            xft, _ = _unint(num_blades_arr, XXXFT, num_blades)
+        else:
+            ct = CTTT[:, 0]
+            xft = XXXFT[:, 0]
+
+        # NOTE this could be handled via the metamodel comps (extrapolate flag)
+        if report:
+            for count in ichck[ichck > 0]:
+                print(f'  table look-up error = {count} (if you go outside the tables.)')
+
+        return ct, xft
 
 
 class PostHamiltonStandard(om.ExplicitComponent):
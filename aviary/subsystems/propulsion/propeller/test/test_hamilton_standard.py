@@ -134,6 +134,46 @@ class HamiltonStandardTest(unittest.TestCase):
         )
         assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
 
+    def test_HS_vectorized(self):
+        # nodes in different advance ratio brackets, with an odd number of blades and a lift
+        # coefficient between table values, must match results computed one node at a time
+        power_coefficient = [0.2352, 0.2352, 0.2553, 0.1501, 0.1200, 0.0800]
+        advance_ratio = [0.0066, 0.8295, 1.9908, 1.2501, 0.5500, 2.3000]
+        mach = [0.001509, 0.1887, 0.4976, 0.3102, 0.1200, 0.5500]
+        tip_mach = [1.2094, 1.2094, 1.3290, 0.8500, 0.6500, 0.9300]
+
+        def run_hs(num_nodes, nodes):
+            options = get_option_defaults()
+            options.set_val(Aircraft.Engine.Propeller.NUM_BLADES, val=3, units='unitless')
+
+            prob = om.Problem()
+            prob.model.add_subsystem(
+                'hs', HamiltonStandard(num_nodes=num_nodes), promotes_inputs=['*']
+            )
+            setup_model_options(prob, options)
+            prob.setup()
+
+            prob.set_val('power_coefficient', np.array(power_coefficient)[nodes])
+            prob.set_val('advance_ratio', np.array(advance_ratio)[nodes])
+            prob.set_val(Dynamic.Atmosphere.MACH, np.array(mach)[nodes])
+            prob.set_val('tip_mach', np.array(tip_mach)[nodes])
+            prob.set_val(Aircraft.Engine.Propeller.ACTIVITY_FACTOR, 125.0)
+            prob.set_val(Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT, 0.55)
+            prob.run_model()
+
+            return prob
+
+        prob = run_hs(6, slice(None))
+        for i in range(6):
+            single = run_hs(1, [i])
+            for name in ('hs.thrust_coefficient', 'hs.comp_tip_loss_factor'):
+                assert_near_equal(prob.get_val(name)[i], single.get_val(name)[0], tolerance=1e-12)
+
+        partial_data = prob.check_partials(
+            out_stream=None, form='central', method='fd', minimum_step=1e-12
+        )
+        assert_check_partials(partial_data, atol=1e-4, rtol=1e-4)
+
 
 class PostHamiltonStandardTest(unittest.TestCase):
     """Test computation in PostHamiltonStandard class."""
@@ -1,10 +1,13 @@
 import sys
+import warnings
 
 import numpy as np
 import openmdao.api as om
 
+from aviary.subsystems.propulsion.engine_deck_stack import EngineDeckStack, can_stack_engine_decks
 from aviary.subsystems.propulsion.utils import EngineModelVariables, max_variables
 from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.enums import Verbosity
 from aviary.variable_info.functions import add_aviary_option
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
@@ -52,6 +55,42 @@ class PropulsionMission(om.Group):
         user_options = self.options['user_options']
         num_engine_type = len(engine_models)
 
+        # Engine decks of identical structure can be evaluated as a single stack, whose outputs
+        # are already vectorized for all engine types
+        self.stacked = False
+        if (
+            Aircraft.Propulsion.STACK_ENGINE_DECKS in options
+            and options.get_val(Aircraft.Propulsion.STACK_ENGINE_DECKS)
+            and num_engine_type > 1
+        ):
+            self.stacked = can_stack_engine_decks(engine_models)
+            if Settings.VERBOSITY in options:
+                verbosity = options.get_val(Settings.VERBOSITY)
+            else:
+                verbosity = Verbosity.BRIEF
+            if not self.stacked and verbosity >= Verbosity.BRIEF:
+                warnings.warn(
+                    f'{Aircraft.Propulsion.STACK_ENGINE_DECKS} is True, but the engine models are '
+                    'not EngineDecks with the same variables, units, and interpolation settings. '
+                    'A separate group is used for each engine type.'
+                )
+
+        if self.stacked:
+            self.add_subsystem(
+                'engine_stack',
+                EngineDeckStack(num_nodes=nn, engine_models=engine_models),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+            self.add_subsystem(
+                'propulsion_sum',
+                subsys=PropulsionSum(num_nodes=nn),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+            return
+
         # Create IndepVarComp to pass maximum throttle to max thrust interpolator
         # Only needed if any engine doesn't compute max thrust
         if any(not engine.compute_max_values for engine in engine_models):
@@ -328,6 +367,10 @@ class PropulsionMission(om.Group):
         # from aviary.utils.test_utils.variable_test import get_names_from_hierarchy
         # supported_outputs = get_names_from_hierarchy(Dynamic.Vehicle.Propulsion)
 
+        if self.stacked:
+            # outputs of the stack are already vectorized and promoted
+            return
+
         supported_outputs = [
             Dynamic.Vehicle.Propulsion.ELECTRIC_POWER_IN,
             Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
@@ -2,14 +2,18 @@ import csv
 import unittest
 from pathlib import Path
 
+import numpy as np
+import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
 from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
 from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.engine_deck_conversion import compile_engine_deck
 from aviary.utils.named_values import NamedValues
 from aviary.validation_cases.validation_tests import get_flops_inputs
-from aviary.variable_info.variables import Aircraft
+from aviary.variable_info.variables import Aircraft, Dynamic
 
 
 class EngineDeckTest(unittest.TestCase):
@@ -144,5 +148,87 @@ class EngineDeckTest(unittest.TestCase):
         self.assertEqual(str(cm.exception), msg)
 
 
+@use_tempdirs
+class EngineDeckDataTest(unittest.TestCase):
+    def test_compiled_deck(self):
+        aviary_values = get_flops_inputs('LargeSingleAisle1FLOPS')
+        aviary_values.set_val(Aircraft.Engine.GLOBAL_THROTTLE, False)
+        engine = build_engine_deck(aviary_values)
+
+        filename = compile_engine_deck(
+            aviary_values.get_val(Aircraft.Engine.DATA_FILE), 'compiled', aviary_values
+        )
+        self.assertEqual(filename.name, 'compiled.npz')
+
+        aviary_values.set_val(Aircraft.Engine.DATA_FILE, filename)
+        compiled_engine = build_engine_deck(aviary_values)
+
+        for key in engine.data:
+            assert_near_equal(compiled_engine.data[key], engine.data[key], tolerance=1e-12)
+            assert_near_equal(
+                compiled_engine.packed_data[key], engine.packed_data[key], tolerance=1e-12
+            )
+        assert_near_equal(compiled_engine.throttle_max, engine.throttle_max, tolerance=1e-12)
+        assert_near_equal(compiled_engine.data_indices, engine.data_indices, tolerance=1e-12)
+        for key in engine.max_data:
+            assert_near_equal(compiled_engine.max_data[key], engine.max_data[key], tolerance=1e-12)
+        self.assertEqual(compiled_engine.engine_variables, engine.engine_variables)
+        self.assertEqual(
+            compiled_engine.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'),
+            engine.get_val(Aircraft.Engine.REFERENCE_SLS_THRUST, 'lbf'),
+        )
+
+        # options that change data processing must match those used to compile the deck
+        aviary_values.set_val(Aircraft.Engine.GLOBAL_THROTTLE, True)
+        with self.assertRaises(UserWarning) as cm:
+            build_engine_deck(aviary_values)
+        self.assertIn(Aircraft.Engine.GLOBAL_THROTTLE, str(cm.exception))
+
+    def test_max_data(self):
+        aviary_values = get_flops_inputs('LargeSingleAisle1FLOPS')
+        aviary_values.set_val(Aircraft.Engine.GLOBAL_THROTTLE, False)
+        engine = build_engine_deck(aviary_values)
+
+        max_data = engine.max_data
+        self.assertEqual(set(max_data), {keys.MACH, keys.ALTITUDE, keys.THRUST})
+        self.assertEqual(len(max_data[keys.THRUST]), np.count_nonzero(engine.data_indices))
+
+        # maximum values are the data at the highest throttle of each flight condition
+        data = engine.data
+        for mach, alt, thrust in zip(
+            max_data[keys.MACH], max_data[keys.ALTITUDE], max_data[keys.THRUST]
+        ):
+            idx = (data[keys.MACH] == mach) & (data[keys.ALTITUDE] == alt)
+            expected = data[keys.THRUST][idx][np.argmax(data[keys.THROTTLE][idx])]
+            assert_near_equal(thrust, expected, tolerance=1e-12)
+
+        # the mission evaluates maximum thrust from the reduced table
+        prob = om.Problem()
+        prob.model.add_subsystem('engine', engine.build_mission(4, aviary_values, {}, {}))
+        prob.setup()
+
+        max_interp = prob.model._get_subsystem('engine.max_interpolation')
+        self.assertEqual(max_interp.pnames, [Dynamic.Atmosphere.MACH, Dynamic.Mission.ALTITUDE])
+        self.assertIsNone(prob.model._get_subsystem('engine.interp_max_throttles'))
+
+    def test_shared_interpolant(self):
+        # interpolation tables are shared between mission groups with different num_nodes
+        aviary_values = get_flops_inputs('LargeSingleAisle1FLOPS')
+        engine = build_engine_deck(aviary_values)
+
+        prob = om.Problem()
+        for num_nodes in (3, 8):
+            prob.model.add_subsystem(
+                f'engine_{num_nodes}', engine.build_mission(num_nodes, aviary_values, {}, {})
+            )
+        prob.setup()
+
+        for name in ('interpolation', 'max_interpolation'):
+            interps_3 = prob.model._get_subsystem(f'engine_3.{name}').interps
+            interps_8 = prob.model._get_subsystem(f'engine_8.{name}').interps
+            for output in interps_3:
+                self.assertIs(interps_3[output].table, interps_8[output].table)
+
+
 if __name__ == '__main__':
     unittest.main()
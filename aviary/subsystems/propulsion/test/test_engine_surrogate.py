@@ -0,0 +1,189 @@
+import unittest
+from io import StringIO
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.subsystems.atmosphere.atmosphere import Atmosphere
+from aviary.subsystems.propulsion.engine_surrogate import EngineSurrogate, build_turboprop_surrogate
+from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import get_path
+from aviary.utils.preprocessors import preprocess_propulsion
+from aviary.validation_cases.validation_tests import get_flops_inputs
+from aviary.variable_info.enums import SpeedType
+from aviary.variable_info.functions import setup_model_options
+from aviary.variable_info.options import get_option_defaults
+from aviary.variable_info.variables import Aircraft, Dynamic
+
+
+def build_engine_problem(engine, options, machs, alts, throttles, atmosphere=False):
+    """Build a problem that evaluates the mission system of an engine model at given points."""
+    num_nodes = len(machs)
+    options = options.deepcopy()
+    preprocess_propulsion(options, [engine])
+
+    prob = om.Problem()
+
+    ivc = om.IndepVarComp(Dynamic.Atmosphere.MACH, np.array(machs), units='unitless')
+    ivc.add_output(Dynamic.Mission.ALTITUDE, np.array(alts), units='ft')
+    ivc.add_output(Dynamic.Vehicle.Propulsion.THROTTLE, np.array(throttles), units='unitless')
+    prob.model.add_subsystem('IVC', ivc, promotes=['*'])
+
+    if atmosphere:
+        prob.model.add_subsystem(
+            'atmosphere',
+            Atmosphere(num_nodes=num_nodes, input_speed_type=SpeedType.MACH),
+            promotes=['*'],
+        )
+
+    propulsion_group = prob.model.add_subsystem('propulsion', om.Group(), promotes=['*'])
+    propulsion_group.add_subsystem(
+        engine.name,
+        engine.build_mission(
+            num_nodes=num_nodes, aviary_inputs=options, user_options={}, subsystem_options={}
+        ),
+        promotes=['*'],
+    )
+
+    setup_model_options(prob, options, engine_models=[engine])
+
+    prob.setup(force_alloc_complex=True)
+
+    return prob
+
+
+@use_tempdirs
+class EngineSurrogateTest(unittest.TestCase):
+    def setUp(self):
+        self.options = get_flops_inputs('LargeSingleAisle1FLOPS')
+        self.deck = build_engine_deck(self.options)
+        self.surrogate = EngineSurrogate(source=self.deck)
+
+    def test_accuracy(self):
+        report = self.surrogate.accuracy_report(out_stream=None)
+        self.assertEqual(set(report), {'thrust_net', 'fuel_flow_rate', 'nox_rate'})
+
+        self.assertLess(report['thrust_net']['max_rel_error'], 5e-3)
+        self.assertLess(report['fuel_flow_rate']['max_rel_error'], 5e-3)
+
+        stream = StringIO()
+        self.surrogate.accuracy_report(out_stream=stream)
+        self.assertIn('thrust_net', stream.getvalue())
+
+        # the mission system reproduces the deck at its own data points, including scaling
+        data = self.deck.data
+        idx = np.arange(0, len(data[keys.MACH]), 25)
+        prob = build_engine_problem(
+            self.surrogate,
+            self.options,
+            data[keys.MACH][idx],
+            data[keys.ALTITUDE][idx],
+            data[keys.THROTTLE][idx],
+        )
+        prob.set_val(Aircraft.Engine.SCALE_FACTOR, 1.2)
+        prob.run_model()
+
+        thrust = prob.get_val(Dynamic.Vehicle.Propulsion.THRUST, units='lbf')
+        max_error = np.max(np.abs(thrust - 1.2 * data[keys.THRUST][idx]))
+        self.assertLess(max_error, 1.2 * report['thrust_net']['max_abs_error'] + 1e-8)
+
+        partial_data = prob.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-8, rtol=1e-8)
+
+    def test_max_values(self):
+        machs = [0.2, 0.5, 0.78]
+        alts = [1000.0, 20000.0, 35000.0]
+
+        prob = build_engine_problem(self.surrogate, self.options, machs, alts, [0.3, 1.0, 0.6])
+        prob.run_model()
+
+        # maximum thrust is the thrust at full throttle
+        thrust_max = prob.get_val(Dynamic.Vehicle.Propulsion.THRUST_MAX, units='lbf')
+        thrust = prob.get_val(Dynamic.Vehicle.Propulsion.THRUST, units='lbf')
+        assert_near_equal(thrust_max[1], thrust[1], 1e-10)
+        self.assertTrue(np.all(thrust_max >= thrust))
+
+        deck_prob = build_engine_problem(self.deck, self.options, machs, alts, [1.0, 1.0, 1.0])
+        deck_prob.run_model()
+        assert_near_equal(
+            thrust_max, deck_prob.get_val(Dynamic.Vehicle.Propulsion.THRUST_MAX, units='lbf'), 1e-2
+        )
+
+    def test_save_load(self):
+        filename = self.surrogate.save('surrogate')
+        self.assertEqual(filename.name, 'surrogate.npz')
+
+        loaded = EngineSurrogate(options=self.deck.options, data_file=filename)
+
+        self.assertEqual(loaded.method, self.surrogate.method)
+        for var, table in self.surrogate.tables.items():
+            assert_near_equal(loaded.tables[var], table, 0.0)
+        self.assertEqual(
+            loaded.accuracy_report(out_stream=None), self.surrogate.accuracy_report(out_stream=None)
+        )
+
+        # modified data is detected
+        with np.load(filename) as data:
+            arrays = dict(data)
+        arrays['table.THRUST'] = arrays['table.THRUST'] * 1.01
+        np.savez(filename, **arrays)
+
+        with self.assertRaises(UserWarning):
+            EngineSurrogate(options=self.deck.options, data_file=filename)
+
+    def test_errors(self):
+        with self.assertRaises(UserWarning):
+            EngineSurrogate(options=self.deck.options)
+
+        with self.assertRaises(TypeError):
+            EngineSurrogate(source=TurbopropModel(options=self.options))
+
+
+@use_tempdirs
+class TurbopropSurrogateTest(unittest.TestCase):
+    def test_turboprop(self):
+        options = get_option_defaults()
+        options.set_val(Aircraft.Engine.DATA_FILE, get_path('models/engines/turboshaft_1120hp.csv'))
+        options.set_val(Aircraft.Engine.FIXED_RPM, 1455.13090827, units='rpm')
+        options.set_val(Aircraft.Engine.NUM_ENGINES, 2)
+        options.set_val(Aircraft.Engine.SCALE_FACTOR, 1)
+        options.set_val(Aircraft.Engine.GENERATE_FLIGHT_IDLE, False)
+        options.set_val(Aircraft.Engine.Propeller.NUM_BLADES, val=4, units='unitless')
+
+        turboprop = TurbopropModel(options=options)
+        surrogate = build_turboprop_surrogate(turboprop)
+
+        self.assertIsInstance(surrogate.shaft_power_model, EngineSurrogate)
+        self.assertIs(surrogate.propeller_model, turboprop.propeller_model)
+
+        results = []
+        for engine in (turboprop, surrogate):
+            prob = build_engine_problem(
+                engine, options, [0.0, 0.3, 0.6], [0.0, 10000.0, 25000.0], [1.0, 0.8, 1.0], True
+            )
+            prob.set_val(Aircraft.Engine.Propeller.DIAMETER, 10.5, units='ft')
+            prob.set_val(Aircraft.Engine.Propeller.ACTIVITY_FACTOR, 114.0, units='unitless')
+            prob.set_val(
+                Aircraft.Engine.Propeller.INTEGRATED_LIFT_COEFFICIENT, 0.5, units='unitless'
+            )
+            prob.set_val(Aircraft.Engine.Propeller.TIP_SPEED_MAX, 800, units='ft/s')
+            prob.run_model()
+
+            results.append(
+                (
+                    prob.get_val(Dynamic.Vehicle.Propulsion.SHAFT_POWER, units='hp'),
+                    prob.get_val(Dynamic.Vehicle.Propulsion.THRUST, units='lbf'),
+                    prob.get_val(Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE, units='lbm/h'),
+                )
+            )
+
+        for expected, actual in zip(*results):
+            assert_near_equal(actual, expected, 1e-2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ from packaging import version
 
 from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from aviary.subsystems.propulsion.engine_deck_stack import can_stack_engine_decks
 from aviary.subsystems.propulsion.propulsion_mission import PropulsionMission, PropulsionSum
 from aviary.subsystems.propulsion.test.test_custom_engine_model import SimpleTestEngine
 from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
@@ -295,6 +296,83 @@ class PropulsionMissionTest(unittest.TestCase):
         partial_data = self.prob.check_partials(out_stream=None, method='cs')
         assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
+    def test_case_stacked_multiengine(self):
+        # two different engine decks evaluated as a stack must match separate engine groups
+        nn = 8
+
+        options = get_flops_inputs('LargeSingleAisle2FLOPS')
+        options.set_val(Settings.VERBOSITY, 0)
+        options.set_val(Aircraft.Engine.GLOBAL_THROTTLE, True)
+
+        engine = build_engine_deck(options)
+
+        engine2_options = options.deepcopy()
+        engine2_options.set_val(
+            Aircraft.Engine.DATA_FILE, get_path('models/engines/turbofan_23k_1.csv')
+        )
+        engine2_options.set_val(Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER, 1.05)
+        engine2_options.set_val(Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM, 0.5)
+        engine2_options.set_val(Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION, 10.0, units='lbm/h')
+        engine2 = build_engine_deck(engine2_options)
+        engine2.name = 'engine2'
+        engine_models = [engine, engine2]
+        preprocess_propulsion(options, engine_models=engine_models)
+
+        self.assertTrue(can_stack_engine_decks(engine_models))
+        self.assertFalse(can_stack_engine_decks([engine]))
+        self.assertFalse(can_stack_engine_decks([engine, SimpleTestEngine()]))
+
+        throttle = np.linspace(1.0, 0.6, nn)
+        results = []
+        for stack in (False, True):
+            options.set_val(Aircraft.Propulsion.STACK_ENGINE_DECKS, stack)
+
+            prob = om.Problem()
+            model = prob.model
+
+            ivc = om.IndepVarComp()
+            ivc.add_output(Dynamic.Atmosphere.MACH, np.linspace(0, 0.85, nn), units='unitless')
+            ivc.add_output(Dynamic.Mission.ALTITUDE, np.linspace(0, 40000, nn), units='ft')
+            ivc.add_output(
+                Dynamic.Vehicle.Propulsion.THROTTLE,
+                np.vstack((throttle, throttle[::-1])).transpose(),
+                units='unitless',
+            )
+            model.add_subsystem('ivc', ivc, promotes=['*'])
+
+            prop = PropulsionMission(
+                num_nodes=nn,
+                aviary_options=options,
+                user_options={},
+                engine_models=engine_models,
+            )
+            model.add_subsystem('propulsion', prop, promotes=['*'])
+
+            setup_model_options(prob, options, engine_models=engine_models)
+
+            prob.setup(force_alloc_complex=True)
+            prob.set_val(Aircraft.Engine.SCALE_FACTOR, [0.975, 1.1], units='unitless')
+
+            prob.run_model()
+
+            self.assertEqual(prop.stacked, stack)
+            results.append(prob)
+
+        unstacked, stacked = results
+        for name in (
+            Dynamic.Vehicle.Propulsion.THRUST,
+            Dynamic.Vehicle.Propulsion.THRUST_MAX,
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE,
+            Dynamic.Vehicle.Propulsion.NOX_RATE,
+            Dynamic.Vehicle.Propulsion.THRUST_TOTAL,
+            Dynamic.Vehicle.Propulsion.FUEL_FLOW_RATE_NEGATIVE_TOTAL,
+        ):
+            with self.subTest(name=name):
+                assert_near_equal(stacked.get_val(name), unstacked.get_val(name), tolerance=1e-12)
+
+        partial_data = stacked.check_partials(out_stream=None, method='cs')
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
     def test_case_no_max_thrust(self):
         # replaces the engine model with a fake one that does not compute maximum thrust
         nn = 5
@@ -5,6 +5,7 @@ import openmdao.api as om
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
 from aviary.subsystems.propulsion.engine_model import EngineModel
+from aviary.subsystems.propulsion.engine_surrogate import EngineSurrogate
 from aviary.subsystems.propulsion.gearbox.gearbox_builder import GearboxBuilder
 from aviary.subsystems.propulsion.propeller.propeller_builder import PropellerBuilder
 from aviary.subsystems.propulsion.utils import EngineModelVariables, build_engine_deck
@@ -130,7 +131,7 @@ class TurbopropModel(EngineModel):
 
         # TODO engine scaling for turboshafts requires EngineSizing to be refactored to accept
         #      target scaling variable as an option, skipping for now
-        if not isinstance(shp_model, EngineDeck):
+        if not isinstance(shp_model, (EngineDeck, EngineSurrogate)):
             shp_model_pre_mission = shp_model.build_pre_mission(
                 self.options, subsystem_options=subsystem_options
             )
@@ -17,10 +17,10 @@ class AviaryValues
     define a collection of named values with associated units
 """
 
-from openmdao.utils.units import convert_units as _convert_units
+from copy import deepcopy
 
 from aviary.utils.named_values import NamedValues
-from aviary.utils.utils import cast_type, check_type
+from aviary.utils.utils import cast_type, check_type, get_unit_conversion
 from aviary.variable_info.variable_meta_data import CoreMetaData
 
 
@@ -55,6 +55,56 @@ class AviaryValues(NamedValues):
 
         super().set_val(key=key, val=val, units=units)
 
+    def update(self, other=None, meta_data=CoreMetaData, **kwargs):
+        """
+        Assign named values and their associated units found in another
+        collection to this collection, overwriting existing items.
+
+        Items copied from another AviaryValues were already validated when they were set, so
+        they are copied in bulk without repeating the type and units checks. Items from any
+        other collection or from keyword arguments are validated against `meta_data`.
+
+        Parameters
+        ----------
+        other (None)
+            a collection of named values and their associated units
+
+        meta_data : dict
+            metadata used to validate items that did not come from an AviaryValues
+
+        **kwargs (optional)
+            individual named values and their associated units
+
+        See Also
+        --------
+        NamedValues.update
+        """
+        if isinstance(other, AviaryValues):
+            # copy so that mutable values are not shared between the two collections
+            self._mapping.update(deepcopy(other._mapping))
+            other = None
+
+        elif isinstance(other, NamedValues):
+            other = other._mapping
+
+        if other is not None:
+            # check for dictionary
+            keys = getattr(other, 'keys', None)
+
+            if keys is None:
+                # iterable, but not dictionary
+                for key, (val, units) in other:
+                    self.set_val(key, val, units, meta_data=meta_data)
+
+            else:
+                # dictionary
+                for key in keys():
+                    val, units = other[key]
+                    self.set_val(key, val, units, meta_data=meta_data)
+
+        for key, (val, units) in kwargs.items():
+            self.set_val(key, val, units, meta_data=meta_data)
+
     def _check_units_compatibility(self, key, val, units, meta_data=CoreMetaData):
         """
         Check that the two provided units are compatible - we don't actually want to convert here,
@@ -62,10 +112,14 @@ class AviaryValues(NamedValues):
         """
         expected_units = meta_data[key]['units']
 
+        if not expected_units or not units:
+            # nothing to convert; invalid units are reported by NamedValues.set_val
+            return
+
         try:
-            # NOTE the value here is unimportant, we only care if OpenMDAO will
-            # convert the units
-            _convert_units(10, expected_units, units)
+            # NOTE we only care if OpenMDAO can convert the units. The conversion is cached,
+            # so repeated checks of the same units do not parse them again
+            get_unit_conversion(expected_units, units)
         except ValueError:
             raise ValueError(f'The units {units} which you have provided for {key} are invalid.')
         except TypeError:
@@ -10,13 +10,18 @@ from openmdao.components.interp_util.interp import InterpND
 from aviary.interface.utils import round_it
 from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 from aviary.subsystems.propulsion.engine_deck import normalize
-from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
+from aviary.subsystems.propulsion.utils import (
+    EngineModelVariables,
+    build_engine_deck,
+    default_units,
+)
+from aviary.utils.aviary_values import AviaryValues
 from aviary.utils.conversion_utils import _parse, _read_map, _rep
 from aviary.utils.csv_data_file import write_data_file
 from aviary.utils.functions import get_aviary_resource_path, get_path
 from aviary.utils.named_values import NamedValues
 from aviary.variable_info.enums import EngineDeckType
-from aviary.variable_info.variables import Dynamic
+from aviary.variable_info.variables import Aircraft, Dynamic
 
 
 MACH = EngineModelVariables.MACH
@@ -362,6 +367,44 @@ def convert_engine_deck(input_file, output_file, data_format: EngineDeckType, ro
     write_data_file(output_file, write_data, outputs, comments, include_timestamp=True)
 
 
+def compile_engine_deck(input_file, output_file=None, aviary_inputs=None):
+    """
+    Converts an Aviary-formatted engine deck into a compiled (binary) engine deck. The compiled deck
+    contains the already sorted, packed, and normalized engine data, and can be used directly as
+    Aircraft.Engine.DATA_FILE to skip reading and processing the data during model setup.
+
+    Parameters
+    ----------
+    input_file : (str, Path)
+        path to Aviary-formatted engine deck file to be compiled
+    output_file : (str, Path), optional
+        path to file where compiled engine deck will be written. Defaults to the input file name
+        with a ".npz" extension in the current directory.
+    aviary_inputs : AviaryValues, optional
+        aircraft inputs containing the engine options (interpolation sort, global throttle, flight
+        idle generation, etc.) used to process the data. The same options must be used by any
+        EngineDeck that loads the compiled deck. If not provided, default options are used.
+
+    Returns
+    -------
+    Path
+        Path to the compiled engine deck.
+    """
+    if aviary_inputs is None:
+        options = AviaryValues()
+    else:
+        options = aviary_inputs.deepcopy()
+
+    options.set_val(Aircraft.Engine.DATA_FILE, get_path(input_file))
+
+    engine = build_engine_deck(options)
+
+    if output_file is None:
+        output_file = Path(input_file).stem
+
+    return engine.save_compiled_data(output_file)
+
+
 def _read_flops_engine(input_file):
     """
     Read engine data file using FLOPS standard, which is column delimited data
@@ -33,3 +33,38 @@ def _exec_EDC(args, user_args):
         data_format=args.format,
         round_data=args.round,
     )
+
+
+def _setup_ECD_parser(parser):
+    parser.add_argument(
+        'input_file', type=str, help='path to Aviary-formatted engine deck file to be compiled'
+    )
+    parser.add_argument(
+        'output_file',
+        type=str,
+        nargs='?',
+        help='path to file where compiled engine deck will be written',
+    )
+    parser.add_argument(
+        '--vehicle',
+        type=str,
+        default=None,
+        help='path to Aviary vehicle input deck containing the engine options used to process the '
+        'data. Default engine options are used if not provided.',
+    )
+
+
+def _exec_ECD(args, user_args):
+    from aviary.utils.engine_deck_conversion import compile_engine_deck
+
+    aviary_inputs = None
+    if args.vehicle is not None:
+        from aviary.utils.process_input_decks import create_vehicle
+
+        aviary_inputs, _ = create_vehicle(args.vehicle)
+
+    compile_engine_deck(
+        input_file=args.input_file,
+        output_file=args.output_file,
+        aviary_inputs=aviary_inputs,
+    )
@@ -18,8 +18,10 @@ ARNGE(1) = 3600 !target range in nautical miles
 
 import csv
 import getpass
+import os
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -61,7 +63,8 @@ def fortran_to_aviary(
     vehicle_data = {
         'input_values': NamedValues(),
         'unused_values': NamedValues(),
-        'initialization_guesses': initialization_guesses,
+        # copy so that conversions do not share guesses
+        'initialization_guesses': initialization_guesses.copy(),
     }
 
     fortran_deck: Path = get_path(fortran_deck, verbosity=verbosity)
@@ -83,7 +86,8 @@ def fortran_to_aviary(
 
     # create dictionary to convert legacy code variables to Aviary variables
     # key: variable name, value: either None or relevant historical_name
-    aviary_variable_dict = generate_aviary_names(legacy_code.value)
+    # The dictionary and its lookup index are only built once per process for each legacy code
+    aviary_variable_dict, alias_index = get_alias_index(legacy_code)
 
     # Get legacy-code based depreciated variable list and set vehicle data to defaults
     if legacy_code is GASP:
@@ -107,6 +111,7 @@ def fortran_to_aviary(
             vehicle_data=vehicle_data,
             unused_vars=deprecated_vars,
             verbosity=verbosity,
+            alias_index=alias_index,
         )
 
     # read in and convert input file
@@ -118,6 +123,7 @@ def fortran_to_aviary(
         deprecated_vars,
         legacy_code,
         verbosity,
+        alias_index,
     )
 
     # Postprocessing step to handle special cases for conversion (not 1-to-1 match),
@@ -184,6 +190,134 @@ def fortran_to_aviary(
             writer.writerow([var] + val)
 
 
+def fortran_to_aviary_batch(
+    input_dir,
+    legacy_code,
+    output_dir=None,
+    pattern='*',
+    num_workers=None,
+    force=False,
+    verbosity=Verbosity.BRIEF,
+    summary_file='conversion_summary.txt',
+):
+    """
+    Convert every Fortran input deck in a directory tree to an Aviary CSV file.
+
+    Decks are converted in parallel on a pool of worker processes. Each worker builds the
+    alternate names of the legacy code and their index once, and reuses them for every deck
+    it converts. A deck that fails to convert does not stop the batch: the failures are
+    collected and written to a summary file.
+
+    Parameters
+    ----------
+    input_dir : str or Path
+        Directory that is searched recursively for input decks.
+    legacy_code : LegacyCode or str
+        Legacy code that all of the input decks originated from.
+    output_dir : str or Path, optional
+        Directory that the converted files are written to, mirroring the layout of input_dir.
+        By default, each converted file is written next to its input deck.
+    pattern : str, optional
+        Glob pattern that input deck filenames must match. Files from a previous conversion
+        (ending in "_converted.csv"), files named like the summary file, and anything in
+        output_dir are always skipped.
+    num_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs. If 1, decks are converted in
+        the current process.
+    force : bool, optional
+        Allow overwriting existing output files.
+    verbosity : Verbosity or int, optional
+        Sets level of printouts for the batch and for each conversion.
+    summary_file : str or Path, optional
+        Name of the summary file, which is written to output_dir (or input_dir if output_dir is
+        not given). If None, no summary file is written.
+
+    Returns
+    -------
+    dict
+        Maps the path of each input deck to None if it was converted successfully, or to the
+        error message if conversion failed.
+    """
+    verbosity = Verbosity(verbosity)
+    legacy_code = LegacyCode(legacy_code)
+
+    input_dir = Path(input_dir)
+    if not input_dir.is_dir():
+        raise FileNotFoundError(f'{input_dir} is not a directory')
+
+    # fortran_to_aviary places relative output paths next to the input deck
+    output_root = input_dir if output_dir is None else Path(output_dir).resolve()
+
+    # outputs of this batch, or of an earlier run of it, are not input decks
+    summary_name = None if summary_file is None else Path(summary_file).name
+    excluded_dir = None
+    if output_dir is not None and input_dir.resolve() in output_root.parents:
+        excluded_dir = output_root
+
+    decks = sorted(
+        path
+        for path in input_dir.rglob(pattern)
+        if path.is_file()
+        and not path.name.endswith('_converted.csv')
+        and path.name != summary_name
+        and (excluded_dir is None or excluded_dir not in path.resolve().parents)
+    )
+
+    jobs = []
+    for deck in decks:
+        if output_dir is None:
+            output_file = None
+        else:
+            relative = deck.relative_to(input_dir)
+            output_file = output_root / relative.parent / (relative.stem + '_converted.csv')
+        jobs.append((deck, legacy_code, output_file, force, verbosity))
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    if verbosity >= Verbosity.BRIEF:
+        print(f'Converting {len(jobs)} {legacy_code.value} decks from {input_dir}')
+
+    if num_workers == 1 or len(jobs) <= 1:
+        errors = [_convert_batch_deck(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(jobs)),
+            initializer=get_alias_index,
+            initargs=(legacy_code,),
+        ) as executor:
+            errors = list(executor.map(_convert_batch_deck, *zip(*jobs)))
+
+    results = {str(deck): error for deck, error in zip(decks, errors)}
+    failures = {deck: error for deck, error in results.items() if error is not None}
+
+    if summary_file is not None:
+        summary_file = output_root / summary_file
+        summary_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_file, 'w') as f:
+            f.write(f'# {legacy_code.value} decks converted from {input_dir.resolve()}\n')
+            f.write(f'# converted: {len(results) - len(failures)}\n')
+            f.write(f'# failed: {len(failures)}\n')
+            for deck, error in failures.items():
+                f.write(f'{deck}: {error}\n')
+
+    if verbosity >= Verbosity.BRIEF:
+        print(f'Converted {len(results) - len(failures)} of {len(results)} decks')
+        if failures and summary_file is not None:
+            print(f'{len(failures)} decks failed to convert, see {summary_file}')
+
+    return results
+
+
+def _convert_batch_deck(fortran_deck, legacy_code, output_file, force, verbosity):
+    """Convert a single deck of a batch, and return the error message if conversion fails."""
+    try:
+        fortran_to_aviary(fortran_deck, legacy_code, output_file, force, verbosity)
+    except Exception as err:
+        return f'{type(err).__name__}: {err}'
+    return None
+
+
 def parse_input_file(
     fortran_deck,
     vehicle_data,
@@ -192,6 +326,7 @@ def parse_input_file(
     unused_vars,
     legacy_code,
     verbosity=Verbosity.BRIEF,
+    alias_index=None,
 ):
     """
     parse_input_file reads the data in fortran_deck and adds it to vehicle_data.
@@ -199,6 +334,7 @@ def parse_input_file(
     Lines are read one by one, comments are removed, and namelists are tracked.
     Lines with multiple variable-data pairs are supported, but the last value per
     variable must be followed by a trailing comma.
+    If an alias_index built from alternate_names is given, it is used to look up variable names.
     """
     with open(fortran_deck, 'r') as f_in:
         current_namelist = current_tag = ''
@@ -239,6 +375,7 @@ def parse_input_file(
                         unused_vars,
                         comment,
                         verbosity,
+                        alias_index,
                     )
                 except Exception as err:
                     if current_namelist == '':
@@ -279,6 +416,7 @@ def parse_input_file(
                             unused_vars,
                             comment,
                             verbosity,
+                            alias_index,
                         )
                     except Exception as err:
                         if current_namelist == '':
@@ -308,6 +446,7 @@ def process_and_store_data(
     unused_vars,
     comment='',
     verbosity=Verbosity.BRIEF,
+    alias_index=None,
 ):
     """
     process_and_store_data takes in a string that contains the data, the current variable's name and
@@ -335,7 +474,7 @@ def process_and_store_data(
         var_values = []
 
     list_of_equivalent_aviary_names, var_ind = update_name(
-        alternate_names, current_namelist + '.' + var_name, verbosity
+        alternate_names, current_namelist + '.' + var_name, verbosity, alias_index
     )
 
     # Fortran uses 1 indexing, Python uses 0 indexing
@@ -446,8 +585,46 @@ def generate_aviary_names(legacy_code):
     return alternate_names
 
 
-def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
-    """update_name will convert a Fortran name to a list of equivalent Aviary names."""
+def generate_alias_index(alternate_names):
+    """
+    Create an index of the names in alternate_names for fast lookups in update_name.
+    Every trailing part of each lowercase name is mapped to the position of that name and the
+    Aviary variable it belongs to.
+    """
+    alias_index = {}
+    position = 0
+    for key, list_of_names in alternate_names.items():
+        if list_of_names is not None:
+            for altname in list_of_names:
+                altname = altname.lower()
+                for start in range(len(altname)):
+                    alias_index.setdefault(altname[start:], []).append((position, key))
+                position += 1
+    return alias_index
+
+
+# alternate names and their index for each legacy code, built once per process
+_alias_indices = {}
+
+
+def get_alias_index(legacy_code):
+    """
+    Return the alternate names of the specified legacy code and their index, building them
+    the first time they are requested.
+    """
+    legacy_code = LegacyCode(legacy_code)
+    if legacy_code not in _alias_indices:
+        alternate_names = generate_aviary_names(legacy_code.value)
+        _alias_indices[legacy_code] = (alternate_names, generate_alias_index(alternate_names))
+    return _alias_indices[legacy_code]
+
+
+def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF, alias_index=None):
+    """
+    update_name will convert a Fortran name to a list of equivalent Aviary names.
+    If an alias_index built from alternate_names is given, it is used instead of searching
+    through all of the alternate names.
+    """
     if '(' in var_name:  # some GASP lists are given as individual elements
         # get the target index
         var_ind = int(var_name.split('(')[1].split(')')[0])
@@ -456,17 +633,37 @@ def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
         var_ind = None
 
     all_equivalent_names = []
-    for key, list_of_names in alternate_names.items():
-        if list_of_names is not None:
-            for altname in list_of_names:
-                altname = altname.lower()
-                if altname.endswith(var_name.lower()):
-                    all_equivalent_names.append(key)
-                    continue
-                elif var_ind is not None and altname.endswith(f'{var_name.lower()}({var_ind})'):
-                    all_equivalent_names.append(key)
-                    var_ind = None
+    if alias_index is not None:
+        # matches in the same order as the search below
+        matches = [
+            (position, key, False) for position, key in alias_index.get(var_name.lower(), [])
+        ]
+        if var_ind is not None:
+            matched = {position for position, _, _ in matches}
+            matches.extend(
+                (position, key, True)
+                for position, key in alias_index.get(f'{var_name.lower()}({var_ind})', [])
+                if position not in matched
+            )
+            matches.sort()
+        for _, key, indexed in matches:
+            if indexed:
+                if var_ind is None:
                     continue
+                var_ind = None
+            all_equivalent_names.append(key)
+    else:
+        for key, list_of_names in alternate_names.items():
+            if list_of_names is not None:
+                for altname in list_of_names:
+                    altname = altname.lower()
+                    if altname.endswith(var_name.lower()):
+                        all_equivalent_names.append(key)
+                        continue
+                    elif var_ind is not None and altname.endswith(f'{var_name.lower()}({var_ind})'):
+                        all_equivalent_names.append(key)
+                        var_ind = None
+                        continue
 
     # if there are no equivalent variable names, return the original name
     if len(all_equivalent_names) == 0:
@@ -1448,59 +1645,3 @@ initialization_guesses = {
     'climb_range': 0,
     'reserves': 0,
 }
-
-
-def _setup_F2A_parser(parser):
-    """
-    Set up the subparser for the Fortran_to_aviary tool.
-
-    Parameters
-    ----------
-    parser : argparse subparser
-        The parser we're adding options to.
-    """
-    parser.add_argument(
-        'input_deck',
-        type=str,
-        nargs=1,
-        help='Filename of vehicle input deck, including partial or complete path.',
-    )
-    parser.add_argument(
-        'output_file',
-        type=str,
-        nargs='?',
-        help='Filename for converted input deck, including partial or complete path.',
-    )
-    parser.add_argument(
-        '-f',
-        '--format',
-        type=LegacyCode,
-        help='Name of the legacy code the deck originated from',
-        choices=set(LegacyCode),
-        required=True,
-    )
-    parser.add_argument(
-        '--force',
-        action='store_true',
-        help='Allow overwriting existing output files',
-    )
-    parser.add_argument(
-        '-v',
-        '--verbosity',
-        type=int,
-        choices=Verbosity.values(),
-        default=1,
-        help='Set level of print statements',
-    )
-
-
-def _exec_F2A(args, user_args):
-    # check if args.input_deck is a list, if so, use the first element
-    if isinstance(args.input_deck, list):
-        args.input_deck = args.input_deck[0]
-    filepath = args.input_deck
-
-    # convert verbosity from int to enum
-    verbosity = Verbosity(args.verbosity)
-
-    fortran_to_aviary(filepath, args.format, args.output_file, args.force, verbosity)
@@ -0,0 +1,96 @@
+"""
+Command line api for the legacy input deck converter.
+Kept in a separate file to speed up the command line imports.
+"""
+
+from aviary.variable_info.enums import LegacyCode, Verbosity
+
+
+def _setup_F2A_parser(parser):
+    """
+    Set up the subparser for the Fortran_to_aviary tool.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument(
+        'input_deck',
+        type=str,
+        nargs=1,
+        help='Filename of vehicle input deck, including partial or complete path. '
+        'With --batch, the directory that is searched for input decks.',
+    )
+    parser.add_argument(
+        'output_file',
+        type=str,
+        nargs='?',
+        help='Filename for converted input deck, including partial or complete path. '
+        'With --batch, the directory that converted decks are written to.',
+    )
+    parser.add_argument(
+        '-f',
+        '--format',
+        type=LegacyCode,
+        help='Name of the legacy code the deck originated from',
+        choices=set(LegacyCode),
+        required=True,
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Allow overwriting existing output files',
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Convert every input deck in the input_deck directory and its subdirectories',
+    )
+    parser.add_argument(
+        '--pattern',
+        type=str,
+        default='*',
+        help='Glob pattern that input deck filenames must match when using --batch',
+    )
+    parser.add_argument(
+        '-j',
+        '--num-workers',
+        type=int,
+        default=None,
+        help='Number of worker processes used with --batch, defaults to the number of CPUs',
+    )
+    parser.add_argument(
+        '-v',
+        '--verbosity',
+        type=int,
+        choices=Verbosity.values(),
+        default=1,
+        help='Set level of print statements',
+    )
+
+
+def _exec_F2A(args, user_args):
+    from aviary.utils.fortran_to_aviary import fortran_to_aviary, fortran_to_aviary_batch
+
+    # check if args.input_deck is a list, if so, use the first element
+    if isinstance(args.input_deck, list):
+        args.input_deck = args.input_deck[0]
+    filepath = args.input_deck
+
+    # convert verbosity from int to enum
+    verbosity = Verbosity(args.verbosity)
+
+    if args.batch:
+        fortran_to_aviary_batch(
+            filepath,
+            args.format,
+            args.output_file,
+            pattern=args.pattern,
+            num_workers=args.num_workers,
+            force=args.force,
+            verbosity=verbosity,
+        )
+        return
+
+    fortran_to_aviary(filepath, args.format, args.output_file, args.force, verbosity)
@@ -0,0 +1,155 @@
+"""
+Process-wide cache of precomputed semi-structured interpolants.
+
+Building an InterpNDSemi object sorts the training grid into nested per-dimension tables and
+computes the spline coefficients for every output. When the same data is interpolated in many
+places (for example an engine deck used in every phase of a mission, each with a different number
+of nodes), that work is identical every time. Components created with
+CachedMetaModelSemiStructuredComp look up their tables in a module-level cache keyed by a hash of
+the training data content, the interpolation method, and the extrapolation setting, so the grid and
+coefficients are built once per process and shared by every instance.
+
+Classes
+-------
+CachedMetaModelSemiStructuredComp : MetaModelSemiStructuredComp that shares precomputed tables.
+
+Functions
+---------
+hash_training_data : Compute a content hash for a set of training arrays.
+get_cached_interpolant : Return a fresh InterpNDSemi that shares a cached, precomputed table.
+clear_interpolant_cache : Remove all cached interpolants.
+"""
+
+import copy
+import hashlib
+
+import numpy as np
+import openmdao.api as om
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
+
+# cached InterpNDSemi objects, keyed by (content hash, method, extrapolate)
+_interpolant_cache = {}
+
+
+def hash_training_data(*arrays):
+    """
+    Compute a content hash for a set of training arrays.
+
+    The order of the provided arrays is part of the hash, so the same data sorted or stacked in a
+    different order produces a different key.
+
+    Parameters
+    ----------
+    *arrays : numpy.ndarray
+        Arrays containing training data.
+
+    Returns
+    -------
+    str
+        Hex digest uniquely identifying the content of the provided arrays.
+    """
+    sha = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        sha.update(str(array.shape).encode())
+        sha.update(array.tobytes())
+    return sha.hexdigest()
+
+
+def get_cached_interpolant(grid, values, method='slinear', extrapolate=True, key=None):
+    """
+    Return an InterpNDSemi for the provided data, reusing a cached precomputed table if possible.
+
+    The returned object is a shallow copy of the cached interpolant with its evaluation state
+    reset, so it can safely be used with any number of evaluation points. The (read-only) nested
+    tables and spline coefficients are shared between all copies.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        Training grid points with shape (number of points, number of dimensions).
+    values : numpy.ndarray
+        Training values at each grid point.
+    method : str, optional
+        Interpolation method.
+    extrapolate : bool, optional
+        Flag that sets if the interpolant allows extrapolation.
+    key : str, optional
+        Precomputed content hash of grid and values. Computed if not provided.
+
+    Returns
+    -------
+    InterpNDSemi
+        Interpolant for the provided data.
+    """
+    if key is None:
+        key = f'{hash_training_data(grid)}-{hash_training_data(values)}'
+    cache_key = (key, method, extrapolate)
+
+    try:
+        cached = _interpolant_cache[cache_key]
+    except KeyError:
+        # store copies of the training data so later changes to the caller's arrays cannot
+        # invalidate the cached table
+        cached = _interpolant_cache[cache_key] = InterpNDSemi(
+            np.array(grid, dtype=float),
+            np.array(values, dtype=float),
+            method=method,
+            extrapolate=extrapolate,
+        )
+
+    interp = copy.copy(cached)
+    interp.extrapolated_points = None
+    interp._xi = None
+    interp._d_dx = None
+    interp._d_dvalues = None
+
+    return interp
+
+
+def clear_interpolant_cache():
+    """Remove all cached interpolants."""
+    _interpolant_cache.clear()
+
+
+class CachedMetaModelSemiStructuredComp(om.MetaModelSemiStructuredComp):
+    """
+    MetaModelSemiStructuredComp that shares precomputed interpolation tables across instances.
+
+    Behaves identically to MetaModelSemiStructuredComp, but the interpolation tables for each
+    output are retrieved from a process-wide cache keyed by training data content, interpolation
+    method, and extrapolation setting. Components with training data gradients enabled always
+    build their own tables, since their training values change during execution.
+    """
+
+    def _setup_var_data(self):
+        if self.options['training_data_gradients']:
+            super()._setup_var_data()
+            return
+
+        interp_method = self.options['method']
+        extrapolate = self.options['extrapolate']
+
+        # Make sure all training data is sized correctly.
+        size = len(self.training_inputs[self.pnames[0]])
+        for data_dict in [self.training_inputs, self.training_outputs]:
+            for name, data in data_dict.items():
+                size2 = len(data)
+                if size2 != size:
+                    msg = (
+                        f"Size mismatch: training data for '{name}' is length {size2}, but data "
+                        f"for '{self.pnames[0]}' is length {size}."
+                    )
+                    raise ValueError(msg)
+
+        grid = np.array([col for col in self.training_inputs.values()]).T
+        grid_hash = hash_training_data(grid)
+
+        for name, train_data in self.training_outputs.items():
+            key = f'{grid_hash}-{hash_training_data(train_data)}'
+            self.interps[name] = get_cached_interpolant(
+                grid, train_data, method=interp_method, extrapolate=extrapolate, key=key
+            )
+
+        # skip MetaModelSemiStructuredComp._setup_var_data, which would rebuild the tables
+        super(om.MetaModelSemiStructuredComp, self)._setup_var_data()
@@ -150,37 +150,9 @@ def _read_pm_table(f, cmts):
     return tab_data
 
 
-def _setup_PMC_parser(parser):
-    parser.add_argument('input_file', type=str, help='path to propeller map file to be converted')
-    parser.add_argument(
-        'output_file',
-        type=str,
-        nargs='?',
-        help='path to file where new converted data will be written (optional)',
-    )
-    # currently removing as there is only one allowed map type at the moment
-    # parser.add_argument(
-    #     '-f',
-    #     '--data_format',
-    #     type=PropMapType,
-    #     choices=list(PropMapType),
-    #     nargs='?',
-    #     default='GASP',
-    #     help='data format used by input_file',
-    # )
-    parser.add_argument('--round', action='store_true', help='round data to improve readability')
-
-
-def _exec_PMC(args, user_args):
-    convert_propeller_map(
-        input_file=args.input_file,
-        output_file=args.output_file,
-        # data_format=args.format,
-        round_data=args.round,
-    )
-
-
 if __name__ == '__main__':
+    from aviary.utils.propeller_map_conversion_cmd import _exec_PMC, _setup_PMC_parser
+
     parser = argparse.ArgumentParser(
         description='Converts GASP-formatted propeller map files into Aviary csv format.\n'
     )
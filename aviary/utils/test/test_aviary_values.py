@@ -217,6 +217,35 @@ class TestUnits(unittest.TestCase):
             self.fail('Expecting TypeError.')
 
 
+class TestUpdate(unittest.TestCase):
+    """Test bulk assignment of values to an AviaryValues."""
+
+    def test_update_from_aviary_values(self):
+        vals = AviaryValues()
+        vals.set_val(Aircraft.Wing.SPAN, 100.0, units='ft')
+        vals.set_val(Aircraft.Engine.SCALE_FACTOR, np.array([1.0, 2.0]))
+
+        new_vals = AviaryValues(vals)
+        self.assertEqual(new_vals.get_val(Aircraft.Wing.SPAN, 'ft'), 100.0)
+        assert_near_equal(new_vals.get_val(Aircraft.Engine.SCALE_FACTOR), [1.0, 2.0])
+
+        # copied values must not be shared between the two collections
+        new_vals.get_val(Aircraft.Engine.SCALE_FACTOR)[0] = 3.0
+        assert_near_equal(vals.get_val(Aircraft.Engine.SCALE_FACTOR), [1.0, 2.0])
+
+    def test_update_validates(self):
+        vals = AviaryValues()
+        vals.update({Aircraft.CrewPayload.NUM_PASSENGERS: (5.0, 'unitless')})
+        self.assertIsInstance(vals.get_val(Aircraft.CrewPayload.NUM_PASSENGERS), int)
+
+        with self.assertRaises(TypeError):
+            vals.update({Aircraft.Wing.SPAN: (100.0, 'lbm')})
+
+        vals = AviaryValues()
+        vals.update([(ExtendedAircraft.Wing.AERO_CENTER, (5.0, 'ft'))], meta_data=ExtendedMetaData)
+        assert_near_equal(vals.get_val(ExtendedAircraft.Wing.AERO_CENTER, 'inch'), [60.0])
+
+
 class TestVariableExtension(unittest.TestCase):
     """Test set_val function for extended Aviary variables."""
 
@@ -1,9 +1,10 @@
+import shutil
 import unittest
 from pathlib import Path
 
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.fortran_to_aviary import fortran_to_aviary
+from aviary.utils.fortran_to_aviary import fortran_to_aviary, fortran_to_aviary_batch
 from aviary.utils.functions import get_path
 from aviary.variable_info.enums import LegacyCode
 
@@ -133,6 +134,70 @@ class TestFortranToAviary(unittest.TestCase):
         self.compare_files(comparison_filepath)
 
 
+@use_tempdirs
+class TestFortranToAviaryBatch(unittest.TestCase):
+    """Test batch conversion of a directory tree of legacy code input files."""
+
+    def test_batch(self):
+        legacy_files = 'validation_cases/validation_data/legacy_files/'
+        decks = {
+            'small_single_aisle_GASP.dat': Path('archive'),
+            'large_single_aisle_1_GASP.dat': Path('archive/large'),
+            'generic_BWB_GASP.dat': Path('archive/large'),
+        }
+        for deck, folder in decks.items():
+            folder.mkdir(parents=True, exist_ok=True)
+            shutil.copy(get_path(legacy_files + deck), folder)
+
+        # a deck that cannot be parsed, and a file that does not match the pattern
+        Path('archive/broken_GASP.dat').write_text('$INGASP\nWG = 1, 2 3 4\n$END\n')
+        Path('archive/notes.txt').write_text('not an input deck')
+
+        results = fortran_to_aviary_batch(
+            'archive', LegacyCode.GASP, 'converted', pattern='*.dat', num_workers=2, verbosity=0
+        )
+
+        self.assertEqual(len(results), 4)
+        failures = [deck for deck, error in results.items() if error is not None]
+        self.assertEqual(failures, [str(Path('archive/broken_GASP.dat'))])
+
+        summary = Path('converted/conversion_summary.txt').read_text()
+        self.assertIn('# converted: 3', summary)
+        self.assertIn('# failed: 1', summary)
+        self.assertIn('broken_GASP.dat', summary)
+
+        # batch conversion matches converting each deck separately
+        for deck, folder in decks.items():
+            expected_file = Path.cwd() / (Path(deck).stem + '.csv')
+            fortran_to_aviary(
+                legacy_files + deck, LegacyCode.GASP, expected_file, force=True, verbosity=0
+            )
+            with open(expected_file) as expected:
+                expected_lines = expected.readlines()[1:]
+            with open(
+                Path('converted')
+                / folder.relative_to('archive')
+                / (expected_file.stem + '_converted.csv')
+            ) as f:
+                self.assertEqual(f.readlines()[1:], expected_lines)
+
+    def test_batch_rerun(self):
+        Path('decks').mkdir()
+        shutil.copy(
+            get_path('validation_cases/validation_data/legacy_files/small_single_aisle_GASP.dat'),
+            'decks',
+        )
+
+        # the summary file and converted files of an earlier run are not converted again, whether
+        # they are written next to the decks or to a folder inside the input folder
+        for output_dir in (None, 'decks/converted'):
+            for _ in range(2):
+                results = fortran_to_aviary_batch(
+                    'decks', LegacyCode.GASP, output_dir, force=True, num_workers=1, verbosity=0
+                )
+                self.assertEqual(results, {str(Path('decks/small_single_aisle_GASP.dat')): None})
+
+
 if __name__ == '__main__':
     unittest.main()
     # test = TestFortranToAviary()
@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.utils.interpolant_cache import (
+    CachedMetaModelSemiStructuredComp,
+    clear_interpolant_cache,
+    get_cached_interpolant,
+    hash_training_data,
+)
+
+
+class InterpolantCacheTest(unittest.TestCase):
+    def setUp(self):
+        clear_interpolant_cache()
+
+        # semi-structured grid: number of y points varies with x
+        x = []
+        y = []
+        for xi, ny in zip([0.0, 1.0, 2.0, 3.0], [4, 5, 4, 6]):
+            x.extend([xi] * ny)
+            y.extend(np.linspace(-1.0, 1.0 + xi, ny))
+        self.x = np.array(x)
+        self.y = np.array(y)
+        self.f = self.x**2 + 3.0 * self.x * self.y - self.y**2
+
+    def tearDown(self):
+        clear_interpolant_cache()
+
+    def _build_comp(self, comp_class, num_nodes):
+        comp = comp_class(method='lagrange2', extrapolate=True, vec_size=num_nodes)
+        comp.add_input('x', self.x)
+        comp.add_input('y', self.y)
+        comp.add_output('f', self.f)
+        return comp
+
+    def test_hash(self):
+        key = hash_training_data(self.x, self.y)
+        self.assertEqual(key, hash_training_data(self.x.copy(), self.y.copy()))
+        # order of arrays matters
+        self.assertNotEqual(key, hash_training_data(self.y, self.x))
+
+    def test_shared_tables(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp_3', self._build_comp(CachedMetaModelSemiStructuredComp, 3))
+        prob.model.add_subsystem('comp_7', self._build_comp(CachedMetaModelSemiStructuredComp, 7))
+        prob.model.add_subsystem('ref', self._build_comp(om.MetaModelSemiStructuredComp, 7))
+        prob.setup(force_alloc_complex=True)
+
+        x = np.linspace(0.1, 2.9, 7)
+        y = np.linspace(-0.5, 1.5, 7)
+        for name in ['comp_7', 'ref']:
+            prob.set_val(f'{name}.x', x)
+            prob.set_val(f'{name}.y', y)
+        prob.set_val('comp_3.x', x[:3])
+        prob.set_val('comp_3.y', y[:3])
+        prob.run_model()
+
+        comp_3 = prob.model.comp_3
+        comp_7 = prob.model.comp_7
+        # components with different vec_size share one precomputed table, but not evaluation state
+        self.assertIs(comp_3.interps['f'].table, comp_7.interps['f'].table)
+        self.assertIsNot(comp_3.interps['f'], comp_7.interps['f'])
+        self.assertIsNot(comp_7.interps['f'].table, prob.model.ref.interps['f'].table)
+
+        assert_near_equal(prob.get_val('comp_7.f'), prob.get_val('ref.f'), 1e-12)
+        assert_near_equal(prob.get_val('comp_3.f'), prob.get_val('ref.f')[:3], 1e-12)
+
+        partial_data = prob.check_partials(
+            out_stream=None, method='fd', includes=['comp_3', 'comp_7']
+        )
+        assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
+
+    def test_cache_key(self):
+        interp = get_cached_interpolant(np.array([self.x, self.y]).T, self.f, method='slinear')
+        same = get_cached_interpolant(np.array([self.x, self.y]).T, self.f, method='slinear')
+        other_method = get_cached_interpolant(
+            np.array([self.x, self.y]).T, self.f, method='lagrange2'
+        )
+        other_data = get_cached_interpolant(np.array([self.x, self.y]).T, 2 * self.f)
+
+        self.assertIs(interp.table, same.table)
+        self.assertIsNot(interp.table, other_method.table)
+        self.assertIsNot(interp.table, other_data.table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ from copy import deepcopy
 from enum import Enum
 
 import numpy as np
-from openmdao.utils.units import convert_units
+from openmdao.utils.units import unit_conversion
 
 from aviary.variable_info.variable_meta_data import CoreMetaData
 
@@ -27,9 +27,79 @@ def isiterable(val, valid_iterables: tuple = (list, np.ndarray, tuple)):
     return isinstance(val, valid_iterables)
 
 
+# conversion factor and offset between two units, keyed by (old_units, new_units)
+_unit_conversion_cache = {}
+
+
+def get_unit_conversion(old_units, new_units):
+    """
+    Return the conversion factor and offset between two units.
+
+    Parsing unit strings is expensive, so the result for each pair of units is computed once per
+    process and cached. A value is converted with (val + offset) * factor.
+
+    Parameters
+    ----------
+    old_units : str
+        Original units.
+    new_units : str
+        New units to convert to.
+
+    Returns
+    -------
+    (float, float)
+        Conversion factor and offset.
+
+    Raises
+    ------
+    ValueError
+        If either of the units is not a valid unit string.
+    TypeError
+        If the units are not compatible.
+    """
+    key = (old_units, new_units)
+
+    try:
+        return _unit_conversion_cache[key]
+    except KeyError:
+        pass
+
+    conversion = _unit_conversion_cache[key] = unit_conversion(old_units, new_units)
+
+    return conversion
+
+
+def convert_units(val, old_units, new_units):
+    """
+    Convert a value between units using cached conversion factors.
+
+    This is a drop-in replacement for OpenMDAO's convert_units function.
+
+    Parameters
+    ----------
+    val : float or np.ndarray
+        Value in original units.
+    old_units : str or None
+        Original units.
+    new_units : str or None
+        New units to convert to.
+
+    Returns
+    -------
+    float or np.ndarray
+        Value in new units.
+    """
+    if not old_units or not new_units:
+        return val
+
+    factor, offset = get_unit_conversion(old_units, new_units)
+
+    return (val + offset) * factor
+
+
 def wrapped_convert_units(val_unit_tuple, new_units):
     """
-    Wrapper for OpenMDAO's convert_units function. Can handle iterable values.
+    Wrapper for the cached convert_units function. Can handle iterable values.
 
     Parameters
     ----------
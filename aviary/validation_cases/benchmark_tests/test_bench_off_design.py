@@ -2,6 +2,7 @@ import unittest
 import aviary.api as av
 from copy import deepcopy
 
+import numpy as np
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import require_pyoptsparse, use_tempdirs
 
@@ -489,6 +490,99 @@ class Test2DOFOffDesign(unittest.TestCase):
         self.assertTrue(prob_off_design_min_fuel.result.success)
 
 
+@use_tempdirs
+class OffDesignBatchTest(unittest.TestCase):
+    def test_off_design_batch(self):
+        # design case is only evaluated, the batch is checked against individual off-design runs
+        prob = AviaryProblem(verbosity=0, name='design')
+        prob.load_inputs(
+            'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+            deepcopy(energy_phase_info),
+        )
+        prob.check_and_preprocess_inputs()
+        prob.build_model()
+        prob.add_driver('SLSQP', max_iter=0)
+        prob.add_design_variables()
+        prob.add_objective()
+        prob.setup()
+        prob.set_initial_guesses()
+        prob.run_aviary_problem()
+
+        missions = [
+            {'problem_type': 'off_design_min_fuel', 'mission_range': 1800.0, 'num_pax': 120},
+            # invalid mission, reported in results table instead of stopping the batch
+            {'problem_type': 'off_design_max_range', 'fill_cargo': True, 'fill_fuel': True},
+        ]
+        results = prob.run_off_design_missions(missions, num_procs=2)
+
+        self.assertEqual(
+            results.get_val('Mission Name'),
+            ['design_off_design_batch_0', 'design_off_design_batch_1'],
+        )
+        self.assertEqual(
+            results.get_val('Problem Type'), ['off_design_min_fuel', 'off_design_max_range']
+        )
+
+        off_design_prob = prob.run_off_design_mission(**missions[0])
+        self.assertEqual(results.get_val('Success')[0], off_design_prob.result.success)
+        for column, var_name in (
+            ('Payload', Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS),
+            ('Fuel', Mission.FUEL),
+            ('Range', Mission.RANGE),
+            ('Gross Mass', Mission.GROSS_MASS),
+        ):
+            units = results.get_item(column)[1]
+            assert_near_equal(
+                results.get_val(column, units)[0],
+                off_design_prob.get_val(var_name, units)[0],
+                tolerance=1e-10,
+            )
+            self.assertTrue(np.isnan(results.get_val(column, units)[1]))
+
+        self.assertFalse(results.get_val('Success')[1])
+
+
+@use_tempdirs
+class OffDesignRerunTest(unittest.TestCase):
+    def test_rerun_off_design_mission(self):
+        prob = AviaryProblem(verbosity=0, name='design')
+        prob.load_inputs(
+            'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+            deepcopy(energy_phase_info),
+        )
+        prob.check_and_preprocess_inputs()
+        prob.build_model()
+        prob.add_driver('SLSQP', max_iter=100)
+        prob.add_design_variables()
+        prob.add_objective()
+        prob.setup()
+        prob.set_initial_guesses()
+        prob.run_aviary_problem()
+
+        off_design_prob = prob.run_off_design_mission('off_design_min_fuel', mission_range=1800.0)
+        coloring = off_design_prob.driver._coloring_info.coloring
+
+        # re-solved problem keeps its coloring and matches a newly built off-design mission
+        off_design_prob.rerun_off_design_mission(mission_range=1500.0)
+        self.assertTrue(off_design_prob.result.success)
+        self.assertIs(off_design_prob.driver._coloring_info.coloring, coloring)
+
+        new_prob = prob.run_off_design_mission('off_design_min_fuel', mission_range=1500.0)
+        for var_name, units in (
+            (Mission.FUEL, 'lbm'),
+            (Mission.RANGE, 'NM'),
+            (Mission.GROSS_MASS, 'lbm'),
+        ):
+            assert_near_equal(
+                off_design_prob.get_val(var_name, units),
+                new_prob.get_val(var_name, units),
+                tolerance=1e-6,
+            )
+
+        with self.assertRaises(UserWarning):
+            off_design_prob.rerun_off_design_mission(cargo_mass=1000.0)
+
+
 @use_tempdirs
 class PayloadRangeTest(unittest.TestCase):
     @require_pyoptsparse(optimizer='SNOPT')
@@ -0,0 +1,55 @@
+import unittest
+
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.validation_cases.timing_benchmarks import (
+    TIMING_METRICS,
+    compare_to_baseline,
+    load_timing_history,
+    run_timing_benchmarks,
+)
+
+
+@use_tempdirs
+class TimingBenchmarksTest(unittest.TestCase):
+    def test_run_timing_benchmarks(self):
+        record = run_timing_benchmarks(
+            cases=['FwFm'], num_repeats=1, isolate=False, history_file='timing_history.json'
+        )
+
+        results = record['cases']['FwFm']
+        self.assertEqual(set(results), set(TIMING_METRICS))
+        for metric in ('setup', 'final_setup', 'run_model', 'total_coloring', 'compute_totals'):
+            self.assertGreater(results[metric], 0.0)
+
+        history = load_timing_history('timing_history.json')
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0]['cases'], record['cases'])
+
+        self.assertEqual(compare_to_baseline(record, record), [])
+
+        with self.assertRaises(ValueError):
+            run_timing_benchmarks(cases=['FwGw'], isolate=False)
+
+    def test_compare_to_baseline(self):
+        baseline = {
+            'cases': {
+                'FwFm': {'setup': 2.0, 'run_model': 0.01, 'compute_totals': 0.5},
+                'GwGm': {'setup': 2.0},
+            }
+        }
+        record = {
+            'cases': {
+                # setup is 50% slower, run_model is slower but by less than the timing noise
+                'FwFm': {'setup': 3.0, 'run_model': 0.02, 'compute_totals': 0.55},
+                # cases that are not in the baseline are ignored
+                'turboprop': {'setup': 10.0},
+            }
+        }
+
+        self.assertEqual(compare_to_baseline(record, baseline), [('FwFm', 'setup', 2.0, 3.0)])
+        self.assertEqual(compare_to_baseline(record, baseline, tolerance=0.6), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,356 @@
+"""
+Timing benchmarks of representative Aviary models.
+
+The accuracy benchmarks (``bench_test*``) check the converged answers of optimizations. The
+timing benchmarks instead measure how long the different stages of a run take for a set of
+representative models, so that performance regressions can be caught:
+
+- 'setup': building the model, OpenMDAO setup and setting the initial guesses.
+- 'final_setup': OpenMDAO final_setup.
+- 'run_model': one evaluation of the model.
+- 'total_coloring': computing the coloring of the total jacobian.
+- 'compute_totals': one evaluation of the (colored) total derivatives used by the driver.
+- 'peak_memory': peak memory of the process running the case, in MB.
+
+Each case is run in a separate process by default, so that the cases do not share caches and
+their peak memory can be measured. No optimizer other than SLSQP and no network access are
+needed.
+
+Results are appended to a JSON history file, and can be compared against a stored baseline
+with ``compare_to_baseline``.
+"""
+
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from datetime import datetime
+from functools import partial
+from multiprocessing import get_context
+from pathlib import Path
+
+import dymos
+import numpy as np
+import openmdao
+from openmdao.utils.testing_utils import set_env_vars_context
+
+import aviary
+from aviary.core.aviary_problem import AviaryProblem, _build_off_design_mission
+from aviary.interface.performance import get_peak_memory
+from aviary.models.aircraft.large_turboprop_freighter.phase_info import two_dof_phase_info
+from aviary.models.missions.energy_state_default import phase_info as energy_phase_info
+from aviary.models.missions.two_dof_default import phase_info as two_dof_default_phase_info
+from aviary.subsystems.propulsion.turboprop_model import TurbopropModel
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.process_input_decks import create_vehicle
+from aviary.variable_info.enums import ProblemType
+from aviary.variable_info.variables import Aircraft, Settings
+
+TIMING_METRICS = (
+    'setup',
+    'final_setup',
+    'run_model',
+    'total_coloring',
+    'compute_totals',
+    'peak_memory',
+)
+
+# Differences smaller than these are not reported as regressions, whatever the relative change,
+# so that noise on short timings is not flagged. Times are in seconds, memory in MB.
+_MIN_DIFFERENCE = {
+    'setup': 0.2,
+    'final_setup': 0.1,
+    'run_model': 0.02,
+    'total_coloring': 0.2,
+    'compute_totals': 0.02,
+    'peak_memory': 25.0,
+}
+
+
+def _build_problem(inputs, phase_info, external_subsystems=None):
+    """Build and set up an AviaryProblem with an SLSQP driver, without running it."""
+    prob = AviaryProblem(verbosity=0)
+    prob.load_inputs(inputs, deepcopy(phase_info))
+    if external_subsystems is not None:
+        prob.load_external_subsystems(external_subsystems)
+    prob.check_and_preprocess_inputs()
+    prob.build_model()
+    prob.add_driver('SLSQP', max_iter=0)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+
+    return prob
+
+
+def _fwfm_case():
+    return partial(
+        _build_problem,
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        energy_phase_info,
+    )
+
+
+def _gwgm_case():
+    return partial(
+        _build_problem,
+        'validation_cases/validation_data/test_models/aircraft_for_bench_GwGm.csv',
+        two_dof_default_phase_info,
+    )
+
+
+def _multiengine_case():
+    from aviary.validation_cases.validation_data.test_data.multi_engine_single_aisle_data import (
+        engine_1_inputs,
+        engine_2_inputs,
+        inputs,
+    )
+
+    inputs = deepcopy(inputs)
+    inputs.set_val(Aircraft.Nacelle.LAMINAR_FLOW_LOWER, np.zeros(2))
+    inputs.set_val(Aircraft.Nacelle.LAMINAR_FLOW_UPPER, np.zeros(2))
+
+    engine1 = build_engine_deck(engine_1_inputs)
+    engine1.name = 'engine_1'
+    engine2 = build_engine_deck(engine_2_inputs)
+    engine2.name = 'engine_2'
+
+    return partial(_build_problem, inputs, energy_phase_info, [engine1, engine2])
+
+
+def _turboprop_case():
+    options, _ = create_vehicle(
+        'models/aircraft/large_turboprop_freighter/large_turboprop_freighter_GASP.csv'
+    )
+    options.set_val(Settings.PROBLEM_TYPE, ProblemType.SIZING)
+
+    def build():
+        # the turboprop model is part of what is being set up
+        turboprop = TurbopropModel('turboprop', options=options)
+        return _build_problem(options, two_dof_phase_info, [turboprop])
+
+    return build
+
+
+def _off_design_case():
+    sizing_prob = _build_problem(
+        'validation_cases/validation_data/test_models/aircraft_for_bench_FwFm.csv',
+        energy_phase_info,
+    )
+    sizing_prob.final_setup()
+    sizing_prob.run_model()
+
+    return partial(
+        _build_off_design_mission,
+        sizing_prob._get_off_design_sizing_data(),
+        ProblemType.OFF_DESIGN_MIN_FUEL,
+        mission_range=1800.0,
+        optimizer='SLSQP',
+        name='off_design',
+        verbosity=0,
+    )
+
+
+# Each case prepares anything that should not be timed, and returns a function that builds and
+# sets up the problem to time.
+TIMING_CASES = {
+    'FwFm': _fwfm_case,
+    'GwGm': _gwgm_case,
+    'multiengine': _multiengine_case,
+    'turboprop': _turboprop_case,
+    'off_design': _off_design_case,
+}
+
+
+def _timed(func):
+    """Call func and return its result and its wall time."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def time_case(name, num_repeats=3):
+    """
+    Time the stages of a benchmark case in the current process.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case, one of the keys of TIMING_CASES.
+    num_repeats : int
+        Number of times the model and the total derivatives are evaluated. The median time is
+        reported, after one evaluation that is not timed.
+
+    Returns
+    -------
+    dict
+        Time of each stage, in seconds, and peak memory of the process, in MB.
+    """
+    if name not in TIMING_CASES:
+        raise ValueError(
+            f'Unknown timing benchmark "{name}". Valid cases are: {", ".join(TIMING_CASES)}.'
+        )
+
+    # reports would be included in the timings
+    with set_env_vars_context(OPENMDAO_REPORTS='0'):
+        build = TIMING_CASES[name]()
+
+        results = {}
+        prob, results['setup'] = _timed(build)
+        _, results['final_setup'] = _timed(prob.final_setup)
+
+        # the first evaluations also compute any partial colorings
+        prob.run_model()
+        results['run_model'] = statistics.median(
+            _timed(prob.run_model)[1] for _ in range(num_repeats)
+        )
+
+        driver = prob.driver
+        driver.declare_coloring(show_summary=False, show_sparsity=False)
+        _, results['total_coloring'] = _timed(partial(driver._get_coloring, run_model=False))
+
+        driver._compute_totals()
+        results['compute_totals'] = statistics.median(
+            _timed(driver._compute_totals)[1] for _ in range(num_repeats)
+        )
+
+    results['peak_memory'] = get_peak_memory()
+
+    return results
+
+
+def _time_case_in_dir(name, num_repeats, directory):
+    """Time a case from a working directory, in a process that is only used for that case."""
+    os.chdir(directory)
+    return time_case(name, num_repeats)
+
+
+def run_timing_benchmarks(cases=None, num_repeats=3, isolate=True, history_file=None):
+    """
+    Run timing benchmarks and optionally append the results to a history file.
+
+    The cases are run in a temporary directory, so the files written by Aviary are discarded.
+
+    Parameters
+    ----------
+    cases : list of str, optional
+        Names of the cases to run. All cases in TIMING_CASES are run by default.
+    num_repeats : int
+        Number of timed evaluations of the model and the total derivatives of each case.
+    isolate : bool
+        If True, each case is run in a new process.
+    history_file : str or Path, optional
+        JSON file the results are appended to.
+
+    Returns
+    -------
+    dict
+        Record of this run, with the timings of each case under 'cases'.
+    """
+    if cases is None:
+        cases = list(TIMING_CASES)
+
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'machine': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'versions': {
+            'aviary': aviary.__version__,
+            'openmdao': openmdao.__version__,
+            'dymos': dymos.__version__,
+            'numpy': np.__version__,
+        },
+        'num_repeats': num_repeats,
+        'cases': {},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in cases:
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                    results = pool.submit(_time_case_in_dir, name, num_repeats, directory).result()
+            else:
+                cwd = os.getcwd()
+                os.chdir(directory)
+                try:
+                    results = time_case(name, num_repeats)
+                finally:
+                    os.chdir(cwd)
+
+            record['cases'][name] = results
+
+    if history_file is not None:
+        history = load_timing_history(history_file)
+        history.append(record)
+        with open(history_file, 'w') as f:
+            json.dump(history, f, indent=1)
+            print(file=f)  # avoid 'no newline at end of file' message
+
+    return record
+
+
+def load_timing_history(history_file):
+    """
+    Load the records of previous timing benchmark runs.
+
+    Parameters
+    ----------
+    history_file : str or Path
+        JSON file written by run_timing_benchmarks.
+
+    Returns
+    -------
+    list of dict
+        Records of the previous runs, oldest first. Empty if the file does not exist.
+    """
+    history_file = Path(history_file)
+    if not history_file.is_file():
+        return []
+
+    with open(history_file) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(record, baseline, tolerance=0.25):
+    """
+    Find the timings of a benchmark run that are slower than a baseline run.
+
+    A timing is a regression if it is more than ``tolerance`` slower than the baseline, and the
+    difference is larger than the noise expected for that timing. Cases and timings that are
+    not in both runs are ignored.
+
+    Parameters
+    ----------
+    record : dict
+        Record of a run, as returned by run_timing_benchmarks.
+    baseline : dict
+        Record of the baseline run.
+    tolerance : float
+        Allowed relative increase from the baseline.
+
+    Returns
+    -------
+    list of tuple
+        (case, metric, baseline value, new value) of each regression.
+    """
+    regressions = []
+    for name, results in record['cases'].items():
+        baseline_results = baseline['cases'].get(name, {})
+        for metric in TIMING_METRICS:
+            value = results.get(metric)
+            baseline_value = baseline_results.get(metric)
+            if value is None or baseline_value is None:
+                continue
+
+            if (
+                value > baseline_value * (1.0 + tolerance)
+                and value - baseline_value > _MIN_DIFFERENCE[metric]
+            ):
+                regressions.append((name, metric, baseline_value, value))
+
+    return regressions
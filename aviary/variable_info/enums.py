@@ -51,6 +51,8 @@ class AtmosphereModel(Enum):
     Specifies which atmosphere model to select.
 
     STANDARD use the 1976 US atmosphere model.
+    STANDARD_ANALYTIC use the piecewise analytic equations of the 1976 US atmosphere model instead
+    of interpolating its tables
     HOT use the MIL-SPEC-210A Hottest Day in Northern Hemesphere atmosphere model
     COLD use the MIL-SPEC-210A Coldest Day in Northern Hemesphere atmosphere model
     TROPICAL use the MIL-SPEC-210A Tropical atmosphere model
@@ -58,6 +60,7 @@ class AtmosphereModel(Enum):
     """
 
     STANDARD = 'standard'
+    STANDARD_ANALYTIC = 'standard_analytic'
     COLD = 'cold'
     HOT = 'hot'
     TROPICAL = 'tropical'
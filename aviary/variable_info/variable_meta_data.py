@@ -4546,6 +4546,19 @@ add_meta_data(
     default_value=1.0,
 )
 
+add_meta_data(
+    Aircraft.Propulsion.STACK_ENGINE_DECKS,
+    meta_data=_MetaData,
+    historical_name={'GASP': None, 'FLOPS': None},
+    units='unitless',
+    desc='Flag to evaluate the mission performance of all engine types as a single stack when '
+    'they are EngineDecks with the same variables, units, and interpolation settings, instead of '
+    'building a separate group for each engine type',
+    option=True,
+    types=bool,
+    default_value=False,
+)
+
 add_meta_data(
     Aircraft.Propulsion.TOTAL_ENGINE_CONTROLS_MASS,
     meta_data=_MetaData,
@@ -7682,7 +7695,8 @@ add_meta_data(
     Settings.ATMOSPHERE_MODEL,
     meta_data=_MetaData,
     historical_name={'GASP': None, 'FLOPS': None},
-    desc='The atmospheric model used. Chose one of: standard, tropical, polar, hot, cold.',
+    desc='The atmospheric model used. Chose one of: standard, standard_analytic, tropical, polar, '
+    'hot, cold.',
     option=True,
     types=AtmosphereModel,
     default_value=AtmosphereModel.STANDARD,
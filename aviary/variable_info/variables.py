@@ -428,6 +428,7 @@ class Aircraft:
         ENGINE_OIL_MASS_SCALER = 'aircraft:propulsion:engine_oil_mass_scaler'
         MASS = 'aircraft:propulsion:mass'
         MISC_MASS_SCALER = 'aircraft:propulsion:misc_mass_scaler'
+        STACK_ENGINE_DECKS = 'aircraft:propulsion:stack_engine_decks'
         TOTAL_ENGINE_CONTROLS_MASS = 'aircraft:propulsion:total_engine_controls_mass'
         TOTAL_ENGINE_MASS = 'aircraft:propulsion:total_engine_mass'
         TOTAL_ENGINE_OIL_MASS = 'aircraft:propulsion:total_engine_oil_mass'
@@ -4,10 +4,10 @@ from enum import IntEnum
 from string import Template
 from typing import Iterator, List, Tuple
 
-import openmdao.api as om
 from openmdao.utils.om_warnings import issue_warning
 
 import aviary.api as av
+from aviary.visualization.case_recorder_cache import get_case_reader
 
 
 class WingType(IntEnum):
@@ -242,7 +242,7 @@ class AircraftModelReader(object):
         case_recorder_file : str
             Path to the case recorder file.
         """
-        cr = om.CaseReader(self._case_recorder_file)
+        cr = get_case_reader(self._case_recorder_file)
         self._cr = cr
         self._problem_metadata = cr.problem_metadata
 
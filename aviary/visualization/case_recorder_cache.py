@@ -0,0 +1,242 @@
+"""
+Cached and incremental access to case recorder files for the dashboard.
+
+Opening a case recorder file unpickles all of the model metadata it contains, and reading the
+driver history means loading every recorded iteration. For long optimizations this makes the
+dashboard slow to open. The utilities here avoid repeating that work.
+
+Classes
+-------
+DriverHistoryReader : Incrementally read the driver iteration history of a case recorder file.
+
+Functions
+---------
+get_case_reader : Return a CaseReader that is shared by every user of the same recorder file.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+
+# open CaseReaders, keyed by resolved recorder file path
+_case_readers = {}
+
+
+def _file_signature(filename):
+    """Return the size and modification time of a file, which change whenever it is rewritten."""
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_case_reader(recorder_file):
+    """
+    Return a CaseReader for the given recorder file.
+
+    The CaseReader is shared by every caller in this process, and is only reopened if the file
+    has changed since it was last opened.
+
+    Parameters
+    ----------
+    recorder_file : str or Path
+        Path to the case recorder file.
+
+    Returns
+    -------
+    BaseCaseReader
+        CaseReader for the recorder file.
+    """
+    key = Path(recorder_file).resolve()
+    signature = _file_signature(key)
+
+    cached = _case_readers.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    cr = om.CaseReader(str(recorder_file))
+    _case_readers[key] = (signature, cr)
+
+    return cr
+
+
+class DriverHistoryReader:
+    """
+    Incrementally read the driver iteration history of a case recorder file.
+
+    Each driver iteration is reduced to one row containing the objectives, constraints, and
+    design variables, with array values replaced by their norm. The parsed rows are cached in a
+    sidecar file next to the recorder file. Later reads load the sidecar, and only parse
+    iterations that were recorded since it was written. If the recorder file has not changed,
+    it is not opened at all.
+
+    Parameters
+    ----------
+    recorder_file : str or Path
+        Path to the driver case recorder file.
+    cache_file : str or Path or None
+        Path to the sidecar file. Defaults to the recorder file name with '.history.npz'
+        appended.
+
+    Attributes
+    ----------
+    units : dict
+        Units of each variable in the history, keyed by variable name.
+    """
+
+    def __init__(self, recorder_file, cache_file=None):
+        self._recorder_file = Path(recorder_file)
+
+        if cache_file is None:
+            cache_file = self._recorder_file.with_name(self._recorder_file.name + '.history.npz')
+        self._cache_file = Path(cache_file)
+
+        self.units = {}
+
+        self._names = []
+        self._case_names = []
+        self._timestamps = []
+        self._rows = []
+
+    def read(self):
+        """
+        Return the driver iteration history, reading only iterations that are not cached.
+
+        Returns
+        -------
+        DataFrame or None
+            One row per driver iteration. The first column is 'iter_count', followed by the
+            objectives, constraints, and design variables. None if there are no driver
+            iterations in the recorder file.
+        """
+        signature = _file_signature(self._recorder_file)
+
+        if not self._load_cache(signature):
+            self._read_new_cases()
+            self._save_cache(signature)
+
+        if not self._rows:
+            return None
+
+        df = pd.DataFrame(np.array(self._rows), columns=self._names)
+        df.insert(0, 'iter_count', np.arange(len(self._rows)))
+
+        return df
+
+    def _load_cache(self, signature):
+        """
+        Load the sidecar file, if there is one.
+
+        Returns True if the cached history is complete, meaning the recorder file has not changed
+        since the sidecar was written.
+        """
+        if not self._cache_file.is_file():
+            return False
+
+        try:
+            with np.load(self._cache_file) as data:
+                cached_signature = tuple(data['signature'].tolist())
+                names = data['names'].tolist()
+                units = data['units'].tolist()
+                case_names = data['case_names'].tolist()
+                timestamps = data['timestamps'].tolist()
+                rows = list(data['rows'])
+        except (OSError, ValueError, KeyError):
+            # an unreadable sidecar is rebuilt from the recorder file
+            return False
+
+        # variables without units are stored as empty strings
+        self.units = {name: units or None for name, units in zip(names, units)}
+        self._names = names
+        self._case_names = case_names
+        self._timestamps = timestamps
+        self._rows = rows
+
+        return cached_signature == signature
+
+    def _save_cache(self, signature):
+        """Write the parsed history to the sidecar file."""
+        num_vars = len(self._names)
+        rows = np.array(self._rows).reshape(len(self._rows), num_vars)
+
+        try:
+            with open(self._cache_file, 'wb') as f:
+                np.savez(
+                    f,
+                    signature=np.array(signature, dtype=np.int64),
+                    names=np.array(self._names, dtype=str),
+                    units=np.array([self.units[name] or '' for name in self._names], dtype=str),
+                    case_names=np.array(self._case_names, dtype=str),
+                    timestamps=np.array(self._timestamps, dtype=float),
+                    rows=rows,
+                )
+        except OSError:
+            # the cache is only an optimization, so a read-only output directory is not an error
+            pass
+
+    def _read_new_cases(self):
+        """Parse the driver iterations recorded since the cache was written."""
+        cr = get_case_reader(self._recorder_file)
+        case_names = cr.list_cases('driver', recurse=False, out_stream=None)
+
+        num_cached = len(self._case_names)
+        if num_cached and not self._is_cache_valid(cr, case_names):
+            # the recorder file was overwritten by a different run
+            num_cached = 0
+            self._names = []
+            self._case_names = []
+            self._timestamps = []
+            self._rows = []
+
+        for case_name in case_names[num_cached:]:
+            case = cr.get_case(case_name)
+
+            desvars = case.get_design_vars(scaled=False)
+            objectives = case.get_objectives(scaled=False)
+            constraints = case.get_constraints(scaled=False)
+
+            if not self._names:
+                # A variable can be in more than one of the objectives, constraints, and design
+                # variables. Start with the objectives, then constraints, then design variables,
+                # and only keep the first occurrence of each.
+                names = []
+                for group in (objectives, constraints, desvars):
+                    for name in group:
+                        if name not in names:
+                            names.append(name)
+
+                var_meta = cr.problem_metadata['variables']
+                self._names = names
+                self.units = {name: var_meta[name]['units'] for name in names}
+
+            row = []
+            for name in self._names:
+                if name in objectives:
+                    value = objectives[name]
+                elif name in constraints:
+                    value = constraints[name]
+                else:
+                    value = desvars[name]
+
+                if not np.isscalar(value):
+                    value = np.linalg.norm(value)
+                row.append(value)
+
+            self._case_names.append(case_name)
+            self._timestamps.append(case.timestamp)
+            self._rows.append(np.array(row, dtype=float))
+
+    def _is_cache_valid(self, cr, case_names):
+        """Check that the cached iterations are the first iterations in the recorder file."""
+        num_cached = len(self._case_names)
+
+        if len(case_names) < num_cached or case_names[:num_cached] != self._case_names:
+            return False
+
+        # case names repeat between runs, so also compare the time the cases were recorded
+        for idx in (0, num_cached - 1):
+            if cr.get_case(case_names[idx]).timestamp != self._timestamps[idx]:
+                return False
+
+        return True
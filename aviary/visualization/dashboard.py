@@ -9,7 +9,6 @@ from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
-import openmdao.api as om
 import pandas as pd
 import panel as pn
 from bokeh.models import (
@@ -42,6 +41,7 @@ from openmdao.utils.om_warnings import issue_warning
 
 from aviary.variable_info.variable_meta_data import CoreMetaData
 from aviary.visualization.aircraft_3d_model import Aircraft3DModel
+from aviary.visualization.case_recorder_cache import DriverHistoryReader, get_case_reader
 
 # support getting this function from OpenMDAO post movement of the function to utils
 #    but also support its old location
@@ -96,6 +96,35 @@ def _handle_pane_creation_errors():
     return decorator
 
 
+def _create_deferred_pane(pane_title, pane_list, create_pane, pane_documentation, *args):
+    """
+    Add a pane that is only created once the dashboard page has loaded in the browser.
+
+    This is used for panes that need to read large case recorder files, so that they do not
+    delay opening the dashboard.
+
+    Parameters
+    ----------
+    pane_title : str
+        Title of the tab containing the pane.
+    pane_list : list
+        List of (title, pane) tuples the pane is added to.
+    create_pane : function
+        Pane creation function decorated with _handle_pane_creation_errors.
+    pane_documentation : str
+        Explanation of what this tab is showing.
+    *args
+        Additional arguments passed to create_pane.
+    """
+
+    def load_pane():
+        panes = []
+        create_pane(pane_title, panes, pane_documentation, *args)
+        return panes[0][1]
+
+    pane_list.append((pane_title, pn.panel(load_pane, defer_load=True)))
+
+
 @_handle_pane_creation_errors()
 def create_table_pane_from_json(documentation, json_filepath):
     """
@@ -212,6 +241,115 @@ def create_csv_frame(documentation, csv_filepath):
     return report_pane
 
 
+@_handle_pane_creation_errors()
+def create_performance_pane(documentation, json_filepath):
+    """
+    Create a Panel Pane showing the performance data written by the 'performance' report.
+
+    Parameters
+    ----------
+    documentation : str
+        Explanation of what this tab is showing.
+    json_filepath : str
+        Path to the JSON file written by the 'performance' report.
+
+    Returns
+    -------
+    pane : Panel.Pane
+        A Panel Pane with tables of the driver, subsystem, and solver performance data.
+    """
+    doc_pane = pn.pane.HTML(
+        f'<p class="pane_doc">{documentation}</p>',
+        stylesheets=['assets/aviary_styles.css'],
+        styles={'text-align': documentation_text_align},
+    )
+
+    if not os.path.isfile(json_filepath):
+        return pn.Column(
+            doc_pane,
+            pn.pane.Markdown(
+                f"# Report not shown because data source JSON file, '{json_filepath}', not found."
+            ),
+        )
+
+    with open(json_filepath) as json_file:
+        performance = json.load(json_file)
+
+    driver = performance['driver']
+    summary = {
+        'Driver': driver['name'],
+        'Run time (s)': performance['run_time'],
+        'Peak memory (MB)': performance['peak_memory'],
+        'Driver iterations': driver['iterations'],
+    }
+    for key, name in (
+        ('model_evals', 'Model evaluations'),
+        ('deriv_evals', 'Derivative evaluations'),
+    ):
+        evals = driver[key]
+        summary[name] = evals['count']
+        summary[f'{name} time (s)'] = evals['time']
+        summary[f'{name} max time (s)'] = evals['max_time']
+
+    summary_df = pd.DataFrame(list(summary.items()), columns=['Name', 'Value'])
+
+    subsystem_rows = []
+    for phase, phase_data in performance['phases'].items():
+        for name, data in phase_data['subsystems'].items():
+            subsystem_rows.append({'Phase': phase, 'Subsystem': name, **data})
+    for name, data in performance['other_systems'].items():
+        subsystem_rows.append({'Phase': '', 'Subsystem': name, **data})
+
+    subsystem_df = pd.DataFrame(
+        subsystem_rows,
+        columns=[
+            'Phase',
+            'Subsystem',
+            'compute_count',
+            'compute_time',
+            'linearize_count',
+            'linearize_time',
+        ],
+    )
+    subsystem_df['total_time'] = subsystem_df['compute_time'] + subsystem_df['linearize_time']
+    subsystem_df = subsystem_df.sort_values('total_time', ascending=False)
+
+    solver_df = pd.DataFrame(
+        performance['solvers'],
+        columns=['path', 'solver', 'kind', 'solves', 'iterations', 'max_iterations', 'time'],
+    )
+
+    def make_table(df):
+        formatters = {
+            c: ScientificFormatter(precision=3) for c in df.columns if df[c].dtype == np.float64
+        }
+        return pn.widgets.Tabulator(
+            df,
+            show_index=False,
+            layout='fit_data_stretch',
+            max_height=600,
+            disabled=True,  # disables editing of the table
+            formatters=formatters,
+        )
+
+    return pn.Column(
+        doc_pane,
+        pn.pane.Markdown('### Summary'),
+        pn.widgets.Tabulator(
+            summary_df,
+            show_index=False,
+            selectable=False,
+            sortable=False,
+            disabled=True,  # disables editing of the table
+            titles={'Name': '', 'Value': ''},
+        ),
+        pn.pane.Markdown('### Subsystems'),
+        make_table(subsystem_df),
+        pn.pane.Markdown('### Solvers'),
+        make_table(solver_df),
+    )
+
+
 def get_run_status(status_filepath):
     """Get run status."""
     try:
@@ -346,9 +484,21 @@ def create_aviary_variables_table_data_nested(output_dir, recorder_file):
         A nested list of information about the Aviary variables.
 
     """
-    cr = om.CaseReader(recorder_file)
+    aviary_variables_file_path = Path(
+        f'{output_dir}/reports/aviary_vars/{aviary_variables_json_file_name}'
+    )
+
+    # the table only needs to be rebuilt if the recorder file changed since it was written
+    if (
+        aviary_variables_file_path.is_file()
+        and aviary_variables_file_path.stat().st_mtime_ns >= Path(recorder_file).stat().st_mtime_ns
+    ):
+        with open(aviary_variables_file_path) as fp:
+            return json.load(fp)
 
-    if 'final' not in cr.list_cases():
+    cr = get_case_reader(recorder_file)
+
+    if 'final' not in cr.list_cases(out_stream=None):
         return None
 
     case = cr.get_case('final')
@@ -425,9 +575,6 @@ def create_aviary_variables_table_data_nested(output_dir, recorder_file):
                 }
             )
 
-    aviary_variables_file_path = (
-        f'{output_dir}/reports/aviary_vars/{aviary_variables_json_file_name}'
-    )
     with open(aviary_variables_file_path, 'w') as fp:
         json.dump(table_data_nested, fp)
 
@@ -438,71 +585,15 @@ def convert_driver_case_recorder_file_to_df(recorder_file_name):
     """
     Convert a case recorder file into a Pandas data frame.
 
+    Parsed iterations are cached next to the recorder file, so only iterations recorded since
+    the last call are read.
+
     Parameters
     ----------
     recorder_file_name : str
         Name of the case recorder file.
     """
-    cr = om.CaseReader(recorder_file_name)
-    driver_cases = cr.list_cases('driver', out_stream=None)
-
-    df = None
-    for i, case in enumerate(driver_cases):
-        driver_case = cr.get_case(case)
-
-        desvars = driver_case.get_design_vars(scaled=False)
-        objectives = driver_case.get_objectives(scaled=False)
-        constraints = driver_case.get_constraints(scaled=False)
-
-        if i == 0:  # Only need to get header of the data frame once
-            # Need to worry about the fact that a variable can be in more than one of
-            #  desvars, cons, and obj. So filter out the dupes
-            initial_desvars_names = list(desvars.keys())
-            initial_constraints_names = list(constraints.keys())
-            objectives_names = list(objectives.keys())
-
-            # Start with obj, then cons, then desvars
-            # Give priority to having a duplicate being in the obj and cons
-            #  over being in the desvars
-            all_var_names = objectives_names.copy()
-            constraints_names = []
-            for name in initial_constraints_names:
-                if name not in all_var_names:
-                    constraints_names.append(name)
-                    all_var_names.append(name)
-            desvars_names = []
-            for name in initial_desvars_names:
-                if name not in all_var_names:
-                    desvars_names.append(name)
-                    all_var_names.append(name)
-            header = ['iter_count'] + all_var_names
-            df = pd.DataFrame(columns=header)
-
-        # Now fill up a row
-        row = [
-            i,
-        ]
-        # important to do in this order since that is the order added to the header
-        for varname in objectives_names:
-            value = objectives[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in constraints_names:
-            value = constraints[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in desvars_names:
-            value = desvars[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-        df.loc[i] = row
-
-    return df
+    return DriverHistoryReader(recorder_file_name).read()
 
 
 def create_aircraft_3d_file(recorder_file, reports_dir, outfilepath):
@@ -548,7 +639,33 @@ def _get_interactive_plot_sources(data_by_varname_and_phase, x_varname, y_varnam
         return [], []
 
 
-def create_optimization_history_plot(case_recorder, df):
+@_handle_pane_creation_errors()
+def create_optimization_history_pane(documentation, recorder_file):
+    """
+    Create a pane with a plot of the driver iteration history in a case recorder file.
+
+    Parameters
+    ----------
+    documentation : str
+        Explanation of what this tab is showing.
+    recorder_file : Path
+        Path to the driver case recorder file.
+
+    Returns
+    -------
+    pane : Panel.Pane
+        The optimization history plot.
+    """
+    reader = DriverHistoryReader(recorder_file)
+    df = reader.read()
+
+    if df is None:
+        return _create_message_pane(documentation, 'No driver iterations were recorded.')
+
+    return create_optimization_history_plot(reader.units, df)
+
+
+def create_optimization_history_plot(units, df):
     # Create a ColumnDataSource
     source = ColumnDataSource(df)
 
@@ -620,9 +737,8 @@ def create_optimization_history_plot(case_recorder, df):
     # be added to the Legend
     legend_items = []
     for variable_name in variable_names:
-        units = case_recorder.problem_metadata['variables'][variable_name]['units']
         legend_item = LegendItem(
-            label=f'{variable_name} ({units})', renderers=[renderers[variable_name]]
+            label=f'{variable_name} ({units[variable_name]})', renderers=[renderers[variable_name]]
         )
         legend_items.append(legend_item)
 
@@ -765,7 +881,7 @@ def _create_interactive_xy_plot_mission_variables(documentation, problem_recorde
     """
     if problem_recorder_path:
         if os.path.exists(problem_recorder_path):
-            cr = om.CaseReader(problem_recorder_path)
+            cr = get_case_reader(problem_recorder_path)
 
             # determine what trajectories there are
             traj_nodes = [
@@ -1141,10 +1257,13 @@ def dashboard(script_name, port=0, run_in_background=False):
     # Optimization History Plot
     opt_history_path = out_dir / 'optimization_history.db'
     if opt_history_path.exists():
-        df = convert_driver_case_recorder_file_to_df(opt_history_path)
-        cr = om.CaseReader(opt_history_path)
-        opt_history_pane = create_optimization_history_plot(cr, df)
-        optimization_tabs_list.append(('Optimization History', opt_history_pane))
+        _create_deferred_pane(
+            'Optimization History',
+            optimization_tabs_list,
+            create_optimization_history_pane,
+            'History of the objectives, constraints, and design variables at each iteration.',
+            opt_history_path,
+        )
 
     # IPOPT report
     if os.path.isfile(reports_dir / 'IPOPT.out'):
@@ -1214,6 +1333,18 @@ def dashboard(script_name, port=0, run_in_background=False):
         reports_dir / 'total_coloring.html',
     )
 
+    # Performance report
+    create_performance_pane(
+        'Performance',
+        optimization_tabs_list,
+        """
+        Number of evaluations and wall time of the subsystems of each phase, and of the systems
+        outside of phases, along with iterations of the solvers and evaluations of the driver,
+        recorded during the driver run. Solver times include the evaluations of the systems they
+        converge.""",
+        reports_dir / 'performance.json',
+    )
+
     ####### Results Tab #######
     results_tabs_list = []
 
@@ -1298,6 +1429,8 @@ def dashboard(script_name, port=0, run_in_background=False):
     run_status_pane_tab_number = len(results_tabs_list) - 1
 
     # Timeseries Mission Output Report
+    # multi-mission problems write one file per mission, currently only the first is shown
+    timeseries_files = sorted(reports_dir.glob('mission_timeseries_data*.csv'))
     create_csv_frame(
         'Timeseries Mission Output',
         results_tabs_list,
@@ -1306,7 +1439,7 @@ def dashboard(script_name, port=0, run_in_background=False):
         Any value that is included in the timeseries data is included in this report.
         This data is useful for post-processing, especially those used for acoustic analysis.
         """,
-        reports_dir / 'mission_timeseries_data.csv',
+        timeseries_files[0] if timeseries_files else reports_dir / 'mission_timeseries_data.csv',
     )
 
     # Paylaod Range Output Pane
@@ -1337,9 +1470,10 @@ def dashboard(script_name, port=0, run_in_background=False):
     )
 
     # Interactive XY plot of mission variables
-    _create_interactive_xy_plot_mission_variables(
+    _create_deferred_pane(
         'Interactive Mission Variable Plot',
         results_tabs_list,
+        _create_interactive_xy_plot_mission_variables,
         'Plot of mission variables allowing user to select X and Y plot values.',
         problem_recorder_path,
     )
@@ -2,9 +2,6 @@ import mimetypes
 import os
 import pathlib
 import subprocess
-from openmdao.utils.file_utils import _load_and_exec
-import openmdao.utils.hooks as hooks
-from openmdao.utils.file_utils import is_python_file
 
 
 def _rtplot_setup_parser(parser):
@@ -30,6 +27,10 @@ def _rtplot_cmd(options, user_args):
     user_args : list of str
         Args to be passed to the user script.
     """
+    # OpenMDAO is only imported when the command runs, to keep the command line startup fast
+    import openmdao.utils.hooks as hooks
+    from openmdao.utils.file_utils import _load_and_exec, is_python_file
+
     script_path = options.file[0]
     if not is_python_file(script_path):
         raise RuntimeError(
@@ -0,0 +1,118 @@
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.visualization import case_recorder_cache
+from aviary.visualization.case_recorder_cache import DriverHistoryReader, get_case_reader
+
+
+def record_doe(recorder_file, num_cases=9, offset=0.0):
+    prob = om.Problem()
+    prob.model.add_subsystem(
+        'parab', om.ExecComp(f'f = (x - 3.0)**2 + x*y + (y + 4.0)**2 - 3.0 + {offset}'), ['*']
+    )
+    prob.model.add_subsystem('con', om.ExecComp('c = x + y'), ['*'])
+    prob.model.add_design_var('x', lower=-10.0, upper=10.0)
+    prob.model.add_design_var('y', lower=-10.0, upper=10.0)
+    prob.model.add_objective('f')
+    prob.model.add_constraint('c', upper=0.0)
+
+    cases = [[('x', x), ('y', 2.0 * x - 5.0)] for x in np.linspace(-10.0, 10.0, num_cases)]
+    prob.driver = om.DOEDriver(om.ListGenerator(cases))
+    # relative recorder paths are placed in the problem outputs directory
+    prob.driver.add_recorder(om.SqliteRecorder(str(Path(recorder_file).absolute())))
+    prob.setup()
+    prob.run_driver()
+    prob.cleanup()
+
+
+def recorded_values(recorder_file, name):
+    cr = om.CaseReader(recorder_file)
+    cases = cr.list_cases('driver', out_stream=None)
+    return np.array([np.linalg.norm(cr.get_case(case)[name]) for case in cases])
+
+
+class CountingCaseReader:
+    """Wrap a CaseReader and count the number of cases that are loaded."""
+
+    def __init__(self, cr):
+        self._cr = cr
+        self.num_cases_loaded = 0
+
+    def __getattr__(self, name):
+        return getattr(self._cr, name)
+
+    def get_case(self, case_name):
+        self.num_cases_loaded += 1
+        return self._cr.get_case(case_name)
+
+
+@use_tempdirs
+class DriverHistoryReaderTest(unittest.TestCase):
+    def setUp(self):
+        case_recorder_cache._case_readers.clear()
+
+    def test_read(self):
+        record_doe('cases.db')
+
+        df = DriverHistoryReader('cases.db').read()
+
+        self.assertEqual(list(df.columns), ['iter_count', 'f', 'c', 'x', 'y'])
+        self.assertEqual(len(df), 9)
+
+        assert_near_equal(df['iter_count'].values, np.arange(9))
+        for name in ('f', 'c', 'x', 'y'):
+            assert_near_equal(df[name].values, recorded_values('cases.db', name), tolerance=1e-12)
+
+        # a second read comes entirely from the sidecar file, without opening the recorder
+        with patch.object(case_recorder_cache, 'get_case_reader') as mock_reader:
+            reader = DriverHistoryReader('cases.db')
+            cached_df = reader.read()
+            mock_reader.assert_not_called()
+
+        self.assertTrue(cached_df.equals(df))
+        self.assertEqual(reader.units, {'f': None, 'c': None, 'x': None, 'y': None})
+
+    def test_incremental_read(self):
+        record_doe('cases.db')
+        df = DriverHistoryReader('cases.db').read()
+
+        # pretend the sidecar was written while only the first four cases were recorded
+        sidecar = 'cases.db.history.npz'
+        with np.load(sidecar) as data:
+            data = dict(data)
+        data['signature'] = np.zeros(2, dtype=np.int64)
+        for key in ('case_names', 'timestamps', 'rows'):
+            data[key] = data[key][:4]
+        np.savez(sidecar, **data)
+
+        cr = CountingCaseReader(get_case_reader('cases.db'))
+        with patch.object(case_recorder_cache, 'get_case_reader', return_value=cr):
+            new_df = DriverHistoryReader('cases.db').read()
+
+        self.assertTrue(new_df.equals(df))
+        # the five new cases, plus two used to check that the cached cases are still valid
+        self.assertEqual(cr.num_cases_loaded, 7)
+
+    def test_overwritten_recorder(self):
+        record_doe('cases.db')
+        df = DriverHistoryReader('cases.db').read()
+
+        # a new run with the same case names must not reuse the cached iterations
+        record_doe('cases.db', offset=10.0)
+        new_df = DriverHistoryReader('cases.db').read()
+        assert_near_equal(new_df['f'].values, recorded_values('cases.db', 'f'), tolerance=1e-12)
+        self.assertFalse(np.allclose(new_df['f'].values, df['f'].values))
+
+        # fewer cases than were cached
+        record_doe('cases.db', num_cases=4)
+        self.assertEqual(len(DriverHistoryReader('cases.db').read()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()